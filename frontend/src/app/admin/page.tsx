@@ -683,7 +683,7 @@ export default function AdminDashboardPage() {
                                                                 View Results
                                                             </button>
                                                         )}
-                                                        {candidate.parse_status === 'success' && candidate.resume_json && (
+                                                        {candidate.parse_status === 'success' && (
                                                             <button
                                                                 onClick={() => setPreviewTarget(candidate)}
                                                                 className="px-3 py-1.5 bg-blue-50 text-blue-700 rounded-md text-xs font-semibold hover:bg-blue-100 transition-colors"
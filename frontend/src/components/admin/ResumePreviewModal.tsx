@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import { CandidateResponse } from '@/types/api';
 import { useAuthStore } from '@/store/authStore';
 import { API_BASE_URL } from '@/lib/apiClient';
@@ -22,8 +22,22 @@ function MatchScoreBadge({ score }: { score?: number | null }) {
 
 export default function ResumePreviewModal({ candidate, onClose }: ResumePreviewModalProps) {
     const { token } = useAuthStore();
-    const resume = candidate.resume_json || {};
-    const jd = candidate.jd_json || {};
+    // The candidate list omits the parsed blobs; load them from the detail endpoint
+    const [detail, setDetail] = useState<CandidateResponse | null>(null);
+    useEffect(() => {
+        if (candidate.resume_json) return;
+        fetch(`${API_BASE_URL}/api/v1/auth/admin/candidates/${candidate.id}`, {
+            headers: { 'Authorization': `Bearer ${token}` }
+        })
+            .then(res => {
+                if (!res.ok) throw new Error('Failed to fetch candidate details');
+                return res.json();
+            })
+            .then(setDetail)
+            .catch(err => console.error(err));
+    }, [candidate.id, candidate.resume_json, token]);
+    const resume = candidate.resume_json || detail?.resume_json || {};
+    const jd = candidate.jd_json || detail?.jd_json || {};
     const [showFullOriginal, setShowFullOriginal] = useState(false);
     const [originalBlobUrl, setOriginalBlobUrl] = useState<string | null>(null);
 
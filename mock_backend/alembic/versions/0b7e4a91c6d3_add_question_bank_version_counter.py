@@ -0,0 +1,50 @@
+"""add question_bank_version change counter
+
+Revision ID: 0b7e4a91c6d3
+Revises: f18c6d2e9a05
+Create Date: 2026-10-19 18:12:37.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7e4a91c6d3'
+down_revision: Union[str, Sequence[str], None] = 'f18c6d2e9a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('question_bank_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO question_bank_version (id, version) VALUES (1, 0)")
+
+    # One bump per statement, so bulk seeds cost a single counter update
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_question_bank_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE question_bank_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_questions_bump_bank_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON questions
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_question_bank_version()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_questions_bump_bank_version ON questions")
+    op.execute("DROP FUNCTION IF EXISTS bump_question_bank_version()")
+    op.drop_table('question_bank_version')
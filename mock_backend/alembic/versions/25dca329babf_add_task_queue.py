@@ -0,0 +1,54 @@
+"""add task_queue table
+
+Revision ID: 25dca329babf
+Revises: 869e9f0f81ec
+Create Date: 2026-10-19 13:40:51.207734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '25dca329babf'
+down_revision: Union[str, Sequence[str], None] = '869e9f0f81ec'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'task_queue',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('task_type', sa.String(length=100), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('status', sa.String(length=20), server_default='queued', nullable=False),
+        sa.Column('idempotency_key', sa.String(length=255), nullable=True),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('max_attempts', sa.Integer(), server_default='5', nullable=False),
+        sa.Column('run_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('locked_by', sa.String(length=255), nullable=True),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_task_queue_claim', 'task_queue', ['status', 'task_type', 'run_at'], unique=False)
+    op.create_index(
+        'uq_task_queue_active_idempotency_key',
+        'task_queue',
+        ['idempotency_key'],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_task_queue_active_idempotency_key', table_name='task_queue')
+    op.drop_index('idx_task_queue_claim', table_name='task_queue')
+    op.drop_table('task_queue')
@@ -0,0 +1,52 @@
+"""add keyset and trigram search indexes for admin listings
+
+Revision ID: 3d9f27b1e8a4
+Revises: 0b7e4a91c6d3
+Create Date: 2026-10-19 18:55:20.318842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9f27b1e8a4'
+down_revision: Union[str, Sequence[str], None] = '0b7e4a91c6d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TRIGRAM_INDEXES = [
+    ('idx_users_username_trgm', 'users', 'username'),
+    ('idx_users_email_trgm', 'users', 'email'),
+    ('idx_candidate_profiles_first_name_trgm', 'candidate_profiles', 'first_name'),
+    ('idx_candidate_profiles_last_name_trgm', 'candidate_profiles', 'last_name'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset seeks on (sort field, id) for the candidate and interview listings
+    op.create_index('idx_users_role_created_at_id', 'users', ['role', 'created_at', 'id'], unique=False)
+    op.create_index('idx_users_role_username_id', 'users', ['role', 'username', 'id'], unique=False)
+    op.create_index('idx_candidate_profiles_match_score_user_id', 'candidate_profiles', ['match_score', 'user_id'], unique=False)
+    op.create_index('idx_interviews_created_at_id', 'interviews', ['created_at', 'id'], unique=False)
+
+    # ILIKE '%term%' search
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in _TRIGRAM_INDEXES:
+        op.create_index(
+            name, table, [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(_TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table, postgresql_using='gin')
+    op.drop_index('idx_interviews_created_at_id', table_name='interviews')
+    op.drop_index('idx_candidate_profiles_match_score_user_id', table_name='candidate_profiles')
+    op.drop_index('idx_users_role_username_id', table_name='users')
+    op.drop_index('idx_users_role_created_at_id', table_name='users')
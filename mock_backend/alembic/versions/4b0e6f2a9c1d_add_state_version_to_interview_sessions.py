@@ -0,0 +1,28 @@
+"""add state_version to interview_sessions
+
+Revision ID: 4b0e6f2a9c1d
+Revises: 25dca329babf
+Create Date: 2026-10-19 15:02:17.493821
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b0e6f2a9c1d'
+down_revision: Union[str, Sequence[str], None] = '25dca329babf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('interview_sessions', sa.Column('state_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('interview_sessions', 'state_version')
@@ -0,0 +1,83 @@
+"""add trigger-maintained interview_status_counts
+
+Revision ID: 7a2c5e8f1b90
+Revises: 3d9f27b1e8a4
+Create Date: 2026-10-19 21:04:52.318640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2c5e8f1b90'
+down_revision: Union[str, Sequence[str], None] = '3d9f27b1e8a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('interview_status_counts',
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('status')
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION maintain_interview_status_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                UPDATE interview_status_counts SET count = 0;
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE interview_status_counts SET count = count - 1 WHERE status = OLD.status::text;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO interview_status_counts (status, count) VALUES (NEW.status::text, 1)
+                ON CONFLICT (status) DO UPDATE SET count = interview_status_counts.count + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Block writes to interviews so the backfill and the triggers see the same rows
+    op.execute("LOCK TABLE interviews IN SHARE ROW EXCLUSIVE MODE")
+    op.execute("""
+        CREATE TRIGGER trg_interviews_status_counts_insert_delete
+        AFTER INSERT OR DELETE ON interviews
+        FOR EACH ROW EXECUTE FUNCTION maintain_interview_status_counts()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_interviews_status_counts_update
+        AFTER UPDATE OF status ON interviews
+        FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION maintain_interview_status_counts()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_interviews_status_counts_truncate
+        AFTER TRUNCATE ON interviews
+        FOR EACH STATEMENT EXECUTE FUNCTION maintain_interview_status_counts()
+    """)
+    op.execute("""
+        INSERT INTO interview_status_counts (status, count)
+        SELECT unnest(enum_range(NULL::interviewstatus))::text, 0
+    """)
+    op.execute("""
+        UPDATE interview_status_counts c SET count = s.n
+        FROM (SELECT status::text AS status, count(*) AS n FROM interviews GROUP BY status) s
+        WHERE c.status = s.status
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_interviews_status_counts_truncate ON interviews")
+    op.execute("DROP TRIGGER IF EXISTS trg_interviews_status_counts_update ON interviews")
+    op.execute("DROP TRIGGER IF EXISTS trg_interviews_status_counts_insert_delete ON interviews")
+    op.execute("DROP FUNCTION IF EXISTS maintain_interview_status_counts()")
+    op.drop_table('interview_status_counts')
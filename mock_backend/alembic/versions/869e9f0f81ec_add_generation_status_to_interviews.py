@@ -0,0 +1,30 @@
+"""add generation_status to interviews
+
+Revision ID: 869e9f0f81ec
+Revises: dfefec736560
+Create Date: 2026-10-19 11:02:17.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '869e9f0f81ec'
+down_revision: Union[str, Sequence[str], None] = 'dfefec736560'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('interviews', sa.Column('generation_status', sa.String(length=20), server_default='ready', nullable=False))
+    op.add_column('interviews', sa.Column('generation_error', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('interviews', 'generation_error')
+    op.drop_column('interviews', 'generation_status')
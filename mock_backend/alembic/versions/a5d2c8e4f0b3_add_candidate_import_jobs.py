@@ -0,0 +1,58 @@
+"""add candidate_import_jobs and candidate_import_rows
+
+Revision ID: a5d2c8e4f0b3
+Revises: d9a3f5b7c1e2
+Create Date: 2026-10-21 10:12:47.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5d2c8e4f0b3'
+down_revision: Union[str, Sequence[str], None] = 'd9a3f5b7c1e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('candidate_import_jobs',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('status', sa.String(length=20), server_default='queued', nullable=False),
+    sa.Column('workdir', sa.String(length=512), nullable=False),
+    sa.Column('default_job_description', sa.Text(), server_default='', nullable=False),
+    sa.Column('checkpoint_line', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_rows', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('processed', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('created', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('failed', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('candidate_import_rows',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('job_id', sa.Uuid(), nullable=False),
+    sa.Column('row', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('candidate_id', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['candidate_import_jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_candidate_import_rows_job_row', 'candidate_import_rows', ['job_id', 'row'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_candidate_import_rows_job_row', table_name='candidate_import_rows')
+    op.drop_table('candidate_import_rows')
+    op.drop_table('candidate_import_jobs')
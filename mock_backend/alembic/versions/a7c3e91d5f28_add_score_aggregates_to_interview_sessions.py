@@ -0,0 +1,79 @@
+"""add running score aggregates to interview_sessions
+
+Revision ID: a7c3e91d5f28
+Revises: 4b0e6f2a9c1d
+Create Date: 2026-10-19 16:21:45.830114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91d5f28'
+down_revision: Union[str, Sequence[str], None] = '4b0e6f2a9c1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('interview_sessions', sa.Column('score_sum', sa.Float(), server_default='0', nullable=False))
+    op.add_column('interview_sessions', sa.Column('score_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('interview_sessions', sa.Column('score_max', sa.Float(), nullable=True))
+    op.add_column('interview_sessions', sa.Column('score_min', sa.Float(), nullable=True))
+    op.add_column('interview_sessions', sa.Column('section_scores', sa.JSON(), nullable=True))
+    op.add_column('interview_sessions', sa.Column('feedback_sketch', sa.JSON(), nullable=True))
+
+    # Backfill score aggregates for existing sessions (the feedback sketch starts empty)
+    op.execute("""
+        UPDATE interview_sessions s
+        SET score_sum = agg.score_sum,
+            score_count = agg.score_count,
+            score_max = agg.score_max,
+            score_min = agg.score_min
+        FROM (
+            SELECT session_id,
+                   COALESCE(SUM(ai_score), 0) AS score_sum,
+                   COUNT(ai_score) AS score_count,
+                   MAX(ai_score) AS score_max,
+                   MIN(ai_score) AS score_min
+            FROM interview_responses
+            GROUP BY session_id
+        ) agg
+        WHERE s.id = agg.session_id
+    """)
+    op.execute("""
+        UPDATE interview_sessions s
+        SET section_scores = agg.section_scores
+        FROM (
+            SELECT per_section.session_id,
+                   json_object_agg(
+                       per_section.section_id::text,
+                       json_build_object('sum', per_section.score_sum, 'count', per_section.score_count)
+                   ) AS section_scores
+            FROM (
+                SELECT r.session_id, q.section_id,
+                       SUM(r.ai_score) AS score_sum,
+                       COUNT(r.ai_score) AS score_count
+                FROM interview_responses r
+                JOIN interview_session_questions q ON q.id = r.question_id
+                WHERE r.ai_score IS NOT NULL
+                GROUP BY r.session_id, q.section_id
+            ) per_section
+            GROUP BY per_section.session_id
+        ) agg
+        WHERE s.id = agg.session_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('interview_sessions', 'feedback_sketch')
+    op.drop_column('interview_sessions', 'section_scores')
+    op.drop_column('interview_sessions', 'score_min')
+    op.drop_column('interview_sessions', 'score_max')
+    op.drop_column('interview_sessions', 'score_count')
+    op.drop_column('interview_sessions', 'score_sum')
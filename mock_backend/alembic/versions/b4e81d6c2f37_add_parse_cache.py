@@ -0,0 +1,37 @@
+"""add parse_cache for resume and JD parse results
+
+Revision ID: b4e81d6c2f37
+Revises: 7a2c5e8f1b90
+Create Date: 2026-10-19 23:12:06.481927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e81d6c2f37'
+down_revision: Union[str, Sequence[str], None] = '7a2c5e8f1b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('parse_cache',
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('parser_version', sa.String(length=50), nullable=False),
+    sa.Column('result', sa.JSON(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_hit_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('kind', 'content_hash', 'parser_version')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('parse_cache')
@@ -0,0 +1,41 @@
+"""add category random_key indexes to questions
+
+Revision ID: b8f4e2a6c1d7
+Revises: c3e7a1f9d4b6
+Create Date: 2026-10-21 16:12:40.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f4e2a6c1d7'
+down_revision: Union[str, Sequence[str], None] = 'c3e7a1f9d4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Sampler seeks filtered on category (template category_filters, bank search by skill)
+    op.create_index(
+        'idx_questions_active_difficulty_category_random_key',
+        'questions',
+        ['is_active', 'difficulty', 'category', 'random_key'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_questions_active_category_random_key',
+        'questions',
+        ['is_active', 'category', 'random_key'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_questions_active_category_random_key', table_name='questions')
+    op.drop_index('idx_questions_active_difficulty_category_random_key', table_name='questions')
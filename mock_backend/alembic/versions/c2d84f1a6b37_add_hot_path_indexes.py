@@ -0,0 +1,100 @@
+"""add hot path indexes and unique interview response per question
+
+Revision ID: c2d84f1a6b37
+Revises: a7c3e91d5f28
+Create Date: 2026-10-19 17:02:13.415208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d84f1a6b37'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e91d5f28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Coding re-submissions used to insert one response each; keep the latest per question
+    op.execute("""
+        DELETE FROM interview_responses r
+        USING (
+            SELECT id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY session_id, question_id
+                       ORDER BY submitted_at DESC, id DESC
+                   ) AS rn
+            FROM interview_responses
+        ) ranked
+        WHERE r.id = ranked.id AND ranked.rn > 1
+    """)
+
+    # Re-derive the per-session counters that counted the removed duplicates
+    op.execute("""
+        UPDATE interview_sessions s
+        SET answered_count = agg.answered_count,
+            score_sum = agg.score_sum,
+            score_count = agg.score_count,
+            score_max = agg.score_max,
+            score_min = agg.score_min
+        FROM (
+            SELECT session_id,
+                   COUNT(*) AS answered_count,
+                   COALESCE(SUM(ai_score), 0) AS score_sum,
+                   COUNT(ai_score) AS score_count,
+                   MAX(ai_score) AS score_max,
+                   MIN(ai_score) AS score_min
+            FROM interview_responses
+            GROUP BY session_id
+        ) agg
+        WHERE s.id = agg.session_id
+    """)
+    op.execute("""
+        UPDATE interview_sessions s
+        SET section_scores = agg.section_scores
+        FROM (
+            SELECT per_section.session_id,
+                   json_object_agg(
+                       per_section.section_id::text,
+                       json_build_object('sum', per_section.score_sum, 'count', per_section.score_count)
+                   ) AS section_scores
+            FROM (
+                SELECT r.session_id, q.section_id,
+                       SUM(r.ai_score) AS score_sum,
+                       COUNT(r.ai_score) AS score_count
+                FROM interview_responses r
+                JOIN interview_session_questions q ON q.id = r.question_id
+                WHERE r.ai_score IS NOT NULL
+                GROUP BY r.session_id, q.section_id
+            ) per_section
+            GROUP BY per_section.session_id
+        ) agg
+        WHERE s.id = agg.session_id
+    """)
+
+    # The unique constraint's index also serves session_id-only lookups
+    op.create_unique_constraint(
+        'uq_interview_responses_session_question', 'interview_responses', ['session_id', 'question_id']
+    )
+    op.drop_index(op.f('ix_interview_responses_session_id'), table_name='interview_responses')
+
+    op.create_index(op.f('ix_interview_sessions_interview_id'), 'interview_sessions', ['interview_id'], unique=False)
+    op.create_index(
+        'idx_questions_active_difficulty_category_type',
+        'questions',
+        ['is_active', 'difficulty', 'category', 'question_type'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_questions_active_difficulty_category_type', table_name='questions')
+    op.drop_index(op.f('ix_interview_sessions_interview_id'), table_name='interview_sessions')
+    op.create_index(op.f('ix_interview_responses_session_id'), 'interview_responses', ['session_id'], unique=False)
+    op.drop_constraint('uq_interview_responses_session_question', 'interview_responses', type_='unique')
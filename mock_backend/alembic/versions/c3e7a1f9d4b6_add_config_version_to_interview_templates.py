@@ -0,0 +1,28 @@
+"""add config_version to interview_templates
+
+Revision ID: c3e7a1f9d4b6
+Revises: a5d2c8e4f0b3
+Create Date: 2026-10-21 14:03:55.582914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e7a1f9d4b6'
+down_revision: Union[str, Sequence[str], None] = 'a5d2c8e4f0b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('interview_templates', sa.Column('config_version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('interview_templates', 'config_version')
@@ -0,0 +1,48 @@
+"""add reparse_jobs and candidate_profiles.parse_fingerprint
+
+Revision ID: d9a3f5b7c1e2
+Revises: b4e81d6c2f37
+Create Date: 2026-10-20 00:41:19.630214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a3f5b7c1e2'
+down_revision: Union[str, Sequence[str], None] = 'b4e81d6c2f37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('candidate_profiles', sa.Column('parse_fingerprint', sa.String(length=64), nullable=True))
+    op.create_table('reparse_jobs',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('status', sa.String(length=20), server_default='queued', nullable=False),
+    sa.Column('filters', sa.JSON(), nullable=False),
+    sa.Column('force', sa.Boolean(), server_default='false', nullable=False),
+    sa.Column('run', sa.Integer(), server_default='1', nullable=False),
+    sa.Column('checkpoint_user_id', sa.Uuid(), nullable=True),
+    sa.Column('total', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('processed', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('enqueued', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('skipped', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('already_queued', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('reparse_jobs')
+    op.drop_column('candidate_profiles', 'parse_fingerprint')
@@ -0,0 +1,42 @@
+"""add question_pool table
+
+Revision ID: dfefec736560
+Revises: c7f9d72d1e11, e9142a940e83
+Create Date: 2026-10-19 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dfefec736560'
+down_revision: Union[str, Sequence[str], None] = ('c7f9d72d1e11', 'e9142a940e83')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'question_pool',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('pool_key', sa.String(length=64), nullable=False),
+        sa.Column('role_name', sa.String(length=255), nullable=True),
+        sa.Column('skills', sa.JSON(), nullable=True),
+        sa.Column('difficulty', sa.String(length=20), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('exposure_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('last_served_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_question_pool_key_difficulty_exposure', 'question_pool', ['pool_key', 'difficulty', 'exposure_count'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_question_pool_key_difficulty_exposure', table_name='question_pool')
+    op.drop_table('question_pool')
@@ -0,0 +1,51 @@
+"""convert questions.tags to jsonb with gin index
+
+Revision ID: e5a19b7c3f42
+Revises: c2d84f1a6b37
+Create Date: 2026-10-19 17:04:51.902733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a19b7c3f42'
+down_revision: Union[str, Sequence[str], None] = 'c2d84f1a6b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'questions', 'tags',
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=True,
+        postgresql_using='tags::jsonb',
+    )
+    # jsonb_path_ops: smaller index, supports the @> containment used by tag matching
+    op.create_index(
+        'idx_questions_tags_gin',
+        'questions',
+        ['tags'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'tags': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_questions_tags_gin', table_name='questions', postgresql_using='gin')
+    op.alter_column(
+        'questions', 'tags',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='tags::json',
+    )
@@ -0,0 +1,41 @@
+"""add random_key to questions for indexed random sampling
+
+Revision ID: f18c6d2e9a05
+Revises: e5a19b7c3f42
+Create Date: 2026-10-19 17:40:08.271936
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f18c6d2e9a05'
+down_revision: Union[str, Sequence[str], None] = 'e5a19b7c3f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # random() is volatile, so Postgres evaluates it per existing row
+    op.add_column(
+        'questions',
+        sa.Column('random_key', sa.Float(), server_default=sa.text('random()'), nullable=False),
+    )
+    op.create_index(
+        'idx_questions_active_difficulty_random_key',
+        'questions',
+        ['is_active', 'difficulty', 'random_key'],
+        unique=False,
+    )
+    op.create_index('idx_questions_active_random_key', 'questions', ['is_active', 'random_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_questions_active_random_key', table_name='questions')
+    op.drop_index('idx_questions_active_difficulty_random_key', table_name='questions')
+    op.drop_column('questions', 'random_key')
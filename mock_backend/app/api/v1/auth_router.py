@@ -3,26 +3,32 @@ import logging
 import uuid
 from datetime import timedelta, datetime, timezone
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Depends, Form, UploadFile, File, BackgroundTasks, Request
+from fastapi import APIRouter, HTTPException, status, Depends, Form, UploadFile, File, BackgroundTasks, Request, Query
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 import secrets
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import pypdf
 import io
 
-from app.schemas.auth import TokenResponse, LoginRequest, CandidateResponse, AdminRegistrationRequest, AdminResponse, PaginatedCandidateResponse
+from app.schemas.auth import TokenResponse, LoginRequest, CandidateResponse, AdminRegistrationRequest, AdminResponse, PaginatedCandidateResponse, ReparseJobRequest
 from app.db.sql.session import get_db_session
 from app.db.sql.unit_of_work import UnitOfWork
 from app.db.sql.models.user import User, CandidateProfile, AdminProfile
 from app.db.sql.enums import UserRole
-from app.core.security import verify_password, create_access_token, get_password_hash
+from app.core.security import create_access_token, password_hasher
 from app.core.config import settings
 from app.services.email_service import email_service
 from app.services.admin_auth_service import AdminAuthSQLService
-from app.services.resume_tasks import parse_candidate_resume
+from app.services.resume_tasks import send_candidate_welcome_email
+from app.services.task_queue_service import task_queue_service
+from app.db.sql.pagination import TOTAL_MODES, MAX_PAGE_LIMIT, InvalidCursorError, list_total_cache
+from app.db.sql.repositories.user_repository import CANDIDATE_LIST_FIELDS, DEFAULT_CANDIDATE_LIST_FIELDS
+from app.services.principal_cache import Principal, principal_cache
+from app.services.candidate_import_service import candidate_import_service
+from app.services.reparse_job_service import reparse_job_service
+from app.services.dashboard_stats_service import dashboard_stats_service
 
 logger = logging.getLogger(__name__)
 CANDIDATE_MATERIALS_COLLECTION = "candidate_materials"
@@ -42,14 +48,8 @@ async def get_token_from_header(request: Request) -> Optional[str]:
 async def get_current_user_from_request(
     request: Request,
     session: AsyncSession = Depends(get_db_session)
-) -> User:
+) -> Principal:
     """Get current user from request - works with both JSON and FormData."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
     # Try to get token from header first (works with FormData)
     token = await get_token_from_header(request)
     
@@ -60,27 +60,8 @@ async def get_current_user_from_request(
     
     if not token:
         logger.warning(f"Authentication failed: No token found in request headers")
-        raise credentials_exception
     
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id_str: str = payload.get("sub")
-        if user_id_str is None:
-            raise credentials_exception
-            
-        try:
-            user_id = uuid.UUID(user_id_str)
-        except ValueError:
-            raise credentials_exception
-            
-    except JWTError:
-        raise credentials_exception
-    
-    async with UnitOfWork(session) as uow:
-        user = await uow.users.get_by_id(user_id)
-        if user is None:
-            raise credentials_exception
-        return user
+    return await principal_cache.authenticate(session, token)
 
 async def get_current_active_user_from_request(
     current_user: User = Depends(get_current_user_from_request)
@@ -105,31 +86,9 @@ def validate_uuid(id_str: str) -> uuid.UUID:
             detail=f"Invalid UUID: {id_str}",
         )
 
-async def get_current_user(token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_db_session)):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id_str: str = payload.get("sub")
-        if user_id_str is None:
-            raise credentials_exception
-            
-        try:
-            user_id = uuid.UUID(user_id_str)
-        except ValueError:
-            raise credentials_exception
-            
-    except JWTError:
-        raise credentials_exception
-    
-    async with UnitOfWork(session) as uow:
-        user = await uow.users.get_by_id(user_id)
-        if user is None:
-            raise credentials_exception
-        return user
+async def get_current_user(token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_db_session)) -> Principal:
+    """Principal behind the bearer token (cached per token; no query in the steady state)."""
+    return await principal_cache.authenticate(session, token)
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)):
     if not current_user.is_active:
@@ -167,8 +126,11 @@ async def login_admin(request: LoginRequest, session: AsyncSession = Depends(get
     try:
         async with UnitOfWork(session) as uow:
             user = await uow.users.get_by_username(request.username)
+            valid, new_hash = await password_hasher.verify_and_update(
+                request.password, user.hashed_password if user else None
+            )
             
-            if not user or not verify_password(request.password, user.hashed_password):
+            if not user or not valid:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Incorrect admin credentials",
@@ -180,6 +142,10 @@ async def login_admin(request: LoginRequest, session: AsyncSession = Depends(get
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="User is not an admin",
                 )
+
+            # Hash was made with older Argon2 parameters: store the upgraded one
+            if new_hash:
+                user.hashed_password = new_hash
         
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
@@ -206,8 +172,11 @@ async def login_candidate(request: LoginRequest, session: AsyncSession = Depends
     try:
         async with UnitOfWork(session) as uow:
             user = await uow.users.get_by_username(request.username)
+            valid, new_hash = await password_hasher.verify_and_update(
+                request.password, user.hashed_password if user else None
+            )
             
-            if not user or not verify_password(request.password, user.hashed_password):
+            if not user or not valid:
                  raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Incorrect candidate credentials",
@@ -225,6 +194,10 @@ async def login_candidate(request: LoginRequest, session: AsyncSession = Depends
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Login has been disabled for this account. Please contact the administrator."
                 )
+
+            # Hash was made with older Argon2 parameters: store the upgraded one
+            if new_hash:
+                user.hashed_password = new_hash
         
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
@@ -286,7 +259,7 @@ async def admin_register_candidate(
              raise HTTPException(status_code=400, detail="Job description exceeds the maximum length of 5 pages (approx 2500 words).")
     
         password = secrets.token_urlsafe(12)
-        hashed_password = get_password_hash(password)
+        hashed_password = await password_hasher.hash(password)
         
         resume_id = secrets.token_hex(8)
         
@@ -341,14 +314,22 @@ async def admin_register_candidate(
         # Flush to get the ID for response
         await uow.flush()
         
-        # Always add background task for parsing and email
+        # Parsing goes on the durable queue (committed with the candidate); the welcome
+        # email carries the plaintext password so it stays an in-process background task
+        await task_queue_service.enqueue(
+            session,
+            "parse_candidate_resume",
+            {"candidate_id": str(new_user.id)},
+            idempotency_key=f"parse-resume:{new_user.id}",
+        )
         if background_tasks:
-            background_tasks.add_task(parse_candidate_resume, new_user.id, password)
+            background_tasks.add_task(send_candidate_welcome_email, new_user.id, password)
         else:
             logger.warning(f"BackgroundTasks not available for candidate {new_user.id}")
         
         # logger credentials to terminal for local dev visibility
         logger.info(f"\n[REGISTRATION] Registered User: {username} | Password: {password}\n")
+        list_total_cache.invalidate("candidates")
         
         return CandidateResponse(
             id=str(new_user.id),
@@ -362,98 +343,94 @@ async def admin_register_candidate(
             password=password
         )
 
-@router.get("/admin/candidates", response_model=PaginatedCandidateResponse)
+@router.post("/admin/candidates/import", status_code=status.HTTP_202_ACCEPTED)
+async def import_candidates(
+    manifest: UploadFile = File(...),
+    resumes: UploadFile = File(...),
+    job_description: str = Form(""),
+    current_admin: User = Depends(get_current_admin_from_request),
+):
+    """
+    Bulk-register candidates. `manifest` is a CSV with columns name, email, resume (file
+    name inside the `resumes` zip) and optionally job_description (defaults to the
+    `job_description` field). Returns a job to poll at GET /admin/candidates/import/{job_id}.
+    """
+    job = await candidate_import_service.start(manifest, resumes, job_description, current_admin.id)
+    logger.info(f"Admin {current_admin.username} (ID: {current_admin.id}) started candidate import {job['job_id']} ({job['total_rows']} rows)")
+    return job
+
+@router.get("/admin/candidates/import/{job_id}")
+async def get_candidate_import(
+    job_id: str,
+    since: int = 0,
+    current_admin: User = Depends(get_current_admin),
+):
+    """Import progress; per-row results start at index `since` (use the previous `next_since`)."""
+    progress = await candidate_import_service.get_progress(job_id, since)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return progress
+
+@router.get("/admin/candidates",response_model=PaginatedCandidateResponse, response_model_exclude_unset=True)
 async def get_all_candidates(
-    limit: int = 10,
-    offset: int = 0,
+    limit: int = Query(10, ge=1, le=MAX_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     search: str = "",
     sort_by: str = "created_at",
     order: str = "desc",
+    cursor: Optional[str] = None,
+    total: str = "exact",
+    fields: Optional[str] = None,
     current_admin: User = Depends(get_current_admin),
     session: AsyncSession = Depends(get_db_session)
 ):
+    """
+    Candidates page. Pass the previous response's `next_cursor` as `cursor` for keyset
+    paging on (sort_by, id); `total` is exact, cached or none. `fields` is a comma-separated
+    subset of the list columns (id is always included); resume_json / jd_json are only
+    returned by GET /admin/candidates/{candidate_id}.
+    """
+    if total not in TOTAL_MODES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"total must be one of {', '.join(TOTAL_MODES)}")
+    selected_fields = list(DEFAULT_CANDIDATE_LIST_FIELDS)
+    if fields:
+        requested = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in requested if f not in CANDIDATE_LIST_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown or detail-only fields: {', '.join(unknown)}. Allowed: {', '.join(CANDIDATE_LIST_FIELDS)}",
+            )
+        selected_fields = ["id"] + [f for f in dict.fromkeys(requested) if f != "id"]
     try:
-        from sqlalchemy.orm import selectinload
-        from sqlalchemy import func, or_, nulls_last
-        from app.db.sql.models.user import CandidateProfile
-        
         async with UnitOfWork(session) as uow:
-            # Base query
-            query = select(User).where(User.role == UserRole.CANDIDATE)
-            
-            # Apply search
-            if search:
-                search_term = f"%{search}%"
-                query = query.outerjoin(User.candidate_profile).where(
-                    or_(
-                        User.username.ilike(search_term),
-                        User.email.ilike(search_term),
-                        CandidateProfile.first_name.ilike(search_term),
-                        CandidateProfile.last_name.ilike(search_term),
-                    )
+            try:
+                page = await uow.users.list_candidates_page(
+                    limit=limit,
+                    cursor=cursor,
+                    offset=offset,
+                    search=search,
+                    sort_by=sort_by,
+                    order=order,
+                    total_mode=total,
+                    fields=selected_fields,
                 )
-
-            # Apply sorting
-            sort_field = User.created_at
-            if sort_by == "match_score":
-                query = query.outerjoin(User.candidate_profile)
-                sort_field = CandidateProfile.match_score
-            elif sort_by == "username":
-                sort_field = User.username
-
-            if order == "desc":
-                query = query.order_by(nulls_last(sort_field.desc()))
-            else:
-                query = query.order_by(nulls_last(sort_field.asc()))
-
-            # Eagerly load candidate_profile to avoid lazy loading issues
-            stmt = query.options(selectinload(User.candidate_profile)).offset(offset).limit(limit)
-            result = await session.execute(stmt)
-            users = result.scalars().all()
-            
-            # Count total
-            count_stmt = select(func.count(User.id)).where(User.role == UserRole.CANDIDATE)
-            if search:
-                count_stmt = count_stmt.outerjoin(User.candidate_profile).where(
-                    or_(
-                        User.username.ilike(search_term),
-                        User.email.ilike(search_term),
-                        CandidateProfile.first_name.ilike(search_term),
-                        CandidateProfile.last_name.ilike(search_term),
-                    )
-                )
-            
-            total_result = await session.execute(count_stmt)
-            total = total_result.scalar() or 0
+            except InvalidCursorError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
             
             candidates = []
-            for u in users:
-                job_desc = None
-                if u.candidate_profile:
-                    job_desc = u.candidate_profile.job_description
-                
-                c = CandidateResponse(
-                    id=str(u.id),
-                    username=u.username,
-                    email=u.email,
-                    is_active=u.is_active,
-                    login_disabled=u.login_disabled,
-                    created_at=u.created_at,
-                    job_description=job_desc or "",
-                    role_name=u.candidate_profile.role_name if u.candidate_profile else None,
-                    parse_status=u.candidate_profile.parse_status if u.candidate_profile else None,
-                    parsed_at=u.candidate_profile.parsed_at if u.candidate_profile else None,
-                    resume_json=u.candidate_profile.resume_json if u.candidate_profile else None,
-                    jd_json=u.candidate_profile.jd_json if u.candidate_profile else None,
-                    match_score=u.candidate_profile.match_score if u.candidate_profile else None
-                )
-                candidates.append(c)
+            for row in page["data"]:
+                row["id"] = str(row["id"])
+                if "job_description" in row:
+                    row["job_description"] = row["job_description"] or ""
+                candidates.append(row)
                 
             return {
                 "data": candidates,
-                "total": total,
+                "total": page["total"],
                 "limit": limit,
-                "offset": offset
+                "offset": offset,
+                "next_cursor": page["next_cursor"],
             }
     except HTTPException:
         raise
@@ -464,6 +441,35 @@ async def get_all_candidates(
             detail=f"Failed to fetch candidates: {str(e)}"
         )
 
+@router.get("/admin/candidates/{candidate_id}", response_model=CandidateResponse)
+async def get_candidate_detail(
+    candidate_id: str,
+    current_admin: User = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Full candidate record, including the parsed resume_json / jd_json."""
+    valid_id = validate_uuid(candidate_id)
+    async with UnitOfWork(session) as uow:
+        u = await uow.users.get_by_id(valid_id)
+        if not u or u.role != UserRole.CANDIDATE:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Candidate not found")
+        profile = u.candidate_profile
+        return CandidateResponse(
+            id=str(u.id),
+            username=u.username,
+            email=u.email,
+            is_active=u.is_active,
+            login_disabled=u.login_disabled,
+            created_at=u.created_at,
+            job_description=(profile.job_description if profile else None) or "",
+            role_name=profile.role_name if profile else None,
+            parse_status=profile.parse_status if profile else None,
+            parsed_at=profile.parsed_at if profile else None,
+            resume_json=profile.resume_json if profile else None,
+            jd_json=profile.jd_json if profile else None,
+            match_score=profile.match_score if profile else None
+        )
+
 @router.post("/admin/candidates/{candidate_id}/toggle-login")
 async def toggle_candidate_login(
     candidate_id: str, 
@@ -484,6 +490,8 @@ async def toggle_candidate_login(
         new_status = not user.login_disabled
         user.login_disabled = new_status
         user.updated_at = datetime.now(timezone.utc)
+        await uow.commit()
+        principal_cache.invalidate_user(user.id)
         
         return {
             "message": f"Candidate login has been {'disabled' if new_status else 'enabled'}",
@@ -495,7 +503,6 @@ async def toggle_candidate_login(
 @router.post("/admin/candidates/{user_id}/reparse-resume", status_code=status.HTTP_202_ACCEPTED)
 async def reparse_resume(
     user_id: str,
-    background_tasks: BackgroundTasks,
     current_admin: User = Depends(get_current_admin),
     session: AsyncSession = Depends(get_db_session)
 ):
@@ -512,12 +519,57 @@ async def reparse_resume(
         user.candidate_profile.parse_status = "pending"
         user.candidate_profile.updated_at = datetime.now(timezone.utc)
         
+        await task_queue_service.enqueue(
+            session,
+            "parse_candidate_resume",
+            {"candidate_id": str(user.id)},
+            idempotency_key=f"parse-resume:{user.id}",
+        )
         await session.commit()
         
-        background_tasks.add_task(parse_candidate_resume, user.id)
-        
         return {"message": "Reparsing background task initiated", "user_id": str(user.id)}
 
+@router.post("/admin/candidates/reparse-jobs", status_code=status.HTTP_202_ACCEPTED)
+async def create_reparse_job(
+    request: ReparseJobRequest,
+    current_admin: User = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_db_session)
+):
+    """
+    Re-parse every candidate matching the filters on the task queue. Candidates whose
+    resume/JD texts and parser versions are unchanged are skipped unless `force` is set.
+    """
+    job = await reparse_job_service.create_job(session, request, current_admin.id)
+    logger.info(f"Admin {current_admin.username} started reparse job {job.id} ({job.total} candidates)")
+    return await reparse_job_service.get_progress(session, job.id)
+
+@router.get("/admin/candidates/reparse-jobs/{job_id}")
+async def get_reparse_job(
+    job_id: str,
+    current_admin: User = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_db_session)
+):
+    return await reparse_job_service.get_progress(session, validate_uuid(job_id))
+
+@router.post("/admin/candidates/reparse-jobs/{job_id}/cancel")
+async def cancel_reparse_job(
+    job_id: str,
+    current_admin: User = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_db_session)
+):
+    job = await reparse_job_service.cancel(session, validate_uuid(job_id))
+    return await reparse_job_service.get_progress(session, job.id)
+
+@router.post("/admin/candidates/reparse-jobs/{job_id}/resume", status_code=status.HTTP_202_ACCEPTED)
+async def resume_reparse_job(
+    job_id: str,
+    current_admin: User = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Continue a cancelled or stalled job from its checkpoint."""
+    job = await reparse_job_service.resume(session, validate_uuid(job_id))
+    return await reparse_job_service.get_progress(session, job.id)
+
 @router.get("/admin/candidates/{user_id}/resume-file")
 async def get_candidate_resume_file(
     user_id: str,
@@ -570,4 +622,9 @@ async def admin_delete_candidate(
 ):
     """Delete a candidate and all associated data."""
     await AdminAuthSQLService.delete_candidate(session, candidate_id)
+    principal_cache.invalidate_user(candidate_id)
+    list_total_cache.invalidate("candidates")
+    list_total_cache.invalidate("interviews")
+    # The candidate's interviews went with them
+    dashboard_stats_service.invalidate()
     return None
@@ -10,12 +10,14 @@ from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.auth_router import get_current_active_user
+from app.core.config import settings
 from app.db.sql.session import get_db_session
 from app.db.sql.models.user import User
 from app.db.sql.enums import UserRole
 from app.db.sql.unit_of_work import UnitOfWork
 from app.services.face_service import face_service
 from app.services.speech_service import speech_service
+from app.services.upload_storage import stream_upload, IMAGE_KINDS, VOICE_RECORDING_KINDS
 
 router = APIRouter()
 
@@ -46,10 +48,9 @@ async def upload_face(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File must be an image (e.g. image/jpeg, image/png)",
         )
-    image_bytes = await photo.read()
-    if len(image_bytes) == 0:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty image")
-    ref_id, path_or_azure_id = face_service.enroll_face(candidate_id, image_bytes, content_type)
+    ref_id, path = face_service.new_sample_path(candidate_id, content_type)
+    await stream_upload(photo, str(path), IMAGE_KINDS, settings.UPLOAD_MAX_IMAGE_BYTES, "Image")
+    ref_id, path_or_azure_id = face_service.enroll_face_file(candidate_id, ref_id, path, content_type)
     
     async with UnitOfWork(session) as uow:
         candidate = await uow.users.get_by_id(current_candidate.id)
@@ -88,10 +89,9 @@ async def upload_voice(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File must be an audio recording (e.g. audio/webm, audio/wav)",
         )
-    audio_bytes = await audio.read()
-    if len(audio_bytes) == 0:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty audio")
-    ref_id, path_or_azure_id = speech_service.enroll_voice(candidate_id, audio_bytes, content_type)
+    ref_id, path = speech_service.new_sample_path(candidate_id, content_type)
+    await stream_upload(audio, str(path), VOICE_RECORDING_KINDS, settings.UPLOAD_MAX_AUDIO_BYTES, "Audio")
+    ref_id, path_or_azure_id = speech_service.enroll_voice_file(candidate_id, ref_id, path, content_type)
     
     async with UnitOfWork(session) as uow:
         candidate = await uow.users.get_by_id(current_candidate.id)
@@ -1,50 +1,34 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, distinct
+from sqlalchemy import select
 from typing import Dict, Optional
-from jose import JWTError, jwt
 from fastapi.security import OAuth2PasswordBearer
 
 from app.db.sql.session import get_db_session
-from app.db.sql.unit_of_work import UnitOfWork
 from app.db.sql.models.interview import Interview
 from app.db.sql.models.user import User
-from app.db.sql.enums import InterviewStatus, UserRole
+from app.db.sql.enums import UserRole
 from app.core.config import settings
+from app.core.security import password_hasher
 from app.services.report_generation_service import report_generation_service
+from app.services.task_queue_service import task_queue_service
+from app.services.dashboard_stats_service import dashboard_stats_service
+from app.services.principal_cache import principal_cache
+from app.services.pdf_extraction import pdf_extraction_pool
+from app.services.parse_cache_service import parse_cache_service
+from app.services.azure_openai_service import azure_openai_service
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 async def get_current_admin_from_token(token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_db_session)):
     """Get current admin user from token - extracted to avoid circular import."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id_str: str = payload.get("sub")
-        if user_id_str is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    async with UnitOfWork(session) as uow:
-        import uuid
-        try:
-            user_id = uuid.UUID(user_id_str)
-        except ValueError:
-            raise credentials_exception
-        user = await uow.users.get_by_id(user_id)
-        if user is None:
-            raise credentials_exception
-        if user.role != UserRole.ADMIN:
-            raise HTTPException(status_code=403, detail="The user doesn't have enough privileges")
-        if not user.is_active:
-            raise HTTPException(status_code=400, detail="Inactive user")
-        return user
+    user = await principal_cache.authenticate(session, token)
+    if user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="The user doesn't have enough privileges")
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return user
 
 router = APIRouter()
 
@@ -54,36 +38,60 @@ async def get_dashboard_stats(
     session: AsyncSession = Depends(get_db_session)
 ) -> Dict[str, int]:
     """
-    Get dashboard statistics using real database aggregates.
+    Get dashboard statistics from the trigger-maintained per-status interview counts.
     """
-    result_total = await session.execute(select(func.count(Interview.id)))
-    total_interviews = result_total.scalar() or 0
+    return await dashboard_stats_service.get_stats(session)
 
-    result_completed = await session.execute(select(func.count(Interview.id)).where(Interview.status == InterviewStatus.COMPLETED))
-    completed = result_completed.scalar() or 0
 
-    result_pending = await session.execute(select(func.count(Interview.id)).where(Interview.status == InterviewStatus.SCHEDULED))
-    pending_review = result_pending.scalar() or 0
+@router.get("/task-queue")
+async def get_task_queue_stats(
+    current_admin: User = Depends(get_current_admin_from_token),
+    session: AsyncSession = Depends(get_db_session)
+) -> Dict:
+    """
+    Background task queue health: depth, in-flight and dead tasks, and the age of the
+    oldest ready task per task type.
+    """
+    return await task_queue_service.get_stats(session)
 
-    result_candidates = await session.execute(select(func.count(distinct(Interview.candidate_id))))
-    total_candidates = result_candidates.scalar() or 0
 
-    # Count in_progress as pending
-    result_in_progress = await session.execute(select(func.count(Interview.id)).where(Interview.status == InterviewStatus.IN_PROGRESS))
-    in_progress = result_in_progress.scalar() or 0
-    
-    # Total pending = scheduled + in_progress
-    pending = pending_review + in_progress
-    
-    # Flagged interviews (not implemented yet, return 0)
-    flagged = 0
-    
-    return {
-        "total_interviews": total_interviews,
-        "completed": completed,
-        "pending": pending,
-        "flagged": flagged
-    }
+@router.get("/password-hashing")
+async def get_password_hashing_stats(
+    current_admin: User = Depends(get_current_admin_from_token),
+) -> Dict:
+    """
+    Password hashing pool health: workers, in-flight and queued hashes, rejections,
+    rehashes on login and queue wait times.
+    """
+    return password_hasher.stats()
+
+
+@router.get("/pdf-extraction")
+async def get_pdf_extraction_stats(
+    current_admin: User = Depends(get_current_admin_from_token),
+) -> Dict:
+    """Resume PDF extraction pool: workers, completed and failed documents, timeouts, pool restarts."""
+    return pdf_extraction_pool.stats()
+
+
+@router.get("/llm-endpoints")
+async def get_llm_endpoint_health(
+    current_admin: User = Depends(get_current_admin_from_token),
+) -> Dict:
+    """Azure OpenAI endpoints: circuit state, consecutive failures and p95 latency."""
+    return {"hedging": settings.LLM_HEDGE_ENABLED, "endpoints": azure_openai_service.get_endpoint_health()}
+
+
+@router.get("/parse-cache")
+async def get_parse_cache_stats(
+    current_admin: User = Depends(get_current_admin_from_token),
+    session: AsyncSession = Depends(get_db_session)
+) -> Dict:
+    """
+    Resume/JD parse cache: hit rates in this process and stored entries and lifetime hits
+    per kind.
+    """
+    return {**parse_cache_service.stats(), "stored": await parse_cache_service.db_stats(session)}
 
 
 @router.get("/interviews/{interview_id}/report")
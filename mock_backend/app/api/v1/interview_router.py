@@ -2,13 +2,14 @@
 Interview Router — Admin-only scheduling endpoints (Refactored for SQLAlchemy)
 ----------------------------------------------------
 POST   /admin/interviews/schedule          – Create a new scheduled interview
+GET    /admin/interviews/{id}/generation-status – Poll background question generation
 PUT    /admin/interviews/{id}/reschedule   – Move interview to a new datetime
 PUT    /admin/interviews/{id}/cancel       – Cancel a non-completed interview
 """
 
 import logging
 import uuid
-from fastapi import APIRouter, Depends, status, HTTPException, Query, Body
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Body, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
@@ -32,8 +33,10 @@ from app.schemas.interview_template import TemplatePreviewResponse
 
 logger = logging.getLogger(__name__)
 from app.services.interview_admin_sql_service import InterviewAdminSQLService
+from app.db.sql.pagination import MAX_PAGE_LIMIT
 from app.services.interview_session_sql_service import InterviewSessionSQLService
 from app.services.template_engine import template_engine
+from app.services.dashboard_stats_service import dashboard_stats_service
 from app.db.sql.enums import InterviewStatus
 from app.db.sql.unit_of_work import UnitOfWork
 
@@ -142,6 +145,7 @@ async def preview_template(
             curated_questions=curated_questions
         )
         await session.commit()
+        dashboard_stats_service.invalidate()
         logger.info(f"Successfully created and committed DRAFT interview {draft.id} for candidate {validated_cid}.")
         
         return {
@@ -187,9 +191,15 @@ async def regenerate_question(
     response_model=ScheduleInterviewResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Schedule a new interview for a candidate",
+    description=(
+        "Admin-only. Scheduling from a DRAFT returns 201 with its questions. Otherwise the "
+        "interview is accepted (202) and questions are generated in the background; poll "
+        "GET /{interview_id}/generation-status until generation_status is 'ready'."
+    ),
 )
 async def schedule_interview(
     request: ScheduleInterviewRequest,
+    response: Response,
     current_admin: User = Depends(get_current_admin),
     session: AsyncSession = Depends(get_db_session),
 ):
@@ -206,6 +216,8 @@ async def schedule_interview(
         questions=request.questions,
         draft_interview_id=draft_interview_id
     )
+    if interview.generation_status == "pending":
+        response.status_code = status.HTTP_202_ACCEPTED
     
     return {
         "id": str(interview.id),
@@ -215,25 +227,45 @@ async def schedule_interview(
         "status": interview.status.value if isinstance(interview.status, InterviewStatus) else interview.status,
         "scheduled_at": interview.scheduled_at,
         "curated_questions": interview.curated_questions,
+        "generation_status": interview.generation_status,
         "created_at": interview.created_at,
     }
 
+
+@router.get(
+    "/{interview_id}/generation-status",
+    summary="Poll background question generation for a scheduled interview",
+)
+async def get_generation_status(
+    interview_id: str,
+    current_admin: User = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_db_session),
+):
+    validated_iid = validate_uuid(interview_id)
+    return await InterviewAdminSQLService.get_generation_status(session, validated_iid)
+
 @router.get(
     "/summary",
     summary="Get a lightweight summary of all interviews",
     description=(
         "Admin-only. Returns candidate_id, interview_id, status, and scheduled_at "
-        "for every interview. Excludes curated_questions for performance."
+        "for every interview. Excludes curated_questions for performance. "
+        "Pass the previous page's next_cursor as `cursor` for keyset paging; "
+        "`total` is exact, cached or none."
     ),
 )
 async def get_interview_summary(
-    limit: int = 10,
-    offset: int = 0,
+    limit: int = Query(10, ge=1, le=MAX_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
     search: str = "",
+    cursor: Optional[str] = None,
+    total: str = "exact",
     current_admin: User = Depends(get_current_admin),
     session: AsyncSession = Depends(get_db_session),
 ):
-    result = await InterviewAdminSQLService.get_interview_summary(session, limit, offset, search)
+    result = await InterviewAdminSQLService.get_interview_summary(
+        session, limit, offset, search, cursor=cursor, total_mode=total
+    )
     data = [
         {
             "interview_id": str(s["interview_id"]),
@@ -248,7 +280,8 @@ async def get_interview_summary(
         "data": data,
         "total": result["total"],
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": result["next_cursor"],
     }
 
 
@@ -6,6 +6,7 @@ from sqlalchemy import select, update
 
 from app.db.sql.session import get_db_session
 from app.db.sql.models.interview_template import InterviewTemplate
+from app.services.template_config_cache import template_config_cache
 from app.schemas.interview import (
     InterviewTemplateCreate,
     InterviewTemplateUpdate,
@@ -76,6 +77,7 @@ async def create_template(
         )
     
     await db.commit()
+    template_config_cache.invalidate(new_template.id)
     await db.refresh(new_template)
     return new_template
 
@@ -104,6 +106,7 @@ async def update_template(
         )
         
     await db.commit()
+    template_config_cache.invalidate(template.id)
     await db.refresh(template)
     return template
 
@@ -119,6 +122,7 @@ async def delete_template(
     
     template.is_active = False
     await db.commit()
+    template_config_cache.invalidate(template.id)
     return None
 
 @router.patch("/{template_id}/activate", response_model=InterviewTemplateResponse)
@@ -134,5 +138,6 @@ async def toggle_template_activation(
     
     template.is_active = is_active
     await db.commit()
+    template_config_cache.invalidate(template.id)
     await db.refresh(template)
     return template
@@ -12,11 +12,13 @@ from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File,
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.auth_router import get_current_active_user
+from app.core.config import settings
 from app.db.sql.session import get_db_session
 from app.db.sql.unit_of_work import UnitOfWork
 from app.db.sql.models.user import User, CandidateProfile
 from app.db.sql.enums import UserRole
 from app.services.azure_verification_service import azure_verification_service
+from app.services.upload_storage import stream_upload, IMAGE_KINDS, AUDIO_KINDS, VIDEO_KINDS
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,13 @@ async def upload_face_sample(
     """
     Upload a face sample photo. This will be used for face verification during the interview.
     """
+    # Validate image format before receiving any data
+    if not photo.content_type or photo.content_type not in ["image/jpeg", "image/png", "image/jpg"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid image format. Please upload JPEG or PNG image."
+        )
+
     async with UnitOfWork(session) as uow:
         candidate = await uow.users.get_by_id(current_candidate.id)
         if not candidate or not candidate.candidate_profile:
@@ -61,23 +70,11 @@ async def upload_face_sample(
             )
         candidate_profile = candidate.candidate_profile
         
-        # Read image data
-        image_data = await photo.read()
-        
-        # Validate image format
-        if not photo.content_type or photo.content_type not in ["image/jpeg", "image/png", "image/jpg"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid image format. Please upload JPEG or PNG image."
-            )
-        
-        # Save file locally
+        # Stream file to disk
         file_id = str(uuid.uuid4())
         file_extension = "jpg" if "jpeg" in photo.content_type or "jpg" in photo.content_type else "png"
         file_path = os.path.join(VERIFICATION_UPLOAD_DIR, f"{current_candidate.id}_face_{file_id}.{file_extension}")
-        
-        with open(file_path, "wb") as f:
-            f.write(image_data)
+        stored = await stream_upload(photo, file_path, IMAGE_KINDS, settings.UPLOAD_MAX_IMAGE_BYTES, "Photo")
         
         # Create or get Azure Face person
         if not candidate_profile.face_verification_id:
@@ -102,7 +99,7 @@ async def upload_face_sample(
         if candidate_profile.face_verification_id:
             persisted_face_id = await azure_verification_service.add_face_sample(
                 candidate_profile.face_verification_id,
-                image_data
+                await stored.read_bytes()
             )
             mode = "detection-only" if is_detection_only else "full verification"
             if persisted_face_id or is_detection_only:
@@ -118,7 +115,8 @@ async def upload_face_sample(
             "success": True,
             "message": "Face sample uploaded successfully",
             "face_verified": candidate_profile.face_verified,
-            "face_sample_url": candidate_profile.face_sample_url
+            "face_sample_url": candidate_profile.face_sample_url,
+            "sha256": stored.sha256,
         }
 
 
@@ -131,6 +129,13 @@ async def upload_video_sample(
     """
     Upload a video sample. This will be used for face verification during the interview.
     """
+    # Validate video format before receiving any data
+    if not video.content_type or video.content_type not in ["video/mp4", "video/webm", "video/quicktime"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid video format. Please upload MP4 or WebM video."
+        )
+
     async with UnitOfWork(session) as uow:
         candidate = await uow.users.get_by_id(current_candidate.id)
         if not candidate or not candidate.candidate_profile:
@@ -140,23 +145,11 @@ async def upload_video_sample(
             )
         candidate_profile = candidate.candidate_profile
         
-        # Read video data
-        video_data = await video.read()
-        
-        # Validate video format
-        if not video.content_type or video.content_type not in ["video/mp4", "video/webm", "video/quicktime"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid video format. Please upload MP4 or WebM video."
-            )
-        
-        # Save file locally
+        # Stream file to disk
         file_id = str(uuid.uuid4())
         file_extension = "mp4" if "mp4" in video.content_type else "webm"
         file_path = os.path.join(VERIFICATION_UPLOAD_DIR, f"{current_candidate.id}_video_{file_id}.{file_extension}")
-        
-        with open(file_path, "wb") as f:
-            f.write(video_data)
+        stored = await stream_upload(video, file_path, VIDEO_KINDS, settings.UPLOAD_MAX_VIDEO_BYTES, "Video")
         
         # Extract frame from video for face verification (simplified - in production, use video processing)
         # For now, we'll just store the video
@@ -167,7 +160,8 @@ async def upload_video_sample(
         return {
             "success": True,
             "message": "Video sample uploaded successfully",
-            "video_sample_url": candidate_profile.video_sample_url
+            "video_sample_url": candidate_profile.video_sample_url,
+            "sha256": stored.sha256,
         }
 
 
@@ -180,6 +174,22 @@ async def upload_voice_sample(
     """
     Upload a voice sample. This will be used for voice verification during the interview.
     """
+    # Validate audio format before receiving any data - accept WebM (browser default), WAV, and MP3
+    valid_audio_types = [
+        "audio/wav", "audio/wave", "audio/mpeg", "audio/mp3",
+        "audio/webm", "audio/webm;codecs=opus", "audio/ogg", "audio/ogg;codecs=opus"
+    ]
+    
+    # Also check filename extension as fallback
+    filename_lower = audio.filename.lower() if audio.filename else ""
+    is_valid_by_extension = any(filename_lower.endswith(ext) for ext in [".wav", ".mp3", ".webm", ".ogg"])
+    
+    if not audio.content_type or (audio.content_type not in valid_audio_types and not is_valid_by_extension):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid audio format. Received: {audio.content_type}. Please upload WAV, MP3, or WebM audio."
+        )
+
     async with UnitOfWork(session) as uow:
         candidate = await uow.users.get_by_id(current_candidate.id)
         if not candidate or not candidate.candidate_profile:
@@ -189,25 +199,6 @@ async def upload_voice_sample(
             )
         candidate_profile = candidate.candidate_profile
         
-        # Read audio data
-        audio_data = await audio.read()
-        
-        # Validate audio format - accept WebM (browser default), WAV, and MP3
-        valid_audio_types = [
-            "audio/wav", "audio/wave", "audio/mpeg", "audio/mp3",
-            "audio/webm", "audio/webm;codecs=opus", "audio/ogg", "audio/ogg;codecs=opus"
-        ]
-        
-        # Also check filename extension as fallback
-        filename_lower = audio.filename.lower() if audio.filename else ""
-        is_valid_by_extension = any(filename_lower.endswith(ext) for ext in [".wav", ".mp3", ".webm", ".ogg"])
-        
-        if not audio.content_type or (audio.content_type not in valid_audio_types and not is_valid_by_extension):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid audio format. Received: {audio.content_type}. Please upload WAV, MP3, or WebM audio."
-            )
-        
         # Save file locally - determine extension from content type or filename
         file_id = str(uuid.uuid4())
         if "webm" in audio.content_type or filename_lower.endswith(".webm"):
@@ -219,9 +210,7 @@ async def upload_voice_sample(
         else:
             file_extension = "mp3"  # default fallback
         file_path = os.path.join(VERIFICATION_UPLOAD_DIR, f"{current_candidate.id}_voice_{file_id}.{file_extension}")
-        
-        with open(file_path, "wb") as f:
-            f.write(audio_data)
+        stored = await stream_upload(audio, file_path, AUDIO_KINDS, settings.UPLOAD_MAX_AUDIO_BYTES, "Audio")
         
         # Create or get Azure Speech profile
         if not candidate_profile.voice_profile_id:
@@ -245,7 +234,7 @@ async def upload_voice_sample(
             # For now, we'll attempt enrollment (Azure may accept or reject based on format)
             enrollment_success = await azure_verification_service.enroll_voice_sample(
                 candidate_profile.voice_profile_id,
-                audio_data,
+                await stored.read_bytes(),
                 content_type=audio.content_type or "audio/webm"
             )
             mode = "detection-only" if is_detection_only_voice else "full verification"
@@ -262,7 +251,8 @@ async def upload_voice_sample(
             "success": True,
             "message": "Voice sample uploaded successfully",
             "voice_verified": candidate_profile.voice_verified,
-            "voice_sample_url": candidate_profile.voice_sample_url
+            "voice_sample_url": candidate_profile.voice_sample_url,
+            "sha256": stored.sha256,
         }
 
 
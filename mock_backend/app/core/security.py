@@ -1,11 +1,22 @@
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union, Any
+from typing import Optional, Union, Any, Callable, Dict, Tuple
+from fastapi import HTTPException, status
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
 # Password hashing context - using Argon2
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -19,6 +30,95 @@ def get_password_hash(password: str) -> str:
     """
     return pwd_context.hash(password)
 
+
+class PasswordHasher:
+    """
+    Runs Argon2 on a small dedicated thread pool so request handlers await it instead of
+    blocking the event loop (argon2-cffi releases the GIL while hashing). At most
+    `max_pending` operations may be running or queued; further requests get 503 rather
+    than piling up behind a login burst.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+
+    async def _run(self, fn: Callable, *args):
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-in requests right now. Please try again in a moment.",
+                headers={"Retry-After": "1"},
+            )
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+
+        def timed():
+            started = time.perf_counter()
+            return fn(*args), started, time.perf_counter()
+
+        self._pending += 1
+        submitted = time.perf_counter()
+        try:
+            result, started, finished = await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        finally:
+            self._pending -= 1
+        wait = started - submitted
+        self.completed += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+        self._run_total += finished - started
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """
+        (valid, new_hash). new_hash is set when the stored hash uses outdated Argon2
+        parameters and should replace it.
+        """
+        if not hashed_password:
+            return False, None
+        valid, new_hash = await self._run(pwd_context.verify_and_update, password, hashed_password)
+        if valid and new_hash:
+            self.rehashed += 1
+        return valid, new_hash
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": min(self._pending, self.workers),
+            "queued": max(0, self._pending - self.workers),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+            "avg_queue_wait_ms": round(self._wait_total / self.completed * 1000, 2) if self.completed else 0.0,
+            "max_queue_wait_ms": round(self._wait_max * 1000, 2),
+            "avg_hash_ms": round(self._run_total / self.completed * 1000, 2) if self.completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
 def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -27,7 +127,8 @@ def create_access_token(subject: Union[str, Any], expires_delta: Optional[timede
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode = {"exp": expire, "sub": str(subject)}
+
+    # jti identifies the token in the principal cache
+    to_encode = {"exp": expire, "sub": str(subject), "jti": uuid.uuid4().hex}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
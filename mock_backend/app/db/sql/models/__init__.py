@@ -1,13 +1,18 @@
 from app.db.sql.base import Base
 from app.db.sql.models.user import User, AdminProfile, CandidateProfile
 from app.db.sql.models.interview_template import InterviewTemplate
-from app.db.sql.models.interview import Interview
+from app.db.sql.models.interview import Interview, InterviewStatusCount
 from app.db.sql.models.interview_session import InterviewSession
 from app.db.sql.models.interview_session_question import InterviewSessionQuestion
 from app.db.sql.models.interview_session_section import InterviewSessionSection
 from app.db.sql.models.interview_response import InterviewResponse
-from app.db.sql.models.question import Question, DifficultyEnum, CategoryEnum, QuestionType
+from app.db.sql.models.question import Question, QuestionBankVersion, DifficultyEnum, CategoryEnum, QuestionType
 from app.db.sql.models.coding_problem import CodingProblem, TestCase, CodeSubmission
+from app.db.sql.models.question_pool import PooledQuestion
+from app.db.sql.models.task_queue import QueuedTask
+from app.db.sql.models.parse_cache import ParseCacheEntry
+from app.db.sql.models.reparse_job import ReparseJob
+from app.db.sql.models.candidate_import import CandidateImportJob, CandidateImportRow
 
 __all__ = [
     "Base",
@@ -16,15 +21,23 @@ __all__ = [
     "CandidateProfile",
     "InterviewTemplate",
     "Interview",
+    "InterviewStatusCount",
     "InterviewSession",
     "InterviewSessionSection",
     "InterviewSessionQuestion",
     "InterviewResponse",
     "Question",
+    "QuestionBankVersion",
     "DifficultyEnum",
     "CategoryEnum",
     "QuestionType",
     "CodingProblem",
     "TestCase",
     "CodeSubmission",
+    "PooledQuestion",
+    "QueuedTask",
+    "ParseCacheEntry",
+    "ReparseJob",
+    "CandidateImportJob",
+    "CandidateImportRow",
 ]
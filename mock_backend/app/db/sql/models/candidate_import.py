@@ -0,0 +1,51 @@
+import uuid
+import datetime
+from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.sql.base import Base
+
+class CandidateImportJob(Base):
+    """
+    Bulk candidate import from a CSV manifest and a zip of resumes, run as one queued
+    task. Both uploads are kept under `workdir` (shared uploads directory) until the job
+    finishes; `checkpoint_line` is committed with each batch, so a retried task continues
+    after the last committed manifest line.
+    """
+    __tablename__ = "candidate_import_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    # queued -> running -> completed | failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued", server_default="queued")
+    workdir: Mapped[str] = mapped_column(String(512), nullable=False)
+    default_job_description: Mapped[str] = mapped_column(Text, nullable=False, default="", server_default="")
+    checkpoint_line: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    total_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    created: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    error: Mapped[str] = mapped_column(Text, nullable=True)
+
+    created_by: Mapped[uuid.UUID] = mapped_column(nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class CandidateImportRow(Base):
+    """Result of one manifest row (`row` is its CSV line number), committed with its batch."""
+    __tablename__ = "candidate_import_rows"
+    __table_args__ = (
+        Index("ix_candidate_import_rows_job_row", "job_id", "row", unique=True),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    job_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("candidate_import_jobs.id", ondelete="CASCADE"), nullable=False)
+    row: Mapped[int] = mapped_column(Integer, nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    # created | failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    error: Mapped[str] = mapped_column(Text, nullable=True)
+    candidate_id: Mapped[uuid.UUID] = mapped_column(nullable=True)
@@ -1,6 +1,6 @@
 import uuid
 import datetime
-from sqlalchemy import String, DateTime, Float, Enum, ForeignKey, JSON
+from sqlalchemy import String, DateTime, Float, Enum, ForeignKey, JSON, Index, BigInteger
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -31,6 +31,9 @@ class Interview(Base):
     candidate_feedback: Mapped[dict] = mapped_column(JSON, nullable=True)
     
     curated_questions: Mapped[list] = mapped_column(JSON, nullable=True)
+    # Questions are generated after scheduling is accepted: pending -> ready | failed
+    generation_status: Mapped[str] = mapped_column(String(20), nullable=False, default="ready", server_default="ready")
+    generation_error: Mapped[str] = mapped_column(String, nullable=True)
 
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -39,3 +42,20 @@ class Interview(Base):
     assigner: Mapped["User"] = relationship("User", foreign_keys=[assigned_by])
     template: Mapped["InterviewTemplate"] = relationship("InterviewTemplate", back_populates="interviews")
     sessions: Mapped[list["InterviewSession"]] = relationship("InterviewSession", back_populates="interview", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Keyset pagination of the admin interview summary (newest first)
+        Index("idx_interviews_created_at_id", "created_at", "id"),
+    )
+
+
+class InterviewStatusCount(Base):
+    """
+    Number of interviews per status, maintained by row-level triggers on `interviews`
+    (insert, delete, status change) so the admin dashboard reads a handful of rows
+    instead of aggregating the whole table. `status` holds the InterviewStatus name.
+    """
+    __tablename__ = "interview_status_counts"
+
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0", default=0)
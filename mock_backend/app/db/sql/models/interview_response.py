@@ -1,6 +1,6 @@
 import uuid
 import datetime
-from sqlalchemy import Text, String, Float, DateTime, ForeignKey, JSON
+from sqlalchemy import Text, String, Float, DateTime, ForeignKey, JSON, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,7 +10,7 @@ class InterviewResponse(Base):
     __tablename__ = "interview_responses"
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    session_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("interview_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    session_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("interview_sessions.id", ondelete="CASCADE"), nullable=False)
     question_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("interview_session_questions.id", ondelete="CASCADE"), nullable=False)
     
     answer_text: Mapped[str] = mapped_column(Text, nullable=True)
@@ -27,3 +27,8 @@ class InterviewResponse(Base):
     # Relationships
     session: Mapped["InterviewSession"] = relationship("InterviewSession")
     question: Mapped["InterviewSessionQuestion"] = relationship("InterviewSessionQuestion")
+
+    __table_args__ = (
+        # One response per session question; also the index for (session_id[, question_id]) lookups
+        UniqueConstraint("session_id", "question_id", name="uq_interview_responses_session_question"),
+    )
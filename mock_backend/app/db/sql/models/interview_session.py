@@ -1,7 +1,7 @@
 import uuid
 import datetime
 from typing import Optional
-from sqlalchemy import String, DateTime, Integer, ForeignKey
+from sqlalchemy import String, DateTime, Integer, Float, JSON, ForeignKey
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,7 +11,7 @@ class InterviewSession(Base):
     __tablename__ = "interview_sessions"
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    interview_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False)
+    interview_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False, index=True)
     candidate_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     current_section_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("interview_session_sections.id", use_alter=True, name="fk_session_current_section", ondelete="SET NULL"), nullable=True)
@@ -22,6 +22,16 @@ class InterviewSession(Base):
     completed_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
     
     answered_count: Mapped[int] = mapped_column(Integer, default=0)
+    # Bumped on every change to sections, questions or responses; validates cached session state
+    state_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    # Running aggregates over stored responses (maintained by session_aggregate_service)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default="0")
+    score_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    score_max: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    score_min: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    section_scores: Mapped[dict] = mapped_column(JSON, nullable=True)  # {section_id: {"sum": x, "count": n}}
+    feedback_sketch: Mapped[dict] = mapped_column(JSON, nullable=True)  # {"strengths": {text: n}, "weaknesses": {...}}
     
     # Verification tracking
     face_verification_alerts: Mapped[int] = mapped_column(Integer, default=0)  # Count of face mismatch alerts
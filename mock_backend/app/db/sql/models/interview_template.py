@@ -1,7 +1,7 @@
 import uuid
 import datetime
 from typing import Optional
-from sqlalchemy import String, Boolean, DateTime, JSON, Integer
+from sqlalchemy import String, Boolean, DateTime, JSON, Integer, literal_column
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,6 +18,10 @@ class InterviewTemplate(Base):
     is_default_for_role: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false")
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Bumped by every UPDATE of the row; keys the per-process TemplateConfigCache
+    config_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("config_version + 1")
+    )
 
     # Constraints
     max_duration_minutes: Mapped[int] = mapped_column(Integer, default=60, server_default="60")
@@ -0,0 +1,26 @@
+import datetime
+from sqlalchemy import String, Integer, JSON, DateTime
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.sql.base import Base
+
+class ParseCacheEntry(Base):
+    """
+    Structured LLM parse of a resume or job description text, shared by every candidate
+    whose text normalizes to the same hash. Bumping a parser's version stops old entries
+    from being read.
+    """
+    __tablename__ = "parse_cache"
+
+    # "resume" | "jd"
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    # sha256 of the whitespace-normalized text
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    parser_version: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    result: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_hit_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -1,7 +1,9 @@
 import uuid
 import datetime
 import enum
-from sqlalchemy import Text, JSON, Boolean, DateTime, Enum as SQLEnum, ForeignKey
+import random
+from sqlalchemy import Text, Float, Integer, BigInteger, Boolean, DateTime, Enum as SQLEnum, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -32,8 +34,10 @@ class Question(Base):
     text: Mapped[str] = mapped_column(Text, nullable=False)
     category: Mapped[CategoryEnum] = mapped_column(SQLEnum(CategoryEnum), nullable=False)
     difficulty: Mapped[DifficultyEnum] = mapped_column(SQLEnum(DifficultyEnum), nullable=False)
-    tags: Mapped[list[str]] = mapped_column(JSON, nullable=True) # Usually list[str] for tags
+    tags: Mapped[list[str]] = mapped_column(JSONB, nullable=True) # Usually list[str]; JSONB so tags @> '["x"]' uses the GIN index
     is_active: Mapped[bool] = mapped_column(Boolean, server_default="true", default=True)
+    # Uniform in [0, 1); index seeks on it replace ORDER BY random() (see question_sampler)
+    random_key: Mapped[float] = mapped_column(Float, nullable=False, default=random.random, server_default=func.random())
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     question_type: Mapped[QuestionType] = mapped_column(
@@ -45,3 +49,26 @@ class Question(Base):
         nullable=False,
         server_default="technical"
     )
+
+    __table_args__ = (
+        # Question-bank filters: active questions by difficulty / category / type
+        Index("idx_questions_active_difficulty_category_type", "is_active", "difficulty", "category", "question_type"),
+        # Random sampling seeks: per difficulty (template engine), per difficulty and category
+        # (templates with category_filters), per category (bank search) and over the whole active bank
+        Index("idx_questions_active_difficulty_random_key", "is_active", "difficulty", "random_key"),
+        Index("idx_questions_active_difficulty_category_random_key", "is_active", "difficulty", "category", "random_key"),
+        Index("idx_questions_active_category_random_key", "is_active", "category", "random_key"),
+        Index("idx_questions_active_random_key", "is_active", "random_key"),
+        Index("idx_questions_tags_gin", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+    )
+
+
+class QuestionBankVersion(Base):
+    """
+    Single-row change counter for the questions table, bumped by a statement-level
+    trigger; in-process question bank indexes compare it to decide when to reload.
+    """
+    __tablename__ = "question_bank_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0", default=0)
@@ -0,0 +1,32 @@
+import uuid
+import datetime
+from sqlalchemy import String, Integer, JSON, DateTime, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.sql.base import Base
+
+class PooledQuestion(Base):
+    """
+    An LLM-generated technical question stored for reuse across candidates that share
+    a role and JD skill set. `pool_key` is a hash of the role plus normalized skills.
+    """
+    __tablename__ = "question_pool"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    pool_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    role_name: Mapped[str] = mapped_column(String(255), nullable=True)
+    skills: Mapped[list[str]] = mapped_column(JSON, nullable=True)
+    difficulty: Mapped[str] = mapped_column(String(20), nullable=False, default="medium")
+
+    # Question dict in the curated-questions format (prompt, category, answer_mode, ...)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    # Number of interviews this question has been served to; retired at QUESTION_POOL_MAX_EXPOSURE
+    exposure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_served_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("idx_question_pool_key_difficulty_exposure", "pool_key", "difficulty", "exposure_count"),
+    )
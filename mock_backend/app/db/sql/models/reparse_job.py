@@ -0,0 +1,39 @@
+import uuid
+import datetime
+from sqlalchemy import String, Integer, Boolean, JSON, Text, DateTime
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.sql.base import Base
+
+class ReparseJob(Base):
+    """
+    Batch re-parse of the candidates matching `filters`. The job walks candidates in
+    user id order one page per task; `checkpoint_user_id` is committed with each page's
+    enqueued parse tasks, so a retried or resumed job continues where it stopped.
+    """
+    __tablename__ = "reparse_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    # queued -> running -> completed | cancelled
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued", server_default="queued")
+    filters: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    force: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default="false")
+    # Incremented on resume; page tasks from an earlier run stop themselves
+    run: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+    checkpoint_user_id: Mapped[uuid.UUID] = mapped_column(nullable=True)
+
+    # Matching candidates when the job was created
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    enqueued: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Resume/JD text and parser versions unchanged since the last parse
+    skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # A parse for the candidate was already queued or running
+    already_queued: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_error: Mapped[str] = mapped_column(Text, nullable=True)
+
+    created_by: Mapped[uuid.UUID] = mapped_column(nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
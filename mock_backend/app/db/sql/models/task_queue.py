@@ -0,0 +1,44 @@
+import uuid
+import datetime
+from sqlalchemy import String, Integer, JSON, Text, DateTime, Index, text
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.sql.base import Base
+
+class QueuedTask(Base):
+    """
+    Durable background task. Workers claim rows with SELECT ... FOR UPDATE SKIP LOCKED,
+    so a task runs on exactly one worker and survives restarts.
+    """
+    __tablename__ = "task_queue"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    task_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+
+    # queued -> running -> succeeded | queued (retry with backoff) | dead (attempts exhausted)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued", server_default="queued")
+    # Deduplicates enqueues while a task with the same key is queued or running
+    idempotency_key: Mapped[str] = mapped_column(String(255), nullable=True)
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=5, server_default="5")
+    run_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    locked_by: Mapped[str] = mapped_column(String(255), nullable=True)
+    locked_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    finished_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("idx_task_queue_claim", "status", "task_type", "run_at"),
+        Index(
+            "uq_task_queue_active_idempotency_key",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
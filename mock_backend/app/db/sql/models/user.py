@@ -1,7 +1,7 @@
 import uuid
 import datetime
 from typing import Optional
-from sqlalchemy import String, Boolean, DateTime, Enum, ForeignKey, JSON
+from sqlalchemy import String, Boolean, DateTime, Enum, ForeignKey, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,6 +26,15 @@ class User(Base):
     admin_profile: Mapped["AdminProfile"] = relationship("AdminProfile", back_populates="user", uselist=False, cascade="all, delete-orphan")
     candidate_profile: Mapped["CandidateProfile"] = relationship("CandidateProfile", back_populates="user", uselist=False, cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Keyset pagination of the admin candidate listing
+        Index("idx_users_role_created_at_id", "role", "created_at", "id"),
+        Index("idx_users_role_username_id", "role", "username", "id"),
+        # ILIKE '%term%' search (pg_trgm)
+        Index("idx_users_username_trgm", "username", postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}),
+        Index("idx_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+    )
+
 class AdminProfile(Base):
     __tablename__ = "admin_profiles"
 
@@ -61,6 +70,8 @@ class CandidateProfile(Base):
     match_score: Mapped[float] = mapped_column(nullable=True)
     parse_status: Mapped[str] = mapped_column(String, default="pending")
     parsed_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Hash of the resume/JD texts and parser versions behind resume_json/jd_json (LLM parses only)
+    parse_fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     
     # Verification fields
     face_verified: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -72,3 +83,9 @@ class CandidateProfile(Base):
     voice_profile_id: Mapped[str] = mapped_column(String, nullable=True)  # Azure Speech profile ID
 
     user: Mapped["User"] = relationship("User", back_populates="candidate_profile")
+
+    __table_args__ = (
+        Index("idx_candidate_profiles_match_score_user_id", "match_score", "user_id"),
+        Index("idx_candidate_profiles_first_name_trgm", "first_name", postgresql_using="gin", postgresql_ops={"first_name": "gin_trgm_ops"}),
+        Index("idx_candidate_profiles_last_name_trgm", "last_name", postgresql_using="gin", postgresql_ops={"last_name": "gin_trgm_ops"}),
+    )
@@ -0,0 +1,124 @@
+"""
+Keyset pagination helpers for admin listings.
+
+A page is requested with an opaque cursor holding the (sort value, id) of the last row of
+the previous page; the next page is "rows strictly after that key" in the listing order,
+which an index on (sort column, id) answers with a range seek instead of OFFSET skipping
+every earlier row. Ordering is always NULLS LAST with `id` as the tie-breaker, so keys
+are unique and pages never overlap or skip rows.
+
+Totals are optional: exact (COUNT(*) per request), cached (per-process TTL cache keyed by
+the listing filters) or none.
+"""
+
+import base64
+import datetime
+import json
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import and_, or_, nulls_last
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+TOTAL_MODES = ("exact", "cached", "none")
+# Largest page an admin listing returns
+MAX_PAGE_LIMIT = 100
+
+
+class InvalidCursorError(ValueError):
+    """Cursor is malformed or was issued for a different sort."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(sort_by: str, order: str, sort_value: Any, row_id: uuid.UUID) -> str:
+    payload = {"s": sort_by, "o": order, "v": _encode_value(sort_value), "id": str(row_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, order: str) -> Tuple[Any, uuid.UUID]:
+    """(sort value, id) of the last row seen; raises InvalidCursorError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["s"] != sort_by or payload["o"] != order:
+            raise InvalidCursorError("Cursor was issued for a different sort order")
+        return _decode_value(payload["v"]), uuid.UUID(payload["id"])
+    except InvalidCursorError:
+        raise
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def keyset_order_by(sort_col, id_col, descending: bool) -> list:
+    if descending:
+        return [nulls_last(sort_col.desc()), id_col.desc()]
+    return [nulls_last(sort_col.asc()), id_col.asc()]
+
+
+def keyset_after(sort_col, id_col, sort_value: Any, last_id: uuid.UUID, descending: bool):
+    """WHERE clause for rows after (sort_value, last_id) in keyset_order_by() order."""
+    id_after = id_col < last_id if descending else id_col > last_id
+    if sort_value is None:
+        # Already in the NULLS LAST tail: only later NULL rows remain
+        return and_(sort_col.is_(None), id_after)
+    value_after = sort_col < sort_value if descending else sort_col > sort_value
+    return or_(
+        value_after,
+        and_(sort_col == sort_value, id_after),
+        sort_col.is_(None),
+    )
+
+
+class TotalCountCache:
+    """Per-process TTL cache of listing totals keyed by the listing's filters."""
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Any, Tuple[float, int]] = {}
+
+    async def get(self, session: AsyncSession, key: Any, count_stmt) -> int:
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+        total = (await session.execute(count_stmt)).scalar() or 0
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+        self._entries[key] = (time.monotonic(), total)
+        return total
+
+    def invalidate(self, prefix: Optional[str] = None) -> None:
+        """Drop cached totals (only keys whose first element is `prefix`, if given)."""
+        if prefix is None:
+            self._entries.clear()
+        else:
+            for key in [k for k in self._entries if isinstance(k, tuple) and k and k[0] == prefix]:
+                self._entries.pop(key, None)
+
+
+async def resolve_total(session: AsyncSession, mode: str, cache: TotalCountCache, key: Any, count_stmt) -> Optional[int]:
+    if mode == "none":
+        return None
+    if mode == "cached":
+        return await cache.get(session, key, count_stmt)
+    return (await session.execute(count_stmt)).scalar() or 0
+
+
+list_total_cache = TotalCountCache(ttl_seconds=settings.LIST_TOTAL_CACHE_TTL_SECONDS)
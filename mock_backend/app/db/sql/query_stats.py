@@ -0,0 +1,136 @@
+"""
+Per-request SQL statistics.
+
+Engine events count the statements, rows and database time spent inside the current
+`track_queries()` scope. The scope lives in a ContextVar, so concurrent requests on the
+same event loop each see only their own statements; the HTTP middleware in app.main opens
+one per request and reports it as X-DB-* response headers and a log line.
+
+ENDPOINT_QUERY_BUDGETS records how many statements the hot endpoints are expected to
+issue. The middleware logs a warning when a request goes over its budget, and tests wrap
+the service call behind an endpoint in `query_budget()` so an N+1 regression fails there.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Statement budgets per route path, including the auth lookup on a principal cache miss
+# (COMMIT/ROLLBACK are not counted).
+# /question/next is budgeted for the usual cache-warm poll; a cold rebuild costs a few more.
+ENDPOINT_QUERY_BUDGETS = {
+    "/api/v1/question/next": 2,
+    "/api/v1/candidate/interview/sections": 5,
+    "/api/v1/dashboard/stats": 2,
+    "/api/v1/auth/admin/candidates": 3,
+}
+
+_START_TIMES_KEY = "query_stats_start_times"
+
+
+class QueryStats:
+    """Statements, rows (returned or affected) and DB time seen within one scope."""
+
+    __slots__ = ("queries", "rows", "db_time", "statements", "_keep_statements")
+
+    def __init__(self, keep_statements: bool = False):
+        self.queries = 0
+        self.rows = 0
+        self.db_time = 0.0
+        self.statements: List[str] = []
+        self._keep_statements = keep_statements
+
+    @property
+    def db_time_ms(self) -> float:
+        return round(self.db_time * 1000, 2)
+
+    def as_headers(self) -> dict:
+        return {
+            "X-DB-Query-Count": str(self.queries),
+            "X-DB-Rows": str(self.rows),
+            "X-DB-Time-Ms": f"{self.db_time_ms:.2f}",
+        }
+
+
+_current: contextvars.ContextVar[Optional[QueryStats]] = contextvars.ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries(keep_statements: bool = False) -> Iterator[QueryStats]:
+    """Count the statements executed in this context until the block exits."""
+    stats = QueryStats(keep_statements=keep_statements)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """More statements were issued than the budget allows."""
+
+
+@contextmanager
+def query_budget(max_queries: int, label: str = "block") -> Iterator[QueryStats]:
+    """
+    Test helper: fail if the block issues more than `max_queries` statements.
+    The statements are listed in the error so the extra query is easy to spot.
+    """
+    with track_queries(keep_statements=True) as stats:
+        yield stats
+    if stats.queries > max_queries:
+        listing = "\n".join(f"  {i + 1}. {s.splitlines()[0][:160]}" for i, s in enumerate(stats.statements))
+        raise QueryBudgetExceeded(
+            f"{label} issued {stats.queries} queries (budget {max_queries}):\n{listing}"
+        )
+
+
+def _row_count(cursor) -> int:
+    # DML reports affected rows; the async adapters buffer SELECT results in _rows at execute time
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        return cursor.rowcount
+    rows = getattr(cursor, "_rows", None)
+    return len(rows) if rows is not None else 0
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if start_times:
+        stats.db_time += time.perf_counter() - start_times.pop()
+    stats.queries += 1
+    stats.rows += _row_count(cursor)
+    if stats._keep_statements:
+        stats.statements.append(statement)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    conn = exception_context.connection
+    if conn is not None and _current.get() is not None:
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if start_times:
+            start_times.pop()
+
+
+def install_query_stats(engine: Engine) -> None:
+    """Attach the counters to a (sync) engine; idempotent."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
@@ -52,9 +52,20 @@ class InterviewRepository(BaseRepository[Interview]):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
-    async def get_all_summary(self, limit: int = 10, offset: int = 0, search: str = "") -> dict:
+    async def get_all_summary(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        search: str = "",
+        cursor: Optional[str] = None,
+        total_mode: str = "exact",
+    ) -> dict:
+        """Newest-first interview summaries; keyset-paged on (created_at, id) when `cursor` is given."""
         from sqlalchemy import func, or_
-        from app.db.sql.models.user import User, CandidateProfile
+        from app.db.sql.models.user import CandidateProfile
+        from app.db.sql.pagination import (
+            decode_cursor, encode_cursor, keyset_after, keyset_order_by, resolve_total, list_total_cache,
+        )
         
         stmt = select(
             Interview.id,
@@ -62,25 +73,38 @@ class InterviewRepository(BaseRepository[Interview]):
             Interview.status,
             Interview.scheduled_at,
             Interview.overall_score,
+            Interview.created_at,
         )
-        count_stmt = select(func.count(Interview.id))
+        filters = []
         
         if search:
             search_term = f"%{search}%"
-            join_cond = Interview.candidate_id == User.id
-            filters = or_(
-                CandidateProfile.first_name.ilike(search_term),
-                CandidateProfile.last_name.ilike(search_term),
-            )
-            
-            stmt = stmt.outerjoin(User, join_cond).outerjoin(CandidateProfile, User.id == CandidateProfile.user_id).where(filters)
-            count_stmt = count_stmt.outerjoin(User, join_cond).outerjoin(CandidateProfile, User.id == CandidateProfile.user_id).where(filters)
-            
-        stmt = stmt.order_by(Interview.created_at.desc()).offset(offset).limit(limit)
+            filters.append(Interview.candidate_id.in_(
+                select(CandidateProfile.user_id).where(or_(
+                    CandidateProfile.first_name.ilike(search_term),
+                    CandidateProfile.last_name.ilike(search_term),
+                ))
+            ))
+        stmt = stmt.where(*filters)
         
-        result = await self.session.execute(stmt)
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar() or 0
+        if cursor:
+            created_at, last_id = decode_cursor(cursor, "created_at", "desc")
+            stmt = stmt.where(keyset_after(Interview.created_at, Interview.id, created_at, last_id, True))
+        elif offset:
+            stmt = stmt.offset(offset)
+        stmt = stmt.order_by(*keyset_order_by(Interview.created_at, Interview.id, True)).limit(limit + 1)
+        
+        rows = (await self.session.execute(stmt)).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            if rows:
+                next_cursor = encode_cursor("created_at", "desc", rows[-1].created_at, rows[-1].id)
+        
+        total = await resolve_total(
+            self.session, total_mode, list_total_cache, ("interviews", search),
+            select(func.count(Interview.id)).where(*filters),
+        )
         
         data = [
             {
@@ -90,10 +114,11 @@ class InterviewRepository(BaseRepository[Interview]):
                 "scheduled_at": row.scheduled_at,
                 "overall_score": row.overall_score,
             }
-            for row in result.all()
+            for row in rows
         ]
         
         return {
             "data": data,
-            "total": total
+            "total": total,
+            "next_cursor": next_cursor,
         }
@@ -1,10 +1,36 @@
 import uuid
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Optional, List, Sequence
+from sqlalchemy import select, func, or_
 from sqlalchemy.orm import selectinload
 
 from app.db.sql.repositories.base import BaseRepository
-from app.db.sql.models.user import User
+from app.db.sql.models.user import User, CandidateProfile
+from app.db.sql.enums import UserRole
+from app.db.sql.pagination import (
+    decode_cursor, encode_cursor, keyset_after, keyset_order_by, resolve_total, list_total_cache,
+)
+
+# Columns the candidate listing can project (`fields=`); resume_json / jd_json are detail-only
+CANDIDATE_LIST_FIELDS = {
+    "id": User.id,
+    "username": User.username,
+    "email": User.email,
+    "is_active": User.is_active,
+    "login_disabled": User.login_disabled,
+    "created_at": User.created_at,
+    "first_name": CandidateProfile.first_name,
+    "last_name": CandidateProfile.last_name,
+    "role_name": CandidateProfile.role_name,
+    "parse_status": CandidateProfile.parse_status,
+    "parsed_at": CandidateProfile.parsed_at,
+    "match_score": CandidateProfile.match_score,
+    "job_description": CandidateProfile.job_description,
+}
+DEFAULT_CANDIDATE_LIST_FIELDS = (
+    "id", "username", "email", "is_active", "login_disabled", "created_at",
+    "role_name", "parse_status", "parsed_at", "match_score",
+)
+
 
 class UserRepository(BaseRepository[User]):
     def __init__(self, session):
@@ -55,4 +81,69 @@ class UserRepository(BaseRepository[User]):
         from app.db.sql.models.user import CandidateProfile
         stmt = select(CandidateProfile).where(CandidateProfile.user_id == user_id)
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
\ No newline at end of file
+        return result.scalar_one_or_none()
+
+    async def list_candidates_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        search: str = "",
+        sort_by: str = "created_at",
+        order: str = "desc",
+        total_mode: str = "exact",
+        fields: Sequence[str] = DEFAULT_CANDIDATE_LIST_FIELDS,
+    ) -> dict:
+        """
+        One page of candidates in (sort field, id) order, as dicts of the requested
+        CANDIDATE_LIST_FIELDS only (selected as plain columns, no ORM objects). With
+        `cursor` the page is a keyset seek after the previous page's last row; `offset`
+        is only honoured without a cursor. Raises InvalidCursorError for a bad cursor.
+        """
+        descending = order == "desc"
+        filters = [User.role == UserRole.CANDIDATE]
+        if search:
+            # Each arm can use its own trigram index; no join needed to filter
+            search_term = f"%{search}%"
+            filters.append(or_(
+                User.username.ilike(search_term),
+                User.email.ilike(search_term),
+                User.id.in_(
+                    select(CandidateProfile.user_id).where(or_(
+                        CandidateProfile.first_name.ilike(search_term),
+                        CandidateProfile.last_name.ilike(search_term),
+                    ))
+                ),
+            ))
+
+        if sort_by == "match_score":
+            sort_col = CandidateProfile.match_score
+        elif sort_by == "username":
+            sort_col = User.username
+        else:
+            sort_by, sort_col = "created_at", User.created_at
+
+        columns = [CANDIDATE_LIST_FIELDS[name].label(name) for name in fields]
+        stmt = select(*columns, User.id.label("_row_id"), sort_col.label("_sort_value")).where(*filters)
+        if sort_by == "match_score" or any(CANDIDATE_LIST_FIELDS[name].class_ is CandidateProfile for name in fields):
+            stmt = stmt.outerjoin(CandidateProfile, CandidateProfile.user_id == User.id)
+        if cursor:
+            sort_value, last_id = decode_cursor(cursor, sort_by, order)
+            stmt = stmt.where(keyset_after(sort_col, User.id, sort_value, last_id, descending))
+        elif offset:
+            stmt = stmt.offset(offset)
+        stmt = stmt.order_by(*keyset_order_by(sort_col, User.id, descending)).limit(limit + 1)
+
+        rows = (await self.session.execute(stmt)).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            if rows:
+                next_cursor = encode_cursor(sort_by, order, rows[-1]._sort_value, rows[-1]._row_id)
+
+        total = await resolve_total(
+            self.session, total_mode, list_total_cache, ("candidates", search),
+            select(func.count(User.id)).where(*filters),
+        )
+        data = [{name: row._mapping[name] for name in fields} for row in rows]
+        return {"data": data, "total": total, "next_cursor": next_cursor}
@@ -2,6 +2,7 @@ import logging
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from app.core.config import settings
+from app.db.sql.query_stats import install_query_stats
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +14,7 @@ engine = create_async_engine(
     pool_size=10,
     max_overflow=5,
 )
+install_query_stats(engine.sync_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 import os
+import asyncio
 from fastapi.middleware.cors import CORSMiddleware
 import socketio
 from app.api.v1 import auth_router, dashboard_router
@@ -13,6 +14,8 @@ from app.api.v1 import coding_router
 
 from contextlib import asynccontextmanager
 from app.db.sql.session import AsyncSessionLocal, test_database_connection
+from app.db.sql.query_stats import track_queries, ENDPOINT_QUERY_BUDGETS
+from app.services.upload_storage import reject_oversize_upload
 import logging
 from pathlib import Path
 
@@ -76,9 +79,24 @@ async def lifespan(app: FastAPI):
             exc,
         )
 
+    # ── Step 2: In-process task queue worker (disable when running app.worker separately)
+    worker_task = None
+    task_worker = None
+    if settings.TASK_QUEUE_EMBEDDED_WORKER:
+        from app.services.task_queue_service import TaskWorker
+        task_worker = TaskWorker()
+        worker_task = asyncio.create_task(task_worker.run())
+
     yield
     # ── Shutdown ──────────────────────────────────────────────────────────────
     logger.info("Application shutting down.")
+    if task_worker:
+        task_worker.stop()
+        await worker_task
+    from app.core.security import password_hasher
+    password_hasher.shutdown()
+    from app.services.pdf_extraction import pdf_extraction_pool
+    pdf_extraction_pool.shutdown()
 
 app = FastAPI(title="AI Interview Automation Mock Backend", lifespan=lifespan)
 
@@ -96,7 +114,16 @@ sio = socketio.AsyncServer(
 )
 socketio_app = socketio.ASGIApp(sio, app)
 
-# CORS Middleware - Allow all origins in development
+@app.middleware("http")
+async def upload_size_limits(request, call_next):
+    """Refuse oversize sample uploads from Content-Length, before the body is received."""
+    rejection = reject_oversize_upload(request.method, request.url.path, request.headers.get("content-length"))
+    if rejection is not None:
+        return rejection
+    return await call_next(request)
+
+# CORS Middleware - Allow all origins in development (added after the size check so its
+# 413s carry CORS headers too)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -106,6 +133,27 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+@app.middleware("http")
+async def sql_query_stats(request, call_next):
+    """Count the SQL statements, rows and DB time of each request."""
+    with track_queries() as stats:
+        response = await call_next(request)
+    route = request.scope.get("route")
+    path = getattr(route, "path", request.url.path)
+    budget = ENDPOINT_QUERY_BUDGETS.get(path)
+    if budget is not None and stats.queries > budget:
+        logger.warning(
+            f"[QueryStats] {request.method} {path} issued {stats.queries} queries (budget {budget}), "
+            f"rows={stats.rows}, db_time_ms={stats.db_time_ms}"
+        )
+    elif stats.queries:
+        logger.debug(
+            f"[QueryStats] {request.method} {path} queries={stats.queries} rows={stats.rows} db_time_ms={stats.db_time_ms}"
+        )
+    if settings.SQL_QUERY_STATS_HEADERS:
+        response.headers.update(stats.as_headers())
+    return response
+
 # Router inclusions
 app.include_router(auth_router.router, prefix="/api/v1/auth", tags=["Auth"])
 app.include_router(dashboard_router.router, prefix="/api/v1/dashboard", tags=["Dashboard"])
@@ -39,11 +39,28 @@ class CandidateResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class CandidateListItem(BaseModel):
+    """Candidate list row; only the fields requested with `fields=` are present."""
+    id: str
+    username: Optional[str] = None
+    email: Optional[str] = None
+    is_active: Optional[bool] = None
+    login_disabled: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    role_name: Optional[str] = None
+    parse_status: Optional[str] = None
+    parsed_at: Optional[datetime] = None
+    match_score: Optional[float] = None
+    job_description: Optional[str] = None
+
 class PaginatedCandidateResponse(BaseModel):
-    data: List[CandidateResponse]
-    total: int
+    data: List[CandidateListItem]
+    total: Optional[int] = None  # None when requested with total=none
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # pass as `cursor` for the next page; None on the last page
 
 class AdminProfilePayload(BaseModel):
     first_name: str
@@ -67,3 +84,12 @@ class AdminResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+class ReparseJobRequest(BaseModel):
+    # Filters (all optional, combined with AND); no filters re-parses every candidate
+    parse_status: Optional[List[str]] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    role_name: Optional[str] = None
+    # Re-parse even when resume/JD text and parser versions are unchanged
+    force: bool = False
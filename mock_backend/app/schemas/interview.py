@@ -100,6 +100,7 @@ class CuratedQuestionsPayload(BaseModel):
     coding_section: Optional[CodingSection] = None
     problem_solving_section: Optional[CodingSection] = None
     conversational_section: Optional[ConversationalSection] = None
+    stage_timings_ms: Optional[dict] = None
 
 
 class InterviewTemplateResponse(BaseModel):
@@ -230,7 +231,8 @@ class ScheduleInterviewResponse(BaseModel):
     assigned_by: str
     status: str
     scheduled_at: datetime
-    curated_questions: CuratedQuestionsPayload
+    curated_questions: Optional[CuratedQuestionsPayload] = None
+    generation_status: str = "ready"
     created_at: datetime
 
     class Config:
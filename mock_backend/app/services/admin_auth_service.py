@@ -10,7 +10,7 @@ from app.db.sql.unit_of_work import UnitOfWork
 from app.db.sql.models.user import User, AdminProfile, CandidateProfile
 from app.db.sql.models.interview_response import InterviewResponse
 from app.db.sql.enums import UserRole
-from app.core.security import get_password_hash
+from app.core.security import password_hasher
 from app.schemas.auth import AdminRegistrationRequest
 from app.services.azure_verification_service import azure_verification_service
 from app.core.config import settings
@@ -37,7 +37,7 @@ class AdminAuthSQLService:
                 )
 
             # 2. Hash password securely
-            hashed_password = get_password_hash(request.password)
+            hashed_password = await password_hasher.hash(request.password)
 
             # 3. Create Admin Instance
             new_user = User(
@@ -5,7 +5,10 @@ Service to interact with Azure OpenAI GPT-4o for question generation.
 """
 
 import os
+import time
+import asyncio
 import logging
+from collections import deque
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from openai import AzureOpenAI, AsyncAzureOpenAI
@@ -31,6 +34,68 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Number of recent successful call latencies kept per endpoint for the p95 estimate
+_LATENCY_WINDOW = 50
+
+
+class LLMUnavailableError(RuntimeError):
+    """No endpoint can take the call right now (circuits open); worth retrying later."""
+
+
+class _LLMEndpoint:
+    """One Azure OpenAI deployment with its own circuit breaker and latency window."""
+
+    def __init__(self, name: str, client: AzureOpenAI, async_client: AsyncAzureOpenAI, deployment: Optional[str] = None):
+        self.name = name
+        self.client = client
+        self.async_client = async_client
+        self.deployment = deployment
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.latencies: deque = deque(maxlen=_LATENCY_WINDOW)
+
+    def is_half_open(self, now: float) -> bool:
+        return 0.0 < self.open_until <= now
+
+    def is_available(self, now: float) -> bool:
+        # Closed, or open but past its cool-down with no probe in flight (half-open
+        # admits exactly one request; its outcome closes or re-opens the circuit)
+        if self.open_until == 0.0:
+            return True
+        return self.open_until <= now and not self.probing
+
+    def p95(self) -> Optional[float]:
+        if len(self.latencies) < 5:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def record_success(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self, now: float) -> None:
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= settings.LLM_CIRCUIT_FAILURE_THRESHOLD:
+            self.open_until = now + settings.LLM_CIRCUIT_RESET_SECONDS
+            logger.warning(
+                f"Azure OpenAI endpoint {self.name} circuit opened for "
+                f"{settings.LLM_CIRCUIT_RESET_SECONDS:.0f}s after {self.consecutive_failures} failures"
+            )
+
+    def health(self, now: float) -> Dict[str, Any]:
+        return {
+            "endpoint": self.name,
+            "deployment": self.deployment,
+            "circuit": "closed" if self.consecutive_failures < settings.LLM_CIRCUIT_FAILURE_THRESHOLD
+            else ("open" if self.open_until > now else "half_open"),
+            "consecutive_failures": self.consecutive_failures,
+            "probing": self.probing,
+            "p95_seconds": self.p95(),
+        }
+
 
 class AzureOpenAIService:
     """Service to interact with Azure OpenAI."""
@@ -38,10 +103,15 @@ class AzureOpenAIService:
     def __init__(self):
         self.client = None
         self.async_client = None
+        self.endpoints: List[_LLMEndpoint] = []
         self._initialize_client()
+
+    @staticmethod
+    def _split_csv(value: str) -> List[str]:
+        return [item.strip() for item in (value or "").split(",") if item.strip()]
     
     def _initialize_client(self):
-        """Initialize Azure OpenAI client."""
+        """Initialize Azure OpenAI clients (one per configured deployment endpoint)."""
         try:
             # Try multiple environment variable names for compatibility
             azure_endpoint = (
@@ -57,38 +127,128 @@ class AzureOpenAIService:
                 ""
             )
             api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
+
+            endpoint_urls = self._split_csv(os.getenv("AZURE_OPENAI_ENDPOINTS") or settings.AZURE_OPENAI_ENDPOINTS)
+            api_keys = self._split_csv(os.getenv("AZURE_OPENAI_API_KEYS") or settings.AZURE_OPENAI_API_KEYS)
+            deployments = self._split_csv(os.getenv("AZURE_OPENAI_DEPLOYMENTS") or settings.AZURE_OPENAI_DEPLOYMENTS)
+            if not endpoint_urls and azure_endpoint:
+                endpoint_urls = [azure_endpoint]
             
             # Debug logging
-            logger.debug(f"Azure OpenAI Endpoint: {'***SET***' if azure_endpoint else 'NOT SET'}")
-            logger.debug(f"Azure OpenAI API Key: {'***SET***' if api_key else 'NOT SET'}")
+            logger.debug(f"Azure OpenAI Endpoints: {len(endpoint_urls)} configured")
+            logger.debug(f"Azure OpenAI API Key: {'***SET***' if api_key or api_keys else 'NOT SET'}")
             
-            if not azure_endpoint or not api_key:
+            if not endpoint_urls or not (api_key or api_keys):
                 logger.warning("Azure OpenAI credentials not configured. Question generation will use mock data.")
                 logger.warning(f"  - AZURE_OPENAI_ENDPOINT or OPENAI_API_BASE: {'SET' if azure_endpoint else 'NOT SET'}")
                 logger.warning(f"  - AZURE_OPENAI_API_KEY or OPENAI_API_KEY: {'SET' if api_key else 'NOT SET'}")
                 logger.warning(f"  - Check your .env file in: {Path(__file__).resolve().parent.parent.parent}")
                 return None
             
-            # Clean endpoint (remove trailing slash if present)
-            azure_endpoint = azure_endpoint.rstrip('/')
-            
-            self.client = AzureOpenAI(
-                azure_endpoint=azure_endpoint,
-                api_key=api_key,
-                api_version=api_version
-            )
-            self.async_client = AsyncAzureOpenAI(
-                azure_endpoint=azure_endpoint,
-                api_key=api_key,
-                api_version=api_version
-            )
+            for index, url in enumerate(endpoint_urls):
+                # Keys and deployments are aligned by position; a single value applies to all
+                key = api_keys[index] if index < len(api_keys) else (api_keys[0] if len(api_keys) == 1 else api_key)
+                deployment = deployments[index] if index < len(deployments) else (deployments[0] if len(deployments) == 1 else None)
+                # Clean endpoint (remove trailing slash if present)
+                url = url.rstrip('/')
+                self.endpoints.append(_LLMEndpoint(
+                    name=url,
+                    client=AzureOpenAI(
+                        azure_endpoint=url, api_key=key, api_version=api_version,
+                        timeout=settings.LLM_ATTEMPT_TIMEOUT_SECONDS,
+                    ),
+                    # No SDK retries: a failed attempt fails over to the next endpoint instead
+                    async_client=AsyncAzureOpenAI(
+                        azure_endpoint=url, api_key=key, api_version=api_version,
+                        timeout=settings.LLM_ATTEMPT_TIMEOUT_SECONDS, max_retries=0,
+                    ),
+                    deployment=deployment,
+                ))
+
+            # Primary endpoint stays exposed for callers that gate on client availability
+            self.client = self.endpoints[0].client
+            self.async_client = self.endpoints[0].async_client
             logger.info("✅ Azure OpenAI client initialized successfully")
-            logger.info(f"   Endpoint: {azure_endpoint}")
+            for endpoint in self.endpoints:
+                logger.info(f"   Endpoint: {endpoint.name} (deployment: {endpoint.deployment or 'per-call model'})")
             logger.info(f"   API Version: {api_version}")
+            if settings.LLM_HEDGE_ENABLED and len(self.endpoints) > 1:
+                logger.info("   Hedged requests: enabled")
         except Exception as e:
             logger.error(f"Failed to initialize Azure OpenAI client: {e}", exc_info=True)
             self.client = None
             self.async_client = None
+            self.endpoints = []
+
+    def _ordered_endpoints(self) -> List[_LLMEndpoint]:
+        """Available endpoints, healthiest first (fewest recent failures, then lowest p95)."""
+        now = time.monotonic()
+        available = [e for e in self.endpoints if e.is_available(now)]
+        return sorted(
+            available,
+            key=lambda e: (e.consecutive_failures, e.p95() if e.p95() is not None else 0.0),
+        )
+
+    def get_endpoint_health(self) -> List[Dict[str, Any]]:
+        """Circuit state and p95 latency for each configured endpoint."""
+        now = time.monotonic()
+        return [endpoint.health(now) for endpoint in self.endpoints]
+
+    async def _call_endpoint(self, endpoint: _LLMEndpoint, request: Dict[str, Any]) -> str:
+        started = time.monotonic()
+        if not endpoint.is_available(started):
+            # Re-opened, or another request is probing it, since the endpoints were ordered
+            raise LLMUnavailableError(f"Azure OpenAI endpoint {endpoint.name} is unavailable (circuit open)")
+        probe = endpoint.is_half_open(started)
+        if probe:
+            endpoint.probing = True
+        try:
+            resp = await asyncio.wait_for(
+                endpoint.async_client.chat.completions.create(
+                    **{**request, "model": endpoint.deployment or request["model"]}
+                ),
+                timeout=settings.LLM_ATTEMPT_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            endpoint.record_failure(time.monotonic())
+            raise TimeoutError(
+                f"Azure OpenAI endpoint {endpoint.name} did not answer within {settings.LLM_ATTEMPT_TIMEOUT_SECONDS:.0f}s"
+            )
+        except asyncio.CancelledError:
+            # Lost a hedge race (or the caller gave up); not a health signal either way
+            raise
+        except Exception:
+            endpoint.record_failure(time.monotonic())
+            raise
+        finally:
+            if probe:
+                endpoint.probing = False
+        endpoint.record_success(time.monotonic() - started)
+        return resp.choices[0].message.content
+
+    async def _hedged_call(self, primary: _LLMEndpoint, backup: _LLMEndpoint, request: Dict[str, Any]) -> str:
+        """Send to primary; if it has not answered by its p95, also send to backup and take the first success."""
+        delay = max(primary.p95() or 0.0, settings.LLM_HEDGE_MIN_DELAY_SECONDS)
+        tasks = [asyncio.create_task(self._call_endpoint(primary, request))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done or tasks[0].exception() is not None:
+                logger.debug(f"Hedging LLM request from {primary.name} to {backup.name}")
+                tasks.append(asyncio.create_task(self._call_endpoint(backup, request)))
+
+            last_error: Optional[BaseException] = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
     async def chat_completion_json(
         self,
@@ -101,31 +261,44 @@ class AzureOpenAIService:
     ) -> str:
         """
         Async helper to call chat.completions and return the message content string.
+        Routes to the healthiest endpoint whose circuit is not open, fails over to the
+        next one on error, and optionally hedges slow requests onto a second endpoint.
         Falls back to sync client in a thread if async client is unavailable.
         """
         if not self.async_client and not self.client:
             raise RuntimeError("Azure OpenAI client is not initialized")
-        
-        if self.async_client:
-            resp = await self.async_client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                response_format=response_format,
-            )
-            return resp.choices[0].message.content
+
+        request = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": response_format,
+        }
+
+        if self.endpoints:
+            candidates = self._ordered_endpoints()
+            if not candidates:
+                # Every circuit is open: fail fast so callers drop to their fallbacks
+                raise LLMUnavailableError("All Azure OpenAI endpoints are unavailable (circuit open)")
+
+            last_error: Optional[BaseException] = None
+            index = 0
+            while index < len(candidates):
+                try:
+                    if settings.LLM_HEDGE_ENABLED and index + 1 < len(candidates):
+                        return await self._hedged_call(candidates[index], candidates[index + 1], request)
+                    return await self._call_endpoint(candidates[index], request)
+                except Exception as e:
+                    last_error = e
+                    logger.warning(f"Azure OpenAI call failed on {candidates[index].name}: {e}")
+                    index += 2 if settings.LLM_HEDGE_ENABLED else 1
+            raise last_error
         
         # Fallback: run sync client in threadpool to avoid blocking event loop
         import anyio
         def _call_sync():
-            return self.client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                response_format=response_format,
-            ).choices[0].message.content
+            return self.client.chat.completions.create(**request).choices[0].message.content
         return await anyio.to_thread.run_sync(_call_sync)
     
     async def generate_conversational_questions(
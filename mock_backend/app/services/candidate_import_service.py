@@ -0,0 +1,579 @@
+"""
+Candidate Import Service
+------------------------
+Bulk onboarding of candidates (campus drives) from a CSV manifest and a zip of resume
+PDFs, as POST /auth/admin/candidates/import.
+
+The request only copies both uploads to the shared uploads directory in fixed-size
+chunks (size-capped, never read whole into memory), checks the manifest header and row
+count, and commits a CandidateImportJob together with an `import_candidates` task on the
+durable queue, so any worker runs it and a restart does not lose it. Manifest rows are
+read BULK_IMPORT_BATCH_SIZE at a time, and for each batch
+
+- rows are validated (name, email, resume member present and within
+  BULK_IMPORT_MAX_RESUME_BYTES, duplicates within the file),
+- existing usernames/emails are looked up in one query,
+- resumes are streamed out of the archive into uploads/resumes one member at a time,
+- passwords are hashed on the shared password hasher, using at most its worker count
+  (a row whose hash keeps getting 503 after HASH_BUSY_RETRIES fails instead of waiting),
+- users and profiles are created with one multi-row INSERT each, parse tasks are added
+  with one INSERT, and the batch commits with its per-row results and the job's
+  checkpoint (the last manifest line), so a retried task continues after it.
+
+Resume parsing therefore runs on the durable task queue, bounded cluster-wide by
+TASK_CONCURRENCY_RESUME_PARSE. Welcome emails carry the plaintext password, so like the
+single-candidate endpoint they are sent by the import task itself after each batch
+commits (BULK_IMPORT_EMAIL_CONCURRENCY at a time) and passwords are neither persisted
+nor returned in the job report.
+
+Progress and per-row results are read from the database by
+GET /auth/admin/candidates/import/{job_id}, from any instance.
+"""
+
+import asyncio
+import csv
+import logging
+import os
+import secrets
+import shutil
+import time
+import uuid
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pypdf
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.security import password_hasher
+from app.db.sql.enums import UserRole
+from app.db.sql.models.candidate_import import CandidateImportJob, CandidateImportRow
+from app.db.sql.models.user import User, CandidateProfile
+from app.db.sql.pagination import list_total_cache
+from app.db.sql.session import AsyncSessionLocal
+from app.services.email_service import email_service
+from app.services.task_queue_service import task_queue_service, is_transient_error, is_final_attempt
+
+logger = logging.getLogger(__name__)
+
+# Optional column: job_description (falls back to the one submitted with the import)
+MANIFEST_REQUIRED_COLUMNS = ("name", "email", "resume")
+# Same limits as /admin/register-candidate
+JD_MAX_WORDS = 2500
+RESUME_MAX_PAGES = 10
+COPY_CHUNK_BYTES = 1024 * 1024
+RESUME_UPLOAD_DIR = os.path.join("uploads", "resumes")
+IMPORT_UPLOAD_DIR = os.path.join("uploads", "imports")
+# The password hasher answers 503 while its queue is full; give up on a row after this
+HASH_BUSY_RETRIES = 20
+HASH_BUSY_DELAY_SECONDS = 0.5
+
+
+class _Superseded(Exception):
+    """The job's checkpoint moved under this task: another worker is running the import."""
+
+
+@dataclass
+class _Candidate:
+    row: int
+    email: str
+    username: str
+    first_name: str
+    last_name: str
+    job_description: str
+    member: zipfile.ZipInfo
+    resume_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    user_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    password: str = field(default_factory=lambda: secrets.token_urlsafe(12))
+    hashed_password: Optional[str] = None
+
+    @property
+    def resume_path(self) -> str:
+        return os.path.join(RESUME_UPLOAD_DIR, f"{self.resume_id}.pdf")
+
+
+def _result(row: int, email: str, error: Optional[str] = None, candidate_id: Optional[uuid.UUID] = None) -> Dict[str, Any]:
+    return {
+        "row": row,
+        "email": email,
+        "status": "failed" if error else "created",
+        "error": error,
+        "candidate_id": candidate_id,
+    }
+
+
+def _summary(job: CandidateImportJob, rows: List[CandidateImportRow], since: int) -> Dict[str, Any]:
+    """Progress counters plus per-row results from index `since` (pass back `next_since`)."""
+    return {
+        "job_id": str(job.id),
+        "status": job.status,
+        "total_rows": job.total_rows,
+        "processed": job.processed,
+        "created": job.created,
+        "failed": job.failed,
+        "error": job.error,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+        "rows": [
+            {"row": r.row, "email": r.email, "status": r.status, "error": r.error}
+            if r.status == "failed"
+            else {"row": r.row, "email": r.email, "status": r.status, "candidate_id": str(r.candidate_id)}
+            for r in rows
+        ],
+        "next_since": since + len(rows),
+    }
+
+
+class CandidateImportService:
+    """Starts bulk imports, runs them as queued tasks and reports their progress."""
+
+    def __init__(self, batch_size: int, max_rows: int, email_concurrency: int):
+        self.batch_size = max(1, batch_size)
+        self.max_rows = max_rows
+        self.email_concurrency = max(1, email_concurrency)
+
+    async def get_progress(self, job_id: str, since: int = 0) -> Optional[Dict[str, Any]]:
+        try:
+            job_uuid = uuid.UUID(job_id)
+        except ValueError:
+            return None
+        since = max(0, since)
+        async with AsyncSessionLocal() as session:
+            job = await session.get(CandidateImportJob, job_uuid)
+            if job is None:
+                return None
+            # Batches commit in manifest order, so line order is stable across polls
+            rows = (await session.execute(
+                select(CandidateImportRow)
+                .where(CandidateImportRow.job_id == job_uuid)
+                .order_by(CandidateImportRow.row)
+                .offset(since)
+            )).scalars().all()
+        return _summary(job, rows, since)
+
+    async def start(self, manifest: UploadFile, archive: UploadFile, job_description: str, admin_id: uuid.UUID) -> Dict[str, Any]:
+        """Spool the uploads to disk, validate their shape and queue the import; raises 400/413."""
+        if job_description and len(job_description.split()) > JD_MAX_WORDS:
+            raise HTTPException(status_code=400, detail="Job description exceeds the maximum length of 5 pages (approx 2500 words).")
+
+        job_id = uuid.uuid4()
+        workdir = os.path.join(IMPORT_UPLOAD_DIR, job_id.hex)
+        abs_workdir = os.path.join(settings.BASE_DIR, workdir)
+        manifest_path = os.path.join(abs_workdir, "manifest.csv")
+        archive_path = os.path.join(abs_workdir, "resumes.zip")
+        try:
+            os.makedirs(abs_workdir)
+            await run_in_threadpool(_spool, manifest, manifest_path, settings.BULK_IMPORT_MAX_MANIFEST_BYTES, "Manifest")
+            await run_in_threadpool(_spool, archive, archive_path, settings.BULK_IMPORT_MAX_ARCHIVE_BYTES, "Resume archive")
+            total_rows = await run_in_threadpool(self._inspect, manifest_path, archive_path)
+
+            async with AsyncSessionLocal() as session:
+                job = CandidateImportJob(
+                    id=job_id,
+                    workdir=workdir,
+                    default_job_description=job_description or "",
+                    total_rows=total_rows,
+                    created_by=admin_id,
+                )
+                session.add(job)
+                await session.flush()
+                await task_queue_service.enqueue(
+                    session, "import_candidates", {"job_id": str(job_id)}, idempotency_key=f"candidate-import:{job_id}"
+                )
+                await session.commit()
+                await session.refresh(job)
+        except Exception:
+            shutil.rmtree(abs_workdir, ignore_errors=True)
+            raise
+
+        logger.info(f"[CandidateImport] Job {job.id}: {total_rows} rows queued by admin {admin_id}")
+        return _summary(job, [], 0)
+
+    def _inspect(self, manifest_path: str, archive_path: str) -> int:
+        if not zipfile.is_zipfile(archive_path):
+            raise HTTPException(status_code=400, detail="Resume archive is not a valid zip file")
+        try:
+            with open(manifest_path, newline="", encoding="utf-8-sig") as f:
+                reader = _manifest_reader(f)
+                missing = [c for c in MANIFEST_REQUIRED_COLUMNS if c not in (reader.fieldnames or [])]
+                if missing:
+                    raise HTTPException(status_code=400, detail=f"Manifest is missing columns: {', '.join(missing)}")
+                total_rows = sum(1 for _ in reader)
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise HTTPException(status_code=400, detail=f"Manifest is not a readable UTF-8 CSV file: {e}")
+        if total_rows == 0:
+            raise HTTPException(status_code=400, detail="Manifest has no candidate rows")
+        if total_rows > self.max_rows:
+            raise HTTPException(status_code=400, detail=f"Manifest has {total_rows} rows; the maximum per import is {self.max_rows}")
+        return total_rows
+
+    async def run(self, job_id: uuid.UUID) -> None:
+        """Run (or continue after its checkpoint) an import job (task handler)."""
+        async with AsyncSessionLocal() as session:
+            job = await session.get(CandidateImportJob, job_id)
+            if job is None or job.status not in ("queued", "running"):
+                return
+            job.status = "running"
+            await session.commit()
+
+        abs_workdir = os.path.join(settings.BASE_DIR, job.workdir)
+        manifest_path = os.path.join(abs_workdir, "manifest.csv")
+        archive_path = os.path.join(abs_workdir, "resumes.zip")
+        started = time.perf_counter()
+        email_tasks: List[asyncio.Task] = []
+        email_slots = asyncio.Semaphore(self.email_concurrency)
+        try:
+            if not os.path.exists(archive_path):
+                raise FileNotFoundError(f"Import uploads are no longer in {job.workdir}")
+            with open(manifest_path, newline="", encoding="utf-8-sig") as f, zipfile.ZipFile(archive_path) as zf:
+                members = _index_members(zf)
+                seen: Set[str] = set()
+                reader = _manifest_reader(f)
+                batch: List[Tuple[int, Dict[str, str]]] = []
+                for record in reader:
+                    if reader.line_num <= job.checkpoint_line:
+                        # Committed by an earlier attempt; only rebuild the duplicate check
+                        _validate_row(reader.line_num, record, members, seen, job.default_job_description)
+                        continue
+                    batch.append((reader.line_num, record))
+                    if len(batch) >= self.batch_size:
+                        created = await self._import_batch(job, zf, members, batch, seen)
+                        email_tasks += [asyncio.create_task(self._send_welcome_email(c, email_slots)) for c in created]
+                        batch = []
+                if batch:
+                    created = await self._import_batch(job, zf, members, batch, seen)
+                    email_tasks += [asyncio.create_task(self._send_welcome_email(c, email_slots)) for c in created]
+            await self._finish(job, "completed")
+        except _Superseded:
+            logger.warning(f"[CandidateImport] Job {job.id}: continued by another worker; stopping this task")
+        except Exception as e:
+            if is_transient_error(e) and not is_final_attempt():
+                logger.warning(f"[CandidateImport] Job {job.id}: transient error after {job.processed} rows, will retry: {e}")
+                raise
+            logger.exception(f"[CandidateImport] Job {job.id} failed after {job.processed} rows")
+            await self._finish(job, "failed", str(e))
+        finally:
+            if email_tasks:
+                await asyncio.gather(*email_tasks, return_exceptions=True)
+            if job.status in ("completed", "failed"):
+                shutil.rmtree(abs_workdir, ignore_errors=True)
+            logger.info(
+                f"[CandidateImport] Job {job.id} {job.status}: {job.created} created, {job.failed} failed "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+
+    @staticmethod
+    async def _finish(job: CandidateImportJob, final_status: str, error: Optional[str] = None) -> None:
+        job.status = final_status
+        job.error = error
+        job.finished_at = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(CandidateImportJob)
+                .where(CandidateImportJob.id == job.id)
+                .values(status=final_status, error=error, finished_at=job.finished_at)
+            )
+            await session.commit()
+
+    @staticmethod
+    async def _record(session: AsyncSession, job: CandidateImportJob, results: List[Dict[str, Any]], last_line: int) -> None:
+        """Add a batch's row results and advance the checkpoint (compare-and-set) in `session`."""
+        created = sum(1 for r in results if r["status"] == "created")
+        if results:
+            await session.execute(insert(CandidateImportRow).values([
+                {"id": uuid.uuid4(), "job_id": job.id, **r, "email": r["email"][:255]} for r in results
+            ]))
+        advanced = await session.execute(
+            update(CandidateImportJob)
+            .where(CandidateImportJob.id == job.id, CandidateImportJob.checkpoint_line == job.checkpoint_line)
+            .values(
+                checkpoint_line=last_line,
+                processed=CandidateImportJob.processed + len(results),
+                created=CandidateImportJob.created + created,
+                failed=CandidateImportJob.failed + len(results) - created,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if advanced.rowcount != 1:
+            raise _Superseded()
+        job.checkpoint_line = last_line
+        job.processed += len(results)
+        job.created += created
+        job.failed += len(results) - created
+
+    async def _commit_results(self, job: CandidateImportJob, results: List[Dict[str, Any]], last_line: int) -> None:
+        async with AsyncSessionLocal() as session:
+            try:
+                await self._record(session, job, results, last_line)
+            except _Superseded:
+                await session.rollback()
+                raise
+            await session.commit()
+
+    async def _import_batch(
+        self,
+        job: CandidateImportJob,
+        zf: zipfile.ZipFile,
+        members: Dict[str, zipfile.ZipInfo],
+        batch: List[Tuple[int, Dict[str, str]]],
+        seen: Set[str],
+    ) -> List[_Candidate]:
+        """Create one batch of candidates; returns those committed (for welcome emails)."""
+        last_line = batch[-1][0]
+        results: List[Dict[str, Any]] = []
+        candidates: List[_Candidate] = []
+        for row, record in batch:
+            candidate, error = _validate_row(row, record, members, seen, job.default_job_description)
+            if error:
+                results.append(_result(row, (record.get("email") or "").strip(), error))
+            else:
+                candidates.append(candidate)
+        if not candidates:
+            await self._commit_results(job, results, last_line)
+            return []
+
+        async with AsyncSessionLocal() as session:
+            existing = (await session.execute(
+                select(User.username, User.email).where(or_(
+                    User.username.in_([c.username for c in candidates]),
+                    User.email.in_([c.email for c in candidates]),
+                ))
+            )).all()
+        taken = {u for u, _ in existing} | {e for _, e in existing}
+        for c in [c for c in candidates if c.username in taken or c.email in taken]:
+            results.append(_result(c.row, c.email, "Candidate with this email/username already exists"))
+            candidates.remove(c)
+
+        upload_dir = os.path.join(settings.BASE_DIR, RESUME_UPLOAD_DIR)
+        errors = await run_in_threadpool(_extract_resumes, zf, candidates, upload_dir)
+        for c in [c for c in candidates if c.row in errors]:
+            results.append(_result(c.row, c.email, errors[c.row]))
+            candidates.remove(c)
+
+        # Leave the rest of the hasher's queue to interactive logins
+        hash_slots = asyncio.Semaphore(password_hasher.workers)
+
+        async def hash_password(c: _Candidate) -> None:
+            async with hash_slots:
+                for attempt in range(HASH_BUSY_RETRIES + 1):
+                    try:
+                        c.hashed_password = await password_hasher.hash(c.password)
+                        return
+                    except HTTPException as e:
+                        if e.status_code != status.HTTP_503_SERVICE_UNAVAILABLE:
+                            raise
+                        if attempt < HASH_BUSY_RETRIES:
+                            await asyncio.sleep(HASH_BUSY_DELAY_SECONDS)
+
+        await asyncio.gather(*[hash_password(c) for c in candidates])
+        for c in [c for c in candidates if c.hashed_password is None]:
+            _remove_file(os.path.join(settings.BASE_DIR, c.resume_path))
+            results.append(_result(c.row, c.email, "Server busy: could not hash the password; retry this row"))
+            candidates.remove(c)
+        if not candidates:
+            await self._commit_results(job, results, last_line)
+            return []
+
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(User).values([
+                    {
+                        "id": c.user_id,
+                        "username": c.username,
+                        "email": c.email,
+                        "role": UserRole.CANDIDATE,
+                        "hashed_password": c.hashed_password,
+                        "is_active": True,
+                        "login_disabled": False,
+                    }
+                    for c in candidates
+                ]))
+                await session.execute(insert(CandidateProfile).values([
+                    {
+                        "id": uuid.uuid4(),
+                        "user_id": c.user_id,
+                        "first_name": c.first_name,
+                        "last_name": c.last_name,
+                        "resume_id": c.resume_id,
+                        "job_description": c.job_description,
+                        "resume_filename": os.path.basename(c.member.filename),
+                        "resume_path": c.resume_path,
+                        "skills": [],
+                        "parse_status": "pending",
+                        "face_verified": False,
+                        "voice_verified": False,
+                    }
+                    for c in candidates
+                ]))
+                await task_queue_service.enqueue_many(
+                    session,
+                    "parse_candidate_resume",
+                    [({"candidate_id": str(c.user_id)}, f"parse-resume:{c.user_id}") for c in candidates],
+                )
+                await self._record(
+                    session, job, results + [_result(c.row, c.email, candidate_id=c.user_id) for c in candidates], last_line
+                )
+                await session.commit()
+        except Exception as e:
+            for c in candidates:
+                _remove_file(os.path.join(settings.BASE_DIR, c.resume_path))
+            if isinstance(e, _Superseded) or is_transient_error(e):
+                # Nothing from this batch was kept; the task retry imports it again
+                raise
+            # Typically a username/email registered concurrently
+            logger.warning(f"[CandidateImport] Job {job.id}: batch of {len(candidates)} rows rolled back: {e}")
+            results += [
+                _result(c.row, c.email, "Could not create candidate (batch rolled back); retry this row") for c in candidates
+            ]
+            await self._commit_results(job, results, last_line)
+            return []
+
+        list_total_cache.invalidate("candidates")
+        return candidates
+
+    async def _send_welcome_email(self, c: _Candidate, slots: asyncio.Semaphore) -> None:
+        async with slots:
+            try:
+                await email_service.send_candidate_password_email(
+                    c.email, c.first_name, c.username, c.password, resume_path=c.resume_path
+                )
+            except Exception as e:
+                logger.error(f"Failed to send welcome email to {c.email}: {e}")
+            finally:
+                c.password = ""
+
+
+def _spool(upload: UploadFile, dest_path: str, max_bytes: int, label: str) -> None:
+    """Copy an upload to disk in chunks, stopping at max_bytes (413)."""
+    written = 0
+    upload.file.seek(0)
+    with open(dest_path, "wb") as out:
+        while chunk := upload.file.read(COPY_CHUNK_BYTES):
+            written += len(chunk)
+            if written > max_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"{label} exceeds the maximum size of {max_bytes // (1024 * 1024)} MB",
+                )
+            out.write(chunk)
+    if written == 0:
+        raise HTTPException(status_code=400, detail=f"{label} file is empty")
+
+
+def _manifest_reader(f) -> csv.DictReader:
+    reader = csv.DictReader(f)
+    if reader.fieldnames:
+        reader.fieldnames = [(name or "").strip().lower() for name in reader.fieldnames]
+    return reader
+
+
+def _index_members(zf: zipfile.ZipFile) -> Dict[str, zipfile.ZipInfo]:
+    """Archive members by full path and, where unambiguous, by bare file name."""
+    members: Dict[str, zipfile.ZipInfo] = {}
+    by_basename: Dict[str, Optional[zipfile.ZipInfo]] = {}
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        members[info.filename] = info
+        base = os.path.basename(info.filename)
+        by_basename[base] = None if base in by_basename else info
+    for base, info in by_basename.items():
+        if info is not None:
+            members.setdefault(base, info)
+    return members
+
+
+def _validate_row(
+    row: int,
+    record: Dict[str, str],
+    members: Dict[str, zipfile.ZipInfo],
+    seen: Set[str],
+    default_jd: str,
+) -> Tuple[Optional[_Candidate], Optional[str]]:
+    name = (record.get("name") or "").strip()
+    email = (record.get("email") or "").strip()
+    resume = (record.get("resume") or "").strip()
+    job_description = (record.get("job_description") or "").strip() or default_jd
+
+    if not name:
+        return None, "Name is required"
+    local, _, domain = email.partition("@")
+    if not local or "." not in domain:
+        return None, "Invalid email address"
+    username = local
+    if email in seen or username in seen:
+        return None, "Duplicate email/username in manifest"
+    seen.update((email, username))
+
+    if not resume:
+        return None, "Resume file name is required"
+    member = members.get(resume)
+    if member is None:
+        return None, f"Resume '{resume}' not found in archive"
+    if not member.filename.lower().endswith(".pdf"):
+        return None, "Resume must be a PDF"
+    if member.file_size == 0:
+        return None, "Resume file is empty"
+    if member.file_size > settings.BULK_IMPORT_MAX_RESUME_BYTES:
+        return None, "Resume exceeds the maximum file size"
+    if len(job_description.split()) > JD_MAX_WORDS:
+        return None, "Job description exceeds the maximum length of 5 pages (approx 2500 words)."
+
+    names = name.split(" ", 1)
+    return _Candidate(
+        row=row,
+        email=email,
+        username=username,
+        first_name=names[0],
+        last_name=names[1] if len(names) > 1 else "",
+        job_description=job_description,
+        member=member,
+    ), None
+
+
+def _extract_resumes(zf: zipfile.ZipFile, candidates: List[_Candidate], upload_dir: str) -> Dict[int, str]:
+    """Stream each candidate's resume out of the archive; returns {row: error} for rejects."""
+    os.makedirs(upload_dir, exist_ok=True)
+    errors: Dict[int, str] = {}
+    for c in candidates:
+        dest = os.path.join(upload_dir, f"{c.resume_id}.pdf")
+        try:
+            written = 0
+            with zf.open(c.member) as src, open(dest, "wb") as out:
+                # The declared size is not trusted: stop once the cap is passed
+                while chunk := src.read(COPY_CHUNK_BYTES):
+                    written += len(chunk)
+                    if written > settings.BULK_IMPORT_MAX_RESUME_BYTES:
+                        raise ValueError("Resume exceeds the maximum file size")
+                    out.write(chunk)
+        except Exception as e:
+            _remove_file(dest)
+            errors[c.row] = str(e) if isinstance(e, ValueError) else f"Could not read resume from archive: {e}"
+            continue
+
+        try:
+            if len(pypdf.PdfReader(dest).pages) > RESUME_MAX_PAGES:
+                _remove_file(dest)
+                errors[c.row] = "Resume exceeds the maximum length of 10 pages."
+        except Exception as e:
+            logger.warning(f"Could not verify PDF page count for {c.email}: {e}")
+    return errors
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+candidate_import_service = CandidateImportService(
+    batch_size=settings.BULK_IMPORT_BATCH_SIZE,
+    max_rows=settings.BULK_IMPORT_MAX_ROWS,
+    email_concurrency=settings.BULK_IMPORT_EMAIL_CONCURRENCY,
+)
@@ -0,0 +1,78 @@
+"""
+Dashboard Stats Service
+-----------------------
+Interview counts for the admin dashboard.
+
+Counts per status live in interview_status_counts, kept current by triggers on
+`interviews` (see migration 7a2c5e8f1b90), so a dashboard load reads at most one row per
+status whatever the size of the interviews table. If the counter table is empty (a
+database built with create_all, without the migration's triggers) the counts come from a
+single FILTER-aggregate scan of `interviews` instead.
+
+Results are reused for DASHBOARD_STATS_CACHE_TTL_SECONDS within a process.
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.sql.enums import InterviewStatus
+from app.db.sql.models.interview import Interview, InterviewStatusCount
+
+
+class DashboardStatsService:
+    """Per-status interview counts with a short per-process TTL cache."""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._cached: Optional[Tuple[float, Dict[str, int]]] = None
+
+    async def get_stats(self, session: AsyncSession) -> Dict[str, int]:
+        if self._cached and time.monotonic() - self._cached[0] < self.ttl_seconds:
+            return self._cached[1]
+
+        counts = await self.read_counts(session)
+        if counts is None:
+            counts = await self.compute_counts(session)
+
+        stats = {
+            "total_interviews": sum(counts.values()),
+            "completed": counts.get(InterviewStatus.COMPLETED, 0),
+            # Scheduled and in-progress interviews are both still pending
+            "pending": counts.get(InterviewStatus.SCHEDULED, 0) + counts.get(InterviewStatus.IN_PROGRESS, 0),
+            # Flagged interviews (not implemented yet, return 0)
+            "flagged": 0,
+        }
+        if self.ttl_seconds > 0:
+            self._cached = (time.monotonic(), stats)
+        return stats
+
+    async def read_counts(self, session: AsyncSession) -> Optional[Dict[InterviewStatus, int]]:
+        """Counts from the trigger-maintained table; None if it has never been populated."""
+        result = await session.execute(select(InterviewStatusCount.status, InterviewStatusCount.count))
+        rows = result.all()
+        if not rows:
+            return None
+        return {
+            InterviewStatus[status]: count
+            for status, count in rows
+            if status in InterviewStatus.__members__
+        }
+
+    async def compute_counts(self, session: AsyncSession) -> Dict[InterviewStatus, int]:
+        """Counts per status from `interviews` in one scan."""
+        columns = [
+            func.count().filter(Interview.status == status).label(status.name)
+            for status in InterviewStatus
+        ]
+        row = (await session.execute(select(*columns))).one()
+        return {status: getattr(row, status.name) or 0 for status in InterviewStatus}
+
+    def invalidate(self) -> None:
+        self._cached = None
+
+
+dashboard_stats_service = DashboardStatsService(ttl_seconds=settings.DASHBOARD_STATS_CACHE_TTL_SECONDS)
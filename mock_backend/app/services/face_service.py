@@ -39,23 +39,43 @@ class FaceService:
             return self._enroll_azure(candidate_id, image_bytes, content_type)
         return self._enroll_mock(candidate_id, image_bytes, content_type)
 
-    def _enroll_mock(self, candidate_id: str, image_bytes: bytes, content_type: str) -> Tuple[str, Optional[str]]:
+    def new_sample_path(self, candidate_id: str, content_type: str = "image/jpeg") -> Tuple[str, Path]:
+        """Reference id and local path for a face image, e.g. to stream an upload into."""
         ext = "jpg" if "jpeg" in content_type or "jpg" in content_type else "png"
         ref_id = str(uuid.uuid4())
-        filename = f"{candidate_id}_{ref_id}.{ext}"
-        path = UPLOAD_DIR / filename
+        return ref_id, UPLOAD_DIR / f"{candidate_id}_{ref_id}.{ext}"
+
+    def enroll_face_file(self, candidate_id: str, ref_id: str, path: Path, content_type: str = "image/jpeg") -> Tuple[str, Optional[str]]:
+        """
+        Enroll a face image already written to `path` (from new_sample_path).
+        For mock: the file is the enrolled image. For Azure: its bytes go to the Face API.
+        """
+        if self._use_azure:
+            enrolled = self._azure_add_face(candidate_id, path.read_bytes(), content_type)
+            if enrolled:
+                return enrolled
+        # The streamed file is the enrolled image: no second copy
+        logger.info("Face enrolled (mock) for candidate %s, ref=%s, path=%s", candidate_id, ref_id, str(path))
+        return ref_id, str(path)
+
+    def _enroll_mock(self, candidate_id: str, image_bytes: bytes, content_type: str) -> Tuple[str, Optional[str]]:
+        ref_id, path = self.new_sample_path(candidate_id, content_type)
         path.write_bytes(image_bytes)
         logger.info("Face enrolled (mock) for candidate %s, ref=%s, path=%s", candidate_id, ref_id, str(path))
         return ref_id, str(path)
 
     def _enroll_azure(self, candidate_id: str, image_bytes: bytes, content_type: str) -> Tuple[str, Optional[str]]:
+        return self._azure_add_face(candidate_id, image_bytes, content_type) or self._enroll_mock(candidate_id, image_bytes, content_type)
+
+    def _azure_add_face(self, candidate_id: str, image_bytes: bytes, content_type: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Add the face to the candidate's Azure person; None when it could not (callers fall back to mock)."""
         # TODO: Use Azure Face API, e.g.:
         # person_group_id = "interview_candidates"
         # person_id = get_or_create_person(person_group_id, candidate_id)
         # result = self.client.person_group_person.add_face_from_stream(person_group_id, person_id, image_bytes)
         # return result.persisted_face_id, None
         logger.warning("Azure Face API not implemented yet; falling back to mock enroll")
-        return self._enroll_mock(candidate_id, image_bytes, content_type)
+        return None
 
     def verify_face(self, reference_id: str, probe_image_bytes: bytes) -> Tuple[bool, float]:
         """
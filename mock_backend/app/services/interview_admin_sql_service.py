@@ -1,4 +1,5 @@
 import uuid
+import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone, timedelta
 from fastapi import HTTPException, status
@@ -12,6 +13,13 @@ from app.db.sql.models.interview_template import InterviewTemplate
 from app.db.sql.models.interview_session_question import InterviewSessionQuestion
 from app.services.question_generator_service import question_generator_service
 from app.services.template_engine import template_engine
+from app.services.task_queue_service import task_queue_service, is_transient_error, is_final_attempt
+from app.services.template_config_cache import template_config_cache
+from app.services.dashboard_stats_service import dashboard_stats_service
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.pagination import TOTAL_MODES, InvalidCursorError, list_total_cache
+
+logger = logging.getLogger(__name__)
 
 class InterviewAdminSQLService:
     @staticmethod
@@ -36,25 +44,15 @@ class InterviewAdminSQLService:
         questions: Optional[List[Any]] = None,
         draft_interview_id: Optional[uuid.UUID] = None
     ) -> Interview:
-        async with UnitOfWork(session) as uow:
-            # If draft_interview_id is provided, we just update it
-            if draft_interview_id:
-                interview = await uow.interviews.get_by_id(draft_interview_id, with_for_update=True)
-                if not interview:
-                    raise HTTPException(status_code=404, detail="Draft interview not found")
-                
-                # Check if it belongs to the right candidate and template
-                if interview.candidate_id != candidate_id or interview.template_id != template_id:
-                    raise HTTPException(status_code=400, detail="Draft interview mismatch with candidate/template")
-                
-                # Update status and scheduled_at
-                interview.status = InterviewStatus.SCHEDULED
-                interview.scheduled_at = scheduled_at
-                interview.assigned_by = assigned_by # Refresh assigned_by
-                
-                await uow.flush()
-                return interview
+        # If draft_interview_id is provided, we just update it
+        if draft_interview_id:
+            interview = await InterviewAdminSQLService._schedule_draft(
+                session, draft_interview_id, template_id, candidate_id, assigned_by, scheduled_at
+            )
+            dashboard_stats_service.invalidate()
+            return interview
 
+        async with UnitOfWork(session) as uow:
             # 1. Validate candidate
             candidate = await uow.users.get_by_id(candidate_id)
             if not candidate:
@@ -70,42 +68,145 @@ class InterviewAdminSQLService:
                 raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Candidate already has an active interview (status: scheduled or in_progress)")
 
             # 3. Validate template
-            result = await session.execute(
-                select(InterviewTemplate)
-                .where(InterviewTemplate.id == template_id)
-                .with_for_update()
-            )
-            template = result.scalar_one_or_none()
+            template = await template_config_cache.get(session, template_id)
             if not template:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview template not found")
-            
-            # 4. Build curated questions
-            # Reuse logic from generate_curated_questions
-            profile = candidate.candidate_profile
-            curated_questions = await question_generator_service.generate_curated_questions(
-                session=session,
-                template_id=str(template_id),
-                candidate_id=str(candidate_id),
-                resume_id=profile.resume_id if profile else None,
-                resume_text=profile.resume_text if profile else "",
-                job_description=profile.job_description if profile else "",
-                resume_json=profile.resume_json if profile else None,
-                jd_json=profile.jd_json if profile else None,
-            )
 
-            # 5. Create Interview record
+            # 4. Create Interview record; curated questions are generated in the background
             interview = Interview(
                 candidate_id=candidate_id,
                 template_id=template_id,
                 assigned_by=assigned_by,
                 status=InterviewStatus.SCHEDULED,
                 scheduled_at=scheduled_at,
-                curated_questions=curated_questions,
+                curated_questions=None,
+                generation_status="pending",
             )
 
             uow.interviews.create_interview(interview)
             await uow.flush()
-            return interview
+
+            # Enqueued in the same transaction: the job exists iff the interview does
+            await task_queue_service.enqueue(
+                session,
+                "generate_interview_questions",
+                {"interview_id": str(interview.id)},
+                idempotency_key=f"interview-questions:{interview.id}",
+            )
+        list_total_cache.invalidate("interviews")
+        dashboard_stats_service.invalidate()
+        return interview
+
+    @staticmethod
+    async def _schedule_draft(
+        session: AsyncSession,
+        draft_interview_id: uuid.UUID,
+        template_id: uuid.UUID,
+        candidate_id: uuid.UUID,
+        assigned_by: uuid.UUID,
+        scheduled_at: datetime,
+    ) -> Interview:
+        async with UnitOfWork(session) as uow:
+            interview = await uow.interviews.get_by_id(draft_interview_id, with_for_update=True)
+            if not interview:
+                raise HTTPException(status_code=404, detail="Draft interview not found")
+            
+            # Check if it belongs to the right candidate and template
+            if interview.candidate_id != candidate_id or interview.template_id != template_id:
+                raise HTTPException(status_code=400, detail="Draft interview mismatch with candidate/template")
+            
+            # Update status and scheduled_at
+            interview.status = InterviewStatus.SCHEDULED
+            interview.scheduled_at = scheduled_at
+            interview.assigned_by = assigned_by # Refresh assigned_by
+            
+            await uow.flush()
+        return interview
+
+    @staticmethod
+    async def generate_interview_questions(interview_id: uuid.UUID) -> None:
+        """
+        Background job: build curated questions for an accepted interview.
+
+        Runs on its own session without row locks while questions are generated, then
+        takes a short lock to store them. Runs on the task queue, whose per-type
+        concurrency limit keeps bulk scheduling from draining the connection pool.
+        Transient errors are raised for the queue to retry; the interview is marked
+        "failed" on permanent errors or the final attempt.
+        """
+        async with AsyncSessionLocal() as session:
+            try:
+                interview = await session.get(Interview, interview_id)
+                if not interview or interview.generation_status != "pending" or interview.status == InterviewStatus.CANCELLED:
+                    return
+                candidate = await UnitOfWork(session).users.get_by_id(interview.candidate_id)
+                profile = candidate.candidate_profile if candidate else None
+                template_id = interview.template_id
+                candidate_id = interview.candidate_id
+
+                curated_questions = await question_generator_service.generate_curated_questions(
+                    session=session,
+                    template_id=str(template_id),
+                    candidate_id=str(candidate_id),
+                    resume_id=profile.resume_id if profile else None,
+                    resume_text=profile.resume_text if profile else "",
+                    job_description=profile.job_description if profile else "",
+                    resume_json=profile.resume_json if profile else None,
+                    jd_json=profile.jd_json if profile else None,
+                    retry_transient_errors=True,
+                )
+                await session.commit()
+
+                # The interview may have been cancelled while questions were generated
+                interview = await InterviewAdminSQLService._lock_interview(session, interview_id)
+                if not interview or interview.generation_status != "pending" or interview.status == InterviewStatus.CANCELLED:
+                    await session.rollback()
+                    return
+                interview.curated_questions = curated_questions
+                interview.generation_status = "ready"
+                interview.generation_error = None
+                await session.commit()
+                logger.info(f"Curated questions ready for interview {interview_id}")
+            except Exception as e:
+                await session.rollback()
+                if is_transient_error(e) and not is_final_attempt():
+                    # Stays "pending"; the task queue retries with backoff
+                    logger.warning(f"Question generation for interview {interview_id} hit a transient error, will be retried: {e}")
+                    raise
+                logger.error(f"Question generation failed for interview {interview_id}: {e}", exc_info=True)
+                interview = await InterviewAdminSQLService._lock_interview(session, interview_id)
+                if interview and interview.generation_status == "pending":
+                    interview.generation_status = "failed"
+                    interview.generation_error = str(e)[:500]
+                await session.commit()
+
+    @staticmethod
+    async def _lock_interview(session: AsyncSession, interview_id: uuid.UUID) -> Optional[Interview]:
+        result = await session.execute(
+            select(Interview)
+            .where(Interview.id == interview_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_generation_status(session: AsyncSession, interview_id: uuid.UUID) -> Dict[str, Any]:
+        """Polling view of background question generation for a scheduled interview."""
+        result = await session.execute(
+            select(Interview.id, Interview.status, Interview.generation_status, Interview.generation_error)
+            .where(Interview.id == interview_id)
+        )
+        row = result.one_or_none()
+        if not row:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
+        return {
+            "interview_id": str(row.id),
+            "status": row.status.value if isinstance(row.status, InterviewStatus) else row.status,
+            "generation_status": row.generation_status,
+            "generation_error": row.generation_error,
+            "ready": row.generation_status == "ready",
+        }
 
     @staticmethod
     async def get_draft_interview(
@@ -211,10 +312,8 @@ class InterviewAdminSQLService:
             if section_type == 'technical':
                 # Determine regeneration strategy based on source
                 source = target_q.get('source', 'llm_generated')
-                template = await session.get(InterviewTemplate, interview.template_id)
-                preferred_source = "ai_generated"
-                if template and template.technical_config:
-                    preferred_source = template.technical_config.get("question_source", "ai_generated")
+                template = await template_config_cache.get(session, interview.template_id)
+                preferred_source = template.question_source if template else "ai_generated"
 
                 # Context
                 candidate = await uow.users.get_by_id(interview.candidate_id)
@@ -253,12 +352,10 @@ class InterviewAdminSQLService:
             
             elif section_type == 'coding':
                 # Problem-solving regeneration (coding problem or analytical question)
-                template = await session.get(InterviewTemplate, interview.template_id)
-                config = template.coding_config or {}
-                ps_type_raw = config.get("problem_solving_type") or config.get("problem_type") or "coding"
-                ps_type = str(ps_type_raw).lower()
+                template = await template_config_cache.get(session, interview.template_id)
+                config = template.coding_config if template else {}
 
-                if ps_type in ["analytical", "analytical_question", "analytical_questions", "non_coding", "non-coding"]:
+                if template and template.problem_solving_type == "analytical":
                     candidate = await uow.users.get_by_id(interview.candidate_id)
                     profile = candidate.candidate_profile if candidate else None
                     role_name = profile.role_name if profile and profile.role_name else None
@@ -322,8 +419,9 @@ class InterviewAdminSQLService:
             interview.cancelled_at = datetime.now(timezone.utc)
             if reason:
                 interview.cancellation_reason = reason
-                
-            return interview
+
+        dashboard_stats_service.invalidate()
+        return interview
 
     @staticmethod
     async def reschedule_interview(session: AsyncSession, interview_id: uuid.UUID, scheduled_at: datetime) -> Interview:
@@ -340,9 +438,23 @@ class InterviewAdminSQLService:
             return interview
 
     @staticmethod
-    async def get_interview_summary(session: AsyncSession, limit: int = 10, offset: int = 0, search: str = "") -> Dict[str, Any]:
+    async def get_interview_summary(
+        session: AsyncSession,
+        limit: int = 10,
+        offset: int = 0,
+        search: str = "",
+        cursor: Optional[str] = None,
+        total_mode: str = "exact",
+    ) -> Dict[str, Any]:
+        if total_mode not in TOTAL_MODES:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"total must be one of {', '.join(TOTAL_MODES)}")
         async with UnitOfWork(session) as uow:
-            return await uow.interviews.get_all_summary(limit=limit, offset=offset, search=search)
+            try:
+                return await uow.interviews.get_all_summary(
+                    limit=limit, offset=offset, search=search, cursor=cursor, total_mode=total_mode
+                )
+            except InvalidCursorError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     @staticmethod
     async def list_active_templates(session: AsyncSession) -> List[Dict[str, Any]]:
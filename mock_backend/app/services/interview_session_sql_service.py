@@ -4,7 +4,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.orm import selectinload
 
 from app.db.sql.unit_of_work import UnitOfWork
@@ -17,28 +17,18 @@ from app.db.sql.models.user import CandidateProfile
 from app.db.sql.models.coding_problem import CodingProblem, TestCase
 from app.db.sql.models.question import QuestionType
 from app.services.answer_evaluation_service import answer_evaluation_service
+from app.services.session_state_cache import session_state_cache, SessionState
+from app.services.template_config_cache import template_config_cache, DEFAULT_CONVERSATIONAL_ROUNDS
+from app.services.session_aggregate_service import session_aggregate_service
+from app.services.dashboard_stats_service import dashboard_stats_service
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Concurrency Guard: Track sessions currently generating questions in background
-_active_generations = set()
-
 # Global LLM Concurrency Limit
 import asyncio
 LLM_SEMAPHORE = asyncio.Semaphore(5)
 
-def run_background_task(coro):
-    """Safe wrapper for background tasks to catch exceptions."""
-    async def wrapper():
-        try:
-            await coro
-        except Exception as e:
-            logger.exception("Background task failed", exc_info=e)
-
-    import asyncio
-    asyncio.create_task(wrapper())
-
 # ── Mock score generation ──────────────────────────────────────────────────────
 _STRENGTH_POOL = [
     "Clear communication and structured thinking",
@@ -154,42 +144,42 @@ class InterviewSessionSQLService:
                 uow, session_id, candidate_id
             )
             
-            stmt = select(InterviewSessionSection).where(
-                InterviewSessionSection.interview_session_id == session_obj.id
-            ).order_by(InterviewSessionSection.order_index)
-            
-            result = await session.execute(stmt)
-            sections = result.scalars().all()
-            
-            res = []
-            for s in sections:
-                q_stmt = select(InterviewSessionQuestion.id).where(
-                    InterviewSessionQuestion.interview_session_id == session_obj.id,
-                    InterviewSessionQuestion.section_id == s.id
+            # Per-section question and answered counts in a single grouped query
+            counts = (
+                select(
+                    InterviewSessionQuestion.section_id.label("section_id"),
+                    func.count(func.distinct(InterviewSessionQuestion.id)).label("total_questions"),
+                    func.count(func.distinct(InterviewResponse.id)).label("completed_questions"),
                 )
-                q_res = await session.execute(q_stmt)
-                q_ids = list(q_res.scalars().all())
-                
-                completed_q = 0
-                if q_ids:
-                    resp_stmt = select(func.count(InterviewResponse.id)).where(
-                        InterviewResponse.session_id == session_obj.id,
-                        InterviewResponse.question_id.in_(q_ids)
-                    )
-                    resp_res = await session.execute(resp_stmt)
-                    completed_q = resp_res.scalar() or 0
-                
-                total_q = len(q_ids)
+                .outerjoin(
+                    InterviewResponse,
+                    (InterviewResponse.question_id == InterviewSessionQuestion.id)
+                    & (InterviewResponse.session_id == session_obj.id),
+                )
+                .where(InterviewSessionQuestion.interview_session_id == session_obj.id)
+                .group_by(InterviewSessionQuestion.section_id)
+                .subquery()
+            )
+            stmt = (
+                select(
+                    InterviewSessionSection,
+                    func.coalesce(counts.c.total_questions, 0),
+                    func.coalesce(counts.c.completed_questions, 0),
+                )
+                .outerjoin(counts, counts.c.section_id == InterviewSessionSection.id)
+                .where(InterviewSessionSection.interview_session_id == session_obj.id)
+                .order_by(InterviewSessionSection.order_index)
+            )
+            rows = (await session.execute(stmt)).all()
+
+            # Conversational sections report the configured round count
+            max_conv = 10
+            if any(s.section_type == "conversational" for s, _, _ in rows):
+                max_conv = await InterviewSessionSQLService._conversational_rounds(uow.session, interview.template_id)
+
+            res = []
+            for s, total_q, completed_q in rows:
                 if s.section_type == "conversational":
-                    from app.db.sql.models.interview_template import InterviewTemplate
-                    template = None
-                    if interview.template_id:
-                        template = await uow.session.get(InterviewTemplate, interview.template_id)
-                    max_conv = 10
-                    if template and template.conversational_config:
-                        conv_config = template.conversational_config
-                        if isinstance(conv_config, dict):
-                            max_conv = conv_config.get("rounds", 10)
                     total_q = max_conv
 
                 display_type = s.section_type
@@ -266,18 +256,10 @@ class InterviewSessionSQLService:
                 
                 # If no questions exist, generate initial batch
                 if existing_count == 0:
-                    # Get template to find how many conversational questions should be generated
-                    from app.db.sql.models.interview_template import InterviewTemplate
-                    template = None
-                    if interview.template_id:
-                        template = await uow.session.get(InterviewTemplate, interview.template_id)
-                    
                     # Get conversational config to determine number of questions
-                    num_conversational_questions = 10  # Default
-                    if template and template.conversational_config:
-                        conv_config = template.conversational_config
-                        if isinstance(conv_config, dict):
-                            num_conversational_questions = conv_config.get("rounds", 10)
+                    num_conversational_questions = await InterviewSessionSQLService._conversational_rounds(
+                        uow.session, interview.template_id
+                    )
                     
                     # Get candidate profile for resume/JD data
                     candidate = await uow.users.get_by_id(candidate_id)
@@ -294,7 +276,9 @@ class InterviewSessionSQLService:
                     # Start background generation
                     logger.info(f"[Session {session_id}] Conversational section started, first question will be generated on demand")
             
+            await InterviewSessionSQLService._bump_state_version(uow.session, session_obj.id)
             await uow.flush()
+            session_state_cache.invalidate(session_id)
             
             return {
                 "state": "IN_PROGRESS",
@@ -304,6 +288,182 @@ class InterviewSessionSQLService:
                 "message": "Section started. Questions are being prepared."
             }
 
+    @staticmethod
+    async def _conversational_rounds(db: AsyncSession, template_id: Optional[uuid.UUID]) -> int:
+        """Configured conversational rounds for the template (default 10)."""
+        template_cfg = await template_config_cache.get(db, template_id)
+        return template_cfg.conversational_rounds if template_cfg else DEFAULT_CONVERSATIONAL_ROUNDS
+
+    @staticmethod
+    async def _get_session_header(
+        uow: UnitOfWork,
+        session_id: uuid.UUID,
+        candidate_id: Optional[uuid.UUID] = None,
+    ):
+        """Ownership, current section and state_version only; the cheap read on the cached path."""
+        result = await uow.session.execute(
+            select(
+                InterviewSession.candidate_id,
+                InterviewSession.current_section_id,
+                InterviewSession.state_version,
+            ).where(
+                InterviewSession.id == session_id,
+                InterviewSession.status == "active",
+            )
+        )
+        header = result.one_or_none()
+
+        if not header:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Session not found or not active",
+            )
+
+        if candidate_id and header.candidate_id != candidate_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Session does not belong to you",
+            )
+
+        return header
+
+    @staticmethod
+    async def _bump_state_version(db: AsyncSession, session_id: uuid.UUID) -> int:
+        """Increment InterviewSession.state_version in the caller's transaction and return it."""
+        result = await db.execute(
+            update(InterviewSession)
+            .where(InterviewSession.id == session_id)
+            .values(state_version=InterviewSession.state_version + 1)
+            .returning(InterviewSession.state_version)
+        )
+        return result.scalar_one()
+
+    @staticmethod
+    async def _render_session_question(
+        db: AsyncSession,
+        q: InterviewSessionQuestion,
+        position: int,
+        section_size: int,
+        interview: Interview,
+        section_type: Optional[str],
+        num_conversational_questions: int,
+    ) -> Dict[str, Any]:
+        """
+        Build the /question/next response for one session question, without "question_number".
+        `position` is the question's index among the section's questions in serving order.
+        """
+        q_type = getattr(q, "question_type", None) or "technical"
+
+        # ── CODING branch ─────────────────────────────────────────────────
+        if q_type == "coding":
+            # Prefer coding_problem loaded via direct FK (new path)
+            coding_problem = q.coding_problem
+
+            # Legacy fallback: coding loaded via Question.question_type
+            if coding_problem is None and q.question and q.question.question_type == QuestionType.CODING:
+                cp_result = await db.execute(
+                    select(CodingProblem).where(CodingProblem.question_id == q.question.id)
+                )
+                coding_problem = cp_result.scalars().first()
+
+            if not coding_problem:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Coding problem configuration missing for this question.",
+                )
+
+            tc_result = await db.execute(
+                select(TestCase)
+                .where(
+                    TestCase.problem_id == coding_problem.id,
+                    TestCase.is_hidden == False,  # noqa: E712
+                )
+                .order_by(TestCase.order)
+            )
+            visible_tcs = tc_result.scalars().all()
+
+            return {
+                "type": "coding",
+                "question_id": str(q.question.id) if q.question else None,
+                "session_question_id": str(q.id),
+                "problem_id": str(coding_problem.id),
+                "title": coding_problem.title,
+                "difficulty": coding_problem.difficulty,
+                "description": coding_problem.description,
+                "starter_code": coding_problem.starter_code or {},
+                "examples": [
+                    {"input": tc.input, "expected_output": tc.expected_output}
+                    for tc in visible_tcs
+                ],
+                "time_limit_sec": coding_problem.time_limit_sec,
+                "total_questions": section_size,
+            }
+
+        # ── CONVERSATIONAL branch ─────────────────────────────────────────
+        if q_type == "conversational":
+            question_text = q.custom_text
+            # Ensure question_text is not empty
+            if not question_text or question_text.strip() == "":
+                question_text = "Tell me about your projects and experience."
+                logger.warning(f"[get_session_state] Using fallback question text for question {q.id}")
+
+            return {
+                "type": "conversational",
+                "conversation_round": q.conversation_round or 1,
+                "round_number": q.conversation_round or 1,
+                "answer_mode": "AUDIO",
+                "time_limit_sec": 300,
+                "question_text": question_text,
+                "question_id": str(q.id),
+                "total_questions": num_conversational_questions,
+            }
+
+        # ── TECHNICAL branch ──────────────────────────────────────────────
+        answer_mode = "TEXT"
+        time_limit_sec = 240
+
+        if interview.curated_questions and "questions" in interview.curated_questions:
+            questions_list = interview.curated_questions["questions"]
+            # Match by order or question_id in curated_questions
+            q_data = None
+            for curated_q in questions_list:
+                if curated_q.get("question_id") == str(q.question_id):
+                    q_data = curated_q
+                    break
+
+            if not q_data and len(questions_list) > position:
+                q_data = questions_list[position]
+
+            if q_data:
+                answer_mode = q_data.get("answer_mode", "text").upper() or "TEXT"
+                time_limit_sec = q_data.get("time_limit_sec", 240)
+
+        if answer_mode == "TEXT":
+            if q.question:
+                category_name = q.question.category.name if hasattr(q.question.category, "name") else str(q.question.category)
+                answer_mode = "CODE" if category_name in ["SQL", "DATA_STRUCTURES"] else "AUDIO"
+            elif q.custom_text:
+                answer_mode = "AUDIO"
+
+        answer_mode = answer_mode.upper() if answer_mode else "TEXT"
+        section_response_type = "technical"
+        if section_type == "coding" and q_type == "technical":
+            # Problem-solving analytical mode should support spoken answers.
+            answer_mode = "AUDIO"
+            section_response_type = "analytical"
+        prompt = q.custom_text or (q.question.text if q.question else "Please answer the following question.")
+
+        return {
+            "type": section_response_type,
+            "question_id": str(q.id),
+            "question_text": prompt,
+            "answer_mode": answer_mode,
+            "time_limit_sec": time_limit_sec,
+            "difficulty": q.question.difficulty.value if q.question else None,
+            "category": q.question.category.value if q.question else None,
+            "total_questions": section_size,
+        }
+
     @staticmethod
     async def get_session_state(
         session: AsyncSession,
@@ -311,6 +471,20 @@ class InterviewSessionSQLService:
         candidate_id: uuid.UUID,
     ) -> Dict[str, Any]:
         async with UnitOfWork(session) as uow:
+            header = await InterviewSessionSQLService._get_session_header(uow, session_id, candidate_id)
+
+            if not header.current_section_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="No active section. Please start a section first."
+                )
+
+            # Common path: cached state still matches the DB version
+            cached = session_state_cache.next_question(session_id, header.state_version, header.current_section_id)
+            if cached is not None:
+                return cached
+            state_version = header.state_version
+
             session_obj, interview = await InterviewSessionSQLService._get_session_and_interview(
                 uow, session_id, candidate_id
             )
@@ -354,17 +528,10 @@ class InterviewSessionSQLService:
                 
                 # BRANCH A: Conversational section (generate project-based questions)
                 if current_section and current_section.section_type == "conversational":
-                    # Get template to find how many conversational questions should be generated
-                    from app.db.sql.models.interview_template import InterviewTemplate
-                    template = None
-                    if interview.template_id:
-                        template = await uow.session.get(InterviewTemplate, interview.template_id)
-                    
-                    num_conversational_questions = 10  # Default
-                    if template and template.conversational_config:
-                        conv_config = template.conversational_config
-                        if isinstance(conv_config, dict):
-                            num_conversational_questions = conv_config.get("rounds", 10)
+                    # How many conversational questions the template asks for
+                    num_conversational_questions = await InterviewSessionSQLService._conversational_rounds(
+                        uow.session, interview.template_id
+                    )
                     
                     # Count how many conversational questions already exist
                     existing_conv_questions = await uow.session.execute(
@@ -467,18 +634,29 @@ class InterviewSessionSQLService:
                             )
                             conv_count_result = await uow.session.execute(conv_count_stmt)
                             conv_question_number = conv_count_result.scalar() or 1
-                            
-                            return {
-                                "type": "conversational",
-                                "question_id": str(live_session_question.id),
-                                "question_text": live_question.get("prompt", ""),
-                                "answer_mode": live_question.get("answer_mode", "text").upper(),
-                                "time_limit_sec": live_question.get("time_limit_sec", 240),
-                                "difficulty": live_question.get("difficulty", "medium"),
-                                "question_number": conv_question_number,
-                                "total_questions": num_conversational_questions,
-                                "source": "live_generated"
-                            }
+                            new_version = await InterviewSessionSQLService._bump_state_version(
+                                uow.session, current_session_id
+                            )
+                            # What a repeat poll for this question returns from the DB
+                            cached_payload = await InterviewSessionSQLService._render_session_question(
+                                uow.session, live_session_question, len(questions), len(questions) + 1,
+                                interview, "conversational", num_conversational_questions,
+                            )
+
+                        session_state_cache.add_question(
+                            current_session_id, live_session_question.id, cached_payload, new_version
+                        )
+                        return {
+                            "type": "conversational",
+                            "question_id": str(live_session_question.id),
+                            "question_text": live_question.get("prompt", ""),
+                            "answer_mode": live_question.get("answer_mode", "text").upper(),
+                            "time_limit_sec": live_question.get("time_limit_sec", 240),
+                            "difficulty": live_question.get("difficulty", "medium"),
+                            "question_number": conv_question_number,
+                            "total_questions": num_conversational_questions,
+                            "source": "live_generated"
+                        }
 
                 # BRANCH B: Technical section (potential legacy fallback)
                 elif current_section and current_section.section_type == "technical":
@@ -496,189 +674,95 @@ class InterviewSessionSQLService:
             
             q_type = getattr(q, "question_type", None) or "technical"
 
-            # ── CODING branch ─────────────────────────────────────────────────
-            if q_type == "coding":
-                # Prefer coding_problem loaded via direct FK (new path)
-                coding_problem = q.coding_problem
-
-                # Legacy fallback: coding loaded via Question.question_type
-                if coding_problem is None and q.question and q.question.question_type == QuestionType.CODING:
-                    cp_result = await session.execute(
-                        select(CodingProblem).where(CodingProblem.question_id == q.question.id)
-                    )
-                    coding_problem = cp_result.scalars().first()
-
-                if not coding_problem:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Coding problem configuration missing for this question.",
-                    )
-
-                tc_result = await session.execute(
-                    select(TestCase)
-                    .where(
-                        TestCase.problem_id == coding_problem.id,
-                        TestCase.is_hidden == False,  # noqa: E712
-                    )
-                    .order_by(TestCase.order)
-                )
-                visible_tcs = tc_result.scalars().all()
-
-                return {
-                    "type": "coding",
-                    "question_id": str(q.question.id) if q.question else None,
-                    "session_question_id": str(q.id),
-                    "problem_id": str(coding_problem.id),
-                    "title": coding_problem.title,
-                    "difficulty": coding_problem.difficulty,
-                    "description": coding_problem.description,
-                    "starter_code": coding_problem.starter_code or {},
-                    "examples": [
-                        {"input": tc.input, "expected_output": tc.expected_output}
-                        for tc in visible_tcs
-                    ],
-                    "time_limit_sec": coding_problem.time_limit_sec,
-                    "question_number": answered_count_in_section + 1,
-                    "total_questions": len(questions),
-                }
-
-            # ── CONVERSATIONAL branch ─────────────────────────────────────────
-            if q_type == "conversational":
-                # Get question text from custom_text (which should contain the actual generated question)
-                question_text = q.custom_text
-                logger.debug(f"[get_session_state] Conversational question {q.id}: custom_text = '{question_text[:100] if question_text else 'None'}...'")
-                if not question_text or question_text.strip() == "":
-                    # Fallback: if custom_text is empty, try to generate a new question
-                    logger.warning(f"[get_session_state] Conversational question {q.id} has empty custom_text, generating new question")
-                    # Get candidate data for generation
-                    candidate = await uow.users.get_by_id(candidate_id)
-                    resume_data = None
-                    jd_data = None
-                    if candidate and candidate.candidate_profile:
-                        profile = candidate.candidate_profile
-                        resume_data = profile.resume_json or {}
-                        jd_data = profile.jd_json or {}
-                    
-                    # Get previous questions and answers
-                    all_prev_q = await uow.session.execute(
-                        select(InterviewSessionQuestion).where(
-                            InterviewSessionQuestion.interview_session_id == session_obj.id
-                        ).order_by(InterviewSessionQuestion.order)
-                    )
-                    prev_questions_list = all_prev_q.scalars().all()
-                    previous_questions = [{"question_id": str(pq.id), "prompt": pq.custom_text or "", "question_type": "conversational"} for pq in prev_questions_list if pq.custom_text]
-                    
-                    all_prev_a = await uow.session.execute(
-                        select(InterviewResponse).where(
-                            InterviewResponse.session_id == session_obj.id
-                        ).order_by(InterviewResponse.submitted_at)
-                    )
-                    prev_answers_list = all_prev_a.scalars().all()
-                    previous_answers = [{"answer_text": pa.answer_text or ""} for pa in prev_answers_list]
-                    
-                    asked_question_ids = [str(pq.id) for pq in prev_questions_list]
-                    
-                    # Store necessary data briefly
-                    current_section_id = session_obj.current_section_id
-                    
-                    # --- Step 2: Call LLM OUTSIDE DB transaction ---
-                    from app.services.question_generator_service import question_generator_service
-                    async with LLM_SEMAPHORE:
-                        live_question = await question_generator_service.generate_live_conversational_question(
-                            resume_data=resume_data or {},
-                            jd_data=jd_data or {},
-                            previous_questions=previous_questions,
-                            previous_answers=previous_answers,
-                            asked_question_ids=asked_question_ids
-                        )
-                    
-                    # --- Step 3: Re-open session for write ---
-                    async with UnitOfWork(session) as uow:
-                        # Update the question with the generated text
-                        q.custom_text = live_question.get("prompt", "Tell me about your projects.")
-                        question_text = q.custom_text
-                        await uow.flush()
-                        logger.debug(f"[get_session_state] Generated and updated question text: {question_text[:80]}...")
+            if q_type == "conversational" and (not q.custom_text or q.custom_text.strip() == ""):
+                # Fallback: if custom_text is empty, try to generate a new question
+                logger.warning(f"[get_session_state] Conversational question {q.id} has empty custom_text, generating new question")
+                # Get candidate data for generation
+                candidate = await uow.users.get_by_id(candidate_id)
+                resume_data = None
+                jd_data = None
+                if candidate and candidate.candidate_profile:
+                    profile = candidate.candidate_profile
+                    resume_data = profile.resume_json or {}
+                    jd_data = profile.jd_json or {}
                 
-                # Ensure question_text is not empty
-                if not question_text or question_text.strip() == "":
-                    question_text = "Tell me about your projects and experience."
-                    logger.warning(f"[get_session_state] Using fallback question text for question {q.id}")
+                # Get previous questions and answers
+                all_prev_q = await uow.session.execute(
+                    select(InterviewSessionQuestion).where(
+                        InterviewSessionQuestion.interview_session_id == session_obj.id
+                    ).order_by(InterviewSessionQuestion.order)
+                )
+                prev_questions_list = all_prev_q.scalars().all()
+                previous_questions = [{"question_id": str(pq.id), "prompt": pq.custom_text or "", "question_type": "conversational"} for pq in prev_questions_list if pq.custom_text]
                 
-                logger.debug(f"[get_session_state] Returning conversational question: '{question_text[:100]}...'")
+                all_prev_a = await uow.session.execute(
+                    select(InterviewResponse).where(
+                        InterviewResponse.session_id == session_obj.id
+                    ).order_by(InterviewResponse.submitted_at)
+                )
+                prev_answers_list = all_prev_a.scalars().all()
+                previous_answers = [{"answer_text": pa.answer_text or ""} for pa in prev_answers_list]
                 
-                from app.db.sql.models.interview_template import InterviewTemplate
-                template = None
-                if interview.template_id:
-                    template = await uow.session.get(InterviewTemplate, interview.template_id)
-                num_conversational_questions = 10
-                if template and template.conversational_config:
-                    conv_config = template.conversational_config
-                    if isinstance(conv_config, dict):
-                        num_conversational_questions = conv_config.get("rounds", 10)
-
-                return {
-                    "type": "conversational",
-                    "conversation_round": q.conversation_round or 1,
-                    "round_number": q.conversation_round or 1,
-                    "answer_mode": "AUDIO",
-                    "time_limit_sec": 300,
-                    "question_text": question_text,
-                    "question_id": str(q.id),
-                    "question_number": answered_count_in_section + 1,
-                    "total_questions": num_conversational_questions,
-                }
-
-            # ── TECHNICAL branch ──────────────────────────────────────────────
-            answer_mode = "TEXT"
-            time_limit_sec = 240
-
-            if interview.curated_questions and "questions" in interview.curated_questions:
-                questions_list = interview.curated_questions["questions"]
-                # Match by order or question_id in curated_questions
-                q_data = None
-                for curated_q in questions_list:
-                    if curated_q.get("question_id") == str(q.question_id):
-                        q_data = curated_q
-                        break
+                asked_question_ids = [str(pq.id) for pq in prev_questions_list]
                 
-                if not q_data and len(questions_list) > answered_count_in_section:
-                    q_data = questions_list[answered_count_in_section]
+                # --- Step 2: Call LLM OUTSIDE DB transaction ---
+                from app.services.question_generator_service import question_generator_service
+                async with LLM_SEMAPHORE:
+                    live_question = await question_generator_service.generate_live_conversational_question(
+                        resume_data=resume_data or {},
+                        jd_data=jd_data or {},
+                        previous_questions=previous_questions,
+                        previous_answers=previous_answers,
+                        asked_question_ids=asked_question_ids
+                    )
                 
-                if q_data:
-                    answer_mode = q_data.get("answer_mode", "text").upper() or "TEXT"
-                    time_limit_sec = q_data.get("time_limit_sec", 240)
-
-            if answer_mode == "TEXT":
-                if q.question:
-                    category_name = q.question.category.name if hasattr(q.question.category, "name") else str(q.question.category)
-                    answer_mode = "CODE" if category_name in ["SQL", "DATA_STRUCTURES"] else "AUDIO"
-                elif q.custom_text:
-                    answer_mode = "AUDIO"
-
-            answer_mode = answer_mode.upper() if answer_mode else "TEXT"
-            section_response_type = "technical"
-            if session_obj.current_section_id and q.section_id == session_obj.current_section_id:
-                from app.db.sql.models.interview_session_section import InterviewSessionSection
-                current_section = await uow.session.get(InterviewSessionSection, session_obj.current_section_id)
-                if current_section and current_section.section_type == "coding" and q_type == "technical":
-                    # Problem-solving analytical mode should support spoken answers.
-                    answer_mode = "AUDIO"
-                    section_response_type = "analytical"
-            prompt = q.custom_text or (q.question.text if q.question else "Please answer the following question.")
+                # --- Step 3: Re-open session for write ---
+                async with UnitOfWork(session) as uow:
+                    # Update the question with the generated text
+                    q.custom_text = live_question.get("prompt", "Tell me about your projects.")
+                    await uow.flush()
+                    state_version = await InterviewSessionSQLService._bump_state_version(uow.session, session_obj.id)
+                    logger.debug(f"[get_session_state] Generated and updated question text: {q.custom_text[:80]}...")
 
-            return {
-                "type": section_response_type,
-                "question_id": str(q.id),
-                "question_text": prompt,
-                "answer_mode": answer_mode,
-                "time_limit_sec": time_limit_sec,
-                "difficulty": q.question.difficulty.value if q.question else None,
-                "category": q.question.category.value if q.question else None,
-                "question_number": answered_count_in_section + 1,
-                "total_questions": len(questions),
-            }
+            from app.db.sql.models.interview_session_section import InterviewSessionSection
+            current_section = await uow.session.get(InterviewSessionSection, session_obj.current_section_id)
+            section_type = current_section.section_type if current_section else None
 
+            num_conversational_questions = 10
+            if any((getattr(uq, "question_type", None) or "technical") == "conversational" for uq in unanswered_questions):
+                num_conversational_questions = await InterviewSessionSQLService._conversational_rounds(
+                    uow.session, interview.template_id
+                )
+
+            # Render the current question, then the rest of the section so the following
+            # /question/next calls are served from the session state cache.
+            payloads: Dict[uuid.UUID, Dict[str, Any]] = {}
+            for offset, uq in enumerate(unanswered_questions):
+                uq_type = getattr(uq, "question_type", None) or "technical"
+                if offset and uq_type == "conversational" and (not uq.custom_text or uq.custom_text.strip() == ""):
+                    break
+                try:
+                    payloads[uq.id] = await InterviewSessionSQLService._render_session_question(
+                        uow.session, uq, answered_count_in_section + offset, len(questions),
+                        interview, section_type, num_conversational_questions,
+                    )
+                except HTTPException:
+                    if not offset:
+                        raise
+                    break
+
+            result = dict(payloads[q.id])
+            result["question_number"] = answered_count_in_section + 1
+            current_section_id = session_obj.current_section_id
+
+        session_state_cache.put(session_id, SessionState(
+            version=state_version,
+            current_section_id=current_section_id,
+            question_ids=[sq.id for sq in questions],
+            answered={sq.id for sq in questions if sq.id in answered_q_ids},
+            payloads=payloads,
+        ))
+        return result
 
     @staticmethod
     async def get_answered_count(
@@ -706,7 +790,9 @@ class InterviewSessionSQLService:
         async with UnitOfWork(session) as uow:
             from app.db.sql.models.interview_session_section import InterviewSessionSection
             
-            session_obj = await uow.session.get(InterviewSession, session_id)
+            session_obj = await uow.session.get(
+                InterviewSession, session_id, with_for_update=True, populate_existing=True
+            )
             if not session_obj:
                 raise HTTPException(status_code=404, detail="Session not found")
             
@@ -717,21 +803,46 @@ class InterviewSessionSQLService:
                 raise HTTPException(status_code=404, detail="Session question not found")
                 
             score = (passed_count / total_count * 10.0) if total_count > 0 else 0.0
-            
-            response = InterviewResponse(
-                session_id=session_id,
-                question_id=session_question_id,
-                answer_mode="CODE",
-                ai_score=score,
-                ai_feedback=f"Passed {passed_count}/{total_count} test cases",
-                evaluation_json={
-                    "passed_count": passed_count,
-                    "total_count": total_count,
-                    "type": "coding"
-                }
-            )
-            session.add(response)
-            session_obj.answered_count += 1
+            evaluation_json = {
+                "passed_count": passed_count,
+                "total_count": total_count,
+                "type": "coding"
+            }
+
+            # (session_id, question_id) is unique: a re-submission replaces the stored result
+            existing = (await session.execute(
+                select(InterviewResponse).where(
+                    InterviewResponse.session_id == session_id,
+                    InterviewResponse.question_id == session_question_id,
+                )
+            )).scalar_one_or_none()
+
+            if existing:
+                old_score = existing.ai_score
+                existing.ai_score = score
+                existing.ai_feedback = f"Passed {passed_count}/{total_count} test cases"
+                existing.evaluation_json = evaluation_json
+                existing.submitted_at = datetime.now(timezone.utc)
+                if session_aggregate_service.replace_score(session_obj, sq.section_id, old_score, score):
+                    await uow.flush()
+                    bounds = (await session.execute(
+                        select(func.max(InterviewResponse.ai_score), func.min(InterviewResponse.ai_score))
+                        .where(InterviewResponse.session_id == session_id)
+                    )).one()
+                    session_obj.score_max, session_obj.score_min = bounds
+            else:
+                response = InterviewResponse(
+                    session_id=session_id,
+                    question_id=session_question_id,
+                    answer_mode="CODE",
+                    ai_score=score,
+                    ai_feedback=f"Passed {passed_count}/{total_count} test cases",
+                    evaluation_json=evaluation_json,
+                )
+                session.add(response)
+                session_obj.answered_count += 1
+                session_aggregate_service.record_response(session_obj, sq.section_id, score, evaluation_json)
+            new_version = await InterviewSessionSQLService._bump_state_version(uow.session, session_id)
             
             # Check if section is complete
             stmt = select(InterviewSessionQuestion.id).where(
@@ -776,15 +887,12 @@ class InterviewSessionSQLService:
                         # Do not auto-complete until candidate submits mandatory feedback.
                         return_state = "READY"
                         await uow.flush()
+                        session_state_cache.invalidate(session_id)
                         return {"state": return_state}
 
                     return_state = "COMPLETED"
                     
-                    score_stmt = select(func.avg(InterviewResponse.ai_score)).where(
-                        InterviewResponse.session_id == session_id
-                    )
-                    avg_score_result = await session.execute(score_stmt)
-                    avg_score = avg_score_result.scalar() or 0.0
+                    avg_score = session_aggregate_service.average_score(session_obj)
                     overall_score = (avg_score / 10.0) * 100.0
                     
                     session_obj.status = "completed"
@@ -803,7 +911,14 @@ class InterviewSessionSQLService:
                         )
             
             await uow.flush()
-            return {"state": return_state}
+
+        if is_section_complete:
+            session_state_cache.invalidate(session_id)
+        else:
+            session_state_cache.mark_answered(session_id, session_question_id, new_version)
+        if return_state == "COMPLETED":
+            dashboard_stats_service.invalidate()
+        return {"state": return_state}
 
     @staticmethod
     async def submit_answer(
@@ -941,6 +1056,20 @@ class InterviewSessionSQLService:
                 uow, session_id, candidate_id, with_for_update=True
             )
 
+            # A concurrent submit for the same question won the row lock while we were
+            # evaluating; (session_id, question_id) is unique, so report it instead of failing the insert.
+            already_answered = await session.scalar(
+                select(InterviewResponse.id).where(
+                    InterviewResponse.session_id == session_id,
+                    InterviewResponse.question_id == current_question_id,
+                )
+            )
+            if already_answered:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="This question has already been answered",
+                )
+
             if q_type == "conversational":
                 response = InterviewResponse(
                     session_id=session_id,
@@ -965,6 +1094,10 @@ class InterviewSessionSQLService:
                 )
             session.add(response)
             session_obj.answered_count += 1
+            session_aggregate_service.record_response(
+                session_obj, current_section_id_snap, evaluation.get("score"), evaluation
+            )
+            new_version = await InterviewSessionSQLService._bump_state_version(uow.session, session_obj.id)
 
             # Check if this section is now complete
             new_unanswered_count = unanswered_count_before - 1
@@ -972,15 +1105,9 @@ class InterviewSessionSQLService:
             # For conversational sections, check against template config rounds
             # not just DB question count (questions are generated on demand)
             if q_type == "conversational":
-                from app.db.sql.models.interview_template import InterviewTemplate
-                template = None
-                if interview.template_id:
-                    template = await uow.session.get(InterviewTemplate, interview.template_id)
-                num_conversational_questions = 10  # default
-                if template and template.conversational_config:
-                    conv_config = template.conversational_config
-                    if isinstance(conv_config, dict):
-                        num_conversational_questions = conv_config.get("rounds", 10)
+                num_conversational_questions = await InterviewSessionSQLService._conversational_rounds(
+                    uow.session, interview.template_id
+                )
                 # Count only conversational answers for this section
                 conv_answered_stmt = select(func.count(InterviewResponse.id)).where(
                     InterviewResponse.session_id == session_obj.id,
@@ -1021,35 +1148,18 @@ class InterviewSessionSQLService:
                 if all_completed:
                     return_state = "COMPLETED"
                     
-                    # Calculate overall score and complete
-                    score_stmt = select(func.avg(InterviewResponse.ai_score)).where(
-                        InterviewResponse.session_id == session_id
-                    )
-                    avg_score_result = await session.execute(score_stmt)
-                    avg_score = avg_score_result.scalar() or 0.0
+                    # Calculate overall score and complete from the running aggregates
+                    avg_score = session_aggregate_service.average_score(session_obj)
                     overall_score = (avg_score / 10.0) * 100.0
                     
-                    feedback_stmt = select(InterviewResponse).where(
-                        InterviewResponse.session_id == session_id
-                    ).order_by(InterviewResponse.submitted_at)
-                    feedback_result = await session.execute(feedback_stmt)
-                    all_responses = feedback_result.scalars().all()
-                    
-                    strengths = []
-                    weaknesses = []
-                    for resp in all_responses:
-                        if resp.evaluation_json:
-                            strengths.extend(resp.evaluation_json.get('strengths', []))
-                            weaknesses.extend(resp.evaluation_json.get('weaknesses', []))
-                    
                     session_obj.status = "completed"
                     session_obj.completed_at = now
                     interview.status = InterviewStatus.COMPLETED
                     interview.completed_at = now
                     interview.overall_score = round(overall_score, 2)
                     
-                    strengths_list = list(set(strengths))[:3] if strengths else []
-                    weaknesses_list = list(set(weaknesses))[:3] if weaknesses else []
+                    strengths_list = session_aggregate_service.top_feedback(session_obj, "strengths", 3)
+                    weaknesses_list = session_aggregate_service.top_feedback(session_obj, "weaknesses", 3)
                     
                     interview.feedback = (
                         f"Overall Score: {overall_score:.1f}/100. "
@@ -1066,7 +1176,14 @@ class InterviewSessionSQLService:
                     )
 
             await uow.flush()
-            return {"state": return_state}
+
+        if is_section_complete:
+            session_state_cache.invalidate(session_id)
+        else:
+            session_state_cache.mark_answered(session_id, current_question_id, new_version)
+        if return_state == "COMPLETED":
+            dashboard_stats_service.invalidate()
+        return {"state": return_state}
 
     @staticmethod
     async def complete_current_section(
@@ -1091,9 +1208,11 @@ class InterviewSessionSQLService:
                 current_section.completed_at = datetime.now(timezone.utc)
             
             session_obj.current_section_id = None
+            await InterviewSessionSQLService._bump_state_version(uow.session, session_obj.id)
             await uow.flush()
 
-            return {"state": "SECTION_COMPLETED"}
+        session_state_cache.invalidate(session_id)
+        return {"state": "SECTION_COMPLETED"}
 
     @staticmethod
     async def complete_session(
@@ -1112,12 +1231,8 @@ class InterviewSessionSQLService:
 
             now = datetime.now(timezone.utc)
             
-            # 1️⃣ Calculate average score
-            score_stmt = select(func.avg(InterviewResponse.ai_score)).where(
-                InterviewResponse.session_id == session_id
-            )
-            avg_score_result = await uow.session.execute(score_stmt)
-            avg_score = avg_score_result.scalar() or 0.0
+            # 1️⃣ Average score from the running aggregates
+            avg_score = session_aggregate_service.average_score(session_obj)
             overall_score = (avg_score / 10.0) * 100.0
 
             # 2️⃣ Update interview fields
@@ -1139,7 +1254,9 @@ class InterviewSessionSQLService:
                 session_id=str(session_obj.id)
             )
 
-            return {"state": "COMPLETED"}
+        session_state_cache.invalidate(session_id)
+        dashboard_stats_service.invalidate()
+        return {"state": "COMPLETED"}
 
     @staticmethod
     async def submit_candidate_feedback(
@@ -1263,16 +1380,16 @@ class InterviewSessionSQLService:
         interview_template_id: Optional[uuid.UUID],
         num_conversational_questions: int
     ):
-        """Background task to generate conversational questions without blocking the main request."""
+        """
+        Background task to generate conversational questions without blocking the main request.
+        Runs on the task queue ("generate_conversational_questions"), enqueued with an
+        idempotency key per session section so only one generation runs at a time.
+        """
         from app.db.sql.session import AsyncSessionLocal
         from app.db.sql.models.interview_session_question import InterviewSessionQuestion
         from app.db.sql.models.user import User
         from app.services.question_generator_service import question_generator_service
         
-        if session_id in _active_generations:
-            return
-        
-        _active_generations.add(session_id)
         logger.info(f"[Session {session_id}] Background generation STARTED")
         
         try:
@@ -1336,6 +1453,8 @@ class InterviewSessionSQLService:
                             conversation_round=round_num
                         )
                         db.add(session_question)
+                        await db.flush()
+                        await InterviewSessionSQLService._bump_state_version(db, session_id)
                 
                 previous_questions.append({
                     "question_id": str(session_question.id),
@@ -1349,5 +1468,4 @@ class InterviewSessionSQLService:
             logger.error(f"[Session {session_id}] Background generation FAILED: {e}", exc_info=True)
             raise
         finally:
-            _active_generations.discard(session_id)
             logger.info(f"[Session {session_id}] Background generation FINISHED")
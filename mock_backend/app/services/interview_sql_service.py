@@ -3,31 +3,20 @@ import logging
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone, timedelta
 from fastapi import HTTPException, status
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.sql.unit_of_work import UnitOfWork
 from app.db.sql.enums import InterviewStatus
 from app.db.sql.models.interview_session import InterviewSession
+from app.db.sql.models.interview_session_section import InterviewSessionSection
 from app.db.sql.models.interview_session_question import InterviewSessionQuestion
 from app.db.sql.models.question import Question
+from app.services.template_config_cache import template_config_cache
 
 logger = logging.getLogger(__name__)
 
 class InterviewSQLService:
-    @staticmethod
-    def _normalize_problem_solving_type(coding_config: Optional[dict]) -> str:
-        cfg = coding_config or {}
-        raw = (
-            cfg.get("problem_solving_type")
-            or cfg.get("problem_type")
-            or cfg.get("type")
-            or "coding"
-        )
-        raw_s = str(raw).strip().lower()
-        if raw_s in ("analytical", "analytical_question", "analytical_questions", "non_coding", "non-coding"):
-            return "analytical"
-        return "coding"
-
     @staticmethod
     async def get_active_interview_for_candidate(session: AsyncSession, candidate_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         async with UnitOfWork(session) as uow:
@@ -127,6 +116,15 @@ class InterviewSQLService:
                     detail=f"Cannot start interview with status '{current_status.value}'"
                 )
 
+            # Questions are generated in the background after scheduling
+            if interview.generation_status != "ready":
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Interview questions are still being prepared. Please try again shortly."
+                    if interview.generation_status == "pending"
+                    else "Interview questions could not be prepared. Please contact the administrator."
+                )
+
             # Time gate: scheduled_at must be <= now (UTC)
             if interview.scheduled_at:
                 now_utc = datetime.now(timezone.utc)
@@ -155,88 +153,73 @@ class InterviewSQLService:
             now = datetime.now(timezone.utc)
             interview.started_at = now
             
-            # Create a new session
+            # Create a new session (client-side id so sections/questions can reference it)
             new_session = InterviewSession(
+                id=uuid.uuid4(),
                 interview_id=interview_id,
                 candidate_id=candidate_id,
                 started_at=now,
                 status="active"
             )
             uow.interviews.create_session(new_session)
-            await uow.flush() # Needed so we can return the ID and use it for relationships
             
             # Retrieve durations from template configs
             tech_dur = 20
             coding_dur = 40
             conv_dur = 15
             
-            from app.db.sql.models.interview_template import InterviewTemplate
-            template_obj = None
-            if interview.template_id:
-                template_obj = await uow.session.get(InterviewTemplate, interview.template_id)
-                
-            if template_obj:
-                t_cfg = template_obj.technical_config or {}
-                c_cfg = template_obj.coding_config or {}
-                v_cfg = template_obj.conversational_config or {}
+            template_cfg = await template_config_cache.get(uow.session, interview.template_id)
                 
+            if template_cfg:
                 # Tech duration
-                if "duration_minutes" in t_cfg and t_cfg["duration_minutes"] > 0:
-                    tech_dur = t_cfg["duration_minutes"]
+                if template_cfg.technical_duration_minutes:
+                    tech_dur = template_cfg.technical_duration_minutes
                 else:
-                    logger.warning(f"Interview {interview_id}: Missing technical duration in template {template_obj.id}, using default 20m")
+                    logger.warning(f"Interview {interview_id}: Missing technical duration in template {template_cfg.id}, using default 20m")
                 
                 # Coding duration
-                if "duration_minutes" in c_cfg and c_cfg["duration_minutes"] > 0:
-                    coding_dur = c_cfg["duration_minutes"]
+                if template_cfg.coding_duration_minutes:
+                    coding_dur = template_cfg.coding_duration_minutes
                 else:
-                    logger.warning(f"Interview {interview_id}: Missing coding duration in template {template_obj.id}, using default 40m")
+                    logger.warning(f"Interview {interview_id}: Missing coding duration in template {template_cfg.id}, using default 40m")
                 
                 # Conversational duration
-                if "duration_minutes" in v_cfg and v_cfg["duration_minutes"] > 0:
-                    conv_dur = v_cfg["duration_minutes"]
+                if template_cfg.conversational_duration_minutes:
+                    conv_dur = template_cfg.conversational_duration_minutes
                 else:
-                    logger.warning(f"Interview {interview_id}: Missing conversational duration in template {template_obj.id}, using default 15m")
+                    logger.warning(f"Interview {interview_id}: Missing conversational duration in template {template_cfg.id}, using default 15m")
             else:
                 logger.warning(f"Interview {interview_id}: No template found for session creation, using global defaults for durations")
 
-            from app.db.sql.models.interview_session_section import InterviewSessionSection
-            
-            # Create the three sections with extracted durations
-            tech_section = InterviewSessionSection(
-                interview_session_id=new_session.id,
-                section_type="technical",
-                order_index=1,
-                duration_minutes=tech_dur,
-                status="pending"
-            )
-            coding_section = InterviewSessionSection(
-                interview_session_id=new_session.id,
-                section_type="coding",
-                order_index=2,
-                duration_minutes=coding_dur,
-                status="pending"
-            )
-            conv_section = InterviewSessionSection(
-                interview_session_id=new_session.id,
-                section_type="conversational",
-                order_index=3,
-                duration_minutes=conv_dur,
-                status="pending"
-            )
-            uow.session.add_all([tech_section, coding_section, conv_section])
-            await uow.flush()
-            
-            section_map = {
-                "technical": tech_section.id,
-                "coding": coding_section.id,
-                "conversational": conv_section.id
-            }
+            # The three sections, with extracted durations
+            section_rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "interview_session_id": new_session.id,
+                    "section_type": section_type,
+                    "order_index": order_index,
+                    "duration_minutes": duration,
+                    "status": "pending",
+                }
+                for order_index, (section_type, duration) in enumerate(
+                    [("technical", tech_dur), ("coding", coding_dur), ("conversational", conv_dur)], start=1
+                )
+            ]
+            section_map = {row["section_type"]: row["id"] for row in section_rows}
 
-            from app.db.sql.models.interview_session_question import InterviewSessionQuestion
-            from app.db.sql.models.question import Question
+            question_rows = []
 
-            order_idx = 1
+            def add_question(section_type: str, question_type: str, **fields) -> None:
+                question_rows.append({
+                    "id": uuid.uuid4(),
+                    "interview_session_id": new_session.id,
+                    "section_id": section_map[section_type],
+                    "question_type": question_type,
+                    "question_id": fields.get("question_id"),
+                    "custom_text": fields.get("custom_text"),
+                    "coding_problem_id": fields.get("coding_problem_id"),
+                    "order": len(question_rows) + 1,
+                })
             
             # 1. ADD TECHNICAL QUESTIONS FROM curated_questions
             # NOTE: Conversational questions are NOT created here - they are generated LIVE
@@ -248,6 +231,21 @@ class InterviewSQLService:
                     questions_list = interview.curated_questions['technical_section']['questions']
                 elif 'questions' in interview.curated_questions:
                     questions_list = interview.curated_questions['questions']
+
+                # Which referenced bank questions still exist, in one query
+                referenced_ids = set()
+                for q_data in questions_list:
+                    try:
+                        referenced_ids.add(uuid.UUID(q_data['question_id']))
+                    except (KeyError, ValueError, TypeError, AttributeError):
+                        # Missing or invalid UUID format, ignore
+                        pass
+                existing_ids = set()
+                if referenced_ids:
+                    existing_result = await uow.session.execute(
+                        select(Question.id).where(Question.id.in_(referenced_ids))
+                    )
+                    existing_ids = set(existing_result.scalars().all())
                 
                 for q_data in questions_list:
                     q_type = q_data.get('question_type', 'technical')
@@ -263,16 +261,14 @@ class InterviewSQLService:
                     
                     # Only process technical questions here
                     if q_type == 'technical':
-                        # For technical questions, check if question_id exists in database
+                        # For technical questions, use question_id only if it exists in the database
                         question_id = None
                         if 'question_id' in q_data:
                             try:
                                 parsed_id = uuid.UUID(q_data['question_id'])
-                                # Verify the question actually exists in the database
-                                question_check = await uow.session.get(Question, parsed_id)
-                                if question_check:
+                                if parsed_id in existing_ids:
                                     question_id = parsed_id
-                            except (ValueError, TypeError):
+                            except (ValueError, TypeError, AttributeError):
                                 # Invalid UUID format, ignore
                                 question_id = None
                         
@@ -288,57 +284,40 @@ class InterviewSQLService:
                             if not custom_text:
                                 custom_text = "Technical question"
                         
-                        session_question = InterviewSessionQuestion(
-                            id=uuid.uuid4(),
-                            interview_session_id=new_session.id,
-                            section_id=section_map["technical"],
-                            question_type="technical",
+                        add_question(
+                            "technical",
+                            "technical",
                             question_id=question_id,  # Will be None for LLM-generated questions
                             custom_text=custom_text if not question_id else None,  # Use custom_text if no valid question_id
-                            order=order_idx
                         )
-                        uow.session.add(session_question)
-                        order_idx += 1
                     
             # 2. ADD PROBLEM-SOLVING QUESTIONS FOR SECTION 2
-            if interview.template_id:
-                from app.db.sql.models.interview_template import InterviewTemplate
+            if template_cfg:
                 from app.services.template_engine import template_engine, CodingProblemItem
                 
-                template = await uow.session.get(InterviewTemplate, interview.template_id)
-                if template:
-                    ps_type = InterviewSQLService._normalize_problem_solving_type(template.coding_config or {})
-                    if ps_type == "coding":
-                        generated_items = await template_engine.generate_interview_questions(template, uow.session)
-                        for item in generated_items:
-                            if isinstance(item, CodingProblemItem):
-                                session_q = InterviewSessionQuestion(
-                                    interview_session_id=new_session.id,
-                                    section_id=section_map["coding"],
-                                    question_type="coding",
-                                    coding_problem_id=item.coding_problem_id,
-                                    order=order_idx,
-                                )
-                                uow.session.add(session_q)
-                                order_idx += 1
-                    else:
-                        # Analytical mode: use generated problem-solving questions (non-coding)
-                        analytical_questions = (
-                            (interview.curated_questions or {}).get("coding_section", {}).get("questions", [])
+                if template_cfg.problem_solving_type == "coding":
+                    generated_items = await template_engine.generate_interview_questions(template_cfg, uow.session)
+                    for item in generated_items:
+                        if isinstance(item, CodingProblemItem):
+                            add_question("coding", "coding", coding_problem_id=item.coding_problem_id)
+                else:
+                    # Analytical mode: use generated problem-solving questions (non-coding)
+                    analytical_questions = (
+                        (interview.curated_questions or {}).get("coding_section", {}).get("questions", [])
+                    )
+                    for q_data in analytical_questions:
+                        add_question(
+                            "coding",
+                            "technical",
+                            custom_text=q_data.get("prompt") or q_data.get("text") or "Analytical question",
                         )
-                        for q_data in analytical_questions:
-                            session_q = InterviewSessionQuestion(
-                                interview_session_id=new_session.id,
-                                section_id=section_map["coding"],
-                                question_type="technical",
-                                question_id=None,
-                                custom_text=q_data.get("prompt") or q_data.get("text") or "Analytical question",
-                                order=order_idx,
-                            )
-                            uow.session.add(session_q)
-                            order_idx += 1
 
+            # Interview update + session insert, then one multi-row INSERT each for
+            # sections and questions (ids are generated client-side, nothing to read back)
             await uow.flush()
+            await uow.session.execute(insert(InterviewSessionSection).values(section_rows))
+            if question_rows:
+                await uow.session.execute(insert(InterviewSessionQuestion).values(question_rows))
 
             return {
                 "session_id": str(new_session.id),
@@ -1,6 +1,8 @@
 import logging
 from typing import Optional
 
+from app.services.skill_matcher import skill_matcher
+
 logger = logging.getLogger(__name__)
 
 def calculate_match_score(resume_json: Optional[dict], jd_json: Optional[dict]) -> float:
@@ -15,14 +17,15 @@ def calculate_match_score(resume_json: Optional[dict], jd_json: Optional[dict])
 
     # 1. Skills Matching (60% weight)
     # ---------------------------------------------------------
-    resume_skills = set(str(s).lower().strip() for s in resume_json.get("skills", []))
+    # Canonical names, so aliases ("Postgres" / "PostgreSQL", "ML" / "machine learning") compare equal
+    resume_skills = set(skill_matcher.canonical_skills(resume_json.get("skills", [])))
     
     # Extract jd_json["required_skills"] or fallback to jd_json["skills"]
     jd_required_skills = jd_json.get("required_skills")
     if jd_required_skills is None:
         jd_required_skills = jd_json.get("skills", [])
     
-    jd_skills = set(str(s).lower().strip() for s in jd_required_skills)
+    jd_skills = set(skill_matcher.canonical_skills(jd_required_skills))
     
     skills_score = 0.0
     if jd_skills:
@@ -0,0 +1,156 @@
+"""
+Parse Cache Service
+-------------------
+Persistent cache of structured LLM parses (resume_json / jd_json), so a hiring drive that
+shares one job description across hundreds of candidates, or a re-uploaded resume,
+costs one LLM call instead of one per candidate.
+
+Entries live in `parse_cache`, keyed by kind, the sha256 of the whitespace-normalized
+text and the parser version; bumping RESUME_PARSER_VERSION / JD_PARSER_VERSION makes
+old entries unreachable. Only successful LLM parses are stored: when the LLM is
+unavailable the caller's fallback parse is returned uncached, so the next parse tries
+the LLM again. Concurrent misses for the same key within a process share one parse.
+
+A hit is one UPDATE ... RETURNING that also bumps the entry's hit_count. Hit/miss
+counts since process start are reported by stats(), totals per kind by db_stats().
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.sql.models.parse_cache import ParseCacheEntry
+from app.db.sql.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]
+
+
+def normalized_text_hash(text: str) -> str:
+    """sha256 of the text with runs of whitespace collapsed (PDF extraction varies in spacing)."""
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+class ParseCacheService:
+    """Get-or-parse over the parse_cache table with in-process request coalescing."""
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    async def get_or_parse(
+        self,
+        kind: str,
+        parser_version: str,
+        text: str,
+        parse: Callable[[], Awaitable[Dict[str, Any]]],
+        fallback: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        The cached parse of `text`, else `parse()` (which raises when the LLM fails) stored
+        for next time, else `fallback()`. A cached result's "text" key is set to `text`.
+        """
+        if not self.enabled or not text or not text.strip():
+            try:
+                return await parse()
+            except Exception as e:
+                logger.warning(f"[ParseCache] {kind} parse failed, using fallback: {e}")
+                return fallback()
+
+        key = (kind, normalized_text_hash(text), parser_version)
+        cached = await self._lookup(key)
+        if cached is not None:
+            self._count(kind, "hits")
+            return self._for_text(cached, text)
+
+        future = self._inflight.get(key)
+        if future is None:
+            self._count(kind, "misses")
+            future = asyncio.ensure_future(self._parse_and_store(key, parse))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._count(kind, "coalesced")
+        try:
+            result = await asyncio.shield(future)
+        except Exception as e:
+            self._count(kind, "uncached")
+            logger.warning(f"[ParseCache] {kind} parse failed, using fallback (not cached): {e}")
+            return fallback()
+        return self._for_text(result, text)
+
+    @staticmethod
+    def _for_text(result: Dict[str, Any], text: str) -> Dict[str, Any]:
+        # Copy: callers add keys to the parse they get back
+        result = dict(result)
+        if "text" in result:
+            result["text"] = text
+        return result
+
+    async def _lookup(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        kind, content_hash, parser_version = key
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    update(ParseCacheEntry)
+                    .where(
+                        ParseCacheEntry.kind == kind,
+                        ParseCacheEntry.content_hash == content_hash,
+                        ParseCacheEntry.parser_version == parser_version,
+                    )
+                    .values(hit_count=ParseCacheEntry.hit_count + 1, last_hit_at=func.now())
+                    .returning(ParseCacheEntry.result)
+                )
+                cached = result.scalar_one_or_none()
+                await session.commit()
+                return cached
+        except Exception as e:
+            logger.warning(f"[ParseCache] Lookup failed, parsing without cache: {e}")
+            return None
+
+    async def _parse_and_store(self, key: CacheKey, parse: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        result = await parse()
+        kind, content_hash, parser_version = key
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(
+                    pg_insert(ParseCacheEntry)
+                    .values(kind=kind, content_hash=content_hash, parser_version=parser_version, result=result, hit_count=0)
+                    .on_conflict_do_nothing(index_elements=["kind", "content_hash", "parser_version"])
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"[ParseCache] Could not store {kind} parse: {e}")
+        return result
+
+    def _count(self, kind: str, counter: str) -> None:
+        counters = self._counters.setdefault(kind, {"hits": 0, "misses": 0, "coalesced": 0, "uncached": 0})
+        counters[counter] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-kind counters since process start; hit_rate counts coalesced misses as hits."""
+        out = {}
+        for kind, c in self._counters.items():
+            lookups = c["hits"] + c["misses"] + c["coalesced"]
+            out[kind] = {**c, "hit_rate": round((c["hits"] + c["coalesced"]) / lookups, 3) if lookups else 0.0}
+        return {"enabled": self.enabled, "kinds": out}
+
+    @staticmethod
+    async def db_stats(session: AsyncSession) -> Dict[str, Dict[str, int]]:
+        """Stored entries and lifetime hits per kind."""
+        rows = (await session.execute(
+            select(ParseCacheEntry.kind, func.count(), func.coalesce(func.sum(ParseCacheEntry.hit_count), 0))
+            .group_by(ParseCacheEntry.kind)
+        )).all()
+        return {kind: {"entries": entries, "hits": int(hits)} for kind, entries, hits in rows}
+
+
+parse_cache_service = ParseCacheService(enabled=settings.PARSE_CACHE_ENABLED)
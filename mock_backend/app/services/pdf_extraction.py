@@ -0,0 +1,204 @@
+"""
+PDF Text Extraction Pool
+------------------------
+pypdf is pure Python: a large or malformed resume can take seconds of CPU, and run on
+the event loop (or a thread, holding the GIL) it stalls every other request. Extraction
+therefore runs in a small process pool shared by the resume parsers, which also lets it
+use more than one core.
+
+Each document is checked against PDF_EXTRACTION_MAX_BYTES before it is submitted, only
+its first PDF_EXTRACTION_MAX_PAGES pages are read, and it must finish within
+PDF_EXTRACTION_TIMEOUT_SECONDS. Worker processes run with an address-space limit of
+PDF_EXTRACTION_MEMORY_LIMIT_MB (Linux/macOS), so a decompression bomb fails with
+MemoryError instead of exhausting the host.
+
+Each worker is its own single-process executor and takes one document at a time:
+submissions wait for a free worker first, so the timeout covers only the extraction
+itself, never time spent queued behind other documents. A timed-out document's process
+cannot be interrupted, so that worker alone is killed and replaced; documents on other
+workers are unaffected. A document whose worker crashed is resubmitted once.
+
+Set PDF_EXTRACTION_WORKERS=0 to extract on a thread in the calling process instead.
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Set, Union
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PdfSource = Union[bytes, str]
+
+
+class PdfExtractionError(Exception):
+    """The document was rejected, timed out or could not be read."""
+
+
+def extract_pdf_pages(source: PdfSource, max_pages: Optional[int] = None) -> List[str]:
+    """
+    Text of each page (up to max_pages) of a PDF given as bytes or a file path. Runs in
+    the pool's worker processes; also usable directly for small synchronous jobs.
+    """
+    from pypdf import PdfReader
+    reader = PdfReader(io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source)
+    total = len(reader.pages)
+    count = min(total, max_pages) if max_pages else total
+    return [reader.pages[i].extract_text() or "" for i in range(count)]
+
+
+def _init_worker(memory_limit_mb: int) -> None:
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"[PdfExtraction] Could not set worker memory limit: {e}")
+
+
+class _Worker:
+    """One extraction process, in its own executor so it can be killed on its own."""
+
+    def __init__(self, memory_limit_mb: int):
+        # spawn: never fork a process that is running an event loop and threads
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(memory_limit_mb,),
+        )
+
+    def kill(self) -> None:
+        for process in list((getattr(self.executor, "_processes", None) or {}).values()):
+            process.kill()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class PdfExtractionPool:
+    """Process pool for pypdf text extraction with size, page, time and memory limits."""
+
+    def __init__(self, workers: int, timeout_seconds: float, max_pages: int, max_bytes: int, memory_limit_mb: int):
+        self.workers = max(0, workers)
+        self.timeout_seconds = timeout_seconds
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.memory_limit_mb = memory_limit_mb
+        # Started lazily; idle ones are reused, busy ones are tracked for shutdown
+        self._idle: List[_Worker] = []
+        self._busy: Set[_Worker] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+    def _recycle(self, worker: _Worker) -> None:
+        """Kill a worker that is stuck, dead or abandoned; its slot starts a new one on demand."""
+        self.restarts += 1
+        worker.kill()
+
+    async def extract_pages(self, source: PdfSource) -> List[str]:
+        """Page texts of a PDF (bytes or path); raises PdfExtractionError."""
+        size = len(source) if isinstance(source, (bytes, bytearray)) else os.path.getsize(source)
+        if size == 0 or size > self.max_bytes:
+            self.failed += 1
+            raise PdfExtractionError("PDF is empty" if size == 0 else f"PDF is {size} bytes; the limit is {self.max_bytes}")
+
+        for attempt in (1, 2):
+            try:
+                pages = await self._submit(source)
+                self.completed += 1
+                return pages
+            except BrokenProcessPool:
+                # Another document took the pool down (or this one crashed its worker)
+                if attempt == 2:
+                    self.failed += 1
+                    raise PdfExtractionError("PDF extraction worker crashed")
+            except PdfExtractionError:
+                self.failed += 1
+                raise
+            except Exception as e:
+                self.failed += 1
+                raise PdfExtractionError(f"PDF text extraction failed: {e!r}") from e
+
+    async def extract_text(self, source: PdfSource, separator: str = "\n\n") -> str:
+        pages = await self.extract_pages(source)
+        return separator.join(p for p in pages if p).strip()
+
+    async def _submit(self, source: PdfSource) -> List[str]:
+        loop = asyncio.get_running_loop()
+        if self.workers == 0:
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(None, extract_pdf_pages, source, self.max_pages), self.timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                raise PdfExtractionError(f"PDF text extraction timed out after {self.timeout_seconds}s")
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        async with self._slots:
+            worker = self._idle.pop() if self._idle else _Worker(self.memory_limit_mb)
+            self._busy.add(worker)
+            healthy = False
+            try:
+                # The clock starts once a worker is ours: queueing for one is not extraction time
+                pages = await asyncio.wait_for(
+                    loop.run_in_executor(worker.executor, extract_pdf_pages, source, self.max_pages),
+                    self.timeout_seconds,
+                )
+                healthy = True
+                return pages
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                raise PdfExtractionError(f"PDF text extraction timed out after {self.timeout_seconds}s")
+            except BrokenProcessPool:
+                raise
+            except asyncio.CancelledError:
+                # The document keeps running in the process; don't hand it to the next caller
+                raise
+            except Exception:
+                # pypdf raised in the worker: the process itself is fine
+                healthy = True
+                raise
+            finally:
+                self._busy.discard(worker)
+                if healthy:
+                    self._idle.append(worker)
+                else:
+                    self._recycle(worker)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "restarts": self.restarts,
+            "busy": len(self._busy),
+            "idle": len(self._idle),
+        }
+
+    def shutdown(self) -> None:
+        for worker in self._idle + list(self._busy):
+            worker.executor.shutdown(wait=False, cancel_futures=True)
+        self._idle.clear()
+        self._busy.clear()
+
+
+pdf_extraction_pool = PdfExtractionPool(
+    workers=settings.PDF_EXTRACTION_WORKERS,
+    timeout_seconds=settings.PDF_EXTRACTION_TIMEOUT_SECONDS,
+    max_pages=settings.PDF_EXTRACTION_MAX_PAGES,
+    max_bytes=settings.PDF_EXTRACTION_MAX_BYTES,
+    memory_limit_mb=settings.PDF_EXTRACTION_MEMORY_LIMIT_MB,
+)
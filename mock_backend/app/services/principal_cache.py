@@ -0,0 +1,141 @@
+"""
+Principal Cache
+---------------
+Per-process cache of the authenticated principal behind a bearer token, so the auth
+dependencies do not reload the user (and its two profiles) on every request, including
+the candidate's verification and /question/next polls.
+
+The JWT is still decoded and verified on every request; only the user lookup is cached.
+Entries are keyed by user id and token id (the `jti` claim; the token signature for
+tokens issued without one) and hold what routers read from the current user: id,
+username, email, role, is_active, login_disabled and the profile ids. They expire after
+AUTH_PRINCIPAL_CACHE_TTL_SECONDS; toggling a candidate's login or deleting a candidate
+drops that user's entries at once (other worker processes catch up within the TTL).
+"""
+
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException, status
+from jose import JWTError, jwt
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.sql.enums import UserRole
+from app.db.sql.models.user import User, CandidateProfile, AdminProfile
+
+logger = logging.getLogger(__name__)
+
+
+class Principal(NamedTuple):
+    """The current user as the auth dependencies hand it to routes."""
+    id: uuid.UUID
+    username: str
+    email: str
+    role: UserRole
+    is_active: bool
+    login_disabled: bool
+    candidate_profile_id: Optional[uuid.UUID]
+    admin_profile_id: Optional[uuid.UUID]
+
+
+def credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+class PrincipalCache:
+    """Bounded LRU of Principals keyed by (user id, token id) with a short TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[uuid.UUID, str], Tuple[float, Principal]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def authenticate(self, session: AsyncSession, token: Optional[str]) -> Principal:
+        """Verify the bearer token and return its principal; raises 401."""
+        if not token:
+            raise credentials_exception()
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            user_id = uuid.UUID(payload.get("sub"))
+        except (JWTError, ValueError, TypeError, AttributeError):
+            raise credentials_exception()
+
+        key = (user_id, payload.get("jti") or token.rsplit(".", 1)[-1])
+        principal = self._get(key)
+        if principal is not None:
+            self.hits += 1
+            return principal
+
+        self.misses += 1
+        principal = await self.load(session, user_id)
+        if principal is None:
+            raise credentials_exception()
+        self._put(key, principal)
+        return principal
+
+    @staticmethod
+    async def load(session: AsyncSession, user_id: uuid.UUID) -> Optional[Principal]:
+        """The principal for a user id in one query (profiles joined for their ids only)."""
+        result = await session.execute(
+            select(
+                User.id,
+                User.username,
+                User.email,
+                User.role,
+                User.is_active,
+                User.login_disabled,
+                CandidateProfile.id,
+                AdminProfile.id,
+            )
+            .outerjoin(CandidateProfile, CandidateProfile.user_id == User.id)
+            .outerjoin(AdminProfile, AdminProfile.user_id == User.id)
+            .where(User.id == user_id)
+        )
+        row = result.first()
+        return Principal(*row) if row else None
+
+    def _get(self, key: Tuple[uuid.UUID, str]) -> Optional[Principal]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _put(self, key: Tuple[uuid.UUID, str], principal: Principal) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic(), principal)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        """Drop every cached token of a user (login toggled, user deleted)."""
+        for key in [k for k in self._entries if k[0] == user_id]:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,219 @@
+"""
+Question Bank Index
+-------------------
+Process-level, read-only index of the active question bank used to pick bank questions
+without going to Postgres. Each active question gets a dense position; postings map every
+category, difficulty, question_type and (lower-cased) tag to a sorted array('I') of
+positions. Selection intersects the AND facets (difficulty, type), unions the OR facets
+(categories / tags matched from the candidate's skills) and samples from the result,
+optionally weighting a question by how many of the OR postings it appears in.
+
+Freshness: a statement-level trigger on `questions` bumps question_bank_version.version
+on every insert/update/delete (seeds, admin scripts, other processes). ensure_fresh()
+reads that counter at most every QUESTION_BANK_INDEX_CHECK_SECONDS and rebuilds the
+index when it moved. If the index cannot be loaded, callers fall back to SQL sampling.
+"""
+
+import asyncio
+import heapq
+import logging
+import random
+import sys
+import time
+import uuid
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.sql.models.question import Question, QuestionBankVersion
+
+logger = logging.getLogger(__name__)
+
+
+class BankQuestion(NamedTuple):
+    """Attributes of an indexed question; mirrors the Question fields the selectors read."""
+    id: uuid.UUID
+    text: str
+    category: object
+    difficulty: object
+    question_type: object
+    tags: tuple
+
+
+def _enum_key(value) -> str:
+    return str(getattr(value, "value", value) or "").lower()
+
+
+class QuestionBankIndex:
+    """In-memory postings over active questions, rebuilt when the bank version changes."""
+
+    def __init__(self, check_interval_seconds: int):
+        self.check_interval_seconds = check_interval_seconds
+        self._questions: List[BankQuestion] = []
+        self._positions: Dict[uuid.UUID, int] = {}
+        self._by_category: Dict[str, array] = {}
+        self._by_difficulty: Dict[str, array] = {}
+        self._by_type: Dict[str, array] = {}
+        self._by_tag: Dict[str, array] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._memory_bytes = 0
+        self._lock = asyncio.Lock()
+
+    # ── Loading ───────────────────────────────────────────────────────────────
+
+    @property
+    def loaded(self) -> bool:
+        return self._version is not None
+
+    async def ensure_fresh(self, session: AsyncSession) -> bool:
+        """Rebuild from `session` if the bank changed; False when no index is available."""
+        if self.loaded and time.monotonic() - self._checked_at < self.check_interval_seconds:
+            return True
+
+        async with self._lock:
+            if self.loaded and time.monotonic() - self._checked_at < self.check_interval_seconds:
+                return True
+            try:
+                version = (await session.execute(select(QuestionBankVersion.version))).scalar() or 0
+                if version != self._version:
+                    await self._rebuild(session, version)
+                self._checked_at = time.monotonic()
+            except Exception as e:
+                logger.warning(f"[QuestionBankIndex] Refresh failed, using SQL selection: {e}")
+        return self.loaded
+
+    async def _rebuild(self, session: AsyncSession, version: int) -> None:
+        started = time.perf_counter()
+        result = await session.execute(
+            select(
+                Question.id, Question.text, Question.category,
+                Question.difficulty, Question.question_type, Question.tags,
+            ).where(Question.is_active == True).order_by(Question.id)
+        )
+
+        questions: List[BankQuestion] = []
+        by_category: Dict[str, array] = {}
+        by_difficulty: Dict[str, array] = {}
+        by_type: Dict[str, array] = {}
+        by_tag: Dict[str, array] = {}
+        for row in result.all():
+            tags = tuple(sorted({t.strip().lower() for t in (row.tags or []) if isinstance(t, str) and t.strip()}))
+            position = len(questions)
+            questions.append(BankQuestion(row.id, row.text, row.category, row.difficulty, row.question_type, tags))
+            by_category.setdefault(_enum_key(row.category), array("I")).append(position)
+            by_difficulty.setdefault(_enum_key(row.difficulty), array("I")).append(position)
+            by_type.setdefault(_enum_key(row.question_type), array("I")).append(position)
+            for tag in tags:
+                by_tag.setdefault(tag, array("I")).append(position)
+
+        # Swap in one step so concurrent readers never see a half-built index
+        (self._questions, self._by_category, self._by_difficulty, self._by_type, self._by_tag) = (
+            questions, by_category, by_difficulty, by_type, by_tag
+        )
+        self._positions = {q.id: i for i, q in enumerate(questions)}
+        self._version = version
+        self._memory_bytes = self._measure()
+        logger.info(
+            f"[QuestionBankIndex] Loaded {len(questions)} questions (version {version}, "
+            f"{len(by_tag)} tags, ~{self._memory_bytes / 1024:.0f} KiB) in {time.perf_counter() - started:.2f}s"
+        )
+
+    def invalidate(self) -> None:
+        """Force a version check on the next ensure_fresh()."""
+        self._checked_at = 0.0
+
+    # ── Selection ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _postings(index: Dict[str, array], keys: Iterable) -> List[array]:
+        return [index[k] for k in {_enum_key(key) for key in keys} if k in index]
+
+    def candidates(
+        self,
+        difficulty=None,
+        categories: Optional[Iterable] = None,
+        tags: Optional[Iterable[str]] = None,
+        question_types: Optional[Iterable] = None,
+        exclude_question_types: Optional[Iterable] = None,
+        exclude_ids: Optional[Iterable] = None,
+    ) -> Dict[int, int]:
+        """
+        Positions matching the filters, each mapped to its weight: 1 plus the number of
+        category/tag postings it is in. `categories` and `tags` are OR-ed together (any
+        match); all other filters must hold. No categories and no tags means any question.
+        """
+        any_of = self._postings(self._by_category, categories or []) + self._postings(self._by_tag, tags or [])
+        weights: Dict[int, int] = {}
+        if any_of:
+            for posting in any_of:
+                for position in posting:
+                    weights[position] = weights.get(position, 1) + 1
+        elif categories or tags:
+            return {}
+        else:
+            weights = dict.fromkeys(range(len(self._questions)), 1)
+
+        required: List[Set[int]] = []
+        if difficulty is not None:
+            required.append(set().union(*self._postings(self._by_difficulty, [difficulty])))
+        if question_types:
+            required.append(set().union(*self._postings(self._by_type, question_types)))
+        # Intersect smallest-first so most positions are dropped early
+        for allowed in sorted(required, key=len):
+            weights = {p: w for p, w in weights.items() if p in allowed}
+
+        for posting in self._postings(self._by_type, exclude_question_types or []):
+            for position in posting:
+                weights.pop(position, None)
+        for qid in exclude_ids or []:
+            try:
+                position = self._positions.get(qid if isinstance(qid, uuid.UUID) else uuid.UUID(str(qid)))
+            except ValueError:
+                continue
+            if position is not None:
+                weights.pop(position, None)
+        return weights
+
+    def sample(self, count: int, weighted: bool = False, **filters) -> List[BankQuestion]:
+        """
+        Up to `count` distinct random questions matching candidates(**filters). With
+        `weighted`, draws without replacement proportionally to the candidate weights
+        (Efraimidis-Spirakis keys u ** (1 / w)).
+        """
+        weights = self.candidates(**filters)
+        if not weights or count <= 0:
+            return []
+        if weighted:
+            positions = heapq.nlargest(count, weights, key=lambda p: random.random() ** (1.0 / weights[p]))
+        else:
+            positions = random.sample(list(weights), min(count, len(weights)))
+        return [self._questions[p] for p in positions]
+
+    # ── Reporting ─────────────────────────────────────────────────────────────
+
+    def _measure(self) -> int:
+        total = sys.getsizeof(self._questions) + sys.getsizeof(self._positions)
+        for q in self._questions:
+            total += sys.getsizeof(q) + sys.getsizeof(q.text) + sys.getsizeof(q.tags)
+        for index in (self._by_category, self._by_difficulty, self._by_type, self._by_tag):
+            total += sys.getsizeof(index)
+            for key, posting in index.items():
+                total += sys.getsizeof(key) + posting.buffer_info()[1] * posting.itemsize
+        # Tag strings are shared between BankQuestion.tags and the tag postings keys
+        return total
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "version": self._version,
+            "questions": len(self._questions),
+            "categories": len(self._by_category),
+            "tags": len(self._by_tag),
+            "memory_bytes": self._memory_bytes,
+        }
+
+
+question_bank_index = QuestionBankIndex(check_interval_seconds=settings.QUESTION_BANK_INDEX_CHECK_SECONDS)
@@ -6,6 +6,9 @@ using Azure OpenAI GPT-4o based on parsed resume and JD.
 """
 
 import os
+import time
+import asyncio
+import contextvars
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional, List
@@ -15,10 +18,27 @@ from sqlalchemy.orm import selectinload
 from app.db.sql.models.question import Question, DifficultyEnum, CategoryEnum
 from app.db.sql.models.coding_problem import CodingProblem
 from app.services.resume_jd_parser import resume_jd_parser
+from app.services.question_sampler import question_sampler
+from app.services.question_bank_index import question_bank_index
+from app.services.skill_matcher import skill_matcher
 from app.services.azure_openai_service import azure_openai_service
+from app.services.task_queue_service import is_transient_error, is_final_attempt
 
 logger = logging.getLogger(__name__)
 
+# Set by generate_curated_questions(retry_transient_errors=True) for its stages
+_retry_transient_errors: contextvars.ContextVar[bool] = contextvars.ContextVar("retry_transient_errors", default=False)
+
+
+def _raise_if_retryable(error: BaseException) -> None:
+    """
+    In a queued generation job with attempts left, re-raise transient errors (LLM outage,
+    timeout, lost DB connection) so the queue retries instead of storing mock questions.
+    The mock fallbacks still apply to other errors and on the final attempt.
+    """
+    if _retry_transient_errors.get() and not is_final_attempt() and is_transient_error(error):
+        raise error
+
 
 class QuestionGeneratorService:
     """Service to generate interview questions from resume and JD."""
@@ -27,18 +47,317 @@ class QuestionGeneratorService:
     RESUME_UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "uploads", "resumes")
 
     @staticmethod
-    def _normalize_problem_solving_type(coding_config: Optional[Dict[str, Any]]) -> str:
-        cfg = coding_config or {}
-        raw = (
-            cfg.get("problem_solving_type")
-            or cfg.get("problem_type")
-            or cfg.get("type")
-            or "coding"
+    async def _timed_stage(timings: Dict[str, float], name: str, coro):
+        """Await a pipeline stage and record its wall time (ms) under `name`."""
+        started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    @staticmethod
+    async def _load_template_config(session: AsyncSession, template_id: str) -> Dict[str, Any]:
+        """Stage: technical question count, source and difficulty split from the cached template config."""
+        from app.services.template_config_cache import template_config_cache
+        template = await template_config_cache.get(session, template_id)
+
+        # Defaults when the template is missing
+        num_technical_questions = template.num_technical_questions if template else 6
+        question_source = template.question_source if template else "ai_generated"
+        difficulty_counts = dict(template.difficulty_counts) if template else {}
+        
+        logger.info(f"Template Configuration - Technical questions: {num_technical_questions}, Source: {question_source}")
+        return {
+            "template": template,
+            "num_technical_questions": num_technical_questions,
+            "question_source": question_source,
+            "difficulty_counts": difficulty_counts,
+        }
+
+    @staticmethod
+    async def _prepare_resume_data(
+        resume_id: Optional[str],
+        resume_text: Optional[str],
+        resume_json: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Stage: structured resume data (parsing with the LLM if needed) with skills merged from projects/experience."""
+        logger.debug("Preparing resume data...")
+        if resume_json:
+            resume_data = resume_json.copy() if isinstance(resume_json, dict) else {}
+            if resume_text and 'text' not in resume_data:
+                resume_data['text'] = resume_text
+            logger.debug("Using provided resume_json")
+        elif resume_text:
+            # If we have resume text but no parsed JSON, parse it now with LLM
+            logger.debug("Parsing resume text with LLM...")
+            from app.services.resume_parser import parse_resume_with_llm, _fallback_parse_resume
+            try:
+                resume_data = await parse_resume_with_llm(resume_text, fallback=False)
+            except Exception as e:
+                _raise_if_retryable(e)
+                resume_data = _fallback_parse_resume(resume_text)
+            if not isinstance(resume_data, dict):
+                resume_data = {}
+            resume_data['text'] = resume_text
+            logger.debug("Resume parsed with LLM")
+        else:
+            logger.debug("Parsing resume from file...")
+            resume_data = await QuestionGeneratorService._parse_resume(resume_id)
+            if not isinstance(resume_data, dict):
+                resume_data = {}
+            logger.debug("Resume parsed from file")
+        
+        # Ensure resume_data is a dict with required keys
+        if not isinstance(resume_data, dict):
+            logger.warning("resume_data is not a dict, initializing empty dict")
+            resume_data = {}
+        
+        # Ensure required keys exist
+        if 'skills' not in resume_data:
+            resume_data['skills'] = []
+        if 'projects' not in resume_data:
+            resume_data['projects'] = []
+        if 'experience' not in resume_data:
+            resume_data['experience'] = []
+        
+        # Ensure skills are extracted from all sources in resume (projects, experience)
+        # Handle cases where skills might be None, empty, or in wrong format
+        try:
+            skills_list = resume_data.get('skills', [])
+            if not isinstance(skills_list, list):
+                skills_list = []
+            all_resume_skills = set(skills_list)
+        except Exception as e:
+            logger.warning(f"Error extracting skills from resume_data: {e}")
+            all_resume_skills = set()
+        
+        # Add technologies from projects (handle both dict and string formats)
+        try:
+            projects_list = resume_data.get('projects', [])
+            if not isinstance(projects_list, list):
+                projects_list = []
+            for project in projects_list:
+                try:
+                    if isinstance(project, dict):
+                        project_techs = project.get('technologies', [])
+                        if project_techs and isinstance(project_techs, list):
+                            all_resume_skills.update(project_techs)
+                    elif isinstance(project, str):
+                        # If project is a string, skip technology extraction
+                        logger.debug(f"Project is a string, skipping technology extraction: {project[:50]}")
+                except Exception as proj_error:
+                    logger.warning(f"Error processing project item: {proj_error}")
+                    continue
+        except Exception as e:
+            logger.warning(f"Error processing projects: {e}")
+        
+        # Add technologies from experience (handle both dict and string formats)
+        try:
+            experience_list = resume_data.get('experience', [])
+            if not isinstance(experience_list, list):
+                experience_list = []
+            for exp in experience_list:
+                try:
+                    if isinstance(exp, dict):
+                        exp_techs = exp.get('technologies', [])
+                        if exp_techs and isinstance(exp_techs, list):
+                            all_resume_skills.update(exp_techs)
+                    elif isinstance(exp, str):
+                        # If experience is a string, skip technology extraction
+                        logger.debug(f"Experience item is a string, skipping technology extraction: {exp[:50]}")
+                except Exception as exp_error:
+                    logger.warning(f"Error processing experience item: {exp_error}")
+                    continue
+        except Exception as e:
+            logger.warning(f"Error processing experience: {e}")
+        
+        resume_data['skills'] = list(all_resume_skills)
+        return resume_data
+
+    @staticmethod
+    async def _prepare_jd_data(
+        job_description: Optional[str],
+        jd_json: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Stage: structured job description data (parsing the raw JD with the LLM if no JSON was stored)."""
+        if jd_json:
+            jd_data = dict(jd_json)
+            logger.debug("Using provided jd_json")
+        elif job_description:
+            logger.debug("Parsing job description with LLM...")
+            try:
+                jd_data = await resume_jd_parser.parse_job_description(job_description, fallback=False)
+            except Exception as e:
+                _raise_if_retryable(e)
+                jd_data = resume_jd_parser._fallback_parse_jd(job_description)
+            if not isinstance(jd_data, dict):
+                jd_data = {}
+            logger.debug("✅ Job description parsed with LLM")
+        else:
+            jd_data = {}
+        
+        # Ensure JD has all skills from technologies field too
+        jd_skills_set = set((jd_data.get('required_skills') or []) + (jd_data.get('technologies') or []))
+        jd_data['required_skills'] = list(jd_skills_set)
+        return jd_data
+
+    @staticmethod
+    async def _build_technical_questions(
+        session: AsyncSession,
+        db_lock: asyncio.Lock,
+        question_source: str,
+        num_technical_questions: int,
+        difficulty_counts: Dict[str, int],
+        role_name: str,
+        all_skills: List[str],
+        resume_skills: List[str],
+        jd_skills: List[str],
+        resume_data: Dict[str, Any],
+        jd_data: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Stage: technical questions from the pool, the bank or the LLM (with mock fallbacks)."""
+        logger.debug("GENERATING TECHNICAL QUESTIONS FOR INTERVIEW")
+        
+        technical_questions = []
+        
+        if question_source == "question_bank":
+            logger.debug(f"📚 Fetching {num_technical_questions} questions from bank...")
+            async with db_lock:
+                technical_questions = await QuestionGeneratorService._get_questions_from_bank(
+                    session=session,
+                    num_questions=num_technical_questions,
+                    role_name=role_name,
+                    required_skills=all_skills,
+                    resume_skills=resume_skills,
+                    jd_skills=jd_skills
+                )
+        
+        # Pools are keyed on the JD skills so candidates applying to the same job share them
+        pool_skills = jd_skills or all_skills
+        if question_source == "ai_generated":
+            from app.services.question_pool_service import question_pool_service
+            async with db_lock:
+                technical_questions = await question_pool_service.sample(
+                    session=session,
+                    role_name=role_name,
+                    skills=pool_skills,
+                    num_questions=num_technical_questions,
+                    difficulty_counts=difficulty_counts,
+                )
+        
+        # Only use LLM if source is AI_GENERATED (and the pool could not serve it), or if question_bank was requested but is literally empty
+        if (question_source == "ai_generated" and not technical_questions) or (question_source == "question_bank" and not technical_questions):
+            logger.debug(f"🤖 Generating {num_technical_questions} technical questions using LLM...")
+            # Check if Azure OpenAI is available
+            if not azure_openai_service.async_client and not azure_openai_service.client:
+                logger.warning("Azure OpenAI client not initialized! Check configs in .env. Falling back to mock questions.")
+            else:
+                logger.debug("Azure OpenAI client is initialized and ready")
+            
+            try:
+                technical_questions = await QuestionGeneratorService._generate_questions_with_llm(
+                    num_questions=num_technical_questions,
+                    skills=all_skills,
+                    role_name=role_name,
+                    resume_data=resume_data,
+                    jd_data=jd_data
+                )
+                # Ensure LLM generated questions
+                if not technical_questions or len(technical_questions) == 0:
+                    logger.warning("LLM generation returned empty, using mock questions")
+                    technical_questions = QuestionGeneratorService._generate_mock_skill_based_questions(
+                        num_questions=num_technical_questions,
+                        skills=all_skills,
+                        role_name=role_name
+                    )
+                else:
+                    logger.info(f"LLM successfully generated {len(technical_questions)} technical questions")
+                    if question_source == "ai_generated":
+                        # Seed the pool with what this candidate was just served
+                        async with db_lock:
+                            question_pool_service.add_questions(session, role_name, pool_skills, technical_questions, exposure_count=1)
+            except Exception as llm_error:
+                _raise_if_retryable(llm_error)
+                logger.error(f"LLM question generation failed: {llm_error}", exc_info=True)
+                logger.error(f"LLM generation failed: {llm_error}. Using mock questions instead.")
+                technical_questions = QuestionGeneratorService._generate_mock_skill_based_questions(
+                    num_questions=num_technical_questions,
+                    skills=all_skills,
+                    role_name=role_name
+                )
+
+        # If still no questions, use mock fallback
+        if not technical_questions:
+            logger.warning("LLM/Bank failed, using mock questions")
+            technical_questions = QuestionGeneratorService._generate_mock_skill_based_questions(
+                num_questions=num_technical_questions,
+                skills=all_skills,
+                role_name=role_name
+            )
+        
+        # Mark metadata
+        for q in technical_questions:
+            q['question_type'] = q.get('question_type', 'static')
+            q['source'] = q.get('source', 'llm_generated' if question_source == "ai_generated" else "question_bank")
+            q['evaluation_mode'] = q.get('evaluation_mode', 'text')
+        
+        # Ensure proper ordering
+        for idx, q in enumerate(technical_questions, 1):
+            q['order'] = idx
+        
+        logger.info(f"Generated {len(technical_questions)} technical questions")
+        return technical_questions
+
+    @staticmethod
+    async def _build_coding_problems(session: AsyncSession, db_lock: asyncio.Lock, template) -> List[Dict[str, Any]]:
+        """Stage: coding problems for the problem-solving section (needs only the template)."""
+        from app.services.template_engine import template_engine
+        async with db_lock:
+            coding_items = await template_engine._generate_coding_questions(template, session)
+        coding_problems_formatted = []
+        for item in coding_items:
+            if item.coding_problem:
+                p = item.coding_problem
+                coding_problems_formatted.append({
+                    "problem_id": str(p.id),
+                    "title": p.title,
+                    "difficulty": p.difficulty,
+                    "description": p.description,
+                    "starter_code": p.starter_code
+                })
+        return coding_problems_formatted
+
+    @staticmethod
+    async def _build_analytical_questions(
+        template,
+        role_name: str,
+        resume_data: Dict[str, Any],
+        jd_data: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Stage: LLM analytical questions for the problem-solving section."""
+        count = int((template.coding_config or {}).get("count", 2) or 2)
+        analytical_questions = await QuestionGeneratorService._generate_analytical_questions_with_llm(
+            num_questions=max(1, count),
+            role_name=role_name or "Business Analyst",
+            resume_data=resume_data,
+            jd_data=jd_data,
         )
-        raw_s = str(raw).strip().lower()
-        if raw_s in ("analytical", "analytical_question", "analytical_questions", "non_coding", "non-coding"):
-            return "analytical"
-        return "coding"
+        analytical_questions_formatted = []
+        for i, q in enumerate(analytical_questions, 1):
+            analytical_questions_formatted.append({
+                "question_id": q.get("question_id"),
+                "question_type": "static",
+                "order": i,
+                "prompt": q.get("prompt", ""),
+                "difficulty": q.get("difficulty", "medium"),
+                "time_limit_sec": q.get("time_limit_sec", 300),
+                "answer_mode": "audio",
+                "evaluation_mode": "audio",
+                "source": q.get("source", "llm_generated"),
+                "category": q.get("category", "ANALYTICAL"),
+                "focus": q.get("focus", "non-technical problem solving")
+            })
+        return analytical_questions_formatted
     
     @staticmethod
     async def generate_curated_questions(
@@ -50,9 +369,42 @@ class QuestionGeneratorService:
         job_description: Optional[str] = None,
         resume_json: Optional[Dict[str, Any]] = None,
         jd_json: Optional[Dict[str, Any]] = None,
+        retry_transient_errors: bool = False,
+    ) -> dict:
+        """
+        Generate curated questions (see _generate_curated_questions). Background jobs on the
+        task queue pass retry_transient_errors=True: a transient LLM or database error is then
+        raised for the queue to retry, and mock questions are only used on the final attempt.
+        """
+        token = _retry_transient_errors.set(retry_transient_errors)
+        try:
+            return await QuestionGeneratorService._generate_curated_questions(
+                session, template_id, candidate_id, resume_id, resume_text, job_description, resume_json, jd_json,
+            )
+        finally:
+            _retry_transient_errors.reset(token)
+
+    @staticmethod
+    async def _generate_curated_questions(
+        session: AsyncSession,
+        template_id: str,
+        candidate_id: str,
+        resume_id: Optional[str] = None,
+        resume_text: Optional[str] = None,
+        job_description: Optional[str] = None,
+        resume_json: Optional[Dict[str, Any]] = None,
+        jd_json: Optional[Dict[str, Any]] = None,
     ) -> dict:
         """
         Generate curated questions: first 5-6 from question bank, then conversational questions.
+
+        Stages run as a dependency graph so independent work overlaps:
+            template ─┬─> coding problems ───────────────┐
+                      │                                  ├─> payload
+            resume ───┼─> technical questions ───────────┤
+            JD ───────┴─> analytical questions ──────────┘
+        Database access is serialised on one lock because the AsyncSession is shared;
+        LLM calls run concurrently. Per-stage wall times are returned in `stage_timings_ms`.
         
         Args:
             session: Database session
@@ -67,224 +419,68 @@ class QuestionGeneratorService:
         Returns:
             dict conforming to CuratedQuestionsPayload schema
         """
+        timings: Dict[str, float] = {}
+        timed = QuestionGeneratorService._timed_stage
+        db_lock = asyncio.Lock()
+        tasks: List[asyncio.Task] = []
+        pipeline_started = time.perf_counter()
         try:
-            all_questions = []
-            
-            # Step 0: Get template to read config for number of questions
-            import uuid as uuid_module
-            from app.db.sql.models.interview_template import InterviewTemplate
-            template_stmt = select(InterviewTemplate).where(InterviewTemplate.id == uuid_module.UUID(template_id))
-            template_result = await session.execute(template_stmt)
-            template = template_result.scalar_one_or_none()
-            
-            # Get number of technical questions and source from template config
-            num_technical_questions = 6  # Default
-            question_source = "ai_generated" # Default
-            if template:
-                technical_config = template.technical_config or {}
-                if isinstance(technical_config, dict):
-                    question_source = technical_config.get("question_source", "ai_generated")
-                    # Count total questions from difficulty distribution (only easy, medium, hard)
-                    difficulty_keys = ["easy", "medium", "hard"]
-                    num_technical_questions = sum(v for k, v in technical_config.items() if k.lower() in difficulty_keys and isinstance(v, int))
-                    
-                    if num_technical_questions == 0:
-                        num_technical_questions = technical_config.get("total_questions", 6)
-                # Fallback to settings if technical_config not available
-                elif template.settings and isinstance(template.settings, dict):
-                    difficulty_dist = template.settings.get("difficulty_distribution", {})
-                    if difficulty_dist:
-                        num_technical_questions = sum(v for v in difficulty_dist.values() if isinstance(v, int))
-            
-            logger.info(f"Template Configuration - Technical questions: {num_technical_questions}, Source: {question_source}")
-            
-            # Step 1: Prepare resume and JD data
-            logger.debug("Step 1: Preparing resume and JD data...")
-            if resume_json:
-                resume_data = resume_json.copy() if isinstance(resume_json, dict) else {}
-                if resume_text and 'text' not in resume_data:
-                    resume_data['text'] = resume_text
-                logger.debug("Using provided resume_json")
-            elif resume_text:
-                # If we have resume text but no parsed JSON, parse it now with LLM
-                logger.debug("Parsing resume text with LLM...")
-                from app.services.resume_parser import parse_resume_with_llm
-                resume_data = await parse_resume_with_llm(resume_text)  # ← was missing await
-                if not isinstance(resume_data, dict):
-                    resume_data = {}
-                resume_data['text'] = resume_text
-                logger.debug("Resume parsed with LLM")
-            else:
-                logger.debug("Parsing resume from file...")
-                resume_data = QuestionGeneratorService._parse_resume(resume_id)
-                if not isinstance(resume_data, dict):
-                    resume_data = {}
-                logger.debug("Resume parsed from file")
-            
-            # Ensure resume_data is a dict with required keys
-            if not isinstance(resume_data, dict):
-                logger.warning("resume_data is not a dict, initializing empty dict")
-                resume_data = {}
-            
-            # Ensure required keys exist
-            if 'skills' not in resume_data:
-                resume_data['skills'] = []
-            if 'projects' not in resume_data:
-                resume_data['projects'] = []
-            if 'experience' not in resume_data:
-                resume_data['experience'] = []
-            
-            # Ensure skills are extracted from all sources in resume (projects, experience)
-            # Handle cases where skills might be None, empty, or in wrong format
-            try:
-                skills_list = resume_data.get('skills', [])
-                if not isinstance(skills_list, list):
-                    skills_list = []
-                all_resume_skills = set(skills_list)
-            except Exception as e:
-                logger.warning(f"Error extracting skills from resume_data: {e}")
-                all_resume_skills = set()
-            
-            # Add technologies from projects (handle both dict and string formats)
-            try:
-                projects_list = resume_data.get('projects', [])
-                if not isinstance(projects_list, list):
-                    projects_list = []
-                for project in projects_list:
-                    try:
-                        if isinstance(project, dict):
-                            project_techs = project.get('technologies', [])
-                            if project_techs and isinstance(project_techs, list):
-                                all_resume_skills.update(project_techs)
-                        elif isinstance(project, str):
-                            # If project is a string, skip technology extraction
-                            logger.debug(f"Project is a string, skipping technology extraction: {project[:50]}")
-                    except Exception as proj_error:
-                        logger.warning(f"Error processing project item: {proj_error}")
-                        continue
-            except Exception as e:
-                logger.warning(f"Error processing projects: {e}")
-            
-            # Add technologies from experience (handle both dict and string formats)
-            try:
-                experience_list = resume_data.get('experience', [])
-                if not isinstance(experience_list, list):
-                    experience_list = []
-                for exp in experience_list:
-                    try:
-                        if isinstance(exp, dict):
-                            exp_techs = exp.get('technologies', [])
-                            if exp_techs and isinstance(exp_techs, list):
-                                all_resume_skills.update(exp_techs)
-                        elif isinstance(exp, str):
-                            # If experience is a string, skip technology extraction
-                            logger.debug(f"Experience item is a string, skipping technology extraction: {exp[:50]}")
-                    except Exception as exp_error:
-                        logger.warning(f"Error processing experience item: {exp_error}")
-                        continue
-            except Exception as e:
-                logger.warning(f"Error processing experience: {e}")
-            
-            resume_data['skills'] = list(all_resume_skills)
-            
-            # Parse job description
-            if jd_json:
-                jd_data = jd_json
-                logger.debug("Using provided jd_json")
-            else:
-                logger.debug("Parsing job description with LLM... ✅ Job description parsed with LLM")
-            
-            # Ensure JD has all skills from technologies field too
-            jd_skills_set = set(jd_data.get('required_skills', []) + jd_data.get('technologies', []))
-            jd_data['required_skills'] = list(jd_skills_set)
+            # Roots of the graph: template (DB), resume and JD (possibly LLM) are independent
+            template_task = asyncio.create_task(timed(timings, "template", QuestionGeneratorService._load_template_config(session, template_id)))
+            resume_task = asyncio.create_task(timed(timings, "resume", QuestionGeneratorService._prepare_resume_data(resume_id, resume_text, resume_json)))
+            jd_task = asyncio.create_task(timed(timings, "job_description", QuestionGeneratorService._prepare_jd_data(job_description, jd_json)))
+            tasks.extend([template_task, resume_task, jd_task])
+
+            template_cfg = await template_task
+            template = template_cfg["template"]
+            num_technical_questions = template_cfg["num_technical_questions"]
+
+            # Coding problems only need the template, so start them before the resume/JD are ready
+            problem_solving_type = "coding"
+            problem_solving_task = None
+            if template and template.coding_config:
+                problem_solving_type = template.problem_solving_type
+                if problem_solving_type == "coding":
+                    problem_solving_task = asyncio.create_task(timed(
+                        timings, "coding_problems",
+                        QuestionGeneratorService._build_coding_problems(session, db_lock, template),
+                    ))
+                    tasks.append(problem_solving_task)
+
+            resume_data = await resume_task
+            jd_data = await jd_task
             
             # Extract role and skills for filtering question bank
             role_name = jd_data.get('job_title') or jd_data.get('role_name', '')
             
             # Combine skills from both resume and JD
-            resume_skills = list(all_resume_skills)
-            jd_skills = list(jd_skills_set)
+            resume_skills = list(resume_data.get('skills', []))
+            jd_skills = list(jd_data.get('required_skills', []))
             
             # Merge and deduplicate skills
             all_skills = list(set(resume_skills + jd_skills))
-            logger.debug(f"[QuestionGenerator] Using skills for question selection: {all_skills}")
             logger.debug(f"[QuestionGenerator] Combined Skills: {all_skills}")
-            
-            # Step 2: Generate technical questions based on source
-            logger.debug("GENERATING TECHNICAL QUESTIONS FOR INTERVIEW")
-            
-            technical_questions = []
-            
-            if question_source == "question_bank":
-                logger.debug(f"📚 Fetching {num_technical_questions} questions from bank...")
-                technical_questions = await QuestionGeneratorService._get_questions_from_bank(
-                    session=session,
-                    num_questions=num_technical_questions,
-                    role_name=role_name,
-                    required_skills=all_skills,
-                    resume_skills=resume_skills,
-                    jd_skills=jd_skills
-                )
-            
-            # Only use LLM if source is AI_GENERATED, or if question_bank was requested but is literally empty
-            if question_source == "ai_generated" or (question_source == "question_bank" and not technical_questions):
-                logger.debug(f"🤖 Generating {num_technical_questions} technical questions using LLM...")
-                # Check if Azure OpenAI is available
-                from app.services.azure_openai_service import azure_openai_service
-                if not azure_openai_service.async_client and not azure_openai_service.client:
-                    logger.warning("Azure OpenAI client not initialized! Check configs in .env. Falling back to mock questions.")
-                else:
-                    logger.debug("Azure OpenAI client is initialized and ready")
-                
-                try:
-                    technical_questions = await QuestionGeneratorService._generate_questions_with_llm(
-                        num_questions=num_technical_questions,
-                        skills=all_skills,
-                        role_name=role_name,
-                        resume_data=resume_data,
-                        jd_data=jd_data
-                    )
-                    # Ensure LLM generated questions
-                    if not technical_questions or len(technical_questions) == 0:
-                        logger.warning("LLM generation returned empty, using mock questions")
-                        technical_questions = QuestionGeneratorService._generate_mock_skill_based_questions(
-                            num_questions=num_technical_questions,
-                            skills=all_skills,
-                            role_name=role_name
-                        )
-                    else:
-                        logger.info(f"LLM successfully generated {len(technical_questions)} technical questions")
-                except Exception as llm_error:
-                    logger.error(f"LLM question generation failed: {llm_error}", exc_info=True)
-                    logger.error(f"LLM generation failed: {llm_error}. Using mock questions instead.")
-                    technical_questions = QuestionGeneratorService._generate_mock_skill_based_questions(
-                        num_questions=num_technical_questions,
-                        skills=all_skills,
-                        role_name=role_name
-                    )
 
-            # If still no questions, use mock fallback
-            if not technical_questions:
-                logger.warning("LLM/Bank failed, using mock questions")
-                technical_questions = QuestionGeneratorService._generate_mock_skill_based_questions(
-                    num_questions=num_technical_questions,
-                    skills=all_skills,
-                    role_name=role_name
-                )
-            
-            # Mark metadata
-            for q in technical_questions:
-                q['question_type'] = q.get('question_type', 'static')
-                q['source'] = q.get('source', 'llm_generated' if question_source == "ai_generated" else "question_bank")
-                q['evaluation_mode'] = q.get('evaluation_mode', 'text')
-            
-            # Ensure proper ordering
-            for idx, q in enumerate(technical_questions, 1):
-                q['order'] = idx
-            all_questions.extend(technical_questions)
-            
-            logger.info(f"Generated {len(technical_questions)} technical questions")
-            
+            if template and template.coding_config and problem_solving_type == "analytical":
+                problem_solving_task = asyncio.create_task(timed(
+                    timings, "analytical_questions",
+                    QuestionGeneratorService._build_analytical_questions(template, role_name, resume_data, jd_data),
+                ))
+                tasks.append(problem_solving_task)
+
+            all_questions = await timed(timings, "technical_questions", QuestionGeneratorService._build_technical_questions(
+                session=session,
+                db_lock=db_lock,
+                question_source=template_cfg["question_source"],
+                num_technical_questions=num_technical_questions,
+                difficulty_counts=template_cfg["difficulty_counts"],
+                role_name=role_name,
+                all_skills=all_skills,
+                resume_skills=resume_skills,
+                jd_skills=jd_skills,
+                resume_data=resume_data,
+                jd_data=jd_data,
+            ))
             
             # CRITICAL CHECK: Ensure we have at least some questions before proceeding
             if len(all_questions) == 0:
@@ -310,11 +506,6 @@ class QuestionGeneratorService:
             # Final sort by order to ensure correct sequence
             all_questions.sort(key=lambda x: x.get('order', 999))
             
-            # CRITICAL: Ensure we have at least one question
-            if not all_questions or len(all_questions) == 0:
-                logger.error("❌ CRITICAL: No questions generated after all attempts!")
-                logger.warning(f"Generated {len(all_questions)} emergency fallback questions")
-            
             logger.info(f"TOTAL QUESTIONS GENERATED: {len(all_questions)}")
             
             # Final validation before returning
@@ -322,47 +513,17 @@ class QuestionGeneratorService:
                 logger.error("❌ CRITICAL: Still no questions after emergency fallback!")
                 raise ValueError("Failed to generate any questions. All fallback mechanisms failed.")
             
-            # Step 3: Build problem-solving section (coding or analytical)
-            problem_solving_type = "coding"
+            # Join: problem-solving section (coding or analytical)
             coding_problems_formatted = []
             analytical_questions_formatted = []
-            if template and template.coding_config:
-                problem_solving_type = QuestionGeneratorService._normalize_problem_solving_type(template.coding_config)
+            if problem_solving_task is not None:
                 if problem_solving_type == "coding":
-                    from app.services.template_engine import template_engine
-                    coding_items = await template_engine._generate_coding_questions(template, session)
-                    for item in coding_items:
-                        if item.coding_problem:
-                            p = item.coding_problem
-                            coding_problems_formatted.append({
-                                "problem_id": str(p.id),
-                                "title": p.title,
-                                "difficulty": p.difficulty,
-                                "description": p.description,
-                                "starter_code": p.starter_code
-                            })
+                    coding_problems_formatted = await problem_solving_task
                 else:
-                    count = int((template.coding_config or {}).get("count", 2) or 2)
-                    analytical_questions = await QuestionGeneratorService._generate_analytical_questions_with_llm(
-                        num_questions=max(1, count),
-                        role_name=role_name or "Business Analyst",
-                        resume_data=resume_data,
-                        jd_data=jd_data,
-                    )
-                    for i, q in enumerate(analytical_questions, 1):
-                        analytical_questions_formatted.append({
-                            "question_id": q.get("question_id"),
-                            "question_type": "static",
-                            "order": i,
-                            "prompt": q.get("prompt", ""),
-                            "difficulty": q.get("difficulty", "medium"),
-                            "time_limit_sec": q.get("time_limit_sec", 300),
-                            "answer_mode": "audio",
-                            "evaluation_mode": "audio",
-                            "source": q.get("source", "llm_generated"),
-                            "category": q.get("category", "ANALYTICAL"),
-                            "focus": q.get("focus", "non-technical problem solving")
-                        })
+                    analytical_questions_formatted = await problem_solving_task
+
+            timings["total"] = round((time.perf_counter() - pipeline_started) * 1000, 1)
+            logger.info(f"Curated question stage timings (ms): {timings}")
             
             return {
                 "template_id": template_id,
@@ -383,9 +544,16 @@ class QuestionGeneratorService:
                     "problems": coding_problems_formatted,
                     "questions": analytical_questions_formatted,
                 },
-                "conversational_section": {"rounds": (template.conversational_config or {}).get("rounds", 0) if template else 0}
+                "conversational_section": {"rounds": (template.conversational_config or {}).get("rounds", 0) if template else 0},
+                "stage_timings_ms": timings,
             }
         except Exception as e:
+            # Don't leave sibling stages running against the shared session
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            _raise_if_retryable(e)
             logger.error(f"Error generating questions: {e}", exc_info=True)
             logger.error(f"ERROR in question generation: {e}. Using fallback questions...")
             # Fallback to mock questions - ensure it always returns questions
@@ -423,161 +591,95 @@ class QuestionGeneratorService:
             import random
             from sqlalchemy import or_
             
-            # Build query with filters
-            # Note: We select Question directly - SQLAlchemy will handle missing columns gracefully
-            # If question_type doesn't exist, it will be None/omitted
-            stmt = select(Question).where(Question.is_active == True)
-            
-            # Comprehensive skill-to-category mapping
-            skill_to_category = {
-                # Python ecosystem
-                'python': CategoryEnum.PYTHON,
-                'django': CategoryEnum.PYTHON,
-                'flask': CategoryEnum.PYTHON,
-                'fastapi': CategoryEnum.PYTHON,
-                'pandas': CategoryEnum.PYTHON,
-                'numpy': CategoryEnum.PYTHON,
-                
-                # SQL/Database
-                'sql': CategoryEnum.SQL,
-                'postgresql': CategoryEnum.SQL,
-                'mysql': CategoryEnum.SQL,
-                'mongodb': CategoryEnum.SQL,
-                'database': CategoryEnum.SQL,
-                'db': CategoryEnum.SQL,
-                
-                # Machine Learning
-                'machine learning': CategoryEnum.MACHINE_LEARNING,
-                'ml': CategoryEnum.MACHINE_LEARNING,
-                'deep learning': CategoryEnum.MACHINE_LEARNING,
-                'tensorflow': CategoryEnum.MACHINE_LEARNING,
-                'pytorch': CategoryEnum.MACHINE_LEARNING,
-                'scikit-learn': CategoryEnum.MACHINE_LEARNING,
-                'sklearn': CategoryEnum.MACHINE_LEARNING,
-                'neural network': CategoryEnum.MACHINE_LEARNING,
-                'ai': CategoryEnum.MACHINE_LEARNING,
-                'artificial intelligence': CategoryEnum.MACHINE_LEARNING,
-                
-                # Data Structures & Algorithms
-                'data structures': CategoryEnum.DATA_STRUCTURES,
-                'algorithms': CategoryEnum.DATA_STRUCTURES,
-                'dsa': CategoryEnum.DATA_STRUCTURES,
-                'algorithm': CategoryEnum.DATA_STRUCTURES,
-                
-                # System Design
-                'system design': CategoryEnum.SYSTEM_DESIGN,
-                'distributed systems': CategoryEnum.SYSTEM_DESIGN,
-                'microservices': CategoryEnum.SYSTEM_DESIGN,
-                'architecture': CategoryEnum.SYSTEM_DESIGN,
-                'scalability': CategoryEnum.SYSTEM_DESIGN,
-                
-                # Statistics
-                'statistics': CategoryEnum.STATISTICS,
-                'statistical': CategoryEnum.STATISTICS,
-                'probability': CategoryEnum.STATISTICS,
-            }
-            
-            matching_categories = []
-            matching_tags = []
-            
             # Process all skills (from both resume and JD)
             all_skills_to_check = list(set((required_skills or []) + (resume_skills or []) + (jd_skills or [])))
             
             logger.debug(f"[QuestionBank] Filtering questions by skills: {all_skills_to_check}")
             
-            for skill in all_skills_to_check:
-                if not skill:
-                    continue
-                skill_lower = skill.lower().strip()
-                
-                # Map skill to category
-                for key, cat in skill_to_category.items():
-                    if key in skill_lower:
-                        if cat not in matching_categories:
-                            matching_categories.append(cat)
-                        break
-                
-                # Also add skill as a tag for matching
-                matching_tags.append(skill_lower)
-            
-            # Filter by categories if we found matches
-            category_condition = None
-            if matching_categories:
-                category_condition = Question.category.in_(matching_categories)
-                logger.debug(f"[QuestionBank] Filtering by categories: {[c.value for c in matching_categories]}")
-                logger.debug(f"[QuestionBank] Matching categories: {[c.value for c in matching_categories]}")
+            # Categories and canonical tags from the shared compiled skill matcher
+            matching_categories, matching_tags = skill_matcher.categorize(all_skills_to_check)
             
-            # Also filter by tags if questions have tags
-            tag_condition = None
-            if matching_tags:
-                # Check if any question tags match our skills
-                # PostgreSQL JSONB contains operator
-                tag_conditions = []
-                for tag in matching_tags[:10]:  # Limit to avoid too many conditions
-                    # Check if tags JSON array contains the skill
-                    tag_conditions.append(
-                        Question.tags.contains([tag])
-                    )
-                
-                if tag_conditions:
+            # Served from the in-memory bank index when available (no tag cap, weighted by
+            # how many skills a question matches); SQL sampling otherwise
+            use_index = await question_bank_index.ensure_fresh(session)
+            selected_questions = []
+            if use_index:
+                selected_questions = question_bank_index.sample(
+                    num_questions, weighted=True, categories=matching_categories, tags=matching_tags,
+                )
+            else:
+                # Filter by categories if we found matches
+                category_condition = None
+                if matching_categories:
+                    category_condition = Question.category.in_(matching_categories)
+                    logger.debug(f"[QuestionBank] Filtering by categories: {[c.value for c in matching_categories]}")
+                    logger.debug(f"[QuestionBank] Matching categories: {[c.value for c in matching_categories]}")
+            
+                # Also filter by tags if questions have tags
+                tag_condition = None
+                if matching_tags:
+                    # Check if any question tags match our skills
+                    # PostgreSQL JSONB contains operator
+                    tag_conditions = [Question.tags.contains([tag]) for tag in matching_tags]
                     tag_condition = or_(*tag_conditions)
-                    logger.debug(f"[QuestionBank] Also filtering by tags: {matching_tags[:10]}")
-                    logger.debug(f"[QuestionBank] Matching tags: {matching_tags[:10]}")
-            
-            # Combine category and tag filters with OR (question matches if it matches category OR tags)
-            if category_condition and tag_condition:
-                stmt = stmt.where(or_(category_condition, tag_condition))
-            elif category_condition:
-                stmt = stmt.where(category_condition)
-            elif tag_condition:
-                stmt = stmt.where(tag_condition)
-            
-            try:
-                result = await session.execute(stmt)
-                all_questions = result.scalars().all()
-            except Exception as query_error:
-                logger.error(f"Error executing question bank query: {query_error}", exc_info=True)
-                logger.error("Error querying question bank. This might be due to missing question_type column. Trying alternative query without question_type...")
-                # Try alternative query without question_type
+                    logger.debug(f"[QuestionBank] Also filtering by tags: {matching_tags}")
+            
+                # Combine category and tag filters with OR (question matches if it matches category OR tags)
+                bank_filters = [Question.is_active == True]
+                if category_condition is not None and tag_condition is not None:
+                    bank_filters.append(or_(category_condition, tag_condition))
+                elif category_condition is not None:
+                    bank_filters.append(category_condition)
+                elif tag_condition is not None:
+                    bank_filters.append(tag_condition)
+            
+                # Random-key index seeks pick the sample without loading every matching row
                 try:
-                    from sqlalchemy import select as sql_select
-                    alt_stmt = sql_select(
-                        Question.id, Question.text, Question.category, 
-                        Question.difficulty, Question.tags, Question.is_active
-                    ).where(Question.is_active == True)
-                    # Re-apply filters
-                    if category_condition:
-                        alt_stmt = alt_stmt.where(category_condition)
-                    if tag_condition:
-                        alt_stmt = alt_stmt.where(tag_condition)
-                    alt_result = await session.execute(alt_stmt)
-                    all_questions = alt_result.all()
-                    logger.info(f"Alternative query succeeded, found {len(all_questions)} questions")
-                except Exception as alt_error:
-                    logger.error(f"Alternative query also failed: {alt_error}")
-                    logger.error(f"Alternative query also failed: {alt_error}. Returning empty list - will use LLM fallback")
-                    all_questions = []
-            
-            logger.info(f"Question Bank Search Results: Found {len(all_questions)} questions")
-            
-            # Fallback ladder: if no skill-specific questions found, fetch any active questions
-            if not all_questions:
+                    selected_questions = await question_sampler.sample(session, num_questions, filters=bank_filters)
+                except Exception as query_error:
+                    logger.error(f"Error executing question bank query: {query_error}", exc_info=True)
+                    logger.error("Error querying question bank. This might be due to missing question_type column. Trying alternative query without question_type...")
+                    # Try alternative query without question_type
+                    try:
+                        from sqlalchemy import select as sql_select
+                        alt_stmt = sql_select(
+                            Question.id, Question.text, Question.category, 
+                            Question.difficulty, Question.tags, Question.is_active
+                        ).where(Question.is_active == True)
+                        # Re-apply filters
+                        if category_condition is not None:
+                            alt_stmt = alt_stmt.where(category_condition)
+                        if tag_condition is not None:
+                            alt_stmt = alt_stmt.where(tag_condition)
+                        alt_result = await session.execute(alt_stmt)
+                        all_questions = alt_result.all()
+                        logger.info(f"Alternative query succeeded, found {len(all_questions)} questions")
+                        selected_questions = random.sample(all_questions, min(num_questions, len(all_questions)))
+                    except Exception as alt_error:
+                        logger.error(f"Alternative query also failed: {alt_error}")
+                        logger.error(f"Alternative query also failed: {alt_error}. Returning empty list - will use LLM fallback")
+                        selected_questions = []
+            
+            logger.info(f"Question Bank Search Results: Sampled {len(selected_questions)} questions")
+            
+            # Fallback ladder: if no skill-specific questions found, sample any active questions
+            if not selected_questions:
                 logger.warning("[QuestionBank] No skill-specific questions found. Fetching any active questions as fallback.")
                 logger.warning("No skill-specific questions found in bank. Fetching any active questions as fallback.")
-                fallback_stmt = select(Question).where(Question.is_active == True)
                 try:
-                    res = await session.execute(fallback_stmt)
-                    all_questions = res.scalars().all()
+                    if use_index:
+                        selected_questions = question_bank_index.sample(num_questions)
+                    else:
+                        selected_questions = await question_sampler.sample(
+                            session, num_questions, filters=[Question.is_active == True]
+                        )
                 except Exception as e:
                     logger.error(f"Fallback bank query failed: {e}")
-                    all_questions = []
+                    selected_questions = []
 
-            # Randomly select questions
-            if all_questions:
-                selected_questions = random.sample(all_questions, min(num_questions, len(all_questions)))
+            if selected_questions:
                 logger.info(f"Selected {len(selected_questions)} questions from bank for interview")
             else:
-                selected_questions = []
                 logger.error("Question bank is completely empty!")
             
             formatted_questions = []
@@ -636,11 +738,13 @@ class QuestionGeneratorService:
         skills: List[str],
         role_name: Optional[str] = None,
         resume_data: Optional[Dict[str, Any]] = None,
-        jd_data: Optional[Dict[str, Any]] = None
+        jd_data: Optional[Dict[str, Any]] = None,
+        difficulty: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate questions using LLM when question bank doesn't have matching questions.
-        Questions are generated based on the provided skills, role, resume, and JD.
+        Questions are generated based on the provided skills, role, resume, and JD; all of
+        one `difficulty` when given (question pool refills), otherwise a mix.
         """
         try:
             import random
@@ -685,6 +789,10 @@ Return ONLY a valid JSON array with this exact structure:
     }
 ]"""
 
+            difficulty_instruction = (
+                f"Every question must be {difficulty} difficulty" if difficulty
+                else "Mix easy, medium, and hard difficulties as appropriate"
+            )
             user_prompt = f"""Generate {num_questions} technical interview questions for {role_text}.
 
 REQUIRED SKILLS:
@@ -694,7 +802,7 @@ REQUIRED SKILLS:
 
 INSTRUCTIONS:
 1. Generate questions that test knowledge of these specific skills: {skills_text}
-2. Mix easy, medium, and hard difficulties as appropriate
+2. {difficulty_instruction}
 3. Questions should be technical and relevant to the skills mentioned
 4. Each question should focus on a specific skill or technology
 5. Return exactly {num_questions} questions
@@ -751,10 +859,10 @@ Return ONLY the JSON array, no additional text or markdown."""
             formatted_questions = []
             logger.debug(f"Successfully parsed {len(llm_questions)} questions from LLM response")
             for i, q in enumerate(llm_questions[:num_questions], 1):
-                # Map difficulty
-                difficulty = q.get('difficulty', 'medium').lower()
-                if difficulty not in ['easy', 'medium', 'hard']:
-                    difficulty = 'medium'
+                # Map difficulty (a requested difficulty wins over what the model labelled)
+                question_difficulty = (difficulty or q.get('difficulty', 'medium')).lower()
+                if question_difficulty not in ['easy', 'medium', 'hard']:
+                    question_difficulty = 'medium'
                 
                 # Map category
                 category_str = q.get('category', 'PYTHON').upper()
@@ -776,14 +884,14 @@ Return ONLY the JSON array, no additional text or markdown."""
                     'medium': 240, # 4 minutes
                     'hard': 360    # 6 minutes
                 }
-                time_limit_sec = time_limits.get(difficulty, 240)
+                time_limit_sec = time_limits.get(question_difficulty, 240)
                 
                 formatted_questions.append({
                     "question_id": str(uuid.uuid4()),  # Generate new UUID for LLM questions
                     "question_type": "static",
                     "order": i,
                     "prompt": q.get('question', ''),
-                    "difficulty": difficulty,
+                    "difficulty": question_difficulty,
                     "time_limit_sec": time_limit_sec,
                     "answer_mode": answer_mode.lower(),
                     "evaluation_mode": "text" if answer_mode == "TEXT" else ("code" if answer_mode == "CODE" else "audio"),
@@ -798,6 +906,7 @@ Return ONLY the JSON array, no additional text or markdown."""
             return formatted_questions
             
         except Exception as e:
+            _raise_if_retryable(e)
             logger.error(f"Error generating questions with LLM: {e}", exc_info=True)
             logger.error(f"ERROR generating with LLM: {e}")
             # Fallback to mock questions
@@ -1166,7 +1275,7 @@ Return ONLY the JSON object."""
         return []
     
     @staticmethod
-    def _parse_resume(resume_id: Optional[str]) -> Dict[str, Any]:
+    async def _parse_resume(resume_id: Optional[str]) -> Dict[str, Any]:
         """Parse resume file if available."""
         if not resume_id:
             return {
@@ -1182,7 +1291,7 @@ Return ONLY the JSON object."""
             resume_path = os.path.join(QuestionGeneratorService.RESUME_UPLOAD_DIR, f"{resume_id}.pdf")
             
             if os.path.exists(resume_path):
-                return resume_jd_parser.parse_resume_pdf(resume_path)
+                return await resume_jd_parser.parse_resume_pdf(resume_path)
             else:
                 logger.warning(f"Resume file not found: {resume_path}")
                 return {
@@ -1309,8 +1418,8 @@ ROLE: {role_name or 'Technical Candidate'}
 Return ONLY the JSON object."""
 
             start_time = datetime.now()
-            response = await asyncio.wait_for(
-                azure_openai_service.async_client.chat.completions.create(
+            content = await asyncio.wait_for(
+                azure_openai_service.chat_completion_json(
                     model="gpt-4o",
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -1325,7 +1434,6 @@ Return ONLY the JSON object."""
             duration = (datetime.now() - start_time).total_seconds()
             logger.info(f"✅ Question regenerated in {duration:.2f}s")
             
-            content = response.choices[0].message.content
             llm_q = await run_in_threadpool(json.loads, content)
             
             # Map values back to our schema
@@ -1471,6 +1579,7 @@ Requirements:
                 })
             return formatted
         except Exception as e:
+            _raise_if_retryable(e)
             logger.error(f"Error generating analytical questions with LLM: {e}", exc_info=True)
             return QuestionGeneratorService._generate_mock_analytical_questions(num_questions, role_name)
 
@@ -1592,22 +1701,24 @@ Return JSON only."""
             from sqlalchemy import or_
             import uuid as uuid_module
             
-            # Use the same logic as _get_questions_from_bank but exclude existing IDs
-            # and limit to 1
-            stmt = select(Question).where(
-                Question.is_active == True,
-                Question.id.notin_([uuid_module.UUID(i) for i in exclude_ids if i and len(i) == 36])
-            )
-            
-            # Try to match difficulty if possible
-            # ... (omitting full skill mapping logic for brevity, reusing it if possible) ...
-            # Actually, let's keep it simple for now or refactor _get_questions_from_bank to be more reusable.
-            # For a single replacement, we can just call _get_questions_from_bank with num=1 and filter later,
-            # but that's inefficient.
-            
-            # Let's reuse some of the filter logic
-            result = await session.execute(stmt.limit(20)) # Get a small pool
-            available = result.scalars().all()
+            valid_exclude_ids = [uuid_module.UUID(i) for i in exclude_ids if i and len(i) == 36]
+
+            if await question_bank_index.ensure_fresh(session):
+                # Prefer the requested difficulty and the candidate's skills as tags, then relax
+                skill_tags = [s.lower().strip() for s in (skills or []) if s and s.strip()]
+                difficulty_key = (difficulty or "").upper() or None
+                available = (
+                    question_bank_index.sample(1, weighted=True, difficulty=difficulty_key, tags=skill_tags, exclude_ids=valid_exclude_ids)
+                    or question_bank_index.sample(1, difficulty=difficulty_key, exclude_ids=valid_exclude_ids)
+                    or question_bank_index.sample(1, exclude_ids=valid_exclude_ids)
+                )
+            else:
+                stmt = select(Question).where(
+                    Question.is_active == True,
+                    Question.id.notin_(valid_exclude_ids)
+                )
+                result = await session.execute(stmt.limit(20)) # Get a small pool
+                available = result.scalars().all()
             
             if not available:
                 return None
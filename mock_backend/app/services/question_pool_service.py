@@ -0,0 +1,231 @@
+"""
+Question Pool Service
+---------------------
+Stores LLM-generated technical questions keyed by role + normalized JD skill set so that
+candidates applying for the same job reuse pre-generated questions instead of waiting
+on GPT-4o at scheduling time. Questions are sampled without replacement, least-exposed
+first, retired after QUESTION_POOL_MAX_EXPOSURE interviews, and refilled by the task queue.
+
+Templates ask for exact per-difficulty counts, so stock is tracked per difficulty: a pool
+is refilled (one LLM batch per difficulty, asked for that difficulty) whenever any of its
+easy / medium / hard buckets drops below its share of QUESTION_POOL_LOW_WATERMARK.
+"""
+
+import copy
+import hashlib
+import logging
+import math
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.sql.models.question_pool import PooledQuestion
+
+logger = logging.getLogger(__name__)
+
+_DIFFICULTIES = ("easy", "medium", "hard")
+
+
+def _bucket_low_watermark() -> int:
+    """Servable questions each difficulty should keep; below it the pool is refilled."""
+    return max(1, math.ceil(settings.QUESTION_POOL_LOW_WATERMARK / len(_DIFFICULTIES)))
+
+
+class QuestionPoolService:
+    """Pre-generated technical question pools per role and skill signature."""
+
+    @staticmethod
+    def normalize_skills(skills: Optional[List[str]]) -> List[str]:
+        """Lowercase, strip, dedupe and sort so equivalent skill lists share a pool."""
+        return sorted({str(s).strip().lower() for s in (skills or []) if s and str(s).strip()})
+
+    @staticmethod
+    def pool_key(role_name: Optional[str], skills: Optional[List[str]]) -> str:
+        role = (role_name or "").strip().lower()
+        signature = ",".join(QuestionPoolService.normalize_skills(skills))
+        return hashlib.sha256(f"{role}|{signature}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    async def available_counts(session: AsyncSession, pool_key: str) -> Dict[str, int]:
+        """Questions in the pool that can still be served, per difficulty."""
+        stmt = select(PooledQuestion.difficulty, func.count(PooledQuestion.id)).where(
+            PooledQuestion.pool_key == pool_key,
+            PooledQuestion.exposure_count < settings.QUESTION_POOL_MAX_EXPOSURE,
+        ).group_by(PooledQuestion.difficulty)
+        counts = dict.fromkeys(_DIFFICULTIES, 0)
+        counts.update({d: n for d, n in (await session.execute(stmt)).all()})
+        return counts
+
+    @staticmethod
+    def low_difficulties(available: Dict[str, int]) -> List[str]:
+        watermark = _bucket_low_watermark()
+        return [d for d in _DIFFICULTIES if available.get(d, 0) < watermark]
+
+    @staticmethod
+    async def sample(
+        session: AsyncSession,
+        role_name: Optional[str],
+        skills: Optional[List[str]],
+        num_questions: int,
+        difficulty_counts: Optional[Dict[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Draw `num_questions` distinct questions for one candidate, least-exposed first.
+
+        With `difficulty_counts` (summing to `num_questions`) exactly that many questions of
+        each difficulty are returned. Returns an empty list when the pool cannot satisfy the
+        request (the caller should generate directly); a background refill is scheduled
+        either way if any difficulty is low.
+        """
+        if not settings.QUESTION_POOL_ENABLED or num_questions <= 0:
+            return []
+
+        key = QuestionPoolService.pool_key(role_name, skills)
+        wanted = {
+            d: int(difficulty_counts.get(d, 0) or 0)
+            for d in _DIFFICULTIES
+        } if difficulty_counts else {}
+        if sum(wanted.values()) != num_questions:
+            # No usable distribution: any difficulty will do
+            wanted = {None: num_questions}
+
+        # The picks lock their rows; on a shortfall rolling back the savepoint releases the
+        # rows already locked for other difficulties, which SKIP LOCKED would otherwise hide
+        # from other schedulers until this job commits after generating with the LLM
+        rows: List[PooledQuestion] = []
+        savepoint = await session.begin_nested()
+        for difficulty, count in wanted.items():
+            if count <= 0:
+                continue
+            stmt = select(PooledQuestion).where(
+                PooledQuestion.pool_key == key,
+                PooledQuestion.exposure_count < settings.QUESTION_POOL_MAX_EXPOSURE,
+            )
+            if difficulty:
+                stmt = stmt.where(PooledQuestion.difficulty == difficulty)
+            stmt = (
+                stmt.order_by(PooledQuestion.exposure_count, func.random())
+                .limit(count)
+                .with_for_update(skip_locked=True)
+            )
+            picked = (await session.execute(stmt)).scalars().all()
+            if len(picked) < count:
+                rows = []
+                break
+            rows.extend(picked)
+        if rows:
+            await savepoint.commit()
+        else:
+            await savepoint.rollback()
+
+        available = await QuestionPoolService.available_counts(session, key)
+        for row in rows:
+            # Serving a question at its last allowed exposure retires it
+            if (row.exposure_count or 0) + 1 >= settings.QUESTION_POOL_MAX_EXPOSURE:
+                available[row.difficulty] = available.get(row.difficulty, 0) - 1
+        if QuestionPoolService.low_difficulties(available):
+            await QuestionPoolService.schedule_refill(role_name, skills, session=session)
+
+        if not rows:
+            logger.info(f"[QuestionPool] Pool {key[:12]} cannot serve {num_questions} questions ({available} available)")
+            return []
+
+        now = datetime.now(timezone.utc)
+        questions = []
+        for row in rows:
+            row.exposure_count = (row.exposure_count or 0) + 1
+            row.last_served_at = now
+            q = copy.deepcopy(row.payload)
+            # Fresh per-interview id; keep a pointer back to the pooled row
+            q["question_id"] = str(uuid.uuid4())
+            q["pool_question_id"] = str(row.id)
+            questions.append(q)
+        await session.flush()
+
+        logger.info(f"[QuestionPool] Served {len(questions)} questions from pool {key[:12]}")
+        return questions
+
+    @staticmethod
+    def add_questions(
+        session: AsyncSession,
+        role_name: Optional[str],
+        skills: Optional[List[str]],
+        questions: List[Dict[str, Any]],
+        exposure_count: int = 0,
+    ) -> int:
+        """Stage LLM-generated questions into the pool; mock/fallback questions are skipped."""
+        key = QuestionPoolService.pool_key(role_name, skills)
+        normalized = QuestionPoolService.normalize_skills(skills)
+        added = 0
+        for q in questions:
+            if q.get("source") != "llm_generated" or not q.get("prompt"):
+                continue
+            difficulty = str(q.get("difficulty", "medium")).lower()
+            payload = {k: v for k, v in q.items() if k not in ("question_id", "pool_question_id", "order")}
+            session.add(PooledQuestion(
+                pool_key=key,
+                role_name=role_name,
+                skills=normalized,
+                difficulty=difficulty if difficulty in _DIFFICULTIES else "medium",
+                payload=payload,
+                exposure_count=exposure_count,
+            ))
+            added += 1
+        return added
+
+    @staticmethod
+    async def schedule_refill(
+        role_name: Optional[str],
+        skills: Optional[List[str]],
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        """Queue a background refill for this pool unless one is already queued or running."""
+        if not settings.QUESTION_POOL_ENABLED:
+            return
+        from app.services.task_queue_service import task_queue_service
+
+        key = QuestionPoolService.pool_key(role_name, skills)
+        kwargs = {
+            "payload": {"role_name": role_name, "skills": QuestionPoolService.normalize_skills(skills)},
+            "idempotency_key": f"question-pool-refill:{key}",
+        }
+        if session is not None:
+            await task_queue_service.enqueue(session, "refill_question_pool", **kwargs)
+        else:
+            await task_queue_service.enqueue_now("refill_question_pool", **kwargs)
+
+    @staticmethod
+    async def refill(role_name: Optional[str], skills: Optional[List[str]]) -> int:
+        """Generate a batch of questions with the LLM for each low difficulty and store them."""
+        from app.db.sql.session import AsyncSessionLocal
+        from app.services.azure_openai_service import azure_openai_service
+        from app.services.question_generator_service import QuestionGeneratorService
+
+        key = QuestionPoolService.pool_key(role_name, skills)
+        if not azure_openai_service.async_client and not azure_openai_service.client:
+            logger.debug("[QuestionPool] Azure OpenAI not configured, skipping refill")
+            return 0
+
+        async with AsyncSessionLocal() as session:
+            low = QuestionPoolService.low_difficulties(await QuestionPoolService.available_counts(session, key))
+            added = 0
+            for difficulty in low:
+                questions = await QuestionGeneratorService._generate_questions_with_llm(
+                    num_questions=settings.QUESTION_POOL_REFILL_BATCH,
+                    skills=QuestionPoolService.normalize_skills(skills),
+                    role_name=role_name,
+                    difficulty=difficulty,
+                )
+                added += QuestionPoolService.add_questions(session, role_name, skills, questions)
+                # Commit per difficulty so a failed LLM call keeps the batches already generated
+                await session.commit()
+            if low:
+                logger.info(f"[QuestionPool] Refilled pool {key[:12]} with {added} questions ({', '.join(low)})")
+            return added
+
+
+question_pool_service = QuestionPoolService()
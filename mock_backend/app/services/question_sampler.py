@@ -0,0 +1,79 @@
+"""
+Question Sampler
+----------------
+Random selection of N question-bank rows matching a filter without scanning or sorting
+the filtered set. Every Question carries a uniformly distributed `random_key` (indexed
+together with the common filters); one draw picks a random point r and seeks the first
+matching row with random_key >= r, wrapping around to the start of the key range when
+nothing lies above r. Ids already drawn (plus any caller exclusions) are kept out with
+NOT IN, so a draw never repeats a question.
+
+Each draw is an index range seek bounded by LIMIT 1, so the cost depends on the sample
+size and filter selectivity, not on the size of the bank. Rows following a larger gap in
+the key space are slightly more likely to be drawn; with uniform keys this bias is small
+and it is the usual trade-off against ORDER BY random().
+"""
+
+import logging
+import random
+import uuid
+from typing import Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.sql.models.question import Question
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionSampler:
+    """Random-key index seeks over the question bank."""
+
+    @staticmethod
+    async def _seek(
+        session: AsyncSession,
+        filters: list,
+        excluded: List[uuid.UUID],
+        lower_bound: Optional[float],
+    ) -> Optional[Question]:
+        stmt = select(Question).where(*filters)
+        if excluded:
+            stmt = stmt.where(Question.id.not_in(excluded))
+        if lower_bound is not None:
+            stmt = stmt.where(Question.random_key >= lower_bound)
+        stmt = stmt.order_by(Question.random_key).limit(1)
+        return (await session.execute(stmt)).scalars().first()
+
+    @staticmethod
+    async def sample(
+        session: AsyncSession,
+        count: int,
+        filters: Optional[list] = None,
+        exclude_ids: Optional[Iterable[uuid.UUID]] = None,
+    ) -> List[Question]:
+        """
+        Up to `count` distinct random questions matching all `filters` (SQLAlchemy
+        expressions on Question), never returning an id in `exclude_ids`. Returns fewer
+        than `count` when the filtered bank runs out.
+        """
+        filters = list(filters or [])
+        excluded = [qid for qid in (exclude_ids or []) if qid]
+        picked: List[Question] = []
+
+        while len(picked) < count:
+            question = await QuestionSampler._seek(session, filters, excluded, random.random())
+            if question is None:
+                # Nothing above r: wrap around to the lowest key
+                question = await QuestionSampler._seek(session, filters, excluded, None)
+            if question is None:
+                break
+            picked.append(question)
+            excluded.append(question.id)
+
+        if len(picked) < count:
+            logger.debug(f"[QuestionSampler] Requested {count} questions, bank had {len(picked)}")
+        return picked
+
+
+question_sampler = QuestionSampler()
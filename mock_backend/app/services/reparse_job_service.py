@@ -0,0 +1,273 @@
+"""
+Reparse Job Service
+-------------------
+Batch re-parse of candidates (e.g. after a parser prompt change), filtered by
+parse_status, registration date range and role.
+
+A job is a row in `reparse_jobs` driven by `reparse_candidates` tasks on the durable
+task queue, one page of REPARSE_JOB_PAGE_SIZE candidates (in user id order) per task.
+Each page enqueues `parse_candidate_resume` tasks, advances the job's checkpoint and
+enqueues the next page in one transaction, so a crashed or retried page task resumes
+from the last committed page; a cancelled job can be resumed the same way. A page task
+carries the run and checkpoint it was enqueued for, and the checkpoint only moves by
+compare-and-set from that value, so a page task delivered twice runs once and the chain
+never forks.
+
+LLM load stays bounded twice over: parse tasks run at TASK_CONCURRENCY_RESUME_PARSE
+across all workers, and a page is only enqueued while fewer than
+REPARSE_MAX_ACTIVE_PARSES parse tasks are queued or running, so a large job does not
+bury new registrations' parses at the back of the queue.
+
+Unless the job is forced, candidates whose last parse succeeded and whose parse
+fingerprint (resume and JD text hashes plus parser versions, see
+candidate_parse_fingerprint) matches their current texts are skipped.
+"""
+
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.sql.enums import UserRole
+from app.db.sql.models.reparse_job import ReparseJob
+from app.db.sql.models.task_queue import QueuedTask
+from app.db.sql.models.user import User, CandidateProfile
+from app.db.sql.session import AsyncSessionLocal
+from app.schemas.auth import ReparseJobRequest
+from app.services.resume_tasks import candidate_parse_fingerprint
+from app.services.task_queue_service import task_queue_service
+
+logger = logging.getLogger(__name__)
+
+PARSE_STATUSES = ("pending", "success", "failed")
+ACTIVE_STATUSES = ("queued", "running")
+
+
+def _candidate_filter(stmt, filters: Dict[str, Any]):
+    stmt = stmt.where(User.role == UserRole.CANDIDATE)
+    if filters.get("parse_status"):
+        stmt = stmt.where(CandidateProfile.parse_status.in_(filters["parse_status"]))
+    if filters.get("created_from"):
+        stmt = stmt.where(User.created_at >= datetime.fromisoformat(filters["created_from"]))
+    if filters.get("created_to"):
+        stmt = stmt.where(User.created_at < datetime.fromisoformat(filters["created_to"]))
+    if filters.get("role_name"):
+        stmt = stmt.where(CandidateProfile.role_name == filters["role_name"])
+    return stmt
+
+
+class ReparseJobService:
+    """Create, advance and report batch re-parse jobs."""
+
+    @staticmethod
+    async def create_job(session: AsyncSession, request: ReparseJobRequest, admin_id: Optional[uuid.UUID]) -> ReparseJob:
+        unknown = [s for s in request.parse_status or [] if s not in PARSE_STATUSES]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown parse_status: {', '.join(unknown)}. Allowed: {', '.join(PARSE_STATUSES)}",
+            )
+        if request.created_from and request.created_to and request.created_from >= request.created_to:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="created_from must be before created_to")
+
+        filters = request.model_dump(mode="json", exclude={"force"}, exclude_none=True)
+        total = (await session.execute(
+            _candidate_filter(select(func.count()).select_from(User).join(CandidateProfile), filters)
+        )).scalar_one()
+
+        job = ReparseJob(id=uuid.uuid4(), status="queued", filters=filters, force=request.force, run=1, total=total, created_by=admin_id)
+        session.add(job)
+        await session.flush()
+        await ReparseJobService._enqueue_page(session, job, None)
+        await session.commit()
+        logger.info(f"[Reparse] Job {job.id} created for {total} candidates (filters={filters}, force={request.force})")
+        return job
+
+    @staticmethod
+    async def _enqueue_page(
+        session: AsyncSession,
+        job: ReparseJob,
+        checkpoint: Optional[uuid.UUID],
+        delay_seconds: float = 0,
+    ) -> None:
+        checkpoint_key = str(checkpoint) if checkpoint else "start"
+        await task_queue_service.enqueue(
+            session,
+            "reparse_candidates",
+            {"job_id": str(job.id), "run": job.run, "checkpoint": str(checkpoint) if checkpoint else None},
+            # One active task per page. A backoff retry re-enqueues the page it is running,
+            # so it goes unkeyed; a duplicate of it is a no-op once the checkpoint moves on.
+            idempotency_key=None if delay_seconds else f"reparse-page:{job.id}:{job.run}:{checkpoint_key}",
+            delay_seconds=delay_seconds,
+        )
+
+    @staticmethod
+    async def run_page(job_id: uuid.UUID, run: int, checkpoint: Optional[uuid.UUID]) -> None:
+        """Process the page after `checkpoint` (task handler); failures are retried by the queue."""
+        try:
+            await ReparseJobService._run_page(job_id, run, checkpoint)
+        except Exception as e:
+            async with AsyncSessionLocal() as session:
+                await session.execute(update(ReparseJob).where(ReparseJob.id == job_id).values(last_error=str(e)[:2000]))
+                await session.commit()
+            raise
+
+    @staticmethod
+    async def _run_page(job_id: uuid.UUID, run: int, checkpoint: Optional[uuid.UUID]) -> None:
+        async with AsyncSessionLocal() as session:
+            job = (await session.execute(
+                select(ReparseJob).where(ReparseJob.id == job_id).with_for_update()
+            )).scalar_one_or_none()
+            if job is None or job.status not in ACTIVE_STATUSES or job.run != run:
+                return
+            if job.checkpoint_user_id != checkpoint:
+                # A duplicate delivery of a page that has already been processed
+                logger.info(f"[Reparse] Job {job_id}: skipping stale page task (checkpoint moved on)")
+                return
+
+            active = (await session.execute(
+                select(func.count(QueuedTask.id)).where(
+                    QueuedTask.task_type == "parse_candidate_resume",
+                    QueuedTask.status.in_(ACTIVE_STATUSES),
+                )
+            )).scalar_one()
+            room = min(settings.REPARSE_JOB_PAGE_SIZE, settings.REPARSE_MAX_ACTIVE_PARSES - active)
+            if room <= 0:
+                job.status = "running"
+                await ReparseJobService._enqueue_page(session, job, checkpoint, delay_seconds=settings.REPARSE_JOB_BACKOFF_SECONDS)
+                await session.commit()
+                return
+
+            stmt = select(
+                User.id,
+                CandidateProfile.resume_text,
+                CandidateProfile.job_description,
+                CandidateProfile.parse_fingerprint,
+                CandidateProfile.parse_status,
+            ).join(CandidateProfile)
+            stmt = _candidate_filter(stmt, job.filters or {})
+            if checkpoint:
+                stmt = stmt.where(User.id > checkpoint)
+            rows = (await session.execute(stmt.order_by(User.id).limit(room))).all()
+
+            to_parse = [
+                row.id for row in rows
+                if job.force
+                or row.parse_status != "success"
+                or not row.resume_text
+                or row.parse_fingerprint != candidate_parse_fingerprint(row.resume_text, row.job_description)
+            ]
+            added = 0
+            if to_parse:
+                await session.execute(
+                    update(CandidateProfile)
+                    .where(CandidateProfile.user_id.in_(to_parse))
+                    .values(parse_status="pending")
+                )
+                added = await task_queue_service.enqueue_many(
+                    session,
+                    "parse_candidate_resume",
+                    [({"candidate_id": str(i), "reparse_job_id": str(job.id)}, f"parse-resume:{i}") for i in to_parse],
+                )
+
+            done = len(rows) < room
+            next_checkpoint = rows[-1].id if rows else checkpoint
+            # Compare-and-set: the checkpoint only advances from the one this page started at
+            advanced = await session.execute(
+                update(ReparseJob)
+                .where(
+                    ReparseJob.id == job.id,
+                    ReparseJob.run == run,
+                    ReparseJob.checkpoint_user_id.is_(None) if checkpoint is None else ReparseJob.checkpoint_user_id == checkpoint,
+                )
+                .values(
+                    status="completed" if done else "running",
+                    checkpoint_user_id=next_checkpoint,
+                    processed=ReparseJob.processed + len(rows),
+                    enqueued=ReparseJob.enqueued + added,
+                    already_queued=ReparseJob.already_queued + len(to_parse) - added,
+                    skipped=ReparseJob.skipped + len(rows) - len(to_parse),
+                    finished_at=datetime.now(timezone.utc) if done else None,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if advanced.rowcount != 1:
+                await session.rollback()
+                logger.warning(f"[Reparse] Job {job_id}: checkpoint moved during the page; discarding it")
+                return
+            if not done:
+                await ReparseJobService._enqueue_page(session, job, next_checkpoint)
+            await session.commit()
+            await session.refresh(job)
+            logger.info(
+                f"[Reparse] Job {job.id}: page of {len(rows)} ({added} enqueued, {len(rows) - len(to_parse)} unchanged); "
+                f"{job.processed}/{job.total} processed, {job.status}"
+            )
+
+    @staticmethod
+    async def _get(session: AsyncSession, job_id: uuid.UUID, lock: bool = False) -> ReparseJob:
+        stmt = select(ReparseJob).where(ReparseJob.id == job_id)
+        job = (await session.execute(stmt.with_for_update() if lock else stmt)).scalar_one_or_none()
+        if job is None:
+            raise HTTPException(status_code=404, detail="Reparse job not found")
+        return job
+
+    @staticmethod
+    async def cancel(session: AsyncSession, job_id: uuid.UUID) -> ReparseJob:
+        """Stop after the current page; parse tasks already enqueued still run."""
+        job = await ReparseJobService._get(session, job_id, lock=True)
+        if job.status in ACTIVE_STATUSES:
+            job.status = "cancelled"
+            job.finished_at = datetime.now(timezone.utc)
+            await session.commit()
+        return job
+
+    @staticmethod
+    async def resume(session: AsyncSession, job_id: uuid.UUID) -> ReparseJob:
+        """Continue from the checkpoint (after a cancel, or if the page task died)."""
+        job = await ReparseJobService._get(session, job_id, lock=True)
+        if job.status == "completed":
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Reparse job already completed")
+        job.status = "queued"
+        job.run += 1
+        job.finished_at = None
+        await ReparseJobService._enqueue_page(session, job, job.checkpoint_user_id)
+        await session.commit()
+        return job
+
+    @staticmethod
+    async def get_progress(session: AsyncSession, job_id: uuid.UUID) -> Dict[str, Any]:
+        job = await ReparseJobService._get(session, job_id)
+        remaining = (await session.execute(
+            select(func.count(QueuedTask.id)).where(
+                QueuedTask.task_type == "parse_candidate_resume",
+                QueuedTask.status.in_(ACTIVE_STATUSES),
+                QueuedTask.payload["reparse_job_id"].as_string() == str(job.id),
+            )
+        )).scalar_one()
+        return {
+            "id": str(job.id),
+            "status": job.status,
+            "filters": job.filters,
+            "force": job.force,
+            "total": job.total,
+            "processed": job.processed,
+            "enqueued": job.enqueued,
+            "skipped": job.skipped,
+            "already_queued": job.already_queued,
+            # Parse tasks of this job still queued or running
+            "parses_remaining": remaining,
+            "checkpoint_user_id": str(job.checkpoint_user_id) if job.checkpoint_user_id else None,
+            "last_error": job.last_error,
+            "created_at": job.created_at,
+            "updated_at": job.updated_at,
+            "finished_at": job.finished_at,
+        }
+
+
+reparse_job_service = ReparseJobService()
@@ -14,6 +14,7 @@ from app.db.sql.models.interview_response import InterviewResponse
 from app.db.sql.models.interview_session_question import InterviewSessionQuestion
 from app.db.sql.models.interview import Interview
 from app.db.sql.models.user import CandidateProfile
+from app.services.session_aggregate_service import session_aggregate_service
 
 logger = logging.getLogger(__name__)
 
@@ -94,30 +95,20 @@ class ReportGenerationService:
         candidate_result = await session.execute(candidate_stmt)
         candidate_profile = candidate_result.scalar_one_or_none()
         
-        # Calculate statistics
-        # Assign 0.0 for unattempted questions
-        all_scores = [r[0].ai_score if r[0] and r[0].ai_score is not None else 0.0 for r in responses_data]
-        avg_raw = sum(all_scores) / len(all_scores) if all_scores else 0.0
+        # Calculate statistics from the session's running aggregates
+        # Unattempted (or unscored) questions count as 0.0
+        total_questions = len(responses_data)
+        scored = interview_session.score_count or 0
+        avg_raw = (interview_session.score_sum or 0.0) / total_questions if total_questions else 0.0
         average_score = avg_raw * 10.0  # Convert 0-10 to 0-100
         
-        # Max/Min should probably only consider attempted questions or stay as is
-        # If we include 0s, min will likely be 0.
-        max_score = max(all_scores) * 10.0 if all_scores else 0.0
-        min_score = min(all_scores) * 10.0 if all_scores else 0.0
+        # If we include 0s for unscored questions, min will be 0.
+        max_score = (interview_session.score_max or 0.0) * 10.0 if total_questions else 0.0
+        min_score = (interview_session.score_min or 0.0) * 10.0 if total_questions and scored >= total_questions else 0.0
         
-        # Extract strengths and weaknesses from evaluations
-        strengths = []
-        weaknesses = []
-        for resp, q in responses_data:
-            if resp and resp.evaluation_json:
-                eval_data = resp.evaluation_json
-                if isinstance(eval_data, dict):
-                    strengths.extend(eval_data.get('strengths', []))
-                    weaknesses.extend(eval_data.get('weaknesses', []))
-        
-        # Deduplicate and limit
-        unique_strengths = list(set(strengths))[:5]
-        unique_weaknesses = list(set(weaknesses))[:5]
+        # Most frequent strengths and weaknesses across evaluations
+        unique_strengths = session_aggregate_service.top_feedback(interview_session, "strengths", 5)
+        unique_weaknesses = session_aggregate_service.top_feedback(interview_session, "weaknesses", 5)
         
         # Generate recommendation
         recommendation = ReportGenerationService._generate_recommendation(
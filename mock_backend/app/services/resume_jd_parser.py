@@ -8,14 +8,18 @@ to extract relevant information for question generation.
 import os
 import json
 import logging
-from typing import Dict, Any, Optional
-import pypdf
-import io
+from typing import Dict, Any, Optional, Callable, List
 import asyncio
 from app.services.azure_openai_service import azure_openai_service
+from app.services.pdf_extraction import pdf_extraction_pool
+from app.services.parse_cache_service import parse_cache_service
+from app.services.skill_matcher import skill_matcher
 
 logger = logging.getLogger(__name__)
 
+# Bump when the JD prompt, model or post-processing changes (invalidates parse_cache entries)
+JD_PARSER_VERSION = "llm-gpt-4o-1"
+
 
 class ResumeJDParser:
     """Service to parse resume PDFs and job descriptions."""
@@ -37,18 +41,10 @@ class ResumeJDParser:
             - education: Education details
         """
         try:
-            import anyio
-            def _read_pdf() -> Dict[str, Any]:
-                with open(resume_path, 'rb') as file:
-                    pdf_reader = pypdf.PdfReader(file)
-                    text_content = []
-                    for page in pdf_reader.pages:
-                        text_content.append(page.extract_text())
-                    full_text = "\n".join(text_content)
-                    parsed_data = ResumeJDParser._extract_resume_info(full_text)
-                    parsed_data['text'] = full_text
-                    return parsed_data
-            return await anyio.to_thread.run_sync(_read_pdf)
+            full_text = "\n".join(await pdf_extraction_pool.extract_pages(resume_path))
+            parsed_data = ResumeJDParser._extract_resume_info(full_text)
+            parsed_data['text'] = full_text
+            return parsed_data
         except Exception as e:
             logger.error(f"Error parsing resume PDF: {e}")
             return {
@@ -71,17 +67,10 @@ class ResumeJDParser:
             Dictionary containing parsed resume data
         """
         try:
-            import anyio
-            def _read_bytes() -> Dict[str, Any]:
-                pdf_reader = pypdf.PdfReader(io.BytesIO(resume_bytes))
-                text_content = []
-                for page in pdf_reader.pages:
-                    text_content.append(page.extract_text())
-                full_text = "\n".join(text_content)
-                parsed_data = ResumeJDParser._extract_resume_info(full_text)
-                parsed_data['text'] = full_text
-                return parsed_data
-            return await anyio.to_thread.run_sync(_read_bytes)
+            full_text = "\n".join(await pdf_extraction_pool.extract_pages(resume_bytes))
+            parsed_data = ResumeJDParser._extract_resume_info(full_text)
+            parsed_data['text'] = full_text
+            return parsed_data
         except Exception as e:
             logger.error(f"Error parsing resume from bytes: {e}")
             return {
@@ -93,9 +82,10 @@ class ResumeJDParser:
             }
     
     @staticmethod
-    async def parse_job_description(jd_text: str) -> Dict[str, Any]:
+    async def parse_job_description(jd_text: str, fallback: bool = True) -> Dict[str, Any]:
         """
-        Parse a job description text using Azure OpenAI LLM.
+        Parse a job description text using Azure OpenAI LLM. With fallback=False, raises
+        instead of returning the keyword-based fallback parse.
         
         Args:
             jd_text: Job description text
@@ -112,6 +102,8 @@ class ResumeJDParser:
             - location: Job location
         """
         if not azure_openai_service.async_client:
+            if not fallback:
+                raise RuntimeError("Azure OpenAI async client not configured")
             logger.warning("Azure OpenAI async client not configured, using fallback parsing")
             return ResumeJDParser._fallback_parse_jd(jd_text)
         
@@ -150,8 +142,8 @@ Return ONLY the JSON object, no additional text or markdown."""
             from fastapi.concurrency import run_in_threadpool
             
             start_time = asyncio.get_event_loop().time()
-            response = await asyncio.wait_for(
-                azure_openai_service.async_client.chat.completions.create(
+            content = await asyncio.wait_for(
+                azure_openai_service.chat_completion_json(
                     model="gpt-4o",
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -166,14 +158,41 @@ Return ONLY the JSON object, no additional text or markdown."""
             duration = asyncio.get_event_loop().time() - start_time
             logger.info(f"✅ JD parsed by LLM in {duration:.2f}s")
             
-            parsed_json = await run_in_threadpool(json.loads, response.choices[0].message.content)
+            parsed_json = await run_in_threadpool(json.loads, content)
             parsed_json['text'] = jd_text  # Keep original text
             logger.info("Successfully parsed JD with LLM")
             return parsed_json
             
         except Exception as e:
             logger.error(f"Error parsing JD with LLM: {e}")
+            if not fallback:
+                raise
             return ResumeJDParser._fallback_parse_jd(jd_text)
+
+    @staticmethod
+    async def parse_job_description_cached(
+        jd_text: str, on_fallback: Optional[Callable[[Optional[BaseException]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        parse_job_description through the shared parse cache (fallback parses are not cached).
+        `on_fallback` is called with the LLM error (None if another caller's parse failed)
+        when the fallback parse is returned.
+        """
+        errors: List[BaseException] = []
+
+        async def parse() -> Dict[str, Any]:
+            try:
+                return await ResumeJDParser.parse_job_description(jd_text, fallback=False)
+            except Exception as e:
+                errors.append(e)
+                raise
+
+        def fallback() -> Dict[str, Any]:
+            if on_fallback:
+                on_fallback(errors[-1] if errors else None)
+            return ResumeJDParser._fallback_parse_jd(jd_text)
+
+        return await parse_cache_service.get_or_parse("jd", JD_PARSER_VERSION, jd_text, parse, fallback)
     
     @staticmethod
     def _fallback_parse_jd(jd_text: str) -> Dict[str, Any]:
@@ -259,19 +278,8 @@ Return ONLY the JSON object, no additional text or markdown."""
     
     @staticmethod
     def _extract_skills(text: str) -> list:
-        """Extract skills from text."""
-        common_skills = [
-            'python', 'java', 'javascript', 'typescript', 'react', 'node.js', 'sql', 
-            'postgresql', 'mongodb', 'aws', 'azure', 'docker', 'kubernetes', 
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch', 
-            'scikit-learn', 'pandas', 'numpy', 'git', 'ci/cd', 'rest api', 
-            'graphql', 'microservices', 'agile', 'scrum'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = [skill for skill in common_skills if skill in text_lower]
-        
-        return list(set(found_skills))  # Remove duplicates
+        """Extract skills from text (canonical names from the shared skill matcher)."""
+        return skill_matcher.find(text)
     
     @staticmethod
     def _extract_experience(text: str) -> Dict[str, Any]:
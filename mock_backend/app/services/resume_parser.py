@@ -3,13 +3,14 @@ Resume Parser — extract text from uploaded resume (PDF) and parse using Azure
 Used to store parsed content for LLM-based question generation when interview starts.
 """
 
-import io
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Union, Callable, List
 import asyncio
 from app.services.azure_openai_service import azure_openai_service
+from app.services.pdf_extraction import PdfExtractionError, extract_pdf_pages, pdf_extraction_pool
+from app.services.parse_cache_service import parse_cache_service
 
 logger = logging.getLogger(__name__)
 
@@ -18,29 +19,42 @@ UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def extract_text_from_pdf(content: bytes) -> str:
-    """Extract text from PDF bytes. Returns empty string on failure."""
+    """
+    Extract text from PDF bytes in the calling thread. Returns empty string on failure.
+    Async code should use extract_text_from_pdf_async, which runs on the extraction pool.
+    """
     try:
-        from pypdf import PdfReader
-        reader = PdfReader(io.BytesIO(content))
-        parts = []
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                parts.append(text)
+        parts = [p for p in extract_pdf_pages(content) if p]
         return "\n\n".join(parts).strip() if parts else ""
     except Exception as e:
         logger.warning("PDF text extraction failed: %s", e)
         return ""
 
 
-async def parse_resume_with_llm(resume_text: str) -> Dict[str, Any]:
+async def extract_text_from_pdf_async(source: Union[bytes, str]) -> str:
+    """Extract text from PDF bytes or a file path on the extraction process pool. Returns empty string on failure."""
+    try:
+        return await pdf_extraction_pool.extract_text(source)
+    except PdfExtractionError as e:
+        logger.warning("PDF text extraction failed: %s", e)
+        return ""
+
+
+# Bump when the prompt, model or post-processing below changes (invalidates parse_cache entries)
+RESUME_PARSER_VERSION = "llm-gpt-4o-1"
+
+
+async def parse_resume_with_llm(resume_text: str, fallback: bool = True) -> Dict[str, Any]:
     """
     Parse resume text using Azure OpenAI LLM to extract structured information.
+    With fallback=False, raises instead of returning the keyword-based fallback parse.
     
     Returns:
         Dictionary with keys: skills, years_of_experience, education, projects, etc.
     """
     if not azure_openai_service.async_client:
+        if not fallback:
+            raise RuntimeError("Azure OpenAI async client not configured")
         logger.warning("Azure OpenAI async client not configured, using fallback parsing")
         return _fallback_parse_resume(resume_text)
     
@@ -99,8 +113,8 @@ Return ONLY the JSON object, no additional text or markdown."""
         from fastapi.concurrency import run_in_threadpool
         
         start_time = asyncio.get_event_loop().time()
-        response = await asyncio.wait_for(
-            azure_openai_service.async_client.chat.completions.create(
+        content = await asyncio.wait_for(
+            azure_openai_service.chat_completion_json(
                 model="gpt-4o",
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -115,7 +129,7 @@ Return ONLY the JSON object, no additional text or markdown."""
         duration = asyncio.get_event_loop().time() - start_time
         logger.info(f"✅ Resume parsed by LLM in {duration:.2f}s")
         
-        parsed_json = await run_in_threadpool(json.loads, response.choices[0].message.content)
+        parsed_json = await run_in_threadpool(json.loads, content)
         
         # Extract additional skills from projects and experience
         all_skills = set(parsed_json.get('skills', []))
@@ -141,9 +155,36 @@ Return ONLY the JSON object, no additional text or markdown."""
         
     except Exception as e:
         logger.error(f"Error parsing resume with LLM: {e}")
+        if not fallback:
+            raise
         return _fallback_parse_resume(resume_text)
 
 
+async def parse_resume_cached(
+    resume_text: str, on_fallback: Optional[Callable[[Optional[BaseException]], None]] = None
+) -> Dict[str, Any]:
+    """
+    parse_resume_with_llm through the shared parse cache (fallback parses are not cached).
+    `on_fallback` is called with the LLM error (None if another caller's parse failed)
+    when the fallback parse is returned.
+    """
+    errors: List[BaseException] = []
+
+    async def parse() -> Dict[str, Any]:
+        try:
+            return await parse_resume_with_llm(resume_text, fallback=False)
+        except Exception as e:
+            errors.append(e)
+            raise
+
+    def fallback() -> Dict[str, Any]:
+        if on_fallback:
+            on_fallback(errors[-1] if errors else None)
+        return _fallback_parse_resume(resume_text)
+
+    return await parse_cache_service.get_or_parse("resume", RESUME_PARSER_VERSION, resume_text, parse, fallback)
+
+
 def _fallback_parse_resume(resume_text: str) -> Dict[str, Any]:
     """Fallback parsing when LLM is not available."""
     import re
@@ -199,7 +240,7 @@ async def save_resume_and_extract_text(
     text = ""
     parsed_data = None
     if ext == "pdf":
-        text = extract_text_from_pdf(content)
+        text = await extract_text_from_pdf_async(content)
         if text:
             # Parse with LLM
             parsed_data = await parse_resume_with_llm(text)
@@ -1,27 +1,68 @@
 import asyncio
+import hashlib
 import logging
 from datetime import datetime, timezone
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.sql.session import AsyncSessionLocal
 from app.db.sql.unit_of_work import UnitOfWork
 from app.db.sql.models.user import User, CandidateProfile
-from app.services.resume_jd_parser import resume_jd_parser
+from app.services.resume_jd_parser import resume_jd_parser, JD_PARSER_VERSION
+from app.services.resume_parser import RESUME_PARSER_VERSION
+from app.services.parse_cache_service import normalized_text_hash
 from app.services.match_score_service import calculate_match_score
+from app.services.task_queue_service import is_transient_error, is_final_attempt
 
 logger = logging.getLogger(__name__)
 
 import uuid
 
-async def parse_candidate_resume(candidate_id: uuid.UUID, password: str = None):
+
+def candidate_parse_fingerprint(resume_text: Optional[str], job_description: Optional[str]) -> str:
+    """Identifies the inputs of a candidate's parse: normalized resume and JD texts and the parser versions."""
+    parts = [RESUME_PARSER_VERSION, normalized_text_hash(resume_text or ""), JD_PARSER_VERSION, normalized_text_hash(job_description or "")]
+    return hashlib.sha256(":".join(parts).encode("utf-8")).hexdigest()
+
+async def _send_welcome_email(user: User, password: str):
+    from app.services.email_service import email_service
+    profile = user.candidate_profile
+    try:
+        await email_service.send_candidate_password_email(
+            user.email, 
+            profile.first_name, 
+            user.username,
+            password, 
+            resume_path=profile.resume_path
+        )
+    except Exception as e:
+        logger.error(f"Failed to send welcome email to {user.email}: {e}")
+
+
+async def send_candidate_welcome_email(candidate_id: uuid.UUID, password: str):
     """
-    Background task to handle text extraction, candidate notification, 
-    and structured parsing of resume/JD.
+    Send the welcome email with login credentials. Kept off the durable task queue so
+    the plaintext password is never persisted.
+    """
+    async with AsyncSessionLocal() as session:
+        user = await UnitOfWork(session).users.get_by_id(candidate_id)
+        if not user or not user.candidate_profile:
+            logger.error(f"Candidate profile not found for id {candidate_id}")
+            return
+        await _send_welcome_email(user, password)
+
+
+async def parse_candidate_resume(candidate_id: uuid.UUID):
+    """
+    Background task to handle text extraction and structured parsing of resume/JD.
+
+    Transient errors (LLM outages and timeouts, lost DB connections) are raised so the
+    task queue retries with backoff; parse_status becomes "failed" only when the error is
+    permanent or this was the final attempt.
     """
     import anyio
     import os
     from app.core.config import settings
-    from app.services.resume_parser import extract_text_from_pdf, parse_resume_with_llm
-    from app.services.email_service import email_service
+    from app.services.resume_parser import extract_text_from_pdf_async, parse_resume_cached
     
     async with AsyncSessionLocal() as session:
         async with UnitOfWork(session) as uow:
@@ -33,48 +74,53 @@ async def parse_candidate_resume(candidate_id: uuid.UUID, password: str = None):
                     return
                 
                 profile = user.candidate_profile
-                
-                # 1. Send Welcome Email (if password provided)
-                if password:
-                    try:
-                        await email_service.send_candidate_password_email(
-                            user.email, 
-                            profile.first_name, 
-                            user.username,
-                            password, 
-                            resume_path=profile.resume_path
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to send welcome email to {user.email}: {e}")
 
-                # 2. Extract Text from PDF (if not already extracted)
+                # 1. Extract Text from PDF (if not already extracted)
                 if not profile.resume_text and profile.resume_path:
                     try:
                         abs_path = os.path.join(settings.BASE_DIR, profile.resume_path)
                         if os.path.exists(abs_path):
-                            with open(abs_path, "rb") as f:
-                                resume_bytes = f.read()
-                                profile.resume_text = extract_text_from_pdf(resume_bytes)
+                            # Off the event loop, on the extraction process pool
+                            profile.resume_text = await extract_text_from_pdf_async(abs_path)
                     except Exception as e:
+                        if is_transient_error(e) and not is_final_attempt():
+                            raise
                         logger.error(f"Error extracting text from PDF for candidate {candidate_id}: {e}")
 
-                # 3. Structured Resume Parsing
+                # 2. Structured Resume Parsing
                 resume_json = None
+                # Set when a parse failed or fell back; such parses are not fingerprinted
+                degraded = []
+                transient_errors = []
+
+                def fell_back(part: str, error: Optional[BaseException]) -> None:
+                    degraded.append(part)
+                    if error is not None and is_transient_error(error):
+                        transient_errors.append(error)
+
                 if profile.resume_text:
                     try:
-                        resume_json = await parse_resume_with_llm(profile.resume_text)
+                        # Shared with every candidate whose resume text is identical
+                        resume_json = await parse_resume_cached(profile.resume_text, on_fallback=lambda e: fell_back("resume", e))
                         if resume_json:
                             resume_json['text'] = profile.resume_text
                     except Exception as e:
+                        fell_back("resume", e)
                         logger.error(f"Error parsing structured resume for candidate {candidate_id}: {e}", exc_info=True)
                 
-                # 4. Structured JD Parsing
+                # 3. Structured JD Parsing
                 jd_json = None
                 if profile.job_description:
                     try:
-                        jd_json = await resume_jd_parser.parse_job_description(profile.job_description)
+                        # One LLM call per distinct JD across a hiring drive
+                        jd_json = await resume_jd_parser.parse_job_description_cached(profile.job_description, on_fallback=lambda e: fell_back("jd", e))
                     except Exception as e:
+                        fell_back("jd", e)
                         logger.error(f"Error parsing job description for candidate {candidate_id}: {e}")
+
+                # The LLM was unreachable: retry rather than keep a fallback parse, unless out of attempts
+                if transient_errors and not is_final_attempt():
+                    raise transient_errors[-1]
                 
                 profile.resume_json = resume_json
                 profile.jd_json = jd_json
@@ -89,17 +135,35 @@ async def parse_candidate_resume(candidate_id: uuid.UUID, password: str = None):
                 
                 profile.parse_status = "success"
                 profile.parsed_at = datetime.now(timezone.utc)
+                # Lets a batch re-parse skip this candidate until its texts or the parsers change
+                profile.parse_fingerprint = (
+                    candidate_parse_fingerprint(profile.resume_text, profile.job_description)
+                    if profile.resume_text and not degraded else None
+                )
                 
                 await session.commit()
                 logger.info(f"Successfully processed structured parsing for candidate {candidate_id}")
+
+                # Warm the technical question pool for this job so scheduling doesn't wait on the LLM
+                if jd_json:
+                    from app.services.question_pool_service import question_pool_service
+                    await question_pool_service.schedule_refill(
+                        jd_json.get('job_title') or jd_json.get('role_name', ''),
+                        (jd_json.get('required_skills') or []) + (jd_json.get('technologies') or []),
+                    )
                 
             except Exception as e:
+                if is_transient_error(e) and not is_final_attempt():
+                    logger.warning(f"Structured parsing for candidate {candidate_id} hit a transient error, will be retried: {e}")
+                    raise
                 logger.error(f"Failed to process structured parsing for candidate {candidate_id}: {e}")
                 # Try to safely update status to failed
                 try:
                     user = await uow.users.get_by_id(candidate_id)
                     if user and user.candidate_profile:
                         user.candidate_profile.parse_status = "failed"
+                        # The stored parse no longer reflects the texts: never skip a re-parse
+                        user.candidate_profile.parse_fingerprint = None
                         await session.commit()
                 except Exception as inner_e:
                     logger.error(f"Failed to set parse_status to 'failed' for {candidate_id}: {inner_e}")
@@ -0,0 +1,136 @@
+"""
+Session Aggregate Service
+-------------------------
+Running score aggregates kept on InterviewSession as each answer is stored: score sum,
+count, min/max, per-section sums, and a bounded top-k sketch of the strengths and
+weaknesses returned by evaluations. Completion and report generation read these instead
+of rescanning every InterviewResponse.
+
+The sketch uses the space-saving algorithm: at most FEEDBACK_SKETCH_SIZE counters per
+kind; a new item evicts the smallest counter and inherits its count, so frequent items
+are always kept.
+"""
+
+import logging
+import uuid
+from typing import Dict, Any, List, Optional
+
+from app.core.config import settings
+from app.db.sql.models.interview_session import InterviewSession
+
+logger = logging.getLogger(__name__)
+
+_FEEDBACK_KINDS = ("strengths", "weaknesses")
+
+
+class SessionAggregateService:
+    """Maintain and read the running aggregates on an InterviewSession row."""
+
+    @staticmethod
+    def _add_to_sketch(counters: Dict[str, int], item: str, capacity: int) -> None:
+        if item in counters:
+            counters[item] += 1
+        elif len(counters) < capacity:
+            counters[item] = 1
+        else:
+            evicted = min(counters, key=counters.get)
+            counters[item] = counters.pop(evicted) + 1
+
+    @staticmethod
+    def record_response(
+        session_obj: InterviewSession,
+        section_id: Optional[uuid.UUID],
+        score: Optional[float],
+        evaluation: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Fold one stored response into the session aggregates. The caller must hold the
+        session row lock; JSON columns are reassigned so the change is flushed.
+        """
+        if score is not None:
+            score = float(score)
+            session_obj.score_sum = (session_obj.score_sum or 0.0) + score
+            session_obj.score_count = (session_obj.score_count or 0) + 1
+            session_obj.score_max = score if session_obj.score_max is None else max(session_obj.score_max, score)
+            session_obj.score_min = score if session_obj.score_min is None else min(session_obj.score_min, score)
+
+            if section_id:
+                sections = dict(session_obj.section_scores or {})
+                entry = dict(sections.get(str(section_id)) or {"sum": 0.0, "count": 0})
+                entry["sum"] = entry.get("sum", 0.0) + score
+                entry["count"] = entry.get("count", 0) + 1
+                sections[str(section_id)] = entry
+                session_obj.section_scores = sections
+
+        if isinstance(evaluation, dict):
+            sketch = {kind: dict(counters) for kind, counters in (session_obj.feedback_sketch or {}).items()}
+            changed = False
+            for kind in _FEEDBACK_KINDS:
+                items = evaluation.get(kind) or []
+                if not isinstance(items, list):
+                    continue
+                counters = sketch.setdefault(kind, {})
+                for item in items:
+                    if isinstance(item, str) and item.strip():
+                        SessionAggregateService._add_to_sketch(counters, item.strip(), settings.FEEDBACK_SKETCH_SIZE)
+                        changed = True
+            if changed:
+                session_obj.feedback_sketch = sketch
+
+    @staticmethod
+    def replace_score(
+        session_obj: InterviewSession,
+        section_id: Optional[uuid.UUID],
+        old_score: Optional[float],
+        new_score: Optional[float],
+    ) -> bool:
+        """
+        Swap a stored response's score (coding re-submission) in the sums and counts.
+        Returns True when score_max/score_min may now be stale and must be re-read.
+        """
+        if old_score is None:
+            SessionAggregateService.record_response(session_obj, section_id, new_score)
+            return False
+
+        old_score = float(old_score)
+        new_score = float(new_score) if new_score is not None else None
+        delta = (new_score if new_score is not None else 0.0) - old_score
+        count_delta = 0 if new_score is not None else -1
+        session_obj.score_sum = (session_obj.score_sum or 0.0) + delta
+        session_obj.score_count = max((session_obj.score_count or 0) + count_delta, 0)
+
+        if section_id:
+            sections = dict(session_obj.section_scores or {})
+            entry = dict(sections.get(str(section_id)) or {"sum": old_score, "count": 1})
+            entry["sum"] = entry.get("sum", 0.0) + delta
+            entry["count"] = max(entry.get("count", 0) + count_delta, 0)
+            sections[str(section_id)] = entry
+            session_obj.section_scores = sections
+
+        if new_score is not None:
+            session_obj.score_max = new_score if session_obj.score_max is None else max(session_obj.score_max, new_score)
+            session_obj.score_min = new_score if session_obj.score_min is None else min(session_obj.score_min, new_score)
+        return old_score in (session_obj.score_max, session_obj.score_min) and old_score != new_score
+
+    @staticmethod
+    def average_score(session_obj: InterviewSession) -> float:
+        """Mean ai_score (0-10) over scored responses; same as AVG(ai_score)."""
+        if not session_obj.score_count:
+            return 0.0
+        return (session_obj.score_sum or 0.0) / session_obj.score_count
+
+    @staticmethod
+    def section_average(session_obj: InterviewSession, section_id: uuid.UUID) -> Optional[float]:
+        entry = (session_obj.section_scores or {}).get(str(section_id))
+        if not entry or not entry.get("count"):
+            return None
+        return entry["sum"] / entry["count"]
+
+    @staticmethod
+    def top_feedback(session_obj: InterviewSession, kind: str, limit: int) -> List[str]:
+        """Most frequent strengths or weaknesses across the session's evaluations."""
+        counters = (session_obj.feedback_sketch or {}).get(kind) or {}
+        return [item for item, _ in sorted(counters.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]]
+
+
+session_aggregate_service = SessionAggregateService()
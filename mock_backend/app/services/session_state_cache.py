@@ -0,0 +1,132 @@
+"""
+Session State Cache
+-------------------
+Per-process cache of the interview state served by /question/next: the current section,
+its ordered question ids, which of them are answered, and the rendered question payloads.
+
+Entries are keyed by session id and stamped with InterviewSession.state_version. Every
+writer bumps the version in the database, so a reader only needs one small row read to
+know whether its cached entry is current; a mismatch (e.g. another worker process wrote)
+falls back to a full rebuild. Writers in this process apply their change to the entry
+instead of dropping it, so the next poll stays a cache hit.
+"""
+
+import copy
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionState:
+    version: int
+    current_section_id: uuid.UUID
+    question_ids: List[uuid.UUID]
+    answered: Set[uuid.UUID]
+    # session question id -> /question/next response without "question_number"
+    payloads: Dict[uuid.UUID, Dict[str, Any]] = field(default_factory=dict)
+    cached_at: float = field(default_factory=time.monotonic)
+
+
+class SessionStateCache:
+    """Bounded LRU of SessionState entries validated against state_version."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[uuid.UUID, SessionState]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, session_id: uuid.UUID, version: int) -> Optional[SessionState]:
+        state = self._entries.get(session_id)
+        if state is None:
+            return None
+        if state.version != version or time.monotonic() - state.cached_at > self.ttl_seconds:
+            self._entries.pop(session_id, None)
+            return None
+        self._entries.move_to_end(session_id)
+        return state
+
+    def next_question(
+        self,
+        session_id: uuid.UUID,
+        version: int,
+        current_section_id: Optional[uuid.UUID],
+    ) -> Optional[Dict[str, Any]]:
+        """Response for the first unanswered question, or None if the caller must rebuild."""
+        state = self._get(session_id, version)
+        if state is None or state.current_section_id != current_section_id:
+            self.misses += 1
+            return None
+
+        answered_in_section = 0
+        for qid in state.question_ids:
+            if qid in state.answered:
+                answered_in_section += 1
+                continue
+            payload = state.payloads.get(qid)
+            if payload is None:
+                break
+            self.hits += 1
+            result = copy.deepcopy(payload)
+            result["question_number"] = answered_in_section + 1
+            return result
+
+        self.misses += 1
+        return None
+
+    def put(self, session_id: uuid.UUID, state: SessionState) -> None:
+        self._entries[session_id] = state
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def mark_answered(self, session_id: uuid.UUID, question_id: uuid.UUID, new_version: int) -> None:
+        """Record an answer committed at `new_version`; drops the entry if it missed a write."""
+        state = self._entries.get(session_id)
+        if state is None:
+            return
+        if state.version != new_version - 1:
+            self.invalidate(session_id)
+            return
+        state.answered.add(question_id)
+        state.payloads.pop(question_id, None)
+        state.version = new_version
+
+    def add_question(
+        self,
+        session_id: uuid.UUID,
+        question_id: uuid.UUID,
+        payload: Dict[str, Any],
+        new_version: int,
+    ) -> None:
+        """Append a question created at `new_version` to the current section."""
+        state = self._entries.get(session_id)
+        if state is None:
+            return
+        if state.version != new_version - 1:
+            self.invalidate(session_id)
+            return
+        state.question_ids.append(question_id)
+        state.payloads[question_id] = {k: v for k, v in payload.items() if k != "question_number"}
+        state.version = new_version
+
+    def invalidate(self, session_id: uuid.UUID) -> None:
+        self._entries.pop(session_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+session_state_cache = SessionStateCache(
+    max_entries=settings.SESSION_STATE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SESSION_STATE_CACHE_TTL_SECONDS,
+)
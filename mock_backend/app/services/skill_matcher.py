@@ -0,0 +1,194 @@
+"""
+Skill Matcher
+-------------
+One compiled matcher for skill names, shared by question-bank selection, resume/JD skill
+extraction and the resume-JD match score. A synonym table maps each canonical skill to
+its aliases and (optionally) a question-bank category; the aliases are tokenized and
+compiled once into a token trie. Matching walks the text's tokens once, taking the
+longest alias at each position, so the cost is linear in the input (times the longest
+alias, a few tokens) instead of skills x table-keys substring scans.
+
+Tokens are runs of [a-z0-9+#], so aliases match on word boundaries: "ai" no longer
+matches inside "maintain", and "node.js" matches "Node.js" and "node js" alike.
+
+The table can be extended without a code change: SKILL_SYNONYMS_FILE may point to a JSON
+object of the same shape ({"canonical": {"aliases": [...], "category": "SQL"}}), merged
+over the defaults.
+"""
+
+import json
+import logging
+import re
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.db.sql.models.question import CategoryEnum
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_TERMINAL = "\0"
+
+# canonical skill -> aliases (the canonical name is always an alias) and bank category
+DEFAULT_SKILL_SYNONYMS: Dict[str, Dict[str, Any]] = {
+    # Python ecosystem
+    "python": {"aliases": ["python3"], "category": "PYTHON"},
+    "django": {"category": "PYTHON"},
+    "flask": {"category": "PYTHON"},
+    "fastapi": {"category": "PYTHON"},
+    "pandas": {"category": "PYTHON"},
+    "numpy": {"category": "PYTHON"},
+
+    # SQL/Database
+    "sql": {"category": "SQL"},
+    "postgresql": {"aliases": ["postgres"], "category": "SQL"},
+    "mysql": {"category": "SQL"},
+    "mongodb": {"aliases": ["mongo"], "category": "SQL"},
+    "database": {"aliases": ["databases", "db", "rdbms"], "category": "SQL"},
+
+    # Machine Learning
+    "machine learning": {"aliases": ["ml"], "category": "MACHINE_LEARNING"},
+    "deep learning": {"category": "MACHINE_LEARNING"},
+    "tensorflow": {"category": "MACHINE_LEARNING"},
+    "pytorch": {"category": "MACHINE_LEARNING"},
+    "scikit-learn": {"aliases": ["sklearn"], "category": "MACHINE_LEARNING"},
+    "neural network": {"aliases": ["neural networks"], "category": "MACHINE_LEARNING"},
+    "artificial intelligence": {"aliases": ["ai"], "category": "MACHINE_LEARNING"},
+
+    # Data Structures & Algorithms
+    "data structures": {"aliases": ["data structure", "dsa"], "category": "DATA_STRUCTURES"},
+    "algorithms": {"aliases": ["algorithm"], "category": "DATA_STRUCTURES"},
+
+    # System Design
+    "system design": {"category": "SYSTEM_DESIGN"},
+    "distributed systems": {"category": "SYSTEM_DESIGN"},
+    "microservices": {"aliases": ["microservice"], "category": "SYSTEM_DESIGN"},
+    "architecture": {"category": "SYSTEM_DESIGN"},
+    "scalability": {"category": "SYSTEM_DESIGN"},
+
+    # Statistics
+    "statistics": {"aliases": ["statistical"], "category": "STATISTICS"},
+    "probability": {"category": "STATISTICS"},
+
+    # Other skills recognised in resumes / JDs (no question-bank category)
+    "java": {},
+    "javascript": {},
+    "typescript": {},
+    "react": {"aliases": ["reactjs", "react.js"]},
+    "node.js": {"aliases": ["nodejs"]},
+    "aws": {"aliases": ["amazon web services"]},
+    "azure": {},
+    "docker": {},
+    "kubernetes": {"aliases": ["k8s"]},
+    "git": {},
+    "ci/cd": {"aliases": ["cicd"]},
+    "rest api": {"aliases": ["rest apis", "restful api"]},
+    "graphql": {},
+    "agile": {},
+    "scrum": {},
+}
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SkillMatcher:
+    """Token trie over skill aliases; maps text or skill lists to canonical skills."""
+
+    def __init__(self, synonyms: Dict[str, Dict[str, Any]]):
+        self._trie: Dict[str, Any] = {}
+        self._categories: Dict[str, Optional[CategoryEnum]] = {}
+        self._max_len = 0
+        for canonical, entry in synonyms.items():
+            canonical = canonical.lower().strip()
+            category = (entry or {}).get("category")
+            if category and category not in CategoryEnum.__members__:
+                logger.warning(f"[SkillMatcher] Unknown category {category!r} for skill {canonical!r}")
+                category = None
+            self._categories[canonical] = CategoryEnum[category] if category else None
+            for alias in [canonical] + list((entry or {}).get("aliases") or []):
+                self._add(_tokens(alias), canonical)
+
+    def _add(self, tokens: List[str], canonical: str) -> None:
+        if not tokens:
+            return
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[_TERMINAL] = canonical
+        self._max_len = max(self._max_len, len(tokens))
+
+    def _scan(self, tokens: List[str]) -> List[str]:
+        found: List[str] = []
+        i = 0
+        while i < len(tokens):
+            node, match, match_len = self._trie, None, 0
+            for j in range(i, min(i + self._max_len, len(tokens))):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if _TERMINAL in node:
+                    match, match_len = node[_TERMINAL], j - i + 1
+            if match:
+                if match not in found:
+                    found.append(match)
+                i += match_len
+            else:
+                i += 1
+        return found
+
+    def find(self, text: str) -> List[str]:
+        """Canonical skills mentioned in free text, in order of first mention."""
+        return self._scan(_tokens(text or ""))
+
+    def canonical_skills(self, skills: Iterable[Any]) -> List[str]:
+        """
+        Canonical names for a skill list; a skill with no known alias is kept as its
+        normalized text so unlisted skills still compare equal to themselves.
+        """
+        result: List[str] = []
+        for skill in skills or []:
+            text = str(skill or "").lower().strip()
+            if not text:
+                continue
+            for name in self._scan(_tokens(text)) or [" ".join(_tokens(text)) or text]:
+                if name not in result:
+                    result.append(name)
+        return result
+
+    def categorize(self, skills: Iterable[Any]) -> Tuple[List[CategoryEnum], List[str]]:
+        """
+        Question-bank categories and tags for a skill list. Tags are the canonical names
+        plus each skill's own normalized text (questions may be tagged either way).
+        """
+        categories: List[CategoryEnum] = []
+        tags: List[str] = []
+        for skill in skills or []:
+            text = str(skill or "").lower().strip()
+            if not text:
+                continue
+            for name in self._scan(_tokens(text)):
+                category = self._categories.get(name)
+                if category and category not in categories:
+                    categories.append(category)
+                if name not in tags:
+                    tags.append(name)
+            if text not in tags:
+                tags.append(text)
+        return categories, tags
+
+
+def _load_synonyms() -> Dict[str, Dict[str, Any]]:
+    synonyms = dict(DEFAULT_SKILL_SYNONYMS)
+    path = settings.SKILL_SYNONYMS_FILE
+    if path:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                synonyms.update(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.error(f"[SkillMatcher] Could not load {path}: {e}. Using built-in synonyms.")
+    return synonyms
+
+
+skill_matcher = SkillMatcher(_load_synonyms())
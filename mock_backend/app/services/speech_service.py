@@ -38,25 +38,47 @@ class SpeechService:
             return self._enroll_azure(candidate_id, audio_bytes, content_type)
         return self._enroll_mock(candidate_id, audio_bytes, content_type)
 
-    def _enroll_mock(self, candidate_id: str, audio_bytes: bytes, content_type: str) -> Tuple[str, Optional[str]]:
+    def new_sample_path(self, candidate_id: str, content_type: str = "audio/webm") -> Tuple[str, Path]:
+        """Reference id and local path for a voice recording, e.g. to stream an upload into."""
         ext = "webm"
         if "wav" in content_type:
             ext = "wav"
         elif "ogg" in content_type:
             ext = "ogg"
         ref_id = str(uuid.uuid4())
-        filename = f"{candidate_id}_{ref_id}.{ext}"
-        path = UPLOAD_DIR / filename
+        return ref_id, UPLOAD_DIR / f"{candidate_id}_{ref_id}.{ext}"
+
+    def enroll_voice_file(
+        self, candidate_id: str, ref_id: str, path: Path, content_type: str = "audio/webm"
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Enroll a recording already written to `path` (from new_sample_path).
+        For mock: the file is the enrolled recording. For Azure: its bytes go to the Speech API.
+        """
+        if self._use_azure:
+            enrolled = self._azure_enroll_voice(candidate_id, path.read_bytes(), content_type)
+            if enrolled:
+                return enrolled
+        # The streamed file is the enrolled recording: no second copy
+        logger.info("Voice enrolled (mock) for candidate %s, ref=%s, path=%s", candidate_id, ref_id, str(path))
+        return ref_id, str(path)
+
+    def _enroll_mock(self, candidate_id: str, audio_bytes: bytes, content_type: str) -> Tuple[str, Optional[str]]:
+        ref_id, path = self.new_sample_path(candidate_id, content_type)
         path.write_bytes(audio_bytes)
         logger.info("Voice enrolled (mock) for candidate %s, ref=%s, path=%s", candidate_id, ref_id, str(path))
         return ref_id, str(path)
 
     def _enroll_azure(self, candidate_id: str, audio_bytes: bytes, content_type: str) -> Tuple[str, Optional[str]]:
+        return self._azure_enroll_voice(candidate_id, audio_bytes, content_type) or self._enroll_mock(candidate_id, audio_bytes, content_type)
+
+    def _azure_enroll_voice(self, candidate_id: str, audio_bytes: bytes, content_type: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Enroll the recording in an Azure voice profile; None when it could not (callers fall back to mock)."""
         # TODO: Use Azure Speaker Recognition / Voice Profile API:
         # https://learn.microsoft.com/en-us/azure/cognitive-services/speech-service/speaker-recognition-overview
         # Create profile, enroll with audio, return profile_id.
         logger.warning("Azure Speech enrollment not implemented yet; falling back to mock")
-        return self._enroll_mock(candidate_id, audio_bytes, content_type)
+        return None
 
     def verify_voice(self, reference_id: str, audio_bytes: bytes) -> Tuple[bool, float]:
         """
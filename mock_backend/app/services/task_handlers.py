@@ -0,0 +1,60 @@
+"""
+Task Handlers
+-------------
+Registers the handlers run by the durable task queue. Imported by TaskWorker; service
+imports are deferred to keep this module free of import cycles.
+"""
+
+import uuid
+from typing import Dict, Any
+
+from app.core.config import settings
+from app.services.task_queue_service import task_handler
+
+
+@task_handler("parse_candidate_resume", concurrency=settings.TASK_CONCURRENCY_RESUME_PARSE)
+async def parse_candidate_resume_task(payload: Dict[str, Any]) -> None:
+    from app.services.resume_tasks import parse_candidate_resume
+    await parse_candidate_resume(uuid.UUID(payload["candidate_id"]))
+
+
+@task_handler("generate_interview_questions", concurrency=settings.SCHEDULING_GENERATION_CONCURRENCY)
+async def generate_interview_questions_task(payload: Dict[str, Any]) -> None:
+    from app.services.interview_admin_sql_service import InterviewAdminSQLService
+    await InterviewAdminSQLService.generate_interview_questions(uuid.UUID(payload["interview_id"]))
+
+
+@task_handler("refill_question_pool", concurrency=settings.TASK_CONCURRENCY_QUESTION_POOL_REFILL)
+async def refill_question_pool_task(payload: Dict[str, Any]) -> None:
+    from app.services.question_pool_service import question_pool_service
+    await question_pool_service.refill(payload.get("role_name"), payload.get("skills") or [])
+
+
+@task_handler("generate_conversational_questions", concurrency=settings.TASK_CONCURRENCY_CONVERSATIONAL)
+async def generate_conversational_questions_task(payload: Dict[str, Any]) -> None:
+    from app.services.interview_session_sql_service import InterviewSessionSQLService
+    template_id = payload.get("interview_template_id")
+    await InterviewSessionSQLService._background_generate_conversational_questions(
+        session_id=uuid.UUID(payload["session_id"]),
+        section_id=uuid.UUID(payload["section_id"]),
+        candidate_id=uuid.UUID(payload["candidate_id"]),
+        interview_template_id=uuid.UUID(template_id) if template_id else None,
+        num_conversational_questions=int(payload.get("num_conversational_questions", 3)),
+    )
+
+
+@task_handler("reparse_candidates", concurrency=1)
+async def reparse_candidates_task(payload: Dict[str, Any]) -> None:
+    from app.services.reparse_job_service import reparse_job_service
+    checkpoint = payload.get("checkpoint")
+    await reparse_job_service.run_page(
+        uuid.UUID(payload["job_id"]),
+        int(payload.get("run", 1)),
+        uuid.UUID(checkpoint) if checkpoint else None,
+    )
+
+
+@task_handler("import_candidates", concurrency=1)
+async def import_candidates_task(payload: Dict[str, Any]) -> None:
+    from app.services.candidate_import_service import candidate_import_service
+    await candidate_import_service.run(uuid.UUID(payload["job_id"]))
@@ -0,0 +1,439 @@
+"""
+Task Queue Service
+------------------
+Durable background tasks stored in Postgres. Tasks are enqueued in the caller's
+transaction (or their own), claimed by workers with FOR UPDATE SKIP LOCKED, retried with
+exponential backoff, and deduplicated by idempotency key while queued or running.
+A handler fails an attempt by raising; handlers that record a terminal failure of their
+own should only do so for non-transient errors or on the final attempt (is_final_attempt).
+Concurrency is limited per task type across all workers via a transaction-scoped
+advisory lock on the claim.
+
+A running task's lock is refreshed every third of TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS,
+so only tasks whose worker died (or hung) are reaped. Each claim writes its own token to
+locked_by, and the heartbeat and result updates match on it, so a run that was reaped
+cannot overwrite the state of the task's next run. A reaped task that has used all its
+attempts (e.g. one that crashes its worker) goes to dead instead of back to the queue.
+
+Run a standalone worker with `python -m app.worker`; the API process also runs one
+unless TASK_QUEUE_EMBEDDED_WORKER=false.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import random
+import socket
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable
+
+from sqlalchemy import select, update, func, text, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.sql.models.task_queue import QueuedTask
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class _RegisteredTask:
+    handler: TaskHandler
+    concurrency: int
+
+
+# task_type -> handler; populated by app.services.task_handlers
+_registry: Dict[str, _RegisteredTask] = {}
+
+
+@dataclass
+class TaskAttempt:
+    number: int
+    max_attempts: int
+
+    @property
+    def is_final(self) -> bool:
+        return self.number >= self.max_attempts
+
+
+# Set by TaskWorker._execute for the duration of a handler call
+_current_attempt: contextvars.ContextVar[Optional[TaskAttempt]] = contextvars.ContextVar("task_attempt", default=None)
+
+
+def current_task_attempt() -> Optional[TaskAttempt]:
+    """The queue attempt the running handler is on; None when not called by a worker."""
+    return _current_attempt.get()
+
+
+def is_final_attempt() -> bool:
+    """True on a task's last attempt, and outside the worker (no retry will follow)."""
+    attempt = _current_attempt.get()
+    return attempt is None or attempt.is_final
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Errors worth retrying: LLM/Azure timeouts, outages and rate limits, lost DB connections."""
+    import httpx
+    import openai
+    from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+    from app.services.azure_openai_service import LLMUnavailableError
+
+    if isinstance(error, (TimeoutError, ConnectionError, LLMUnavailableError, httpx.TransportError)):
+        return True
+    if isinstance(error, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)):
+        return True
+    if isinstance(error, (OperationalError, InterfaceError)):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+
+def task_handler(task_type: str, concurrency: int = 1):
+    """Register an async `handler(payload)` for `task_type` with a cluster-wide concurrency limit."""
+    def decorator(func: TaskHandler) -> TaskHandler:
+        _registry[task_type] = _RegisteredTask(handler=func, concurrency=max(1, concurrency))
+        return func
+    return decorator
+
+
+class TaskQueueService:
+    """Enqueue tasks and inspect the queue."""
+
+    @staticmethod
+    async def enqueue(
+        session: AsyncSession,
+        task_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        idempotency_key: Optional[str] = None,
+        delay_seconds: float = 0,
+        max_attempts: Optional[int] = None,
+    ) -> Optional[uuid.UUID]:
+        """
+        Add a task in the caller's transaction; it becomes visible to workers on commit.
+        Returns None when an active task with the same idempotency key already exists.
+        """
+        stmt = pg_insert(QueuedTask).values(
+            id=uuid.uuid4(),
+            task_type=task_type,
+            payload=payload or {},
+            status="queued",
+            idempotency_key=idempotency_key,
+            attempts=0,
+            max_attempts=max_attempts or settings.TASK_QUEUE_MAX_ATTEMPTS,
+            run_at=datetime.now(timezone.utc) + timedelta(seconds=delay_seconds),
+        )
+        if idempotency_key:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=["idempotency_key"],
+                index_where=text("status IN ('queued', 'running')"),
+            )
+        result = await session.execute(stmt.returning(QueuedTask.id))
+        task_id = result.scalar_one_or_none()
+        if task_id is None:
+            logger.debug(f"[TaskQueue] {task_type} already queued for key {idempotency_key}")
+        return task_id
+
+    @staticmethod
+    async def enqueue_many(
+        session: AsyncSession,
+        task_type: str,
+        tasks: List[Tuple[Dict[str, Any], Optional[str]]],
+        *,
+        max_attempts: Optional[int] = None,
+    ) -> int:
+        """
+        Add many (payload, idempotency_key) tasks of one type in a single INSERT in the
+        caller's transaction. Keys that already have an active task are skipped; returns
+        the number of tasks added.
+        """
+        if not tasks:
+            return 0
+        run_at = datetime.now(timezone.utc)
+        stmt = pg_insert(QueuedTask).values([
+            {
+                "id": uuid.uuid4(),
+                "task_type": task_type,
+                "payload": payload or {},
+                "status": "queued",
+                "idempotency_key": idempotency_key,
+                "attempts": 0,
+                "max_attempts": max_attempts or settings.TASK_QUEUE_MAX_ATTEMPTS,
+                "run_at": run_at,
+            }
+            for payload, idempotency_key in tasks
+        ]).on_conflict_do_nothing(
+            index_elements=["idempotency_key"],
+            index_where=text("status IN ('queued', 'running')"),
+        )
+        result = await session.execute(stmt.returning(QueuedTask.id))
+        added = len(result.scalars().all())
+        if added < len(tasks):
+            logger.debug(f"[TaskQueue] {len(tasks) - added} {task_type} tasks already queued")
+        return added
+
+    @staticmethod
+    async def enqueue_now(
+        task_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Optional[uuid.UUID]:
+        """Enqueue in a separate committed transaction (for callers without a session)."""
+        from app.db.sql.session import AsyncSessionLocal
+        async with AsyncSessionLocal() as session:
+            task_id = await TaskQueueService.enqueue(session, task_type, payload, **kwargs)
+            await session.commit()
+            return task_id
+
+    @staticmethod
+    async def get_stats(session: AsyncSession) -> Dict[str, Any]:
+        """Queue depth, in-flight and dead counts, and oldest ready-task age per task type."""
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(
+                QueuedTask.task_type,
+                func.count().filter(QueuedTask.status == "queued").label("queued"),
+                func.count().filter(and_(QueuedTask.status == "queued", QueuedTask.run_at <= now)).label("ready"),
+                func.count().filter(QueuedTask.status == "running").label("running"),
+                func.count().filter(QueuedTask.status == "dead").label("dead"),
+                func.min(QueuedTask.run_at).filter(and_(QueuedTask.status == "queued", QueuedTask.run_at <= now)).label("oldest_ready_at"),
+            )
+            .where(QueuedTask.status.in_(("queued", "running", "dead")))
+            .group_by(QueuedTask.task_type)
+        )
+        rows = (await session.execute(stmt)).all()
+        by_type = {}
+        for row in rows:
+            by_type[row.task_type] = {
+                "queued": row.queued,
+                "ready": row.ready,
+                "running": row.running,
+                "dead": row.dead,
+                "oldest_ready_age_seconds": round((now - row.oldest_ready_at).total_seconds(), 1) if row.oldest_ready_at else 0.0,
+                "concurrency_limit": _registry[row.task_type].concurrency if row.task_type in _registry else None,
+            }
+        return {
+            "total_queued": sum(t["queued"] for t in by_type.values()),
+            "total_running": sum(t["running"] for t in by_type.values()),
+            "total_dead": sum(t["dead"] for t in by_type.values()),
+            "max_ready_age_seconds": max((t["oldest_ready_age_seconds"] for t in by_type.values()), default=0.0),
+            "task_types": by_type,
+        }
+
+
+class TaskWorker:
+    """Polls the queue and runs registered handlers until stopped."""
+
+    def __init__(self, worker_id: Optional[str] = None, task_types: Optional[List[str]] = None):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.task_types = task_types
+        self._in_flight: Dict[str, int] = {}
+        self._tasks: set = set()
+        self._stop = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def run(self) -> None:
+        from app.services import task_handlers  # noqa: F401  (registers handlers)
+
+        types = [t for t in _registry if not self.task_types or t in self.task_types]
+        logger.info(f"[TaskQueue] Worker {self.worker_id} started for: {', '.join(types)}")
+        last_reap = 0.0
+        loop = asyncio.get_running_loop()
+        while not self._stop.is_set():
+            try:
+                if loop.time() - last_reap > 30:
+                    await self._requeue_stale()
+                    last_reap = loop.time()
+                claimed = 0
+                for task_type in types:
+                    claimed += await self._claim_and_start(task_type)
+            except Exception as e:
+                logger.error(f"[TaskQueue] Worker loop error: {e}", exc_info=True)
+                claimed = 0
+            if not claimed:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=settings.TASK_QUEUE_POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+
+        # Let in-flight tasks finish; anything cut off is requeued by the visibility timeout
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=30)
+        logger.info(f"[TaskQueue] Worker {self.worker_id} stopped")
+
+    async def _claim_and_start(self, task_type: str) -> int:
+        from app.db.sql.session import AsyncSessionLocal
+
+        registered = _registry[task_type]
+        local_free = registered.concurrency - self._in_flight.get(task_type, 0)
+        if local_free <= 0:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                # Serialise claims per type so the concurrency limit holds across workers
+                await session.execute(
+                    text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+                    {"key": f"task_queue:{task_type}"},
+                )
+                running = (await session.execute(
+                    select(func.count(QueuedTask.id)).where(
+                        QueuedTask.task_type == task_type,
+                        QueuedTask.status == "running",
+                    )
+                )).scalar() or 0
+                capacity = min(local_free, registered.concurrency - running)
+                if capacity <= 0:
+                    return 0
+                claim_token = f"{self.worker_id}:{uuid.uuid4().hex[:8]}"
+
+                candidates = (
+                    select(QueuedTask.id)
+                    .where(
+                        QueuedTask.task_type == task_type,
+                        QueuedTask.status == "queued",
+                        QueuedTask.run_at <= now,
+                        QueuedTask.attempts < QueuedTask.max_attempts,
+                    )
+                    .order_by(QueuedTask.run_at)
+                    .limit(capacity)
+                    .with_for_update(skip_locked=True)
+                    .scalar_subquery()
+                )
+                result = await session.execute(
+                    update(QueuedTask)
+                    .where(QueuedTask.id.in_(candidates))
+                    .values(
+                        status="running",
+                        locked_by=claim_token,
+                        locked_at=now,
+                        attempts=QueuedTask.attempts + 1,
+                    )
+                    .returning(QueuedTask.id, QueuedTask.payload, QueuedTask.attempts, QueuedTask.max_attempts)
+                    .execution_options(synchronize_session=False)
+                )
+                claimed = result.all()
+
+        for row in claimed:
+            self._in_flight[task_type] = self._in_flight.get(task_type, 0) + 1
+            task = asyncio.create_task(
+                self._execute(task_type, row.id, claim_token, row.payload, row.attempts, row.max_attempts)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return len(claimed)
+
+    async def _heartbeat(self, task_id: uuid.UUID, claim_token: str) -> None:
+        """Keep a running task's lock fresh so the reaper leaves it alone."""
+        from app.db.sql.session import AsyncSessionLocal
+
+        interval = max(1.0, settings.TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with AsyncSessionLocal() as session:
+                    async with session.begin():
+                        result = await session.execute(
+                            update(QueuedTask)
+                            .where(QueuedTask.id == task_id, QueuedTask.locked_by == claim_token)
+                            .values(locked_at=datetime.now(timezone.utc))
+                        )
+                if result.rowcount == 0:
+                    logger.warning(f"[TaskQueue] Lost the lock on {task_id}; it was reaped and may run again")
+                    return
+            except Exception as e:
+                logger.warning(f"[TaskQueue] Heartbeat for {task_id} failed: {e}")
+
+    async def _execute(
+        self,
+        task_type: str,
+        task_id: uuid.UUID,
+        claim_token: str,
+        payload: Dict[str, Any],
+        attempts: int,
+        max_attempts: int,
+    ) -> None:
+        from app.db.sql.session import AsyncSessionLocal
+
+        values: Dict[str, Any]
+        attempt_token = _current_attempt.set(TaskAttempt(attempts, max_attempts))
+        heartbeat = asyncio.create_task(self._heartbeat(task_id, claim_token))
+        try:
+            await _registry[task_type].handler(payload or {})
+            values = {"status": "succeeded", "finished_at": datetime.now(timezone.utc), "last_error": None}
+            logger.info(f"[TaskQueue] {task_type} {task_id} succeeded (attempt {attempts})")
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"[:2000]
+            if attempts >= max_attempts:
+                values = {"status": "dead", "finished_at": datetime.now(timezone.utc), "last_error": error}
+                logger.error(f"[TaskQueue] {task_type} {task_id} failed permanently after {attempts} attempts: {error}")
+            else:
+                delay = min(
+                    settings.TASK_QUEUE_BACKOFF_MAX_SECONDS,
+                    settings.TASK_QUEUE_BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)),
+                ) * random.uniform(0.8, 1.2)
+                values = {
+                    "status": "queued",
+                    "run_at": datetime.now(timezone.utc) + timedelta(seconds=delay),
+                    "last_error": error,
+                }
+                logger.warning(f"[TaskQueue] {task_type} {task_id} failed (attempt {attempts}/{max_attempts}), retrying in {delay:.0f}s: {error}")
+        finally:
+            heartbeat.cancel()
+            _current_attempt.reset(attempt_token)
+            self._in_flight[task_type] = max(0, self._in_flight.get(task_type, 1) - 1)
+
+        values.update(locked_by=None, locked_at=None)
+        try:
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    await session.execute(
+                        update(QueuedTask)
+                        .where(QueuedTask.id == task_id, QueuedTask.locked_by == claim_token)
+                        .values(**values)
+                    )
+        except Exception as e:
+            logger.error(f"[TaskQueue] Could not record result for {task_type} {task_id}: {e}", exc_info=True)
+
+    async def _requeue_stale(self) -> None:
+        """
+        Return tasks whose worker died mid-run (no heartbeat for the visibility timeout).
+        Tasks with no attempts left go to dead, so one that kills its worker is not re-run forever.
+        """
+        from app.db.sql.session import AsyncSessionLocal
+
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=settings.TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS)
+        stale_running = and_(QueuedTask.status == "running", QueuedTask.locked_at < cutoff)
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                dead = (await session.execute(
+                    update(QueuedTask)
+                    .where(stale_running, QueuedTask.attempts >= QueuedTask.max_attempts)
+                    .values(
+                        status="dead", locked_by=None, locked_at=None, finished_at=now,
+                        last_error="Worker lost during the final attempt (no heartbeat within the visibility timeout)",
+                    )
+                    .returning(QueuedTask.id, QueuedTask.task_type)
+                )).all()
+                requeued = (await session.execute(
+                    update(QueuedTask)
+                    .where(stale_running)
+                    .values(status="queued", locked_by=None, locked_at=None, run_at=func.now())
+                    .returning(QueuedTask.id)
+                )).all()
+        if requeued:
+            logger.warning(f"[TaskQueue] Requeued {len(requeued)} stale running tasks")
+        for row in dead:
+            logger.error(f"[TaskQueue] {row.task_type} {row.id} failed permanently: worker lost on its final attempt")
+
+
+task_queue_service = TaskQueueService()
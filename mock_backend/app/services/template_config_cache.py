@@ -0,0 +1,150 @@
+"""
+Template Config Cache
+---------------------
+Parsed, normalized interview template configuration (conversational rounds, technical
+difficulty split, problem-solving type, section durations) cached per process so the
+interview hot paths do not re-read interview_templates on every request.
+
+Entries are keyed on interview_templates.config_version, which every UPDATE of the row
+bumps. Each read checks it with one primary-key query (no JSON columns) and reloads the
+row only when it changed, so an edit made through any worker process is seen by the
+next read everywhere. The admin template endpoints also drop the local entry.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.sql.models.interview_template import InterviewTemplate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONVERSATIONAL_ROUNDS = 10
+DEFAULT_TECHNICAL_QUESTIONS = 6
+_DIFFICULTY_KEYS = ("easy", "medium", "hard")
+_ANALYTICAL_TYPES = ("analytical", "analytical_question", "analytical_questions", "non_coding", "non-coding")
+
+
+def normalize_problem_solving_type(coding_config: Optional[dict]) -> str:
+    cfg = coding_config or {}
+    raw = (
+        cfg.get("problem_solving_type")
+        or cfg.get("problem_type")
+        or cfg.get("type")
+        or "coding"
+    )
+    return "analytical" if str(raw).strip().lower() in _ANALYTICAL_TYPES else "coding"
+
+
+def _duration(config: dict) -> Optional[int]:
+    value = config.get("duration_minutes")
+    return value if isinstance(value, (int, float)) and value > 0 else None
+
+
+@dataclass(frozen=True)
+class TemplateConfig:
+    """
+    Read-only snapshot of an InterviewTemplate. Keeps the raw config attributes so it can
+    be passed wherever template_engine expects a template.
+    """
+    id: uuid.UUID
+    role_name: Optional[str]
+    is_active: bool
+    technical_config: Dict[str, Any] = field(default_factory=dict)
+    coding_config: Dict[str, Any] = field(default_factory=dict)
+    conversational_config: Dict[str, Any] = field(default_factory=dict)
+    settings: Dict[str, Any] = field(default_factory=dict)
+
+    conversational_rounds: int = DEFAULT_CONVERSATIONAL_ROUNDS
+    question_source: str = "ai_generated"
+    difficulty_counts: Dict[str, int] = field(default_factory=dict)
+    num_technical_questions: int = DEFAULT_TECHNICAL_QUESTIONS
+    problem_solving_type: str = "coding"
+    technical_duration_minutes: Optional[int] = None
+    coding_duration_minutes: Optional[int] = None
+    conversational_duration_minutes: Optional[int] = None
+
+    @classmethod
+    def from_template(cls, template: InterviewTemplate) -> "TemplateConfig":
+        technical = template.technical_config if isinstance(template.technical_config, dict) else {}
+        coding = template.coding_config if isinstance(template.coding_config, dict) else {}
+        conversational = template.conversational_config if isinstance(template.conversational_config, dict) else {}
+        legacy = template.settings if isinstance(template.settings, dict) else {}
+
+        # Technical question count from the difficulty distribution (only easy, medium, hard)
+        difficulty_counts = {
+            k.lower(): v for k, v in technical.items()
+            if k.lower() in _DIFFICULTY_KEYS and isinstance(v, int)
+        }
+        num_technical = sum(difficulty_counts.values())
+        if num_technical == 0:
+            num_technical = technical.get("total_questions", DEFAULT_TECHNICAL_QUESTIONS)
+
+        return cls(
+            id=template.id,
+            role_name=template.role_name,
+            is_active=bool(template.is_active),
+            technical_config=technical,
+            coding_config=coding,
+            conversational_config=conversational,
+            settings=legacy,
+            conversational_rounds=conversational.get("rounds", DEFAULT_CONVERSATIONAL_ROUNDS) if conversational else DEFAULT_CONVERSATIONAL_ROUNDS,
+            question_source=technical.get("question_source", "ai_generated"),
+            difficulty_counts=difficulty_counts,
+            num_technical_questions=num_technical,
+            problem_solving_type=normalize_problem_solving_type(coding),
+            technical_duration_minutes=_duration(technical),
+            coding_duration_minutes=_duration(coding),
+            conversational_duration_minutes=_duration(conversational),
+        )
+
+
+class TemplateConfigCache:
+    """Per-process TemplateConfig cache validated against the row's config_version."""
+
+    def __init__(self):
+        self._entries: Dict[uuid.UUID, Tuple[int, TemplateConfig]] = {}
+
+    async def get(self, session: AsyncSession, template_id: Optional[uuid.UUID]) -> Optional[TemplateConfig]:
+        """Cached config for `template_id`, loading it with `session` on a miss."""
+        if not template_id:
+            return None
+        if isinstance(template_id, str):
+            template_id = uuid.UUID(template_id)
+
+        version = (await session.execute(
+            select(InterviewTemplate.config_version).where(InterviewTemplate.id == template_id)
+        )).scalar_one_or_none()
+        if version is None:
+            self._entries.pop(template_id, None)
+            return None
+        entry = self._entries.get(template_id)
+        if entry and entry[0] == version:
+            return entry[1]
+
+        template = (await session.execute(
+            select(InterviewTemplate)
+            .where(InterviewTemplate.id == template_id)
+            .execution_options(populate_existing=True)
+        )).scalar_one_or_none()
+        if not template:
+            return None
+        config = TemplateConfig.from_template(template)
+        # Keyed on the version read with the row, so a racing edit is caught by the next check
+        self._entries[template_id] = (template.config_version, config)
+        return config
+
+    def invalidate(self, template_id: Optional[uuid.UUID] = None) -> None:
+        """Drop one template (or all of them when `template_id` is None)."""
+        if template_id:
+            self._entries.pop(template_id, None)
+        else:
+            self._entries.clear()
+        logger.debug(f"[TemplateConfigCache] Invalidated {template_id or 'all templates'}")
+
+
+template_config_cache = TemplateConfigCache()
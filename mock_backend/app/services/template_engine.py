@@ -9,6 +9,8 @@ from sqlalchemy import select, func
 from app.db.sql.models.interview_template import InterviewTemplate
 from app.db.sql.models.question import Question, DifficultyEnum, CategoryEnum
 from app.db.sql.models.coding_problem import CodingProblem
+from app.services.question_sampler import question_sampler
+from app.services.question_bank_index import question_bank_index
 
 logger = logging.getLogger(__name__)
 
@@ -119,59 +121,34 @@ class TemplateEngineService:
                 continue
 
             from app.db.sql.models.question import QuestionType
-            
-            # Check if coding_problems table exists before joining
-            # If table doesn't exist, just filter out coding questions
-            try:
-                # Try to create a simple query that checks if table exists
-                # We'll use a simpler approach: just filter out coding questions
-                query = select(Question).where(
-                    Question.difficulty == difficulty,
-                    Question.is_active == True,
-                    Question.question_type != QuestionType.CODING
-                )
-            except Exception:
-                # Fallback: if there's any issue, just filter by difficulty and active status
-                query = select(Question).where(
-                    Question.difficulty == difficulty,
-                    Question.is_active == True
-                )
-
-            if generated:
-                excluded_ids = [item.question_id for item in generated if item.question_id]
-                if excluded_ids:
-                    query = query.where(Question.id.not_in(excluded_ids))
 
-            if categories:
-                cat_enums = [CategoryEnum(c) for c in categories if c in CategoryEnum.__members__]
-                if cat_enums:
-                    query = query.where(Question.category.in_(cat_enums))
-
-            query = query.order_by(func.random()).limit(count)
-            
-            # Execute query with error handling for missing tables
-            try:
-                res = await session.execute(query)
-                batch = res.scalars().all()
-            except Exception as e:
-                # If query fails due to missing table (e.g., coding_problems), 
-                # try a simpler query without the join
-                logger.warning(f"Query failed (possibly due to missing table): {e}. Trying simpler query.")
-                simple_query = select(Question).where(
-                    Question.difficulty == difficulty,
-                    Question.is_active == True
+            filters = [
+                Question.difficulty == difficulty,
+                Question.is_active == True,
+            ]
+            cat_enums = [CategoryEnum(c) for c in categories if c in CategoryEnum.__members__] if categories else []
+            if cat_enums:
+                filters.append(Question.category.in_(cat_enums))
+            excluded_ids = [item.question_id for item in generated if item.question_id]
+
+            if await question_bank_index.ensure_fresh(session):
+                picked = question_bank_index.sample(
+                    count,
+                    difficulty=difficulty,
+                    categories=cat_enums,
+                    exclude_question_types=[QuestionType.CODING],
+                    exclude_ids=excluded_ids,
+                )
+                # Selection is in memory; one primary-key read loads the chosen rows
+                batch = []
+                if picked:
+                    res = await session.execute(select(Question).where(Question.id.in_([q.id for q in picked])))
+                    by_id = {q.id: q for q in res.scalars().all()}
+                    batch = [by_id[q.id] for q in picked if q.id in by_id]
+            else:
+                batch = await TemplateEngineService._sample_technical_from_db(
+                    session, count, filters, excluded_ids
                 )
-                if generated:
-                    excluded_ids = [item.question_id for item in generated if item.question_id]
-                    if excluded_ids:
-                        simple_query = simple_query.where(Question.id.not_in(excluded_ids))
-                if categories:
-                    cat_enums = [CategoryEnum(c) for c in categories if c in CategoryEnum.__members__]
-                    if cat_enums:
-                        simple_query = simple_query.where(Question.category.in_(cat_enums))
-                simple_query = simple_query.order_by(func.random()).limit(count)
-                res = await session.execute(simple_query)
-                batch = res.scalars().all()
 
             if len(batch) < count:
                 logger.warning(
@@ -183,6 +160,29 @@ class TemplateEngineService:
 
         return generated
 
+    @staticmethod
+    async def _sample_technical_from_db(
+        session: AsyncSession,
+        count: int,
+        filters: list,
+        excluded_ids: List[uuid.UUID],
+    ) -> List[Question]:
+        """SQL fallback when the question bank index is unavailable."""
+        from app.db.sql.models.question import QuestionType
+
+        # Random-key index seeks instead of ORDER BY random() over the filtered bank
+        try:
+            return await question_sampler.sample(
+                session,
+                count,
+                filters=filters + [Question.question_type != QuestionType.CODING],
+                exclude_ids=excluded_ids,
+            )
+        except Exception as e:
+            # Older schemas without question_type: sample on difficulty / category only
+            logger.warning(f"Query failed (possibly due to missing column): {e}. Trying simpler query.")
+            return await question_sampler.sample(session, count, filters=filters, exclude_ids=excluded_ids)
+
     @staticmethod
     async def _generate_coding_questions(
         template: InterviewTemplate,
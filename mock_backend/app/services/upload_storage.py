@@ -0,0 +1,160 @@
+"""
+Upload Storage
+--------------
+Streams multipart uploads (face, voice and video samples) to disk in chunks instead of
+reading them into memory with `await file.read()`, so concurrent uploads keep the API's
+memory flat however large the files are.
+
+Starlette receives the whole multipart body (spooling it to a temporary file) before a
+handler runs, so an oversize request is refused up front by reject_oversize_upload, from
+its Content-Length, in an HTTP middleware. Requests without one (chunked) are received,
+then rejected by stream_upload: by the size Starlette recorded, by the magic bytes of the
+first chunk (a renamed or mislabelled file gets 415), and by the size cap enforced while
+copying (413). The sha256 is computed chunk by chunk. The file is written next to its
+destination and only renamed into place once complete, so a rejected or interrupted
+upload leaves nothing behind.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# Enough of the first chunk to recognise every format below
+SNIFF_BYTES = 12
+
+IMAGE_KINDS = frozenset({"jpeg", "png"})
+AUDIO_KINDS = frozenset({"wav", "mp3", "webm", "ogg"})
+# "mp4" covers every ISO base media file: MP4, QuickTime and M4A
+VIDEO_KINDS = frozenset({"mp4", "webm"})
+# Browser voice recordings: Safari's MediaRecorder produces audio/mp4
+VOICE_RECORDING_KINDS = AUDIO_KINDS | {"mp4"}
+
+# Multipart framing and any form fields on top of the file itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Sample upload endpoints -> largest file accepted
+UPLOAD_SIZE_LIMITS: Dict[str, int] = {
+    "/api/v1/verification/face-sample": settings.UPLOAD_MAX_IMAGE_BYTES,
+    "/api/v1/verification/video-sample": settings.UPLOAD_MAX_VIDEO_BYTES,
+    "/api/v1/verification/voice-sample": settings.UPLOAD_MAX_AUDIO_BYTES,
+    "/api/v1/candidate/profile/face": settings.UPLOAD_MAX_IMAGE_BYTES,
+    "/api/v1/candidate/profile/voice": settings.UPLOAD_MAX_AUDIO_BYTES,
+}
+
+
+def sniff_kind(head: bytes) -> Optional[str]:
+    """The file format named by the magic bytes at the start of a file, if recognised."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith(b"\x1a\x45\xdf\xa3"):
+        # EBML header: WebM / Matroska, audio-only or with video
+        return "webm"
+    if head[4:8] in (b"ftyp", b"moov", b"mdat", b"wide", b"free"):
+        return "mp4"
+    if head.startswith(b"RIFF") and head[8:12] == b"WAVE":
+        return "wav"
+    if head.startswith(b"OggS"):
+        return "ogg"
+    if head.startswith(b"ID3") or (len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+        return "mp3"
+    return None
+
+
+@dataclass
+class StoredUpload:
+    path: str
+    size: int
+    sha256: str
+    kind: str
+
+    async def read_bytes(self) -> bytes:
+        """The stored file's content, for APIs that only take bytes (keep to size-capped kinds)."""
+        return await asyncio.to_thread(_read_file, self.path)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def reject_oversize_upload(method: str, path: str, content_length: Optional[str]) -> Optional[JSONResponse]:
+    """A 413 for a sample upload whose declared body is over its cap, before any of it is read."""
+    max_bytes = UPLOAD_SIZE_LIMITS.get(path.rstrip("/"))
+    if method != "POST" or max_bytes is None or not content_length or not content_length.isdigit():
+        return None
+    if int(content_length) <= max_bytes + MULTIPART_OVERHEAD_BYTES:
+        return None
+    return JSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={"detail": f"Upload exceeds the maximum size of {max_bytes // (1024 * 1024)} MB"},
+    )
+
+
+def _too_large(label: str, max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"{label} exceeds the maximum size of {max_bytes // (1024 * 1024)} MB",
+    )
+
+
+async def stream_upload(
+    upload: UploadFile,
+    dest_path: str,
+    allowed_kinds: Iterable[str],
+    max_bytes: int,
+    label: str,
+) -> StoredUpload:
+    """Write `upload` to `dest_path` in chunks, checking its format and size on the way."""
+    allowed = set(allowed_kinds)
+    if upload.size is not None and upload.size > max_bytes:
+        raise _too_large(label, max_bytes)
+
+    partial_path = f"{dest_path}.part"
+    digest = hashlib.sha256()
+    written = 0
+    kind = None
+    out = None
+    try:
+        while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+            if kind is None:
+                kind = sniff_kind(chunk[:SNIFF_BYTES])
+                if kind not in allowed:
+                    raise HTTPException(
+                        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                        detail=f"{label} content is not a supported format ({', '.join(sorted(allowed))})",
+                    )
+                out = await asyncio.to_thread(open, partial_path, "wb")
+            written += len(chunk)
+            if written > max_bytes:
+                raise _too_large(label, max_bytes)
+            digest.update(chunk)
+            await asyncio.to_thread(out.write, chunk)
+        if written == 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{label} file is empty")
+        await asyncio.to_thread(out.close)
+        os.replace(partial_path, dest_path)
+    except BaseException:
+        # Also on cancellation (client disconnect): never leave a partial file behind
+        if out is not None:
+            out.close()
+            try:
+                os.remove(partial_path)
+            except OSError:
+                pass
+        raise
+
+    logger.info(f"[Upload] Stored {label.lower()} ({kind}, {written} bytes) at {dest_path}")
+    return StoredUpload(path=dest_path, size=written, sha256=digest.hexdigest(), kind=kind)
@@ -0,0 +1,48 @@
+"""
+Task queue worker entry point.
+
+    python -m app.worker [--types parse_candidate_resume,generate_interview_questions]
+
+Runs until SIGINT/SIGTERM; in-flight tasks get a grace period, and anything cut off is
+requeued by another worker once TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS has passed.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.services.task_queue_service import TaskWorker
+from app.services.pdf_extraction import pdf_extraction_pool
+
+logging.basicConfig(
+    level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
+
+async def main(task_types=None) -> None:
+    worker = TaskWorker(task_types=task_types)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            # Windows: fall back to KeyboardInterrupt
+            pass
+    try:
+        await worker.run()
+    finally:
+        pdf_extraction_pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the durable task queue worker")
+    parser.add_argument("--types", default="", help="Comma separated task types to process (default: all)")
+    args = parser.parse_args()
+    types = [t.strip() for t in args.types.split(",") if t.strip()] or None
+    try:
+        asyncio.run(main(types))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,172 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone, timedelta
+import httpx
+from sqlalchemy import select, delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.user import User, CandidateProfile
+from app.db.sql.models.interview import Interview
+from app.db.sql.models.interview_template import InterviewTemplate
+from app.db.sql.models.task_queue import QueuedTask
+from app.db.sql.enums import UserRole, InterviewStatus
+from app.core.security import create_access_token
+from app.services.interview_admin_sql_service import InterviewAdminSQLService
+from app.services.interview_sql_service import InterviewSQLService
+from app.services.question_generator_service import question_generator_service
+from app.services.azure_openai_service import LLMUnavailableError
+from app.services.task_queue_service import TaskAttempt, _current_attempt
+
+SCHEDULE_URL = "/api/v1/admin/interviews/schedule"
+
+
+async def _seed(tag: str):
+    async with AsyncSessionLocal() as session:
+        admin = User(
+            username=f"test_sched_admin_{tag}",
+            email=f"test_sched_admin_{tag}@example.com",
+            role=UserRole.ADMIN,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        candidates = []
+        for i in range(3):
+            candidate = User(
+                username=f"test_sched_{tag}_{i}",
+                email=f"test_sched_{tag}_{i}@example.com",
+                role=UserRole.CANDIDATE,
+                hashed_password="mock_password",
+                is_active=True,
+            )
+            candidate.candidate_profile = CandidateProfile(
+                first_name="Sched", resume_text="Python developer", job_description="Backend engineer JD"
+            )
+            candidates.append(candidate)
+        template = InterviewTemplate(title="Background scheduling test", technical_config={"easy": 2})
+        session.add_all([admin, template, *candidates])
+        await session.commit()
+        return admin.id, [c.id for c in candidates], template.id
+
+
+async def _task_for(interview_id: str):
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(
+            select(QueuedTask).where(QueuedTask.idempotency_key == f"interview-questions:{interview_id}")
+        )).scalar_one_or_none()
+
+
+async def verify_background_scheduling():
+    tag = uuid.uuid4().hex[:8]
+    user_ids, template_id, interview_ids = [], None, []
+    generated = []
+    llm_down = False
+
+    async def fake_generate(**kwargs):
+        generated.append(kwargs["candidate_id"])
+        # The job asks for transient errors instead of mock questions
+        assert kwargs["retry_transient_errors"] is True
+        if kwargs["candidate_id"] == str(user_ids[3]):
+            if llm_down:
+                raise LLMUnavailableError("every LLM endpoint's circuit is open")
+            raise ValueError("template has no usable questions")
+        return {"template_id": kwargs["template_id"], "technical_section": {"questions": [{"question_id": "q1"}]}}
+
+    question_generator_service.generate_curated_questions = fake_generate
+    try:
+        admin_id, candidate_ids, template_id = await _seed(tag)
+        user_ids = [admin_id, *candidate_ids]
+        from app.main import app
+        headers = {"Authorization": f"Bearer {create_access_token(subject=str(admin_id))}"}
+        scheduled_at = (datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat()
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            async def schedule(candidate_id):
+                response = await client.post(SCHEDULE_URL, headers=headers, json={
+                    "candidate_id": str(candidate_id), "template_id": str(template_id), "scheduled_at": scheduled_at,
+                })
+                assert response.status_code == 202, response.text
+                interview_ids.append(uuid.UUID(response.json()["id"]))
+                return response.json()
+
+            async def generation_status(interview_id):
+                response = await client.get(f"/api/v1/admin/interviews/{interview_id}/generation-status", headers=headers)
+                assert response.status_code == 200, response.text
+                return response.json()
+
+            # Accepted immediately: nothing generated during the request, one task queued with the interview
+            accepted = await schedule(candidate_ids[0])
+            assert accepted["generation_status"] == "pending" and accepted["curated_questions"] is None
+            assert generated == []
+            task = await _task_for(accepted["id"])
+            assert task is not None and task.task_type == "generate_interview_questions" and task.status == "queued"
+            polled = await generation_status(accepted["id"])
+            assert polled["generation_status"] == "pending" and polled["ready"] is False
+
+            # Starting before the questions are ready is refused
+            async with AsyncSessionLocal() as session:
+                try:
+                    await InterviewSQLService.start_interview(session, uuid.UUID(accepted["id"]), candidate_ids[0])
+                except Exception as e:
+                    assert getattr(e, "status_code", None) == 409 and "being prepared" in e.detail, e
+                else:
+                    raise AssertionError("start_interview should wait for generation")
+
+            # The background job (what the queue worker runs) stores the questions
+            await InterviewAdminSQLService.generate_interview_questions(uuid.UUID(accepted["id"]))
+            polled = await generation_status(accepted["id"])
+            assert polled == {
+                "interview_id": accepted["id"], "status": "scheduled",
+                "generation_status": "ready", "generation_error": None, "ready": True,
+            }, polled
+            async with AsyncSessionLocal() as session:
+                interview = await session.get(Interview, uuid.UUID(accepted["id"]))
+            assert interview.curated_questions["technical_section"]["questions"] == [{"question_id": "q1"}]
+
+            # Cancelled while pending: the job leaves it alone
+            cancelled = await schedule(candidate_ids[1])
+            response = await client.put(f"/api/v1/admin/interviews/{cancelled['id']}/cancel", headers=headers, json={})
+            assert response.status_code == 200, response.text
+            await InterviewAdminSQLService.generate_interview_questions(uuid.UUID(cancelled["id"]))
+            assert generated == [str(candidate_ids[0])]
+            polled = await generation_status(cancelled["id"])
+            assert polled["status"] == "cancelled" and polled["generation_status"] == "pending"
+
+            # A transient error with attempts left is raised for the queue to retry; still pending
+            failed = await schedule(candidate_ids[2])
+            llm_down = True
+            attempt = _current_attempt.set(TaskAttempt(1, 3))
+            try:
+                await InterviewAdminSQLService.generate_interview_questions(uuid.UUID(failed["id"]))
+            except LLMUnavailableError:
+                pass
+            else:
+                raise AssertionError("a transient error should reach the task queue")
+            finally:
+                _current_attempt.reset(attempt)
+                llm_down = False
+            assert (await generation_status(failed["id"]))["generation_status"] == "pending"
+
+            # A permanent error is recorded for the admin to see
+            await InterviewAdminSQLService.generate_interview_questions(uuid.UUID(failed["id"]))
+            polled = await generation_status(failed["id"])
+            assert polled["generation_status"] == "failed" and "no usable questions" in polled["generation_error"], polled
+
+            missing = await client.get(f"/api/v1/admin/interviews/{uuid.uuid4()}/generation-status", headers=headers)
+            assert missing.status_code == 404
+        print("SUCCESS: scheduling is accepted immediately and questions are generated in the background")
+    finally:
+        del question_generator_service.generate_curated_questions
+        async with AsyncSessionLocal() as session:
+            if interview_ids:
+                await session.execute(delete(QueuedTask).where(
+                    QueuedTask.idempotency_key.in_([f"interview-questions:{i}" for i in interview_ids])
+                ))
+                await session.execute(delete(Interview).where(Interview.id.in_(interview_ids)))
+            if user_ids:
+                await session.execute(delete(User).where(User.id.in_(user_ids)))
+            if template_id:
+                await session.execute(delete(InterviewTemplate).where(InterviewTemplate.id == template_id))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_background_scheduling())
@@ -0,0 +1,238 @@
+import asyncio
+import csv
+import io
+import os
+import uuid
+import zipfile
+import httpx
+import pypdf
+from fastapi import HTTPException
+from sqlalchemy import select, update, delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.user import User, CandidateProfile
+from app.db.sql.models.task_queue import QueuedTask
+from app.db.sql.models.candidate_import import CandidateImportJob, CandidateImportRow
+from app.db.sql.enums import UserRole
+from app.core.config import settings
+from app.core.security import create_access_token, password_hasher
+import app.services.candidate_import_service as import_module
+from app.services.candidate_import_service import candidate_import_service
+
+
+def _pdf(pages: int = 1) -> bytes:
+    writer = pypdf.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=612, height=792)
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
+def _manifest(rows) -> bytes:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["Name", "Email", "Resume", "job_description"])
+    writer.writerows(rows)
+    return buf.getvalue().encode("utf-8-sig")
+
+
+async def _seed(tag: str):
+    async with AsyncSessionLocal() as session:
+        admin = User(
+            username=f"test_import_admin_{tag}",
+            email=f"test_import_admin_{tag}@example.com",
+            role=UserRole.ADMIN,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        existing = User(
+            username=f"imp_{tag}_taken",
+            email=f"imp_{tag}_taken@example.com",
+            role=UserRole.CANDIDATE,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        session.add_all([admin, existing])
+        await session.commit()
+        return admin.id, existing.id
+
+
+async def _run_queued_import(job_id: str) -> None:
+    """Run the job's queued task the way a worker would (any instance can)."""
+    async with AsyncSessionLocal() as session:
+        task = (await session.execute(
+            select(QueuedTask).where(QueuedTask.idempotency_key == f"candidate-import:{job_id}")
+        )).scalar_one()
+    assert task.task_type == "import_candidates" and task.status == "queued"
+    await candidate_import_service.run(uuid.UUID(task.payload["job_id"]))
+
+
+async def _poll(client, headers, job_id: str):
+    rows, since = [], 0
+    for _ in range(600):
+        progress = (await client.get(f"/api/v1/auth/admin/candidates/import/{job_id}", params={"since": since}, headers=headers)).json()
+        rows += progress["rows"]
+        since = progress["next_since"]
+        if progress["status"] not in ("queued", "running"):
+            return progress, rows
+        await asyncio.sleep(0.1)
+    raise AssertionError("import did not finish")
+
+
+async def verify_candidate_import():
+    tag = uuid.uuid4().hex[:8]
+    user_ids, job_ids = [], []
+    try:
+        admin_id, existing_id = await _seed(tag)
+        user_ids = [admin_id, existing_id]
+        candidate_import_service.batch_size = 2
+
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            for i in range(5):
+                zf.writestr(f"drive/resume_{i}.pdf", _pdf())
+            zf.writestr("drive/long.pdf", _pdf(pages=11))
+            zf.writestr("drive/notes.txt", b"not a resume")
+        manifest = _manifest([
+            [f"Imported {i}", f"imp_{tag}_{i}@example.com", f"resume_{i}.pdf", "" if i else "Row JD"]
+            for i in range(5)
+        ] + [
+            ["Dup", f"imp_{tag}_0@example.com", "resume_1.pdf", ""],
+            ["Missing", f"imp_{tag}_m@example.com", "nowhere.pdf", ""],
+            ["Taken", f"imp_{tag}_taken@example.com", "resume_2.pdf", ""],
+            ["Long", f"imp_{tag}_long@example.com", "drive/long.pdf", ""],
+            ["Text", f"imp_{tag}_txt@example.com", "notes.txt", ""],
+            ["", f"imp_{tag}_noname@example.com", "resume_3.pdf", ""],
+        ])
+
+        from app.main import app
+        headers = {"Authorization": f"Bearer {create_access_token(subject=str(admin_id))}"}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            # Malformed uploads are rejected before a job is created
+            bad = await client.post(
+                "/api/v1/auth/admin/candidates/import",
+                headers=headers,
+                files={"manifest": ("m.csv", b"name,email\nA,a@example.com\n"), "resumes": ("r.zip", archive.getvalue())},
+            )
+            assert bad.status_code == 400 and "resume" in bad.json()["detail"], bad.text
+            bad = await client.post(
+                "/api/v1/auth/admin/candidates/import",
+                headers=headers,
+                files={"manifest": ("m.csv", manifest), "resumes": ("r.zip", b"not a zip")},
+            )
+            assert bad.status_code == 400, bad.text
+
+            started = await client.post(
+                "/api/v1/auth/admin/candidates/import",
+                headers=headers,
+                files={"manifest": ("m.csv", manifest), "resumes": ("r.zip", archive.getvalue())},
+                data={"job_description": "Default JD"},
+            )
+            assert started.status_code == 202, started.text
+            job_id = started.json()["job_id"]
+            job_ids.append(uuid.UUID(job_id))
+            assert started.json()["total_rows"] == 11 and started.json()["status"] == "queued"
+
+            # The job and its results live in the database; the import runs as a queued task
+            await _run_queued_import(job_id)
+            progress, rows = await _poll(client, headers, job_id)
+            assert progress["status"] == "completed", progress
+            assert progress["created"] == 5 and progress["failed"] == 6 and progress["processed"] == 11, progress
+            assert sorted(r["row"] for r in rows) == list(range(2, 13))
+            errors = {r["email"]: r["error"] for r in rows if r["status"] == "failed"}
+            assert "Duplicate" in errors[f"imp_{tag}_0@example.com"]
+            assert "not found" in errors[f"imp_{tag}_m@example.com"]
+            assert "already exists" in errors[f"imp_{tag}_taken@example.com"]
+            assert "10 pages" in errors[f"imp_{tag}_long@example.com"]
+            assert "PDF" in errors[f"imp_{tag}_txt@example.com"]
+            assert "Name" in errors[f"imp_{tag}_noname@example.com"]
+            assert all("password" not in r for r in rows)
+
+            missing = await client.get("/api/v1/auth/admin/candidates/import/unknown", headers=headers)
+            assert missing.status_code == 404
+            missing = await client.get(f"/api/v1/auth/admin/candidates/import/{uuid.uuid4()}", headers=headers)
+            assert missing.status_code == 404
+
+            # A retried task continues after the committed checkpoint; a row whose password
+            # hash keeps getting 503 fails once the retry cap is hit instead of waiting forever
+            retry_manifest = _manifest([
+                [f"Retry {i}", f"imp_{tag}_r{i}@example.com", f"resume_{i}.pdf", ""] for i in range(4)
+            ])
+            started = await client.post(
+                "/api/v1/auth/admin/candidates/import",
+                headers=headers,
+                files={"manifest": ("m.csv", retry_manifest), "resumes": ("r.zip", archive.getvalue())},
+            )
+            retry_id = started.json()["job_id"]
+            job_ids.append(uuid.UUID(retry_id))
+            async with AsyncSessionLocal() as session:
+                await session.execute(
+                    update(CandidateImportJob).where(CandidateImportJob.id == uuid.UUID(retry_id))
+                    .values(status="running", checkpoint_line=3)
+                )
+                await session.commit()
+
+            async def busy_hash(password):
+                raise HTTPException(status_code=503, detail="busy")
+
+            original_hash, retries = password_hasher.hash, import_module.HASH_BUSY_RETRIES
+            password_hasher.hash, import_module.HASH_BUSY_RETRIES = busy_hash, 1
+            try:
+                await _run_queued_import(retry_id)
+            finally:
+                password_hasher.hash, import_module.HASH_BUSY_RETRIES = original_hash, retries
+            retried, retry_rows = await _poll(client, headers, retry_id)
+            assert retried["status"] == "completed" and retried["processed"] == 2 and retried["failed"] == 2, retried
+            assert [r["row"] for r in retry_rows] == [4, 5] and all("busy" in r["error"] for r in retry_rows), retry_rows
+
+        created_ids = [uuid.UUID(r["candidate_id"]) for r in rows if r["status"] == "created"]
+        user_ids += created_ids
+        async with AsyncSessionLocal() as session:
+            profiles = (await session.execute(
+                select(User.username, CandidateProfile)
+                .join(CandidateProfile, CandidateProfile.user_id == User.id)
+                .where(User.id.in_(created_ids))
+            )).all()
+            tasks = (await session.execute(
+                select(QueuedTask.payload).where(QueuedTask.idempotency_key.in_([f"parse-resume:{i}" for i in created_ids]))
+            )).scalars().all()
+
+        assert len(profiles) == 5
+        by_username = {username: profile for username, profile in profiles}
+        assert by_username[f"imp_{tag}_0"].job_description == "Row JD"
+        assert by_username[f"imp_{tag}_1"].job_description == "Default JD"
+        assert by_username[f"imp_{tag}_1"].first_name == "Imported" and by_username[f"imp_{tag}_1"].last_name == "1"
+        for profile in by_username.values():
+            assert profile.parse_status == "pending" and profile.resume_filename.startswith("resume_")
+            assert os.path.exists(os.path.join(settings.BASE_DIR, profile.resume_path))
+        # One parse task per created candidate
+        assert sorted(t["candidate_id"] for t in tasks) == sorted(str(i) for i in created_ids)
+
+        print(f"SUCCESS: bulk import created {len(created_ids)} candidates, rejected {len(errors)} rows")
+    finally:
+        candidate_import_service.batch_size = settings.BULK_IMPORT_BATCH_SIZE
+        if job_ids:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(QueuedTask).where(
+                    QueuedTask.idempotency_key.in_([f"candidate-import:{j}" for j in job_ids])
+                ))
+                await session.execute(delete(CandidateImportRow).where(CandidateImportRow.job_id.in_(job_ids)))
+                await session.execute(delete(CandidateImportJob).where(CandidateImportJob.id.in_(job_ids)))
+                await session.commit()
+        if user_ids:
+            async with AsyncSessionLocal() as session:
+                paths = (await session.execute(
+                    select(CandidateProfile.resume_path).where(CandidateProfile.user_id.in_(user_ids))
+                )).scalars().all()
+                await session.execute(delete(QueuedTask).where(
+                    QueuedTask.idempotency_key.in_([f"parse-resume:{i}" for i in user_ids])
+                ))
+                await session.execute(delete(User).where(User.id.in_(user_ids)))
+                await session.commit()
+            for path in paths:
+                if path and os.path.exists(os.path.join(settings.BASE_DIR, path)):
+                    os.remove(os.path.join(settings.BASE_DIR, path))
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_candidate_import())
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from sqlalchemy import delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.interview_template import InterviewTemplate
+from app.services.azure_openai_service import azure_openai_service, LLMUnavailableError
+from app.services.question_generator_service import QuestionGeneratorService
+from app.services.task_queue_service import TaskAttempt, _current_attempt
+
+STAGE_SECONDS = 0.2
+PATCHED = ("_prepare_resume_data", "_prepare_jd_data", "_build_technical_questions", "_build_coding_problems", "_build_analytical_questions")
+
+
+class _Timeline:
+    """Start/end offsets of each fake stage, relative to the pipeline start."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans = {}
+
+    async def stage(self, name, result):
+        begin = time.perf_counter() - self.started
+        await asyncio.sleep(STAGE_SECONDS)
+        self.spans[name] = (begin, time.perf_counter() - self.started)
+        return result
+
+
+def _install(timeline: _Timeline) -> None:
+    async def resume(resume_id, resume_text, resume_json):
+        return await timeline.stage("resume", {"skills": ["python"], "projects": [], "experience": []})
+
+    async def jd(job_description, jd_json):
+        return await timeline.stage("jd", {"required_skills": ["sql"], "job_title": "Data Engineer"})
+
+    async def technical(session, db_lock, question_source, num_technical_questions, difficulty_counts, **context):
+        assert sorted(context["all_skills"]) == ["python", "sql"] and context["role_name"] == "Data Engineer"
+        questions = [{"question_id": f"t{i}", "prompt": f"Technical {i}", "order": i} for i in range(1, num_technical_questions + 1)]
+        return await timeline.stage("technical", questions)
+
+    async def coding(session, db_lock, template):
+        return await timeline.stage("coding", [{"problem_id": "p1", "title": "Two sum"}])
+
+    async def analytical(template, role_name, resume_data, jd_data):
+        return await timeline.stage("analytical", [{"question_id": "a1", "prompt": "Estimate demand"}])
+
+    for name, fake in zip(PATCHED, (resume, jd, technical, coding, analytical)):
+        setattr(QuestionGeneratorService, name, staticmethod(fake))
+
+
+async def _generate(template_id, **kwargs) -> dict:
+    async with AsyncSessionLocal() as session:
+        return await QuestionGeneratorService.generate_curated_questions(
+            session=session,
+            template_id=str(template_id),
+            candidate_id="candidate",
+            resume_text="Python developer",
+            job_description="Data engineer JD",
+            **kwargs,
+        )
+
+
+async def _llm_down(*args, **kwargs):
+    raise LLMUnavailableError("every LLM endpoint's circuit is open")
+
+
+async def _verify_transient_errors_retried(coding_template_id, analytical_template_id, originals) -> None:
+    """A queued job with attempts left raises transient errors; mock questions only on the final attempt."""
+    saved_client = azure_openai_service.async_client
+    attempt = _current_attempt.set(TaskAttempt(1, 3))
+    try:
+        _install(_Timeline())
+        QuestionGeneratorService._build_technical_questions = staticmethod(_llm_down)
+        try:
+            await _generate(coding_template_id, retry_transient_errors=True)
+        except LLMUnavailableError:
+            pass
+        else:
+            raise AssertionError("a transient error on a non-final attempt should reach the task queue")
+        # Interactive previews still get fallback questions
+        payload = await _generate(coding_template_id)
+        assert payload["generation_method"] == "fallback_mock", payload["generation_method"]
+
+        # An LLM error inside a stage is raised too, instead of becoming mock questions
+        _install(_Timeline())
+        QuestionGeneratorService._build_analytical_questions = originals["_build_analytical_questions"]
+        azure_openai_service.async_client = object()
+        azure_openai_service.chat_completion_json = _llm_down
+        try:
+            await _generate(analytical_template_id, retry_transient_errors=True)
+        except LLMUnavailableError:
+            pass
+        else:
+            raise AssertionError("the analytical stage swallowed a transient error")
+        # The final attempt falls back to mock questions rather than failing the interview
+        _current_attempt.set(TaskAttempt(3, 3))
+        payload = await _generate(analytical_template_id, retry_transient_errors=True)
+        assert payload["problem_solving_section"]["questions"], payload
+    finally:
+        _current_attempt.reset(attempt)
+        azure_openai_service.async_client = saved_client
+        azure_openai_service.__dict__.pop("chat_completion_json", None)
+
+
+async def verify_curated_question_graph():
+    originals = {name: QuestionGeneratorService.__dict__[name] for name in PATCHED}
+    template_ids = []
+    try:
+        async with AsyncSessionLocal() as session:
+            coding_template = InterviewTemplate(
+                title="Graph test (coding)",
+                technical_config={"easy": 2, "medium": 1, "question_source": "ai_generated"},
+                coding_config={"problem_solving_type": "coding", "count": 1, "difficulty": ["easy"]},
+                conversational_config={"rounds": 3},
+            )
+            analytical_template = InterviewTemplate(
+                title="Graph test (analytical)",
+                technical_config={"easy": 2},
+                coding_config={"problem_solving_type": "analytical", "count": 1},
+            )
+            session.add_all([coding_template, analytical_template])
+            await session.commit()
+            template_ids = [coding_template.id, analytical_template.id]
+
+        # Coding: resume, JD and coding problems run together; technical follows resume/JD
+        timeline = _Timeline()
+        _install(timeline)
+        payload = await _generate(coding_template.id)
+        elapsed = time.perf_counter() - timeline.started
+        spans = timeline.spans
+        assert spans["coding"][0] < spans["resume"][1] and spans["coding"][0] < spans["jd"][1], spans
+        assert spans["technical"][0] >= max(spans["resume"][1], spans["jd"][1]), spans
+        # Sequential stages would take 4 x STAGE_SECONDS
+        assert elapsed < 3 * STAGE_SECONDS, (elapsed, spans)
+        assert [q["question_id"] for q in payload["technical_section"]["questions"]] == ["t1", "t2", "t3"]
+        assert payload["problem_solving_section"]["problems"] == [{"problem_id": "p1", "title": "Two sum"}]
+        assert payload["conversational_section"] == {"rounds": 3}
+        assert {"template", "resume", "job_description", "coding_problems", "technical_questions", "total"} <= set(payload["stage_timings_ms"])
+
+        # Analytical: the two LLM-bound stages overlap once resume and JD are ready
+        timeline = _Timeline()
+        _install(timeline)
+        payload = await _generate(analytical_template.id)
+        elapsed = time.perf_counter() - timeline.started
+        spans = timeline.spans
+        assert spans["analytical"][0] < spans["technical"][1] and spans["technical"][0] < spans["analytical"][1], spans
+        assert elapsed < 3 * STAGE_SECONDS, (elapsed, spans)
+        assert payload["problem_solving_section"]["problem_solving_type"] == "analytical"
+        assert payload["problem_solving_section"]["questions"][0]["prompt"] == "Estimate demand"
+        assert "analytical_questions" in payload["stage_timings_ms"]
+
+        await _verify_transient_errors_retried(coding_template.id, analytical_template.id, originals)
+        print(f"SUCCESS: curated question stages overlap (analytical pipeline {elapsed * 1000:.0f} ms, stages {STAGE_SECONDS * 1000:.0f} ms each)")
+    finally:
+        for name, original in originals.items():
+            setattr(QuestionGeneratorService, name, original)
+        if template_ids:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(InterviewTemplate).where(InterviewTemplate.id.in_(template_ids)))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_curated_question_graph())
@@ -0,0 +1,69 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import delete, update
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.user import User
+from app.db.sql.models.interview import Interview
+from app.db.sql.enums import UserRole, InterviewStatus
+from app.services.dashboard_stats_service import DashboardStatsService
+
+
+async def verify_dashboard_stats():
+    stats_service = DashboardStatsService(ttl_seconds=0)
+    cached_service = DashboardStatsService(ttl_seconds=60)
+    async with AsyncSessionLocal() as session:
+        try:
+            before = await stats_service.read_counts(session)
+            assert before is not None, "interview_status_counts is empty; run `alembic upgrade head`"
+            assert before == await stats_service.compute_counts(session)
+            stats_before = await stats_service.get_stats(session)
+            assert await cached_service.get_stats(session) == stats_before
+
+            user = User(
+                username=f"stats_{uuid.uuid4().hex[:6]}",
+                email=f"stats_{uuid.uuid4().hex[:6]}@example.com",
+                role=UserRole.CANDIDATE,
+                hashed_password="mock_password",
+            )
+            session.add(user)
+            await session.flush()
+            interviews = [
+                Interview(candidate_id=user.id, scheduled_at=datetime.now(timezone.utc), status=InterviewStatus.SCHEDULED)
+                for _ in range(6)
+            ]
+            session.add_all(interviews)
+            await session.flush()
+
+            # Status transitions, a no-op update and a delete
+            await session.execute(update(Interview).where(Interview.id.in_([i.id for i in interviews[:3]])).values(status=InterviewStatus.IN_PROGRESS))
+            await session.execute(update(Interview).where(Interview.id == interviews[0].id).values(status=InterviewStatus.COMPLETED))
+            await session.execute(update(Interview).where(Interview.id == interviews[1].id).values(status=InterviewStatus.IN_PROGRESS))
+            await session.execute(update(Interview).where(Interview.id == interviews[5].id).values(status=InterviewStatus.CANCELLED))
+            await session.execute(delete(Interview).where(Interview.id == interviews[4].id))
+            await session.flush()
+
+            after = await stats_service.read_counts(session)
+            assert after == await stats_service.compute_counts(session), "counter table drifted from interviews"
+            assert after[InterviewStatus.SCHEDULED] - before[InterviewStatus.SCHEDULED] == 1
+            assert after[InterviewStatus.IN_PROGRESS] - before[InterviewStatus.IN_PROGRESS] == 2
+            assert after[InterviewStatus.COMPLETED] - before[InterviewStatus.COMPLETED] == 1
+            assert after[InterviewStatus.CANCELLED] - before[InterviewStatus.CANCELLED] == 1
+
+            stats_after = await stats_service.get_stats(session)
+            assert stats_after["total_interviews"] - stats_before["total_interviews"] == 5
+            assert stats_after["pending"] - stats_before["pending"] == 3
+            assert stats_after["completed"] - stats_before["completed"] == 1
+
+            # The TTL cache serves the old counts until a write path invalidates it
+            assert await cached_service.get_stats(session) == stats_before
+            cached_service.invalidate()
+            assert await cached_service.get_stats(session) == stats_after
+
+            print(f"SUCCESS: dashboard stats {stats_after}")
+        finally:
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_dashboard_stats())
@@ -0,0 +1,118 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import event, delete
+from app.db.sql.session import AsyncSessionLocal, engine
+from app.db.sql.models.user import User
+from app.db.sql.models.interview import Interview
+from app.db.sql.models.interview_session import InterviewSession
+from app.db.sql.models.interview_session_section import InterviewSessionSection
+from app.db.sql.models.interview_session_question import InterviewSessionQuestion
+from app.db.sql.models.interview_response import InterviewResponse
+from app.db.sql.enums import UserRole, InterviewStatus
+from app.services.interview_session_sql_service import InterviewSessionSQLService
+
+# session + interview (with selectinload of sessions) + grouped sections query + template
+MAX_GET_SECTIONS_QUERIES = 5
+
+
+async def _seed(num_sections: int, questions_per_section: int):
+    async with AsyncSessionLocal() as session:
+        candidate = User(
+            username=f"test_sections_{uuid.uuid4().hex[:8]}",
+            email=f"test_sections_{uuid.uuid4().hex[:8]}@example.com",
+            role=UserRole.CANDIDATE,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        session.add(candidate)
+        await session.flush()
+
+        interview = Interview(
+            candidate_id=candidate.id,
+            scheduled_at=datetime.now(timezone.utc),
+            status=InterviewStatus.IN_PROGRESS,
+        )
+        session.add(interview)
+        await session.flush()
+
+        session_obj = InterviewSession(interview_id=interview.id, candidate_id=candidate.id, status="active")
+        session.add(session_obj)
+        await session.flush()
+
+        for i in range(num_sections):
+            section = InterviewSessionSection(
+                interview_session_id=session_obj.id,
+                section_type="technical",
+                order_index=i + 1,
+                duration_minutes=10,
+            )
+            session.add(section)
+            await session.flush()
+            for j in range(questions_per_section):
+                question = InterviewSessionQuestion(
+                    interview_session_id=session_obj.id,
+                    section_id=section.id,
+                    question_type="technical",
+                    custom_text=f"Question {i}.{j}",
+                    order=j + 1,
+                )
+                session.add(question)
+                await session.flush()
+                if j == 0:
+                    session.add(InterviewResponse(
+                        session_id=session_obj.id,
+                        question_id=question.id,
+                        answer_text="answer",
+                        answer_mode="text",
+                    ))
+
+        await session.commit()
+        return candidate.id, session_obj.id
+
+
+async def _count_get_sections_queries(session_id, candidate_id):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        async with AsyncSessionLocal() as session:
+            sections = await InterviewSessionSQLService.get_sections(session, session_id, candidate_id)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+    # COMMIT issued by UnitOfWork does not go through cursor execution
+    return sections, len(statements)
+
+
+async def verify_get_sections_query_count():
+    candidate_ids = []
+    try:
+        candidate_id, session_id = await _seed(num_sections=1, questions_per_section=2)
+        candidate_ids.append(candidate_id)
+        sections, small_count = await _count_get_sections_queries(session_id, candidate_id)
+        assert len(sections) == 1
+        assert sections[0]["total_questions"] == 2
+        assert sections[0]["completed_questions"] == 1
+
+        candidate_id, session_id = await _seed(num_sections=3, questions_per_section=4)
+        candidate_ids.append(candidate_id)
+        sections, large_count = await _count_get_sections_queries(session_id, candidate_id)
+        assert [s["total_questions"] for s in sections] == [4, 4, 4]
+        assert [s["completed_questions"] for s in sections] == [1, 1, 1]
+
+        print(f"get_sections queries: 1 section={small_count}, 3 sections={large_count}")
+        assert large_count == small_count, "get_sections query count grows with the number of sections"
+        assert large_count <= MAX_GET_SECTIONS_QUERIES, f"get_sections issued {large_count} queries"
+        print("SUCCESS: get_sections query count is constant")
+    finally:
+        async with AsyncSessionLocal() as session:
+            if candidate_ids:
+                await session.execute(delete(User).where(User.id.in_(candidate_ids)))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_get_sections_query_count())
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import text, insert
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.user import User
+from app.db.sql.models.interview import Interview
+from app.db.sql.models.interview_session import InterviewSession
+from app.db.sql.models.interview_session_section import InterviewSessionSection
+from app.db.sql.models.interview_session_question import InterviewSessionQuestion
+from app.db.sql.models.interview_response import InterviewResponse
+from app.db.sql.models.question import Question, CategoryEnum, DifficultyEnum, QuestionType
+from app.db.sql.enums import UserRole, InterviewStatus
+
+NUM_QUESTIONS = 2000
+NUM_SESSIONS = 20
+QUESTIONS_PER_SESSION = 10
+
+# Hot queries and the index each one must use
+HOT_QUERIES = [
+    (
+        "response lookup by (session_id, question_id)",
+        "SELECT id FROM interview_responses WHERE session_id = :session_id AND question_id = :question_id",
+        "uq_interview_responses_session_question",
+    ),
+    (
+        "responses of a session",
+        "SELECT question_id FROM interview_responses WHERE session_id = :session_id",
+        "uq_interview_responses_session_question",
+    ),
+    (
+        "sessions of an interview",
+        "SELECT id FROM interview_sessions WHERE interview_id = :interview_id",
+        "ix_interview_sessions_interview_id",
+    ),
+    (
+        "question bank filter",
+        "SELECT id FROM questions WHERE is_active = true AND difficulty = 'MEDIUM' "
+        "AND category = 'SQL' AND question_type = 'technical'",
+        "idx_questions_active_difficulty_category_type",
+    ),
+    (
+        "tag containment",
+        "SELECT id FROM questions WHERE tags @> CAST(:tag AS jsonb)",
+        "idx_questions_tags_gin",
+    ),
+]
+
+
+def _index_names(plan_node):
+    names = set()
+    if "Index Name" in plan_node:
+        names.add(plan_node["Index Name"])
+    for child in plan_node.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+async def _seed(session):
+    categories = list(CategoryEnum)
+    difficulties = list(DifficultyEnum)
+    await session.execute(insert(Question), [
+        {
+            "text": f"Bank question {i}",
+            "category": categories[i % len(categories)],
+            "difficulty": difficulties[i % len(difficulties)],
+            "question_type": QuestionType.TECHNICAL if i % 3 else QuestionType.BEHAVIORAL,
+            "tags": [f"tag{i % 200}", categories[i % len(categories)].value.lower()],
+            "is_active": i % 10 != 0,
+        }
+        for i in range(NUM_QUESTIONS)
+    ])
+
+    candidate = User(
+        username=f"test_index_{uuid.uuid4().hex[:8]}",
+        email=f"test_index_{uuid.uuid4().hex[:8]}@example.com",
+        role=UserRole.CANDIDATE,
+        hashed_password="mock_password",
+        is_active=True,
+    )
+    session.add(candidate)
+    await session.flush()
+
+    probe = None
+    for _ in range(NUM_SESSIONS):
+        interview = Interview(
+            candidate_id=candidate.id,
+            scheduled_at=datetime.now(timezone.utc),
+            status=InterviewStatus.IN_PROGRESS,
+        )
+        session.add(interview)
+        await session.flush()
+
+        session_obj = InterviewSession(interview_id=interview.id, candidate_id=candidate.id, status="active")
+        session.add(session_obj)
+        await session.flush()
+
+        section = InterviewSessionSection(
+            interview_session_id=session_obj.id,
+            section_type="technical",
+            order_index=1,
+            duration_minutes=10,
+        )
+        session.add(section)
+        await session.flush()
+
+        for j in range(QUESTIONS_PER_SESSION):
+            question = InterviewSessionQuestion(
+                interview_session_id=session_obj.id,
+                section_id=section.id,
+                question_type="technical",
+                custom_text=f"Question {j + 1}",
+                order=j + 1,
+            )
+            session.add(question)
+            await session.flush()
+            session.add(InterviewResponse(
+                session_id=session_obj.id,
+                question_id=question.id,
+                answer_text="answer",
+                answer_mode="text",
+            ))
+            probe = {
+                "session_id": session_obj.id,
+                "question_id": question.id,
+                "interview_id": interview.id,
+                "tag": json.dumps(["tag42"]),
+            }
+    await session.flush()
+    return probe
+
+
+async def verify_index_usage():
+    async with AsyncSessionLocal() as session:
+        try:
+            params = await _seed(session)
+            await session.execute(text("ANALYZE questions"))
+            await session.execute(text("ANALYZE interview_responses"))
+            await session.execute(text("ANALYZE interview_sessions"))
+            # Small seeded tables can still favour a seq scan; only index choice is under test
+            await session.execute(text("SET LOCAL enable_seqscan = off"))
+
+            for label, sql, expected_index in HOT_QUERIES:
+                bound = {k: v for k, v in params.items() if f":{k}" in sql}
+                result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), bound)
+                plan = result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                used = _index_names(plan[0]["Plan"])
+                print(f"{label}: {sorted(used) or 'no index'}")
+                assert expected_index in used, f"{label} does not use {expected_index} (plan uses {sorted(used)})"
+
+            print("SUCCESS: hot queries use their indexes")
+        finally:
+            # Nothing seeded here is kept
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_index_usage())
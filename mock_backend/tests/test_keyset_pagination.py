@@ -0,0 +1,124 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone, timedelta
+from sqlalchemy import delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.user import User, CandidateProfile
+from app.db.sql.models.interview import Interview
+from app.db.sql.enums import UserRole, InterviewStatus
+from app.db.sql.repositories.user_repository import UserRepository
+from app.db.sql.repositories.interview_repository import InterviewRepository
+from app.db.sql.pagination import InvalidCursorError
+
+NUM_CANDIDATES = 23
+PAGE_SIZE = 5
+
+
+async def _seed(tag: str):
+    base = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as session:
+        ids = []
+        for i in range(NUM_CANDIDATES):
+            user = User(
+                username=f"{tag}_{i:02d}",
+                email=f"{tag}_{i:02d}@example.com",
+                role=UserRole.CANDIDATE,
+                hashed_password="mock_password",
+                is_active=True,
+                # Pairs share a timestamp so the id tie-breaker is exercised
+                created_at=base - timedelta(minutes=i // 2),
+            )
+            user.candidate_profile = CandidateProfile(
+                first_name=f"First{tag}",
+                last_name=f"Last{i}",
+                # Repeated scores and some NULLs
+                match_score=None if i % 5 == 0 else float(i % 3) * 10,
+            )
+            session.add(user)
+            await session.flush()
+            session.add(Interview(
+                candidate_id=user.id,
+                scheduled_at=base,
+                status=InterviewStatus.SCHEDULED,
+                created_at=base - timedelta(minutes=i // 3),
+            ))
+            ids.append(user.id)
+        await session.commit()
+        return ids
+
+
+async def _walk(fetch):
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = await fetch(cursor)
+        seen.extend(page["data"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if not cursor:
+            return seen, pages
+
+
+async def verify_keyset_pagination():
+    tag = f"keyset_{uuid.uuid4().hex[:6]}"
+    user_ids = []
+    try:
+        user_ids = await _seed(tag)
+        async with AsyncSessionLocal() as session:
+            users = UserRepository(session)
+            for sort_by in ("created_at", "match_score", "username"):
+                for order in ("desc", "asc"):
+                    expected = await users.list_candidates_page(
+                        limit=NUM_CANDIDATES + 10, search=tag, sort_by=sort_by, order=order
+                    )
+                    assert expected["total"] == NUM_CANDIDATES and expected["next_cursor"] is None
+                    expected_ids = [u["id"] for u in expected["data"]]
+
+                    seen, pages = await _walk(lambda cursor: users.list_candidates_page(
+                        limit=PAGE_SIZE, cursor=cursor, search=tag, sort_by=sort_by, order=order, total_mode="none"
+                    ))
+                    assert [u["id"] for u in seen] == expected_ids, f"pages differ from one-shot listing ({sort_by} {order})"
+                    assert pages == -(-NUM_CANDIDATES // PAGE_SIZE)
+
+            # Search hits profile names through the subquery arm
+            by_last_name = await users.list_candidates_page(limit=50, search="Last1", total_mode="cached")
+            assert by_last_name["total"] >= 11  # Last1, Last10..Last19
+
+            # Sparse fieldsets: only the requested columns come back, never the parsed blobs
+            slim = await users.list_candidates_page(limit=3, search=tag, fields=("id", "username"))
+            assert all(set(row) == {"id", "username"} for row in slim["data"])
+            assert all("resume_json" not in row for row in expected["data"])
+
+            # A cursor only works with the sort it was issued for
+            first = await users.list_candidates_page(limit=PAGE_SIZE, search=tag, sort_by="username", order="asc")
+            try:
+                await users.list_candidates_page(limit=PAGE_SIZE, cursor=first["next_cursor"], search=tag, sort_by="created_at")
+                raise AssertionError("cursor accepted for a different sort")
+            except InvalidCursorError:
+                pass
+
+            interviews = InterviewRepository(session)
+            expected = await interviews.get_all_summary(limit=100, search=f"First{tag}")
+            assert expected["total"] == NUM_CANDIDATES
+            seen, _ = await _walk(lambda cursor: interviews.get_all_summary(
+                limit=PAGE_SIZE, search=f"First{tag}", cursor=cursor, total_mode="none"
+            ))
+            assert [r["interview_id"] for r in seen] == [r["interview_id"] for r in expected["data"]]
+
+            # An empty page has no cursor (the routers reject limit < 1 before it gets here)
+            for empty in (
+                await users.list_candidates_page(limit=0, search=tag),
+                await interviews.get_all_summary(limit=0, search=f"First{tag}"),
+            ):
+                assert empty["data"] == [] and empty["next_cursor"] is None
+
+        print("SUCCESS: keyset pages match the full ordered listing")
+    finally:
+        if user_ids:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(Interview).where(Interview.candidate_id.in_(user_ids)))
+                await session.execute(delete(User).where(User.id.in_(user_ids)))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_keyset_pagination())
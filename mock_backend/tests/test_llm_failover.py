@@ -0,0 +1,132 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from app.core.config import settings
+from app.services.azure_openai_service import AzureOpenAIService, _LLMEndpoint
+
+
+class _FakeCompletions:
+    """Stands in for AsyncAzureOpenAI.chat.completions: answers after `delay`, or raises."""
+
+    def __init__(self, name: str, delay: float = 0.0, error: Exception = None):
+        self.name, self.delay, self.error = name, delay, error
+        self.calls = 0
+
+    async def create(self, **request):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.name))])
+
+
+def _service(*fakes: _FakeCompletions) -> AzureOpenAIService:
+    service = AzureOpenAIService.__new__(AzureOpenAIService)
+    service.endpoints = [
+        _LLMEndpoint(f.name, client=None, async_client=SimpleNamespace(chat=SimpleNamespace(completions=f)))
+        for f in fakes
+    ]
+    service.client = None
+    service.async_client = service.endpoints[0].async_client
+    return service
+
+
+async def _ask(service: AzureOpenAIService) -> str:
+    return await service.chat_completion_json([{"role": "user", "content": "hi"}])
+
+
+async def verify_llm_failover():
+    saved = (
+        settings.LLM_ATTEMPT_TIMEOUT_SECONDS, settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+        settings.LLM_CIRCUIT_RESET_SECONDS, settings.LLM_HEDGE_ENABLED, settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+    )
+    try:
+        settings.LLM_ATTEMPT_TIMEOUT_SECONDS = 0.2
+        settings.LLM_CIRCUIT_FAILURE_THRESHOLD = 2
+        settings.LLM_CIRCUIT_RESET_SECONDS = 0.3
+        settings.LLM_HEDGE_ENABLED = False
+
+        # A hung endpoint times out per attempt, counts as a failure and fails over
+        hung, healthy = _FakeCompletions("hung", delay=60), _FakeCompletions("healthy")
+        service = _service(hung, healthy)
+        started = time.monotonic()
+        assert await _ask(service) == "healthy"
+        assert time.monotonic() - started < 1.0
+        assert service.endpoints[0].consecutive_failures == 1
+
+        # The healthier endpoint is now tried first
+        assert await _ask(service) == "healthy" and hung.calls == 1
+        # Second timeout (hung endpoint on its own) opens the circuit
+        solo = _service(hung)
+        solo.endpoints = service.endpoints[:1]
+        try:
+            await _ask(solo)
+        except TimeoutError:
+            pass
+        else:
+            raise AssertionError("expected the attempt to time out")
+        health = {h["endpoint"]: h for h in service.get_endpoint_health()}
+        assert health["hung"]["circuit"] == "open", health
+        calls = hung.calls
+        assert await _ask(service) == "healthy" and hung.calls == calls
+
+        # After the cool-down: half-open admits a single probe among concurrent requests
+        await asyncio.sleep(0.35)
+        assert service.get_endpoint_health()[0]["circuit"] == "half_open"
+        hung.delay = 0.1
+        results = await asyncio.gather(*[_ask(solo) for _ in range(5)], return_exceptions=True)
+        assert hung.calls == calls + 1, hung.calls
+        assert results.count("hung") == 1, results
+        assert all(isinstance(r, RuntimeError) and "circuit open" in str(r) for r in results if r != "hung"), results
+        # The probe succeeded: closed again
+        health = service.get_endpoint_health()[0]
+        assert health["circuit"] == "closed" and health["consecutive_failures"] == 0 and not health["probing"], health
+
+        # A failed probe re-opens the circuit
+        hung.error = RuntimeError("503")
+        for _ in range(2):
+            await asyncio.gather(_ask(solo), return_exceptions=True)
+        assert service.get_endpoint_health()[0]["circuit"] == "open"
+        await asyncio.sleep(0.35)
+        calls = hung.calls
+        await asyncio.gather(_ask(solo), return_exceptions=True)
+        assert hung.calls == calls + 1
+        assert service.get_endpoint_health()[0]["circuit"] == "open"
+
+        # Every circuit open: fail fast
+        both_down = _service(_FakeCompletions("a", error=RuntimeError("down")), _FakeCompletions("b", error=RuntimeError("down")))
+        for _ in range(2):
+            try:
+                await _ask(both_down)
+            except RuntimeError:
+                pass
+        try:
+            await _ask(both_down)
+        except RuntimeError as e:
+            assert "circuit open" in str(e)
+        else:
+            raise AssertionError("expected fail-fast with all circuits open")
+
+        # Hedging: a slow primary is raced by the backup after the hedge delay
+        settings.LLM_HEDGE_ENABLED = True
+        settings.LLM_HEDGE_MIN_DELAY_SECONDS = 0.05
+        slow, fast = _FakeCompletions("slow", delay=0.15), _FakeCompletions("fast", delay=0.01)
+        service = _service(slow, fast)
+        started = time.monotonic()
+        assert await _ask(service) == "fast"
+        assert time.monotonic() - started < 0.15 and slow.calls == 1 and fast.calls == 1
+        # The cancelled loser is not a failure
+        assert service.endpoints[0].consecutive_failures == 0
+        # A primary that answers before the hedge delay is not hedged
+        slow.delay = 0.0
+        assert await _ask(service) == "slow" and fast.calls == 1
+        print("SUCCESS: LLM endpoint failover, half-open probing and hedging")
+    finally:
+        (
+            settings.LLM_ATTEMPT_TIMEOUT_SECONDS, settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+            settings.LLM_CIRCUIT_RESET_SECONDS, settings.LLM_HEDGE_ENABLED, settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+        ) = saved
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_llm_failover())
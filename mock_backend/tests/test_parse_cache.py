@@ -0,0 +1,70 @@
+import asyncio
+import uuid
+from sqlalchemy import select, delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.parse_cache import ParseCacheEntry
+from app.services.parse_cache_service import ParseCacheService, normalized_text_hash
+
+
+async def verify_parse_cache():
+    cache = ParseCacheService(enabled=True)
+    kind = f"test-{uuid.uuid4().hex[:8]}"
+    jd_text = f"Senior Python engineer {uuid.uuid4().hex}\n\nFastAPI,   Postgres"
+    calls = []
+
+    async def parse(text):
+        calls.append(text)
+        await asyncio.sleep(0.05)
+        return {"text": text, "required_skills": ["python", "fastapi"]}
+
+    def fallback():
+        return {"text": jd_text, "required_skills": [], "fallback": True}
+
+    try:
+        # Concurrent parses of the same JD (differently spaced) share one LLM call
+        variants = [jd_text, jd_text.replace("\n\n", " "), "  " + jd_text]
+        results = await asyncio.gather(*[
+            cache.get_or_parse(kind, "v1", t, lambda t=t: parse(t), fallback) for t in variants
+        ])
+        assert len(calls) == 1, calls
+        assert [r["text"] for r in results] == variants
+        assert all(r["required_skills"] == ["python", "fastapi"] for r in results)
+
+        # Later candidates read the stored parse
+        again = await cache.get_or_parse(kind, "v1", jd_text, lambda: parse(jd_text), fallback)
+        assert len(calls) == 1 and again["required_skills"] == ["python", "fastapi"]
+        again["required_skills"].append("mutated")
+        assert "mutated" not in (await cache.get_or_parse(kind, "v1", jd_text, lambda: parse(jd_text), fallback))["required_skills"]
+
+        async with AsyncSessionLocal() as session:
+            entry = (await session.execute(
+                select(ParseCacheEntry).where(ParseCacheEntry.kind == kind, ParseCacheEntry.content_hash == normalized_text_hash(jd_text))
+            )).scalar_one()
+            assert entry.hit_count == 2 and entry.last_hit_at is not None
+
+        # A new parser version does not read old entries
+        await cache.get_or_parse(kind, "v2", jd_text, lambda: parse(jd_text), fallback)
+        assert len(calls) == 2
+
+        # Failed LLM parses fall back and are not stored
+        async def failing():
+            raise RuntimeError("LLM unavailable")
+        other = f"Data analyst {uuid.uuid4().hex}"
+        assert (await cache.get_or_parse(kind, "v1", other, failing, fallback))["fallback"] is True
+        assert (await cache.get_or_parse(kind, "v1", other, lambda: parse(other), fallback))["required_skills"] == ["python", "fastapi"]
+        assert len(calls) == 3
+
+        stats = cache.stats()["kinds"][kind]
+        assert stats == {"hits": 2, "misses": 4, "coalesced": 2, "uncached": 1, "hit_rate": 0.5}, stats
+        async with AsyncSessionLocal() as session:
+            stored = (await ParseCacheService.db_stats(session))[kind]
+        assert stored == {"entries": 3, "hits": 2}, stored
+        print(f"SUCCESS: parse cache {stats}")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(ParseCacheEntry).where(ParseCacheEntry.kind == kind))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_parse_cache())
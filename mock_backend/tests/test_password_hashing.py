@@ -0,0 +1,55 @@
+import asyncio
+import time
+from fastapi import HTTPException
+from passlib.context import CryptContext
+from app.core.security import PasswordHasher, pwd_context, verify_password
+
+
+async def verify_password_hashing():
+    hasher = PasswordHasher(workers=2, max_pending=4)
+    try:
+        # The event loop keeps ticking while hashes run on the pool
+        ticks = 0
+        done = False
+
+        async def heartbeat():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        beat = asyncio.create_task(heartbeat())
+        started = time.perf_counter()
+        hashes = await asyncio.gather(*[hasher.hash(f"password-{i}") for i in range(4)])
+        elapsed = time.perf_counter() - started
+        done = True
+        await beat
+        assert ticks >= int(elapsed / 0.01) // 2, f"event loop stalled: {ticks} ticks in {elapsed:.2f}s"
+        assert all(verify_password(f"password-{i}", h) for i, h in enumerate(hashes))
+
+        # Beyond max_pending callers are turned away instead of queueing without bound
+        results = await asyncio.gather(*[hasher.hash("x") for _ in range(6)], return_exceptions=True)
+        rejected = [r for r in results if isinstance(r, HTTPException)]
+        assert len(rejected) == 2 and rejected[0].status_code == 503
+
+        valid, new_hash = await hasher.verify_and_update("password-0", hashes[0])
+        assert valid and new_hash is None
+        assert await hasher.verify_and_update("wrong", hashes[0]) == (False, None)
+        assert await hasher.verify_and_update("password-0", None) == (False, None)
+
+        # A hash made with other Argon2 parameters is upgraded on a successful login
+        old_context = CryptContext(schemes=["argon2"], argon2__time_cost=1, argon2__memory_cost=8192, argon2__parallelism=1)
+        old_hash = old_context.hash("legacy")
+        valid, new_hash = await hasher.verify_and_update("legacy", old_hash)
+        assert valid and new_hash and new_hash != old_hash
+        assert not pwd_context.needs_update(new_hash) and verify_password("legacy", new_hash)
+
+        stats = hasher.stats()
+        assert stats["rejected"] == 2 and stats["rehashed"] == 1 and stats["queued"] == 0
+        print(f"SUCCESS: password hashing off the event loop {stats}")
+    finally:
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_password_hashing())
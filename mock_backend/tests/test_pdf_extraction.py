@@ -0,0 +1,115 @@
+import asyncio
+import os
+import tempfile
+from app.services.pdf_extraction import PdfExtractionError, PdfExtractionPool
+
+
+def _pdf(page_texts) -> bytes:
+    """Minimal PDF with one Helvetica text line per page."""
+    n = len(page_texts)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(n)) + b"] /Count %d >>" % n,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(page_texts):
+        content = b"BT /F1 12 Tf 72 712 Td (" + text.encode() + b") Tj ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+async def _expect_error(coro, fragment: str) -> None:
+    try:
+        await coro
+    except PdfExtractionError as e:
+        assert fragment in str(e), e
+    else:
+        raise AssertionError(f"expected PdfExtractionError ({fragment})")
+
+
+async def verify_pdf_extraction():
+    document = _pdf([f"Page {i} text" for i in range(1, 6)])
+    pool = PdfExtractionPool(workers=2, timeout_seconds=0.05, max_pages=3, max_bytes=len(document), memory_limit_mb=0)
+    try:
+        # Spawning the first worker takes longer than this timeout: that worker is replaced
+        await _expect_error(pool.extract_text(document), "timed out")
+        assert pool.timeouts == 1 and pool.restarts == 1
+
+        pool.timeout_seconds = 30
+        # Only the first max_pages pages are read, from bytes or a path, concurrently
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            f.write(document)
+        try:
+            from_bytes, from_path = await asyncio.gather(pool.extract_pages(document), pool.extract_pages(f.name))
+        finally:
+            os.remove(f.name)
+        assert [p.strip() for p in from_bytes] == ["Page 1 text", "Page 2 text", "Page 3 text"], from_bytes
+        assert from_path == from_bytes
+        assert await pool.extract_text(document) == "Page 1 text\n\nPage 2 text\n\nPage 3 text"
+
+        await _expect_error(pool.extract_text(document + b" "), "limit")
+        await _expect_error(pool.extract_text(b""), "empty")
+        await _expect_error(pool.extract_text(b"%PDF-1.4 not really a pdf"), "failed")
+        # A bad document does not take the pool down
+        assert (await pool.extract_pages(document))[0].strip() == "Page 1 text"
+        assert pool.restarts == 1
+    finally:
+        pool.shutdown()
+
+    # Time spent waiting for a busy worker does not count towards the timeout
+    pages = _pdf([f"Page {i} text with some words" for i in range(200)])
+    queued = PdfExtractionPool(workers=1, timeout_seconds=30, max_pages=200, max_bytes=len(pages), memory_limit_mb=0)
+    try:
+        await queued.extract_text(document)  # start the worker
+        queued.timeout_seconds = 0.9
+        results = await asyncio.gather(*[queued.extract_pages(pages) for _ in range(5)])
+        assert all(len(r) == 200 for r in results) and queued.timeouts == 0, queued.stats()
+    finally:
+        queued.shutdown()
+
+    # A hung document recycles only its own worker; the other worker's document completes
+    big = _pdf([f"Page {i} text with some words" for i in range(1000)])
+    isolated = PdfExtractionPool(workers=2, timeout_seconds=30, max_pages=1000, max_bytes=len(big), memory_limit_mb=0)
+    try:
+        await asyncio.gather(isolated.extract_text(document), isolated.extract_text(document))  # start both workers
+        isolated.timeout_seconds = 0.5
+        slow, fast = await asyncio.gather(isolated.extract_text(big), isolated.extract_pages(document), return_exceptions=True)
+        assert isinstance(slow, PdfExtractionError) and "timed out" in str(slow), slow
+        assert [p.strip() for p in fast][:1] == ["Page 1 text"], fast
+        assert isolated.timeouts == 1 and isolated.restarts == 1, isolated.stats()
+        assert (await isolated.extract_pages(document))[0].strip() == "Page 1 text"
+    finally:
+        isolated.shutdown()
+
+    # Workers over their memory cap fail the document instead of growing without bound
+    capped = PdfExtractionPool(workers=1, timeout_seconds=30, max_pages=3, max_bytes=len(document), memory_limit_mb=16)
+    try:
+        try:
+            await capped.extract_text(document)
+        except PdfExtractionError:
+            pass
+        else:
+            raise AssertionError("extraction succeeded under a 16 MB address-space limit")
+    finally:
+        capped.shutdown()
+
+    # Thread fallback
+    threaded = PdfExtractionPool(workers=0, timeout_seconds=30, max_pages=1, max_bytes=len(document), memory_limit_mb=0)
+    assert await threaded.extract_text(document) == "Page 1 text"
+    print(f"SUCCESS: PDF extraction pool {pool.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_pdf_extraction())
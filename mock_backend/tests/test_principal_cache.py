@@ -0,0 +1,95 @@
+import asyncio
+import uuid
+import httpx
+from sqlalchemy import delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.user import User, CandidateProfile
+from app.db.sql.enums import UserRole
+from app.db.sql.query_stats import track_queries
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.services.principal_cache import principal_cache
+
+
+async def _seed():
+    async with AsyncSessionLocal() as session:
+        admin = User(
+            username=f"test_principal_admin_{uuid.uuid4().hex[:8]}",
+            email=f"test_principal_admin_{uuid.uuid4().hex[:8]}@example.com",
+            role=UserRole.ADMIN,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        candidate = User(
+            username=f"test_principal_{uuid.uuid4().hex[:8]}",
+            email=f"test_principal_{uuid.uuid4().hex[:8]}@example.com",
+            role=UserRole.CANDIDATE,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        candidate.candidate_profile = CandidateProfile(first_name="Principal", last_name="Test")
+        session.add_all([admin, candidate])
+        await session.commit()
+        return admin.id, candidate.id
+
+
+async def verify_principal_cache():
+    user_ids = []
+    stats_headers = settings.SQL_QUERY_STATS_HEADERS
+    try:
+        settings.SQL_QUERY_STATS_HEADERS = True
+        admin_id, candidate_id = await _seed()
+        user_ids = [admin_id, candidate_id]
+        principal_cache.clear()
+
+        from app.main import app
+        admin_headers = {"Authorization": f"Bearer {create_access_token(subject=str(admin_id))}"}
+        candidate_headers = {"Authorization": f"Bearer {create_access_token(subject=str(candidate_id))}"}
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            # First request loads the principal in one query; repeats cost none
+            first = await client.get("/api/v1/auth/me", headers=candidate_headers)
+            again = await client.get("/api/v1/auth/me", headers=candidate_headers)
+            assert first.status_code == again.status_code == 200
+            assert first.json() == again.json() and first.json()["role"] == "candidate"
+            assert first.headers["X-DB-Query-Count"] == "1", first.headers["X-DB-Query-Count"]
+            assert again.headers["X-DB-Query-Count"] == "0", again.headers["X-DB-Query-Count"]
+
+            async with AsyncSessionLocal() as session:
+                with track_queries() as stats:
+                    principal = await principal_cache.authenticate(session, candidate_headers["Authorization"][7:])
+            assert stats.queries == 0 and principal.candidate_profile_id is not None
+
+            # Each token is its own entry
+            other_token = create_access_token(subject=str(candidate_id))
+            assert (await client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {other_token}"})).headers["X-DB-Query-Count"] == "1"
+
+            # Toggling login drops the candidate's entries
+            toggled = await client.post(f"/api/v1/auth/admin/candidates/{candidate_id}/toggle-login", headers=admin_headers)
+            assert toggled.status_code == 200 and toggled.json()["login_disabled"] is True
+            assert not [k for k in principal_cache._entries if k[0] == candidate_id]
+            async with AsyncSessionLocal() as session:
+                assert (await principal_cache.authenticate(session, other_token)).login_disabled is True
+
+            # A deleted candidate's cached token stops working immediately
+            deleted = await client.delete(f"/api/v1/auth/admin/candidates/{candidate_id}", headers=admin_headers)
+            assert deleted.status_code in (200, 204), deleted.text
+            user_ids.remove(candidate_id)
+            gone = await client.get("/api/v1/auth/me", headers=candidate_headers)
+            assert gone.status_code == 401, gone.status_code
+
+            # Tampered tokens never reach the cache
+            bad = await client.get("/api/v1/auth/me", headers={"Authorization": candidate_headers["Authorization"][:-2] + "xx"})
+            assert bad.status_code == 401
+
+        print(f"SUCCESS: principal cache {principal_cache.stats()}")
+    finally:
+        settings.SQL_QUERY_STATS_HEADERS = stats_headers
+        if user_ids:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(User).where(User.id.in_(user_ids)))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_principal_cache())
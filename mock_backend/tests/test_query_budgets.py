@@ -0,0 +1,137 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+import httpx
+from sqlalchemy import delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.user import User
+from app.db.sql.models.interview import Interview
+from app.db.sql.models.interview_session import InterviewSession
+from app.db.sql.models.interview_session_section import InterviewSessionSection
+from app.db.sql.models.interview_session_question import InterviewSessionQuestion
+from app.db.sql.enums import UserRole, InterviewStatus
+from app.db.sql.query_stats import ENDPOINT_QUERY_BUDGETS, QueryBudgetExceeded, query_budget
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.services.interview_session_sql_service import InterviewSessionSQLService
+from app.services.session_state_cache import session_state_cache
+
+# Header, session, interview (+ sessions), questions, answered ids, section
+MAX_COLD_NEXT_QUESTION_QUERIES = 7
+
+
+async def _seed(num_sections: int, questions_per_section: int):
+    async with AsyncSessionLocal() as session:
+        admin = User(
+            username=f"test_budget_admin_{uuid.uuid4().hex[:8]}",
+            email=f"test_budget_admin_{uuid.uuid4().hex[:8]}@example.com",
+            role=UserRole.ADMIN,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        candidate = User(
+            username=f"test_budget_{uuid.uuid4().hex[:8]}",
+            email=f"test_budget_{uuid.uuid4().hex[:8]}@example.com",
+            role=UserRole.CANDIDATE,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        session.add_all([admin, candidate])
+        await session.flush()
+
+        interview = Interview(
+            candidate_id=candidate.id,
+            scheduled_at=datetime.now(timezone.utc),
+            status=InterviewStatus.IN_PROGRESS,
+        )
+        session.add(interview)
+        await session.flush()
+
+        session_obj = InterviewSession(interview_id=interview.id, candidate_id=candidate.id, status="active")
+        session.add(session_obj)
+        await session.flush()
+
+        first_section_id = None
+        for i in range(num_sections):
+            section = InterviewSessionSection(
+                interview_session_id=session_obj.id,
+                section_type="technical",
+                order_index=i + 1,
+                duration_minutes=10,
+            )
+            session.add(section)
+            await session.flush()
+            first_section_id = first_section_id or section.id
+            for j in range(questions_per_section):
+                session.add(InterviewSessionQuestion(
+                    interview_session_id=session_obj.id,
+                    section_id=section.id,
+                    question_type="technical",
+                    custom_text=f"Question {i}.{j}",
+                    order=j + 1,
+                ))
+
+        await session.commit()
+        return admin.id, candidate.id, session_obj.id, first_section_id
+
+
+async def verify_query_budgets():
+    user_ids = []
+    stats_headers = settings.SQL_QUERY_STATS_HEADERS
+    try:
+        settings.SQL_QUERY_STATS_HEADERS = True
+        admin_id, candidate_id, session_id, section_id = await _seed(num_sections=3, questions_per_section=5)
+        user_ids = [admin_id, candidate_id]
+
+        async with AsyncSessionLocal() as session:
+            await InterviewSessionSQLService.start_section(session, session_id, section_id, candidate_id)
+
+        # Cold path (state not cached in this process): must not grow with the number of questions
+        session_state_cache.invalidate(session_id)
+        with query_budget(MAX_COLD_NEXT_QUESTION_QUERIES, "get_session_state (cold)") as stats:
+            async with AsyncSessionLocal() as session:
+                await InterviewSessionSQLService.get_session_state(session, session_id, candidate_id)
+        print(f"get_session_state cold: {stats.queries} queries, {stats.rows} rows, {stats.db_time_ms} ms")
+
+        # The helper itself fails a block that goes over budget
+        try:
+            with query_budget(1, "over budget"):
+                async with AsyncSessionLocal() as session:
+                    await session.get(User, admin_id)
+                    await session.get(User, candidate_id)
+            raise AssertionError("query_budget did not fail")
+        except QueryBudgetExceeded as e:
+            assert "issued 2 queries (budget 1)" in str(e)
+
+        # Whole requests, auth included, as reported by the middleware
+        from app.main import app
+        candidate_headers = {
+            "Authorization": f"Bearer {create_access_token(subject=str(candidate_id))}",
+            "X-Interview-Id": str(session_id),
+        }
+        admin_headers = {"Authorization": f"Bearer {create_access_token(subject=str(admin_id))}"}
+        requests = [
+            ("/api/v1/question/next", candidate_headers),
+            ("/api/v1/candidate/interview/sections", candidate_headers),
+            ("/api/v1/dashboard/stats", admin_headers),
+            ("/api/v1/auth/admin/candidates", admin_headers),
+        ]
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            for path, headers in requests:
+                response = await client.get(path, headers=headers)
+                assert response.status_code == 200, f"{path}: {response.text}"
+                queries = int(response.headers["X-DB-Query-Count"])
+                print(f"{path}: {queries} queries, {response.headers['X-DB-Rows']} rows, {response.headers['X-DB-Time-Ms']} ms")
+                assert 0 < queries <= ENDPOINT_QUERY_BUDGETS[path], f"{path} issued {queries} queries (budget {ENDPOINT_QUERY_BUDGETS[path]})"
+
+        print("SUCCESS: endpoints stay within their query budgets")
+    finally:
+        settings.SQL_QUERY_STATS_HEADERS = stats_headers
+        if user_ids:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(User).where(User.id.in_(user_ids)))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_query_budgets())
@@ -0,0 +1,88 @@
+import asyncio
+from sqlalchemy import event, insert, update
+from app.db.sql.session import AsyncSessionLocal, engine
+from app.db.sql.models.question import Question, QuestionBankVersion, CategoryEnum, DifficultyEnum, QuestionType
+from app.services.question_bank_index import QuestionBankIndex
+
+NUM_QUESTIONS = 300
+
+
+async def _bump_version(session):
+    # The trigger on questions does this in Postgres; explicit here so the test does not depend on it
+    await session.execute(update(QuestionBankVersion).values(version=QuestionBankVersion.version + 1))
+
+
+async def verify_question_bank_index():
+    index = QuestionBankIndex(check_interval_seconds=0)
+    async with AsyncSessionLocal() as session:
+        try:
+            await session.execute(insert(Question), [
+                {
+                    "text": f"Index question {i}",
+                    "category": CategoryEnum.SQL if i % 2 else CategoryEnum.PYTHON,
+                    "difficulty": DifficultyEnum.HARD if i % 3 == 0 else DifficultyEnum.EASY,
+                    "question_type": QuestionType.CODING if i % 10 == 0 else QuestionType.TECHNICAL,
+                    "tags": ["Index-Test-Tag", f"index-test-{i % 4}"],
+                    "is_active": i % 7 != 0,
+                }
+                for i in range(NUM_QUESTIONS)
+            ])
+            await _bump_version(session)
+            await session.flush()
+
+            assert await index.ensure_fresh(session)
+            loaded = index.stats()["questions"]
+            assert index.stats()["memory_bytes"] > 0
+
+            statements = []
+
+            def _record(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(engine.sync_engine, "before_cursor_execute", _record)
+            try:
+                picked = index.sample(
+                    10,
+                    weighted=True,
+                    difficulty=DifficultyEnum.HARD,
+                    tags=["index-test-1"],
+                    exclude_question_types=[QuestionType.CODING],
+                )
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", _record)
+            assert statements == [], "selection went to the database"
+            assert len(picked) == 10 and len({q.id for q in picked}) == 10
+            for q in picked:
+                i = int(q.text.rsplit(" ", 1)[1])
+                assert i % 3 == 0 and i % 4 == 1 and i % 10 != 0 and i % 7 != 0, q.text
+
+            # Tags are matched case-insensitively; categories OR tags widens the candidate set
+            tagged = index.candidates(tags=["index-test-tag"])
+            either = index.candidates(categories=[CategoryEnum.SQL], tags=["index-test-2"])
+            assert len(either) >= len(index.candidates(tags=["index-test-2"]))
+            excluded = {q.id for q in picked}
+            rest = index.sample(1000, tags=["index-test-tag"], exclude_ids=excluded)
+            assert len(rest) == len(tagged) - len(excluded) and not excluded & {q.id for q in rest}
+
+            # A bump of the change counter makes the next check reload
+            await session.execute(insert(Question), [{
+                "text": "Index question late",
+                "category": CategoryEnum.STATISTICS,
+                "difficulty": DifficultyEnum.MEDIUM,
+                "question_type": QuestionType.TECHNICAL,
+                "tags": ["index-test-late"],
+                "is_active": True,
+            }])
+            await _bump_version(session)
+            await session.flush()
+            assert await index.ensure_fresh(session)
+            assert index.stats()["questions"] == loaded + 1
+            assert [q.text for q in index.sample(5, tags=["index-test-late"])] == ["Index question late"]
+
+            print(f"SUCCESS: question bank index {index.stats()}")
+        finally:
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_question_bank_index())
@@ -0,0 +1,117 @@
+import asyncio
+import uuid
+from collections import Counter
+from sqlalchemy import select, delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.question_pool import PooledQuestion
+from app.db.sql.models.task_queue import QueuedTask
+from app.core.config import settings
+from app.services.azure_openai_service import azure_openai_service
+from app.services.question_generator_service import QuestionGeneratorService
+from app.services.question_pool_service import question_pool_service
+
+SKILLS = ["Python", "sql "]
+
+
+def _row(key: str, role: str, difficulty: str, n: int, exposure: int = 0) -> PooledQuestion:
+    return PooledQuestion(
+        pool_key=key,
+        role_name=role,
+        skills=question_pool_service.normalize_skills(SKILLS),
+        difficulty=difficulty,
+        payload={"prompt": f"{difficulty} question {n}", "difficulty": difficulty, "source": "llm_generated"},
+        exposure_count=exposure,
+    )
+
+
+async def _sample(role: str, counts: dict):
+    async with AsyncSessionLocal() as session:
+        questions = await question_pool_service.sample(
+            session, role, SKILLS, sum(counts.values()), difficulty_counts=counts
+        )
+        await session.commit()
+    return questions
+
+
+async def verify_question_pool():
+    role = f"pool-role-{uuid.uuid4().hex[:8]}"
+    key = question_pool_service.pool_key(role, SKILLS)
+    saved = (settings.QUESTION_POOL_MAX_EXPOSURE, settings.QUESTION_POOL_LOW_WATERMARK, settings.QUESTION_POOL_REFILL_BATCH)
+    generate, async_client = QuestionGeneratorService._generate_questions_with_llm, azure_openai_service.async_client
+    try:
+        settings.QUESTION_POOL_MAX_EXPOSURE = 3
+        settings.QUESTION_POOL_LOW_WATERMARK = 9  # 3 per difficulty
+        settings.QUESTION_POOL_REFILL_BATCH = 4
+        async with AsyncSessionLocal() as session:
+            session.add_all(
+                [_row(key, role, "easy", n) for n in range(6)]
+                + [_row(key, role, "medium", n) for n in range(6)]
+                + [_row(key, role, "hard", n) for n in range(2)]
+                # Retired: served QUESTION_POOL_MAX_EXPOSURE times already
+                + [_row(key, role, "hard", n, exposure=3) for n in range(2, 4)]
+            )
+            await session.commit()
+
+        # Exact per-difficulty counts, distinct pooled rows, fresh per-interview ids
+        first = await _sample(role, {"easy": 2, "medium": 2, "hard": 1})
+        assert Counter(q["difficulty"] for q in first) == {"easy": 2, "medium": 2, "hard": 1}, first
+        assert len({q["pool_question_id"] for q in first}) == 5 and len({q["question_id"] for q in first}) == 5
+        # Least-exposed first: the next draw does not repeat the easy questions just served
+        second = await _sample(role, {"easy": 4, "medium": 0, "hard": 0})
+        assert len(second) == 4 and not {q["pool_question_id"] for q in first} & {q["pool_question_id"] for q in second}
+
+        # A short pick does not keep the rows it locked for other difficulties: while its
+        # transaction stays open (the caller generates with the LLM), another scheduler gets them
+        async with AsyncSessionLocal() as holder:
+            short = await question_pool_service.sample(
+                holder, role, SKILLS, 9, difficulty_counts={"easy": 6, "medium": 0, "hard": 3}
+            )
+            assert short == []
+            easy = await _sample(role, {"easy": 6, "medium": 0, "hard": 0})
+            assert len(easy) == 6, easy
+            await holder.rollback()
+
+        # Retired questions are excluded: two servable hard questions, so three cannot be served
+        assert await _sample(role, {"easy": 0, "medium": 0, "hard": 3}) == []
+        hard = await _sample(role, {"easy": 0, "medium": 0, "hard": 2})
+        assert sorted(q["prompt"] for q in hard) == ["hard question 0", "hard question 1"], hard
+
+        # The short hard bucket scheduled a refill even though the pool as a whole is large
+        async with AsyncSessionLocal() as session:
+            refill_task = (await session.execute(
+                select(QueuedTask).where(QueuedTask.idempotency_key == f"question-pool-refill:{key}")
+            )).scalar_one()
+            available = await question_pool_service.available_counts(session, key)
+        assert refill_task.task_type == "refill_question_pool"
+        assert available["hard"] == 2 and question_pool_service.low_difficulties(available) == ["hard"], available
+
+        # The refill asks the LLM for the low difficulty only
+        asked = []
+
+        async def fake_generate(num_questions, skills, role_name=None, resume_data=None, jd_data=None, difficulty=None):
+            asked.append((difficulty, num_questions))
+            return [
+                {"prompt": f"refill {difficulty} {i}", "difficulty": difficulty, "source": "llm_generated"}
+                for i in range(num_questions)
+            ]
+
+        QuestionGeneratorService._generate_questions_with_llm = staticmethod(fake_generate)
+        azure_openai_service.async_client = object()
+        assert await question_pool_service.refill(role, SKILLS) == 4
+        assert asked == [("hard", 4)], asked
+        # Fresh stock is served: the hard request the pool could not satisfy now succeeds
+        refilled = await _sample(role, {"easy": 0, "medium": 0, "hard": 3})
+        assert len(refilled) == 3 and all(q["difficulty"] == "hard" for q in refilled), refilled
+        print(f"SUCCESS: question pool serves exact difficulty counts and refills per difficulty ({available})")
+    finally:
+        settings.QUESTION_POOL_MAX_EXPOSURE, settings.QUESTION_POOL_LOW_WATERMARK, settings.QUESTION_POOL_REFILL_BATCH = saved
+        QuestionGeneratorService._generate_questions_with_llm = staticmethod(generate)
+        azure_openai_service.async_client = async_client
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(QueuedTask).where(QueuedTask.idempotency_key == f"question-pool-refill:{key}"))
+            await session.execute(delete(PooledQuestion).where(PooledQuestion.pool_key == key))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_question_pool())
@@ -0,0 +1,74 @@
+import asyncio
+from sqlalchemy import event, insert
+from app.db.sql.session import AsyncSessionLocal, engine
+from app.db.sql.models.question import Question, CategoryEnum, DifficultyEnum, QuestionType
+from app.services.question_sampler import question_sampler
+
+NUM_QUESTIONS = 500
+
+
+async def _seed(session):
+    await session.execute(insert(Question), [
+        {
+            "text": f"Sampler question {i}",
+            "category": CategoryEnum.SQL if i % 2 else CategoryEnum.PYTHON,
+            "difficulty": DifficultyEnum.HARD if i % 5 == 0 else DifficultyEnum.EASY,
+            "question_type": QuestionType.TECHNICAL,
+            "tags": [],
+            "is_active": True,
+        }
+        for i in range(NUM_QUESTIONS)
+    ])
+    await session.flush()
+
+
+async def verify_question_sampler():
+    async with AsyncSessionLocal() as session:
+        try:
+            await _seed(session)
+            marker = Question.text.like("Sampler question %")
+            hard_sql = [
+                marker,
+                Question.is_active == True,
+                Question.difficulty == DifficultyEnum.HARD,
+                Question.category == CategoryEnum.SQL,
+            ]
+
+            statements = []
+
+            def _record(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(engine.sync_engine, "before_cursor_execute", _record)
+            try:
+                picked = await question_sampler.sample(session, 10, filters=hard_sql)
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+            # i % 5 == 0 and odd i: 50 matching rows
+            assert len(picked) == 10
+            assert len({q.id for q in picked}) == 10, "sample returned a question twice"
+            assert all(q.difficulty == DifficultyEnum.HARD and q.category == CategoryEnum.SQL for q in picked)
+            # One seek per draw (plus at most one wrap-around each), never a full load
+            assert len(statements) <= 20, f"sampling issued {len(statements)} queries"
+            assert all("random()" not in s.lower() for s in statements)
+
+            # Exclusions are honoured and the sample is cut short when the filter runs out
+            excluded = {q.id for q in picked}
+            rest = await question_sampler.sample(session, 100, filters=hard_sql, exclude_ids=excluded)
+            assert len(rest) == 40
+            assert not excluded & {q.id for q in rest}
+
+            # Draws are spread over the filtered set, not a fixed run of keys
+            seen = set()
+            for _ in range(20):
+                seen |= {q.id for q in await question_sampler.sample(session, 3, filters=hard_sql)}
+            assert len(seen) > 10, f"only {len(seen)} distinct questions over 20 samples"
+
+            print(f"SUCCESS: sampled without a full scan ({len(statements)} queries for 10 questions)")
+        finally:
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_question_sampler())
@@ -0,0 +1,172 @@
+import asyncio
+import uuid
+from sqlalchemy import select, update, delete, func, or_
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.user import User, CandidateProfile
+from app.db.sql.models.task_queue import QueuedTask
+from app.db.sql.models.reparse_job import ReparseJob
+from app.db.sql.enums import UserRole
+from app.core.config import settings
+from app.schemas.auth import ReparseJobRequest
+from app.services.reparse_job_service import ReparseJobService
+from app.services.resume_tasks import candidate_parse_fingerprint
+
+
+async def _seed(role_name: str):
+    """Five candidates: two parsed with the current parsers, one stale, one failed (fingerprint
+    current, as a failure used to leave it), one never extracted."""
+    async with AsyncSessionLocal() as session:
+        ids = []
+        for i in range(5):
+            user = User(
+                username=f"test_reparse_{uuid.uuid4().hex[:8]}",
+                email=f"test_reparse_{uuid.uuid4().hex[:8]}@example.com",
+                role=UserRole.CANDIDATE,
+                hashed_password="mock_password",
+                is_active=True,
+            )
+            resume_text = None if i == 4 else f"Resume {i} Python"
+            jd = "Backend engineer JD"
+            user.candidate_profile = CandidateProfile(
+                first_name="Reparse",
+                role_name=role_name,
+                resume_text=resume_text,
+                job_description=jd,
+                parse_status="failed" if i == 3 else "success",
+                parse_fingerprint=(
+                    candidate_parse_fingerprint(resume_text, jd) if i in (0, 1, 3)
+                    else "stale" if i == 2 else None
+                ),
+            )
+            session.add(user)
+            await session.flush()
+            ids.append(user.id)
+        await session.commit()
+        return ids
+
+
+async def _drain(job_id: uuid.UUID, max_pages: int = 20):
+    for _ in range(max_pages):
+        async with AsyncSessionLocal() as session:
+            job = await session.get(ReparseJob, job_id)
+        if job.status not in ("queued", "running"):
+            return job
+        await ReparseJobService.run_page(job_id, job.run, job.checkpoint_user_id)
+    raise AssertionError("reparse job did not finish")
+
+
+async def verify_reparse_jobs():
+    role_name = f"reparse-role-{uuid.uuid4().hex[:8]}"
+    page_size, max_active = settings.REPARSE_JOB_PAGE_SIZE, settings.REPARSE_MAX_ACTIVE_PARSES
+    user_ids, job_ids = [], []
+    try:
+        user_ids = await _seed(role_name)
+        settings.REPARSE_JOB_PAGE_SIZE = 2
+        settings.REPARSE_MAX_ACTIVE_PARSES = 10_000
+
+        async with AsyncSessionLocal() as session:
+            job = await ReparseJobService.create_job(session, ReparseJobRequest(role_name=role_name), None)
+        job_ids.append(job.id)
+        assert job.total == 5
+        job = await _drain(job.id)
+        assert job.status == "completed"
+        # Unchanged fingerprints are skipped; stale, failed and unextracted ones are queued
+        assert (job.processed, job.skipped, job.enqueued, job.already_queued) == (5, 2, 3, 0), job.__dict__
+
+        async with AsyncSessionLocal() as session:
+            progress = await ReparseJobService.get_progress(session, job.id)
+            statuses = dict((await session.execute(
+                select(CandidateProfile.user_id, CandidateProfile.parse_status).where(CandidateProfile.user_id.in_(user_ids))
+            )).all())
+        assert progress["parses_remaining"] == 3
+        assert [statuses[i] for i in user_ids] == ["success", "success", "pending", "pending", "pending"]
+
+        # Filters narrow the job
+        async with AsyncSessionLocal() as session:
+            success_only = await ReparseJobService.create_job(session, ReparseJobRequest(role_name=role_name, parse_status=["success"]), None)
+        job_ids.append(success_only.id)
+        assert success_only.total == 2
+
+        # A failed candidate is not skipped even though its fingerprint matches
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(CandidateProfile).where(CandidateProfile.user_id == user_ids[3]).values(parse_status="failed")
+            )
+            await session.commit()
+            failed_only = await ReparseJobService.create_job(session, ReparseJobRequest(role_name=role_name, parse_status=["failed"]), None)
+        job_ids.append(failed_only.id)
+        failed_only = await _drain(failed_only.id)
+        # Its parse from the first job is still queued
+        assert (failed_only.total, failed_only.skipped, failed_only.already_queued) == (1, 0, 1), failed_only.__dict__
+
+        # Forced job: cancel after the first page, then resume from the checkpoint
+        async with AsyncSessionLocal() as session:
+            forced = await ReparseJobService.create_job(session, ReparseJobRequest(role_name=role_name, force=True), None)
+        job_ids.append(forced.id)
+        await ReparseJobService.run_page(forced.id, 1, None)
+        # The same page task delivered twice: the second copy is a no-op, so the chain does not fork
+        await ReparseJobService.run_page(forced.id, 1, None)
+        async with AsyncSessionLocal() as session:
+            next_pages = (await session.execute(
+                select(func.count(QueuedTask.id)).where(
+                    QueuedTask.task_type == "reparse_candidates",
+                    QueuedTask.payload["job_id"].as_string() == str(forced.id),
+                )
+            )).scalar_one()
+        assert next_pages == 2, next_pages  # the first page task and one successor
+        async with AsyncSessionLocal() as session:
+            cancelled = await ReparseJobService.cancel(session, forced.id)
+        assert cancelled.status == "cancelled" and cancelled.processed == 2
+        await ReparseJobService.run_page(forced.id, 1, cancelled.checkpoint_user_id)  # leftover page task of the cancelled run
+        async with AsyncSessionLocal() as session:
+            resumed = await ReparseJobService.resume(session, forced.id)
+        assert resumed.run == 2
+        await ReparseJobService.run_page(forced.id, 1, resumed.checkpoint_user_id)  # stale run: no-op
+        async with AsyncSessionLocal() as session:
+            assert (await session.get(ReparseJob, forced.id)).processed == 2
+        forced = await _drain(forced.id)
+        assert forced.status == "completed" and forced.processed == 5 and forced.skipped == 0
+        # Job 1's parses are still queued, so only the two skipped candidates were added
+        assert forced.enqueued == 2 and forced.already_queued == 3, forced.__dict__
+
+        # Backpressure: no page is taken while the parse queue is full
+        async with AsyncSessionLocal() as session:
+            active = (await session.execute(
+                select(func.count(QueuedTask.id)).where(
+                    QueuedTask.task_type == "parse_candidate_resume",
+                    QueuedTask.status.in_(("queued", "running")),
+                )
+            )).scalar_one()
+            waiting = await ReparseJobService.create_job(session, ReparseJobRequest(role_name=role_name, force=True), None)
+        job_ids.append(waiting.id)
+        settings.REPARSE_MAX_ACTIVE_PARSES = active
+        await ReparseJobService.run_page(waiting.id, 1, None)
+        async with AsyncSessionLocal() as session:
+            waiting = await session.get(ReparseJob, waiting.id)
+            page_tasks = (await session.execute(
+                select(func.count(QueuedTask.id)).where(
+                    QueuedTask.task_type == "reparse_candidates",
+                    QueuedTask.payload["job_id"].as_string() == str(waiting.id),
+                )
+            )).scalar_one()
+        # The first page task plus its delayed retry
+        assert waiting.status == "running" and waiting.processed == 0 and page_tasks == 2, (waiting.status, waiting.processed, page_tasks)
+
+        print(f"SUCCESS: reparse jobs (skipped {job.skipped}, enqueued {job.enqueued}; resumed job finished from checkpoint)")
+    finally:
+        settings.REPARSE_JOB_PAGE_SIZE, settings.REPARSE_MAX_ACTIVE_PARSES = page_size, max_active
+        async with AsyncSessionLocal() as session:
+            if job_ids:
+                keys = [str(j) for j in job_ids]
+                await session.execute(delete(QueuedTask).where(or_(
+                    QueuedTask.payload["job_id"].as_string().in_(keys),
+                    QueuedTask.payload["reparse_job_id"].as_string().in_(keys),
+                )))
+                await session.execute(delete(ReparseJob).where(ReparseJob.id.in_(job_ids)))
+            if user_ids:
+                await session.execute(delete(User).where(User.id.in_(user_ids)))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_reparse_jobs())
@@ -0,0 +1,137 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import patch
+from sqlalchemy import event, delete, update
+from app.db.sql.session import AsyncSessionLocal, engine
+from app.db.sql.models.user import User
+from app.db.sql.models.interview import Interview
+from app.db.sql.models.interview_session import InterviewSession
+from app.db.sql.models.interview_session_section import InterviewSessionSection
+from app.db.sql.models.interview_session_question import InterviewSessionQuestion
+from app.db.sql.enums import UserRole, InterviewStatus
+from app.services.interview_session_sql_service import InterviewSessionSQLService
+from app.services.session_state_cache import session_state_cache
+
+
+async def _seed(num_questions: int):
+    async with AsyncSessionLocal() as session:
+        candidate = User(
+            username=f"test_state_{uuid.uuid4().hex[:8]}",
+            email=f"test_state_{uuid.uuid4().hex[:8]}@example.com",
+            role=UserRole.CANDIDATE,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        session.add(candidate)
+        await session.flush()
+
+        interview = Interview(
+            candidate_id=candidate.id,
+            scheduled_at=datetime.now(timezone.utc),
+            status=InterviewStatus.IN_PROGRESS,
+        )
+        session.add(interview)
+        await session.flush()
+
+        session_obj = InterviewSession(interview_id=interview.id, candidate_id=candidate.id, status="active")
+        session.add(session_obj)
+        await session.flush()
+
+        section = InterviewSessionSection(
+            interview_session_id=session_obj.id,
+            section_type="technical",
+            order_index=1,
+            duration_minutes=10,
+        )
+        session.add(section)
+        await session.flush()
+        for j in range(num_questions):
+            session.add(InterviewSessionQuestion(
+                interview_session_id=session_obj.id,
+                section_id=section.id,
+                question_type="technical",
+                custom_text=f"Question {j + 1}",
+                order=j + 1,
+            ))
+
+        await session.commit()
+        return candidate.id, session_obj.id, section.id
+
+
+async def _next_question(session_id, candidate_id):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        async with AsyncSessionLocal() as session:
+            state = await InterviewSessionSQLService.get_session_state(session, session_id, candidate_id)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+    return state, len(statements)
+
+
+async def verify_session_state_cache():
+    candidate_id = None
+    try:
+        candidate_id, session_id, section_id = await _seed(num_questions=3)
+
+        async with AsyncSessionLocal() as session:
+            await InterviewSessionSQLService.start_section(session, session_id, section_id, candidate_id)
+
+        # Cold call rebuilds the state; the repeat poll is a cache hit with one small read
+        first, cold_queries = await _next_question(session_id, candidate_id)
+        again, warm_queries = await _next_question(session_id, candidate_id)
+        print(f"/question/next queries: cold={cold_queries}, warm={warm_queries}")
+        assert first == again
+        assert first["question_text"] == "Question 1" and first["question_number"] == 1
+        assert warm_queries == 1, f"cached path issued {warm_queries} queries"
+
+        # submit_answer updates the cached entry in place
+        with patch("app.services.answer_evaluation_service.DEV_MODE", True):
+            async with AsyncSessionLocal() as session:
+                await InterviewSessionSQLService.submit_answer(
+                    session, session_id, candidate_id,
+                    {"answer_type": "TEXT", "answer_payload": "my answer"},
+                )
+        async with AsyncSessionLocal() as session:
+            session_row = await session.get(InterviewSession, session_id)
+            # Running aggregates are folded in as the answer is stored
+            assert session_row.score_count == 1 and session_row.score_sum == 7
+            assert session_row.feedback_sketch["strengths"] == {"Clear explanation": 1}
+
+        second, queries = await _next_question(session_id, candidate_id)
+        assert second["question_text"] == "Question 2" and second["question_number"] == 2
+        assert queries == 1, f"post-submit path issued {queries} queries"
+
+        # A write this process did not see (another worker) is detected by state_version
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(InterviewSessionQuestion)
+                .where(InterviewSessionQuestion.custom_text == "Question 2",
+                       InterviewSessionQuestion.section_id == section_id)
+                .values(custom_text="Question 2 (edited)")
+            )
+            await InterviewSessionSQLService._bump_state_version(session, session_id)
+            await session.commit()
+        edited, queries = await _next_question(session_id, candidate_id)
+        assert edited["question_text"] == "Question 2 (edited)"
+        assert queries > 1
+
+        async with AsyncSessionLocal() as session:
+            await InterviewSessionSQLService.complete_current_section(session, session_id, candidate_id)
+        assert session_id not in session_state_cache._entries
+
+        print(f"SUCCESS: session state cache {session_state_cache.stats()}")
+    finally:
+        if candidate_id:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(User).where(User.id == candidate_id))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_session_state_cache())
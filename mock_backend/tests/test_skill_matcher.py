@@ -0,0 +1,39 @@
+from app.db.sql.models.question import CategoryEnum
+from app.services.skill_matcher import SkillMatcher, DEFAULT_SKILL_SYNONYMS, skill_matcher
+from app.services.match_score_service import calculate_match_score
+
+
+def verify_skill_matcher():
+    text = "Built REST APIs with Node.js and Python/Django, maintained a Postgres DB. Interested in AI."
+    assert skill_matcher.find(text) == [
+        "rest api", "node.js", "python", "django", "postgresql", "database", "artificial intelligence",
+    ]
+
+    # Whole-token matching: no hits inside "maintain", "html", "digital", "feedback"
+    assert skill_matcher.find("maintain html digital feedback") == []
+
+    # Longest alias wins: "deep learning" is not also reported as a bare token match
+    categories, tags = skill_matcher.categorize(["Deep Learning", "SQL", "Rust"])
+    assert categories == [CategoryEnum.MACHINE_LEARNING, CategoryEnum.SQL]
+    assert tags == ["deep learning", "sql", "rust"]
+
+    # No cap on the number of skills turned into tags
+    many = [f"skill{i}" for i in range(50)]
+    assert len(skill_matcher.categorize(many)[1]) == 50
+
+    # Extra synonyms extend the table
+    custom = SkillMatcher({**DEFAULT_SKILL_SYNONYMS, "spark": {"aliases": ["pyspark", "apache spark"], "category": "PYTHON"}})
+    assert custom.categorize(["Apache Spark"]) == ([CategoryEnum.PYTHON], ["spark", "apache spark"])
+
+    # Aliases compare equal in the match score
+    score = calculate_match_score(
+        {"skills": ["Postgres", "ML"], "experience_years": 3},
+        {"required_skills": ["PostgreSQL", "machine learning"], "min_years_experience": 2},
+    )
+    assert score >= 85.0, score
+
+    print("SUCCESS: skill matcher")
+
+
+if __name__ == "__main__":
+    verify_skill_matcher()
@@ -0,0 +1,106 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone, timedelta
+from sqlalchemy import select, delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.user import User, CandidateProfile
+from app.db.sql.models.interview import Interview
+from app.db.sql.models.interview_session_section import InterviewSessionSection
+from app.db.sql.models.interview_session_question import InterviewSessionQuestion
+from app.db.sql.models.question import Question, CategoryEnum, DifficultyEnum, QuestionType
+from app.db.sql.enums import UserRole, InterviewStatus
+from app.db.sql.query_stats import query_budget
+from app.services.interview_sql_service import InterviewSQLService
+
+# Interview (+ sessions), candidate (+ admin/candidate profiles), flush (interview update +
+# session insert), existing bank ids, sections insert, questions insert
+MAX_START_INTERVIEW_QUERIES = 10
+
+
+async def _seed(num_questions: int):
+    async with AsyncSessionLocal() as session:
+        candidate = User(
+            username=f"test_bulk_{uuid.uuid4().hex[:8]}",
+            email=f"test_bulk_{uuid.uuid4().hex[:8]}@example.com",
+            role=UserRole.CANDIDATE,
+            hashed_password="mock_password",
+            is_active=True,
+        )
+        candidate.candidate_profile = CandidateProfile(face_verified=True, voice_verified=True)
+        session.add(candidate)
+        bank_question = Question(
+            text="Bulk start bank question",
+            category=CategoryEnum.PYTHON,
+            difficulty=DifficultyEnum.EASY,
+            question_type=QuestionType.TECHNICAL,
+            tags=[],
+        )
+        session.add(bank_question)
+        await session.flush()
+
+        curated = [{"question_id": str(bank_question.id), "question_type": "technical"}]
+        curated += [{"question_id": str(uuid.uuid4()), "prompt": f"Generated {i}", "question_type": "static"} for i in range(num_questions)]
+        curated += [{"prompt": "Skipped", "question_type": "conversational"}]
+
+        interview = Interview(
+            candidate_id=candidate.id,
+            scheduled_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+            status=InterviewStatus.SCHEDULED,
+            curated_questions={"questions": curated},
+        )
+        session.add(interview)
+        await session.commit()
+        return candidate.id, interview.id, bank_question.id
+
+
+async def verify_start_interview_bulk():
+    candidate_ids, question_ids = [], []
+    try:
+        counts = []
+        for num_questions in (2, 20):
+            candidate_id, interview_id, bank_question_id = await _seed(num_questions)
+            candidate_ids.append(candidate_id)
+            question_ids.append(bank_question_id)
+
+            with query_budget(MAX_START_INTERVIEW_QUERIES, "start_interview") as stats:
+                async with AsyncSessionLocal() as session:
+                    result = await InterviewSQLService.start_interview(session, interview_id, candidate_id)
+            counts.append(stats.queries)
+
+            session_id = uuid.UUID(result["session_id"])
+            async with AsyncSessionLocal() as session:
+                sections = (await session.execute(
+                    select(InterviewSessionSection)
+                    .where(InterviewSessionSection.interview_session_id == session_id)
+                    .order_by(InterviewSessionSection.order_index)
+                )).scalars().all()
+                questions = (await session.execute(
+                    select(InterviewSessionQuestion)
+                    .where(InterviewSessionQuestion.interview_session_id == session_id)
+                    .order_by(InterviewSessionQuestion.order)
+                )).scalars().all()
+
+            assert [s.section_type for s in sections] == ["technical", "coding", "conversational"]
+            assert all(s.status == "pending" for s in sections)
+            assert len(questions) == num_questions + 1
+            assert [q.order for q in questions] == list(range(1, num_questions + 2))
+            assert all(q.section_id == sections[0].id and q.question_type == "technical" for q in questions)
+            # Existing bank question is linked; unknown ids fall back to their prompt text
+            assert questions[0].question_id == bank_question_id and questions[0].custom_text is None
+            assert questions[1].question_id is None and questions[1].custom_text == "Generated 0"
+
+        print(f"start_interview queries: 3 questions={counts[0]}, 21 questions={counts[1]}")
+        assert counts[0] == counts[1], "start_interview query count grows with the number of questions"
+        print("SUCCESS: start_interview materializes the session in constant statements")
+    finally:
+        async with AsyncSessionLocal() as session:
+            if candidate_ids:
+                await session.execute(delete(Interview).where(Interview.candidate_id.in_(candidate_ids)))
+                await session.execute(delete(User).where(User.id.in_(candidate_ids)))
+            if question_ids:
+                await session.execute(delete(Question).where(Question.id.in_(question_ids)))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_start_interview_bulk())
@@ -0,0 +1,202 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone, timedelta
+from sqlalchemy import select, update, delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.task_queue import QueuedTask
+from app.core.config import settings
+from app.services.task_queue_service import (
+    TaskWorker, task_handler, task_queue_service, current_task_attempt, is_transient_error, _registry,
+)
+
+
+async def _tasks(task_type: str):
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(
+            select(QueuedTask).where(QueuedTask.task_type == task_type).order_by(QueuedTask.created_at)
+        )).scalars().all()
+
+
+async def _run_claimed(*workers: TaskWorker) -> None:
+    for worker in workers:
+        if worker._tasks:
+            await asyncio.gather(*list(worker._tasks))
+
+
+async def _make_ready(task_type: str) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(QueuedTask).where(QueuedTask.task_type == task_type, QueuedTask.status == "queued")
+            .values(run_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        await session.commit()
+
+
+async def _backdate_lock(task_type: str, seconds: float) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(QueuedTask).where(QueuedTask.task_type == task_type, QueuedTask.status == "running")
+            .values(locked_at=datetime.now(timezone.utc) - timedelta(seconds=seconds))
+        )
+        await session.commit()
+
+
+async def verify_task_queue():
+    suffix = uuid.uuid4().hex[:8]
+    ok_type, flaky_type, broken_type = f"test_ok_{suffix}", f"test_flaky_{suffix}", f"test_broken_{suffix}"
+    slow_type = f"test_slow_{suffix}"
+    all_types = (ok_type, flaky_type, broken_type, slow_type)
+    seen = []
+    releases = {}
+
+    @task_handler(ok_type, concurrency=10)
+    async def ok_handler(payload):
+        seen.append(payload["n"])
+        await asyncio.sleep(0.01)
+
+    @task_handler(flaky_type, concurrency=1)
+    async def flaky_handler(payload):
+        attempt = current_task_attempt()
+        seen.append((attempt.number, attempt.max_attempts, attempt.is_final))
+        if attempt.number == 1:
+            raise ConnectionError("LLM endpoint reset the connection")
+
+    @task_handler(broken_type, concurrency=1)
+    async def broken_handler(payload):
+        raise ValueError("bad payload")
+
+    @task_handler(slow_type, concurrency=2)
+    async def slow_handler(payload):
+        attempt = current_task_attempt().number
+        await releases.setdefault(attempt, asyncio.Event()).wait()
+        if attempt == 1:
+            raise ConnectionError("the reaped run fails late")
+
+    visibility_timeout = settings.TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS
+    try:
+        # Idempotency keys dedupe while a task is queued or running
+        async with AsyncSessionLocal() as session:
+            first = await task_queue_service.enqueue(session, ok_type, {"n": 0}, idempotency_key=f"key-{suffix}")
+            again = await task_queue_service.enqueue(session, ok_type, {"n": 0}, idempotency_key=f"key-{suffix}")
+            added = await task_queue_service.enqueue_many(
+                session, ok_type, [({"n": n}, f"key-{suffix}" if n == 1 else None) for n in range(1, 6)]
+            )
+            await session.commit()
+        assert first is not None and again is None and added == 4
+
+        # Two workers claim concurrently: every task runs exactly once
+        a, b = TaskWorker("test-a", [ok_type]), TaskWorker("test-b", [ok_type])
+        claimed = await asyncio.gather(a._claim_and_start(ok_type), b._claim_and_start(ok_type))
+        await _run_claimed(a, b)
+        assert sum(claimed) == 5 and sorted(seen) == [0, 2, 3, 4, 5], (claimed, seen)
+        tasks = await _tasks(ok_type)
+        assert {t.status for t in tasks} == {"succeeded"} and all(t.attempts == 1 and t.locked_by is None for t in tasks)
+        # Once the keyed task finished, the key can be enqueued again
+        async with AsyncSessionLocal() as session:
+            assert await task_queue_service.enqueue(session, ok_type, {"n": 6}, idempotency_key=f"key-{suffix}") is not None
+            await session.commit()
+
+        # A failed attempt is requeued with backoff; the handler sees its attempt number
+        seen.clear()
+        worker = TaskWorker("test-c", [flaky_type, broken_type])
+        await task_queue_service.enqueue_now(flaky_type, {}, max_attempts=3)
+        assert await worker._claim_and_start(flaky_type) == 1
+        await _run_claimed(worker)
+        (task,) = await _tasks(flaky_type)
+        assert task.status == "queued" and task.attempts == 1 and "ConnectionError" in task.last_error
+        run_at = task.run_at if task.run_at.tzinfo else task.run_at.replace(tzinfo=timezone.utc)
+        assert run_at > datetime.now(timezone.utc) + timedelta(seconds=settings.TASK_QUEUE_BACKOFF_BASE_SECONDS * 0.5)
+        # Not claimable until the backoff has passed
+        assert await worker._claim_and_start(flaky_type) == 0
+        await _make_ready(flaky_type)
+        assert await worker._claim_and_start(flaky_type) == 1
+        await _run_claimed(worker)
+        (task,) = await _tasks(flaky_type)
+        assert task.status == "succeeded" and task.attempts == 2
+        assert seen == [(1, 3, False), (2, 3, False)], seen
+
+        # Attempts exhausted: dead
+        await task_queue_service.enqueue_now(broken_type, {}, max_attempts=2)
+        for _ in range(2):
+            await _make_ready(broken_type)
+            assert await worker._claim_and_start(broken_type) == 1
+            await _run_claimed(worker)
+        (task,) = await _tasks(broken_type)
+        assert task.status == "dead" and task.attempts == 2 and "ValueError" in task.last_error
+
+        # A task whose worker died mid-run is requeued after the visibility timeout
+        async with AsyncSessionLocal() as session:
+            stale_id = uuid.uuid4()
+            session.add(QueuedTask(
+                id=stale_id, task_type=ok_type, payload={"n": 7}, status="running", attempts=1, max_attempts=5,
+                run_at=datetime.now(timezone.utc), locked_by="dead-worker",
+                locked_at=datetime.now(timezone.utc) - timedelta(seconds=settings.TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS + 60),
+            ))
+            await session.commit()
+        await worker._requeue_stale()
+        async with AsyncSessionLocal() as session:
+            stale = await session.get(QueuedTask, stale_id)
+        assert stale.status == "queued" and stale.locked_by is None
+
+        # ...unless that was its last attempt: a task that kills its worker ends up dead
+        async with AsyncSessionLocal() as session:
+            poison_id = uuid.uuid4()
+            session.add(QueuedTask(
+                id=poison_id, task_type=broken_type, payload={}, status="running", attempts=3, max_attempts=3,
+                run_at=datetime.now(timezone.utc), locked_by="dead-worker",
+                locked_at=datetime.now(timezone.utc) - timedelta(seconds=settings.TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS + 60),
+            ))
+            await session.commit()
+        await worker._requeue_stale()
+        async with AsyncSessionLocal() as session:
+            poison = await session.get(QueuedTask, poison_id)
+        assert poison.status == "dead" and poison.locked_by is None and "Worker lost" in poison.last_error
+
+        # A reaped run that finishes late does not overwrite the state of the task's next run
+        slow_worker = TaskWorker("test-d", [slow_type])
+        await task_queue_service.enqueue_now(slow_type, {}, max_attempts=3)
+        assert await slow_worker._claim_and_start(slow_type) == 1
+        await _backdate_lock(slow_type, settings.TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS + 60)
+        await slow_worker._requeue_stale()
+        assert await slow_worker._claim_and_start(slow_type) == 1
+        releases.setdefault(1, asyncio.Event()).set()
+        await asyncio.sleep(0.2)
+        (task,) = await _tasks(slow_type)
+        assert task.status == "running" and task.attempts == 2 and task.last_error is None, (task.status, task.last_error)
+        releases.setdefault(2, asyncio.Event()).set()
+        await _run_claimed(slow_worker)
+        (task,) = await _tasks(slow_type)
+        assert task.status == "succeeded" and task.attempts == 2
+
+        # The heartbeat keeps a long-running task's lock fresh, so it is not reaped
+        settings.TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS = 3
+        releases.clear()
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(QueuedTask).where(QueuedTask.task_type == slow_type))
+            await session.commit()
+        await task_queue_service.enqueue_now(slow_type, {}, max_attempts=3)
+        assert await slow_worker._claim_and_start(slow_type) == 1
+        await _backdate_lock(slow_type, 60)
+        await asyncio.sleep(1.3)
+        await slow_worker._requeue_stale()
+        (task,) = await _tasks(slow_type)
+        assert task.status == "running" and task.attempts == 1, task.status
+        releases.setdefault(1, asyncio.Event()).set()
+        await _run_claimed(slow_worker)
+
+        assert is_transient_error(ConnectionError()) and is_transient_error(asyncio.TimeoutError())
+        assert not is_transient_error(ValueError()) and not is_transient_error(RuntimeError("client not initialized"))
+        print("SUCCESS: task queue claims, retries with backoff, dedupes by key, heartbeats and reclaims stale tasks")
+    finally:
+        settings.TASK_QUEUE_VISIBILITY_TIMEOUT_SECONDS = visibility_timeout
+        for event in releases.values():
+            event.set()
+        for task_type in all_types:
+            _registry.pop(task_type, None)
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(QueuedTask).where(QueuedTask.task_type.in_(all_types)))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_task_queue())
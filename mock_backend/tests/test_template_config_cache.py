@@ -0,0 +1,60 @@
+import asyncio
+from sqlalchemy import delete
+from app.db.sql.session import AsyncSessionLocal
+from app.db.sql.models.interview_template import InterviewTemplate
+from app.services.template_config_cache import TemplateConfigCache
+
+
+async def verify_template_config_cache():
+    # Two caches stand in for two worker processes; neither is told about the edit
+    worker_a, worker_b = TemplateConfigCache(), TemplateConfigCache()
+    template_id = None
+    try:
+        async with AsyncSessionLocal() as session:
+            template = InterviewTemplate(
+                title="Cache test",
+                role_name="cache-test-role",
+                technical_config={"easy": 2, "medium": 1},
+                conversational_config={"rounds": 4},
+            )
+            session.add(template)
+            await session.commit()
+            template_id = template.id
+
+        async with AsyncSessionLocal() as session:
+            first = await worker_a.get(session, template_id)
+            assert first.num_technical_questions == 3 and first.conversational_rounds == 4
+            assert await worker_b.get(session, str(template_id)) == first
+            # Unchanged row: served from the cache
+            assert await worker_a.get(session, template_id) is first
+
+        # Edit the template the way the admin endpoint does, on "another process"
+        async with AsyncSessionLocal() as session:
+            template = await session.get(InterviewTemplate, template_id)
+            template.technical_config = {"easy": 1, "medium": 1, "hard": 3}
+            template.conversational_config = {"rounds": 6}
+            await session.commit()
+
+        async with AsyncSessionLocal() as session:
+            for cache in (worker_a, worker_b):
+                updated = await cache.get(session, template_id)
+                assert updated.num_technical_questions == 5 and updated.conversational_rounds == 6, updated
+                assert await cache.get(session, template_id) is updated
+
+        # Soft delete is seen too
+        async with AsyncSessionLocal() as session:
+            template = await session.get(InterviewTemplate, template_id)
+            template.is_active = False
+            await session.commit()
+        async with AsyncSessionLocal() as session:
+            assert (await worker_a.get(session, template_id)).is_active is False
+        print("SUCCESS: template config cache serves the edited config on the next read in every process")
+    finally:
+        if template_id:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(InterviewTemplate).where(InterviewTemplate.id == template_id))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_template_config_cache())
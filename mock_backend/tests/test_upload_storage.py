@@ -0,0 +1,82 @@
+import asyncio
+import hashlib
+import io
+import os
+import tempfile
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+from app.core.config import settings
+from app.services.face_service import FaceService
+from app.services.upload_storage import (
+    stream_upload, sniff_kind, reject_oversize_upload, IMAGE_KINDS, VIDEO_KINDS, UPLOAD_CHUNK_BYTES,
+)
+
+
+def _upload(data: bytes, content_type: str, size=None) -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), size=size, filename="sample", headers=Headers({"content-type": content_type}))
+
+
+async def _expect_status(coro, code: int) -> None:
+    try:
+        await coro
+    except HTTPException as e:
+        assert e.status_code == code, e.detail
+    else:
+        raise AssertionError(f"expected HTTP {code}")
+
+
+async def verify_upload_storage():
+    assert sniff_kind(b"\xff\xd8\xff\xe0") == "jpeg"
+    assert sniff_kind(b"\x00\x00\x00\x18ftypmp42") == "mp4"
+    assert sniff_kind(b"\x1a\x45\xdf\xa3\x01") == "webm"
+    assert sniff_kind(b"RIFF\x00\x00\x00\x00WAVE") == "wav"
+    assert sniff_kind(b"hello world!") is None
+
+    video = b"\x00\x00\x00\x18ftypmp42" + os.urandom(3 * UPLOAD_CHUNK_BYTES + 123)
+    with tempfile.TemporaryDirectory() as tmp:
+        dest = os.path.join(tmp, "video.mp4")
+
+        # Streamed across several chunks, hashed on the way
+        stored = await stream_upload(_upload(video, "video/mp4"), dest, VIDEO_KINDS, len(video), "Video")
+        assert stored.size == len(video) and stored.kind == "mp4"
+        assert stored.sha256 == hashlib.sha256(video).hexdigest()
+        with open(dest, "rb") as f:
+            assert f.read() == video
+
+        # Over the cap while streaming (size unknown up front): 413, nothing left behind
+        dest2 = os.path.join(tmp, "big.mp4")
+        await _expect_status(stream_upload(_upload(video, "video/mp4"), dest2, VIDEO_KINDS, len(video) - 1, "Video"), 413)
+        # Rejected from the recorded size without reading
+        rejected = _upload(video, "video/mp4", size=len(video))
+        await _expect_status(stream_upload(rejected, dest2, VIDEO_KINDS, UPLOAD_CHUNK_BYTES, "Video"), 413)
+        assert rejected.file.tell() == 0
+        # Declared as video but the bytes are not: 415
+        await _expect_status(stream_upload(_upload(b"<html>" * 100, "video/mp4"), dest2, VIDEO_KINDS, len(video), "Video"), 415)
+        await _expect_status(stream_upload(_upload(video, "image/png"), dest2, IMAGE_KINDS, len(video), "Photo"), 415)
+        await _expect_status(stream_upload(_upload(b"", "video/mp4"), dest2, VIDEO_KINDS, len(video), "Video"), 400)
+        assert sorted(os.listdir(tmp)) == ["video.mp4"], os.listdir(tmp)
+
+        assert await stored.read_bytes() == video
+
+    # Oversize bodies are refused from Content-Length before they are received
+    video_cap = settings.UPLOAD_MAX_VIDEO_BYTES
+    rejection = reject_oversize_upload("POST", "/api/v1/verification/video-sample", str(video_cap * 2))
+    assert rejection is not None and rejection.status_code == 413
+    assert reject_oversize_upload("POST", "/api/v1/verification/video-sample", str(video_cap)) is None
+    assert reject_oversize_upload("POST", "/api/v1/verification/video-sample", None) is None
+    assert reject_oversize_upload("POST", "/api/v1/auth/login", str(video_cap * 2)) is None
+
+    # Enrolling a streamed image (Azure configured but unavailable) keeps that one file
+    faces = FaceService(subscription_key="key", endpoint="https://faces.example.com")
+    ref_id, path = faces.new_sample_path("test-candidate", "image/png")
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + b"0" * 64)
+    try:
+        assert faces.enroll_face_file("test-candidate", ref_id, path, "image/png") == (ref_id, str(path))
+        assert [p for p in path.parent.iterdir() if p.name.startswith("test-candidate_")] == [path]
+    finally:
+        path.unlink()
+    print(f"SUCCESS: streamed {stored.size} bytes ({stored.kind}), sha256 {stored.sha256[:12]}")
+
+
+if __name__ == "__main__":
+    asyncio.run(verify_upload_storage())